@@ -18,10 +18,11 @@ import logging
 import os
 import shutil
 import time
-from typing import Dict
+from typing import BinaryIO, Dict, Union
 
 from dfcx_scrapi.agent_extract import (
     entity_types,
+    files,
     flows,
     gcs_utils,
     graph,
@@ -78,18 +79,15 @@ class Agents(scrapi_base.ScrapiBase):
         else:
             os.mkdir(agent_local_path)
 
-    def await_lro(self, lro: str):
-        """Wait for long running operation to complete."""
-        try:
-            i = 0
-            while not self.ops.get_lro(lro).done:
-                time.sleep(1)
-                i += 1
-                if i == 20:
-                    break
+    def await_lro(
+            self, lro: str, timeout: float = operations.DEFAULT_LRO_TIMEOUT):
+        """Wait for long running operation to complete.
 
-        except UserWarning:
-            print("LRO Failed.")
+        Raises:
+          TimeoutError: if the LRO is not done after `timeout` seconds.
+          GoogleAPICallError: if the LRO finished with an error.
+        """
+        self.ops.await_lro(lro, timeout=timeout)
 
         return True
 
@@ -122,16 +120,30 @@ class Agents(scrapi_base.ScrapiBase):
         self.gcs.unzip(agent_file, agent_local_path)
 
 
-    def process_agent(self, agent_id: str, gcs_bucket_uri: str,
-                      environment_display_name: str = None):
-        """Process the specified Agent for offline data gathering."""
-        agent_local_path = "/tmp/agent"
-        self.prep_local_dir(agent_local_path)
-        self.export_agent(agent_id, gcs_bucket_uri, environment_display_name)
-        self.download_and_extract(agent_local_path, gcs_bucket_uri)
+    def process_agent_files(
+            self, agent_files: files.AgentFiles, agent_id: str,
+            parallel: bool = False, max_workers: int = None,
+            use_processes: bool = False) -> types.AgentData:
+        """Process an agent export, reading it through `agent_files`.
+
+        Args:
+          agent_files: the AgentFiles, or ZipAgentFiles, for the export.
+          agent_id: the Agent ID of the exported agent.
+          parallel: (Optional) parse all of the JSON files concurrently
+            before processing them. The graph is still built in the same
+            order, so the results are the same as the serial mode.
+          max_workers: (Optional) the number of workers in parallel mode.
+          use_processes: (Optional) use a process pool in parallel mode,
+            instead of a thread pool.
+        """
+        agent_local_path = agent_files.root_path
 
         logging.info("Processing Agent...")
         data = types.AgentData()
+        data.files = agent_files
+        if parallel:
+            data.files.prefetch(max_workers, use_processes)
+
         data.graph = graph.Graph()
         data.lang_code = self.lang_code
         data.agent_id = agent_id
@@ -141,6 +153,80 @@ class Agents(scrapi_base.ScrapiBase):
             agent_local_path, data)
         data = self.webhooks.process_webhooks_directory(agent_local_path, data)
         data = self.tcs.process_test_cases_directory(agent_local_path, data)
+        data.files.clear()
         logging.info("Processing Complete.")
 
         return data
+
+    def process_agent_directory(
+            self, agent_local_path: str, agent_id: str, **kwargs
+            ) -> types.AgentData:
+        """Process an agent export that has already been unzipped.
+
+        See `process_agent_files` for the other arguments.
+        """
+        return self.process_agent_files(
+            files.AgentFiles(agent_local_path), agent_id, **kwargs)
+
+    def process_agent_zip(
+            self, agent_zip: Union[str, bytes, BinaryIO], agent_id: str,
+            **kwargs) -> types.AgentData:
+        """Process an agent export zip without extracting it to disk.
+
+        Args:
+          agent_zip: a local path to the zip file, its contents as bytes, or
+            a seekable binary file object, such as a GCS blob opened for
+            reading.
+          agent_id: the Agent ID of the exported agent.
+          **kwargs: see `process_agent_files`.
+        """
+        with files.ZipAgentFiles(agent_zip) as agent_files:
+            return self.process_agent_files(agent_files, agent_id, **kwargs)
+
+    def process_agent(self, agent_id: str, gcs_bucket_uri: str,
+                      environment_display_name: str = None,
+                      index_file: str = None, agent_local_path: str = None,
+                      **kwargs):
+        """Process the specified Agent for offline data gathering.
+
+        By default the exported zip file is downloaded into memory and read
+        directly, so nothing is written to disk and several agents can be
+        processed at the same time.
+
+        Args:
+          agent_id: the Agent ID of the agent to export and process.
+          gcs_bucket_uri: the GCS URI to export the agent to.
+          environment_display_name: (Optional) the environment to export.
+          index_file: (Optional) a local file to save `data.index` to, so
+            later jobs can reload it with `index.AgentIndex.load`.
+          agent_local_path: (Optional) a local directory to download and
+            unzip the export into, replacing anything already there, for
+            when the extracted files are needed after processing.
+          **kwargs: `parallel`, `max_workers` and `use_processes`, see
+            `process_agent_files`.
+
+        Returns:
+          The AgentData for the agent, with its lookup index in `data.index`.
+        """
+        self.export_agent(agent_id, gcs_bucket_uri, environment_display_name)
+
+        if agent_local_path:
+            self.prep_local_dir(agent_local_path)
+            self.download_and_extract(agent_local_path, gcs_bucket_uri)
+            data = self.process_agent_directory(
+                agent_local_path, agent_id, **kwargs)
+
+        else:
+            download_start = time.time()
+            logging.info("Downloading agent file from GCS Bucket...")
+            agent_zip = self.gcs.download_gcs_bytes(gcs_bucket_uri)
+            logging.info("Download complete.")
+            logging.debug(f"DOWNLOAD: {time.time() - download_start}")
+
+            data = self.process_agent_zip(agent_zip, agent_id, **kwargs)
+
+        if index_file:
+            data.index.save(index_file)
+            logging.info(f"Saved agent index to {index_file}")
+
+        return data
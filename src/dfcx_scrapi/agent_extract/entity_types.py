@@ -14,11 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-import os
 from typing import Dict
 
-from dfcx_scrapi.agent_extract import common, types
+from dfcx_scrapi.agent_extract import common, files, types
 
 
 class EntityTypes:
@@ -28,7 +26,8 @@ class EntityTypes:
         self.common = common.Common()
 
     @staticmethod
-    def build_entity_type_path_list(agent_local_path: str):
+    def build_entity_type_path_list(
+            agent_local_path: str, agent_files: files.AgentFiles = None):
         """Builds a list of dirs, each representing an Entity Type directory.
 
         Ex: /path/to/agent/entityTypes/<entity_type_dir>
@@ -39,17 +38,19 @@ class EntityTypes:
         - /entities, for the Entities dir
         """
         root_dir = agent_local_path + "/entityTypes"
+        agent_files = agent_files or files.AgentFiles()
 
         entity_type_paths = []
 
-        for entity_type_dir in os.listdir(root_dir):
+        for entity_type_dir in agent_files.listdir(root_dir):
             entity_type_dir_path = f"{root_dir}/{entity_type_dir}"
             entity_type_paths.append(entity_type_dir_path)
 
         return entity_type_paths
 
     @staticmethod
-    def build_lang_code_paths(etype: types.EntityType):
+    def build_lang_code_paths(
+            etype: types.EntityType, agent_files: files.AgentFiles = None):
         """Builds dict of lang codes and file locations.
 
         The language_codes and paths for each file are stored in a dictionary
@@ -57,8 +58,9 @@ class EntityTypes:
         lint each file and provide reporting based on each language code.
         """
         root_dir = etype.dir_path + "/entities"
+        agent_files = agent_files or files.AgentFiles()
 
-        for lang_file in os.listdir(root_dir):
+        for lang_file in agent_files.listdir(root_dir):
             lang_code = lang_file.split(".")[0]
             lang_code_path = f"{root_dir}/{lang_file}"
             etype.entities[lang_code] = {"file_path": lang_code_path}
@@ -72,36 +74,38 @@ class EntityTypes:
         return lang_code_path
 
     @staticmethod
-    def process_entity_type_metadata(etype: types.EntityType):
+    def process_entity_type_metadata(
+            etype: types.EntityType, stats: types.AgentData = None):
         """Extract metadata for Entity Type for later processing."""
         metadata_file = etype.dir_path + f"/{etype.display_name}.json"
+        agent_files = stats.files if stats else files.AgentFiles()
 
-        with open(metadata_file, "r", encoding="UTF-8") as etype_file:
-            etype.data = json.load(etype_file)
-            etype.resource_id = etype.data.get("name", None)
-            etype.kind = etype.data.get("kind", None)
-            etype.auto_expansion = etype.data.get("autoExpansionMode", None)
-            etype.fuzzy_extraction = etype.data.get(
-                "enableFuzzyExtraction", False)
-
-            etype_file.close()
+        etype.data = agent_files.load_json(metadata_file)
+        etype.resource_id = etype.data.get("name", None)
+        etype.kind = etype.data.get("kind", None)
+        etype.auto_expansion = etype.data.get("autoExpansionMode", None)
+        etype.fuzzy_extraction = etype.data.get(
+            "enableFuzzyExtraction", False)
 
     def process_excluded_phrases_language_codes(
-            self, data: Dict[str, str], lang_code_path: str):
+            self, data: Dict[str, str], lang_code_path: str,
+            stats: types.AgentData = None):
         """Process all ecluded phrases lang_code files."""
-        with open(lang_code_path, "r", encoding="UTF-8") as ent_file:
-            new_data = json.load(ent_file)
-            data["excluded_phrases"] = new_data.get("excludedPhrases", None)
+        agent_files = stats.files if stats else files.AgentFiles()
+        new_data = agent_files.load_json(lang_code_path)
+        data["excluded_phrases"] = new_data.get("excludedPhrases", None)
 
         return data
 
     def process_excluded_phrases(self, etype: types.EntityType, lang_code: str,
-                                 data: Dict[str, str]):
+                                 data: Dict[str, str],
+                                 stats: types.AgentData = None):
         """Process the excluded phrases if they exist."""
-        if "excludedPhrases" in os.listdir(etype.dir_path):
+        agent_files = stats.files if stats else files.AgentFiles()
+        if "excludedPhrases" in agent_files.listdir(etype.dir_path):
             lang_code_path = self.build_excluded_phrases_path(etype, lang_code)
             data = self.process_excluded_phrases_language_codes(
-                data, lang_code_path)
+                data, lang_code_path, stats)
 
         return data
 
@@ -114,24 +118,22 @@ class EntityTypes:
             if not self.common.check_lang_code(lang_code, stats):
                 continue
 
-            with open(ent_file_path, "r", encoding="UTF-8") as ent_file:
-                data = json.load(ent_file)
-                data["name"] = f"{stats.agent_id}/entityTypes/"\
-                    f"{etype.resource_id}"
-                data["display_name"] = etype.display_name
-                data["kind"] = etype.kind
-                data["entities"] = data.get("entities", None)
-                data = self.process_excluded_phrases(etype, lang_code, data)
-                stats.entity_types.append(data)
-
-                ent_file.close()
+            data = stats.files.load_json(ent_file_path)
+            data["name"] = f"{stats.agent_id}/entityTypes/"\
+                f"{etype.resource_id}"
+            data["display_name"] = etype.display_name
+            data["kind"] = etype.kind
+            data["entities"] = data.get("entities", None)
+            data = self.process_excluded_phrases(
+                etype, lang_code, data, stats)
+            stats.entity_types.append(data)
 
         return stats
 
     def process_entities(self, etype: types.EntityType, stats: types.AgentData):
         """Process the Entity files inside of an Entity Type."""
-        if "entities" in os.listdir(etype.dir_path):
-            self.build_lang_code_paths(etype)
+        if "entities" in stats.files.listdir(etype.dir_path):
+            self.build_lang_code_paths(etype, stats.files)
             stats = self.process_language_codes(etype, stats)
 
         return stats
@@ -144,7 +146,7 @@ class EntityTypes:
             etype.dir_path, "entity_type")
         etype.display_name = self.common.clean_display_name(etype.display_name)
 
-        self.process_entity_type_metadata(etype)
+        self.process_entity_type_metadata(etype, stats)
         stats = self.process_entities(etype, stats)
         stats.total_entity_types += 1
 
@@ -154,14 +156,21 @@ class EntityTypes:
             self, agent_local_path: str, stats: types.AgentData):
         """Processing the Entity Types dir in the JSON Package structure."""
         # Create a list of all Entity Type paths to iter through
-        entity_type_paths = self.build_entity_type_path_list(agent_local_path)
+        entity_type_paths = self.build_entity_type_path_list(
+            agent_local_path, stats.files)
 
         for entity_type_path in entity_type_paths:
             etype = types.EntityType()
             etype.dir_path = entity_type_path
+            position = len(stats.entity_types)
 
             stats = self.process_entity_type(etype, stats)
             full_etype_id = f"{stats.agent_id}/entityTypes/{etype.resource_id}"
             stats.entity_types_map[etype.display_name] = full_etype_id
+            stats.index.add_resource(
+                "entity_type", full_etype_id, etype.display_name,
+                f"{etype.dir_path}/{etype.display_name}.json",
+                position=(
+                    position if len(stats.entity_types) > position else None))
 
         return stats
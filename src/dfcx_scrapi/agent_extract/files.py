@@ -0,0 +1,217 @@
+"""File access for agent export processing."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import io
+import json
+import logging
+import os
+import threading
+import zipfile
+from concurrent import futures
+from typing import Any, BinaryIO, Callable, Dict, List, Tuple, Union
+
+# logging config
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(message)s",
+)
+
+CHUNKS_PER_WORKER = 4  # Files are split in chunks to balance process workers
+ZIP_ROOT = "agent.zip"  # Root path for zip files that aren't on local disk
+
+
+def _read_json(file_path: str) -> Any:
+    with open(file_path, "rb") as json_file:
+        return json.loads(json_file.read())
+
+
+def _load_chunk(
+    loader: Callable[[Any], Any], items: List[Tuple[str, Any]]
+) -> List[Tuple[str, Any]]:
+    """Parse a chunk of files in a worker process."""
+    return [(file_path, loader(source)) for file_path, source in items]
+
+
+class AgentFiles:
+    """Loads the JSON files of an agent export from a local directory.
+
+    By default every file is read and parsed when it is requested. After
+    `prefetch`, every JSON file in the export has already been parsed
+    concurrently, and requests are served from memory. Each prefetched
+    file is handed out once, since the processors modify the data they are
+    given, and any later request reads the file again.
+    """
+
+    def __init__(self, root_path: str = None):
+        self.root_path = root_path
+        self._parsed: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    # Parses the source returned by `_prefetch_items` for a file.
+    _loader = staticmethod(_read_json)
+
+    def listdir(self, dir_path: str) -> List[str]:
+        """List a directory, sorted so processing order is repeatable."""
+        return sorted(os.listdir(dir_path))
+
+    def json_paths(self) -> List[str]:
+        """List every JSON file in the export."""
+        paths = []
+        for dir_path, _, file_names in os.walk(self.root_path):
+            paths.extend(
+                f"{dir_path}/{file_name}"
+                for file_name in file_names
+                if file_name.endswith(".json")
+            )
+
+        return paths
+
+    def _prefetch_items(self) -> List[Tuple[str, Any]]:
+        return [(file_path, file_path) for file_path in self.json_paths()]
+
+    def prefetch(self, max_workers: int = None, use_processes: bool = False):
+        """Parse every JSON file in the export concurrently.
+
+        Args:
+          max_workers: (Optional) the number of threads or processes to use.
+          use_processes: (Optional) parse files in a process pool instead of
+            a thread pool. Threads overlap file I/O but share the GIL for
+            JSON decoding, so processes are faster for large exports.
+        """
+        items = self._prefetch_items()
+
+        if use_processes:
+            max_workers = max_workers or os.cpu_count()
+            num_chunks = max_workers * CHUNKS_PER_WORKER
+            chunks = [items[i::num_chunks] for i in range(num_chunks)]
+            with futures.ProcessPoolExecutor(max_workers) as executor:
+                parsed = [
+                    pair
+                    for chunk in executor.map(
+                        functools.partial(_load_chunk, self._loader), chunks)
+                    for pair in chunk
+                ]
+        else:
+            with futures.ThreadPoolExecutor(max_workers) as executor:
+                parsed = list(zip(
+                    [file_path for file_path, _ in items],
+                    executor.map(self._loader, [item for _, item in items]),
+                ))
+
+        with self._lock:
+            self._parsed.update(
+                (os.path.normpath(path), data) for path, data in parsed)
+
+        logging.info(f"Parsed {len(items)} agent files.")
+
+    def _read(self, file_path: str) -> Any:
+        return _read_json(file_path)
+
+    def load_json(self, file_path: str) -> Any:
+        """Load a JSON file, using the prefetched data when available."""
+        key = os.path.normpath(file_path)
+        with self._lock:
+            if key in self._parsed:
+                return self._parsed.pop(key)
+
+        return self._read(file_path)
+
+    def clear(self):
+        """Release any prefetched data that was never requested."""
+        with self._lock:
+            self._parsed.clear()
+
+    def close(self):
+        self.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class ZipAgentFiles(AgentFiles):
+    """Loads the JSON files of an agent export straight from the zip file.
+
+    Nothing is extracted to disk. Files are addressed by paths under
+    `root_path`, which is the zip file path when reading from local disk,
+    so the processors can build paths exactly as they do for a directory.
+
+    Args:
+      agent_zip: a local path to the zip file, its contents as bytes, or a
+        seekable binary file object, such as a GCS blob opened for reading.
+    """
+
+    def __init__(self, agent_zip: Union[str, bytes, BinaryIO]):
+        root_path = agent_zip if isinstance(agent_zip, str) else ZIP_ROOT
+        super().__init__(os.path.normpath(root_path))
+
+        if isinstance(agent_zip, bytes):
+            agent_zip = io.BytesIO(agent_zip)
+
+        self._zip = zipfile.ZipFile(agent_zip, "r")
+        self._members: Dict[str, str] = {}
+        self._dirs: Dict[str, set] = {}
+
+        for member in self._zip.namelist():
+            if member.endswith("/"):
+                continue
+
+            parts = member.split("/")
+            self._members["/".join([self.root_path] + parts)] = member
+            for depth in range(len(parts)):
+                dir_path = "/".join([self.root_path] + parts[:depth])
+                self._dirs.setdefault(dir_path, set()).add(parts[depth])
+
+    _loader = staticmethod(json.loads)
+
+    def listdir(self, dir_path: str) -> List[str]:
+        dir_path = os.path.normpath(dir_path)
+        if dir_path not in self._dirs:
+            raise FileNotFoundError(dir_path)
+
+        return sorted(self._dirs[dir_path])
+
+    def json_paths(self) -> List[str]:
+        return [
+            file_path
+            for file_path in self._members
+            if file_path.endswith(".json")
+        ]
+
+    def _prefetch_items(self) -> List[Tuple[str, Any]]:
+        # A ZipFile reads through a single file handle, so the raw bytes are
+        # read serially, and only decoding is spread over the workers.
+        return [
+            (file_path, self._zip.read(self._members[file_path]))
+            for file_path in self.json_paths()
+        ]
+
+    def _read(self, file_path: str) -> Any:
+        member = self._members.get(os.path.normpath(file_path))
+        if member is None:
+            raise FileNotFoundError(file_path)
+
+        with self._lock:
+            raw = self._zip.read(member)
+
+        return json.loads(raw)
+
+    def close(self):
+        super().close()
+        self._zip.close()
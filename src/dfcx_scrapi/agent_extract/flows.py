@@ -14,12 +14,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-import os
 from typing import List
 
 from dfcx_scrapi.agent_extract import (
     common,
+    files,
     graph,
     pages,
     route_groups,
@@ -45,7 +44,8 @@ class Flows:
         ]
 
     @staticmethod
-    def build_flow_path_list(agent_local_path: str):
+    def build_flow_path_list(
+            agent_local_path: str, agent_files: files.AgentFiles = None):
         """Builds a list of dirs, each representing a Flow directory.
 
         Ex: /path/to/agent/flows/<flow_dir>
@@ -57,10 +57,11 @@ class Flows:
         - /pages, for the Pages dir
         """
         root_dir = agent_local_path + "/flows"
+        agent_files = agent_files or files.AgentFiles()
 
         flow_paths = []
 
-        for flow_dir in os.listdir(root_dir):
+        for flow_dir in agent_files.listdir(root_dir):
             flow_dir_path = f"{root_dir}/{flow_dir}"
             flow_paths.append(flow_dir_path)
 
@@ -216,33 +217,33 @@ class Flows:
 
     def process_start_page(self, flow: types.Flow, stats: types.AgentData):
         """Process a single Flow Path file."""
-        with open(flow.start_page_file, "r", encoding="UTF-8") as flow_file:
-            page = types.Page(flow=flow)
-            page.display_name = f"{flow.display_name}: Start Page"
+        page = types.Page(flow=flow)
+        page.display_name = f"{flow.display_name}: Start Page"
 
-            # We keep track of an instance specific Flow graph for the current
-            # Flow, and then a main Graph for the entire agent.
-            flow.graph.add_node(page.display_name)
-            stats.graph.add_node(page.display_name)
+        # We keep track of an instance specific Flow graph for the current
+        # Flow, and then a main Graph for the entire agent.
+        flow.graph.add_node(page.display_name)
+        stats.graph.add_node(page.display_name)
 
-            page.data = json.load(flow_file)
-            page.events = page.data.get("eventHandlers", None)
-            page.routes = page.data.get("transitionRoutes", None)
-            page.route_groups = page.data.get("transitionRouteGroups", None)
-            stats.flows.append(page.data)
+        page.data = stats.files.load_json(flow.start_page_file)
+        page.events = page.data.get("eventHandlers", None)
+        page.routes = page.data.get("transitionRoutes", None)
+        page.route_groups = page.data.get("transitionRouteGroups", None)
+        stats.flows.append(page.data)
 
-            flow.resource_id = page.data.get("name", None)
+        flow.resource_id = page.data.get("name", None)
 
-            # Order of processing is important
-            stats = self.routes.process_routes(page, stats)
-            stats = self.routes.process_events(page, stats)
+        # Order of processing is important
+        stats = self.routes.process_routes(page, stats)
+        stats = self.routes.process_events(page, stats)
 
-            if page.route_groups:
-                page, stats = self.routes.set_route_group_targets(page, stats)
-
-            flow_file.close()
+        if page.route_groups:
+            page, stats = self.routes.set_route_group_targets(page, stats)
 
         full_flow_id = f"{stats.agent_id}/flows/{flow.resource_id}"
+        stats.index.add_resource(
+            "flow", full_flow_id, flow.display_name, flow.start_page_file,
+            position=len(stats.flows) - 1)
         stats.flows_map[flow.display_name] = full_flow_id
         stats.flow_page_map[flow.display_name] = {
             "id": full_flow_id,
@@ -290,7 +291,7 @@ class Flows:
         files in the pages dir.
         """
         # Create a list of all Flow paths to iter through
-        flow_paths = self.build_flow_path_list(agent_local_path)
+        flow_paths = self.build_flow_path_list(agent_local_path, stats.files)
         stats.total_flows = len(flow_paths)
 
         for flow_path in flow_paths:
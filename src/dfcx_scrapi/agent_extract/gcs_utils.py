@@ -52,14 +52,23 @@ class GcsUtils:
 
         return is_gcs_file
 
-    def download_gcs(self, gcs_path: str, local_path: str = None):
-        """Downloads the specified GCS file to local machine."""
+    def get_blob(self, gcs_path: str) -> storage.Blob:
+        """Gets the Blob for a `gs://<bucket>/<object>` path."""
         path = gcs_path.split("//")[1]
         bucket = path.split("/", 1)[0]
         gcs_object = path.split("/", 1)[1]
-        file_name = gcs_object.split("/")[-1]
         bucket = self.gcs_client.bucket(bucket)
-        blob = storage.Blob(gcs_object, bucket)
+
+        return storage.Blob(gcs_object, bucket)
+
+    def download_gcs_bytes(self, gcs_path: str) -> bytes:
+        """Downloads the specified GCS file into memory."""
+        return self.get_blob(gcs_path).download_as_bytes()
+
+    def download_gcs(self, gcs_path: str, local_path: str = None):
+        """Downloads the specified GCS file to local machine."""
+        blob = self.get_blob(gcs_path)
+        file_name = blob.name.split("/")[-1]
 
         if local_path:
             file_name = local_path + "/" + file_name
@@ -0,0 +1,218 @@
+"""Lookup index for resources and references in an agent export."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import json
+import os
+from typing import Any, Dict, List
+
+AGENT_SCOPE = ""  # Scope for resources that don't belong to a Flow
+
+
+class AgentIndex:
+    """Lookup index for resources and references in an agent export.
+
+    The index is filled in while the agent export is processed and maps:
+      - Resource ID to its type, display name, Flow, source file and
+        position in the matching `AgentData` list.
+      - Display name, scoped by Flow for Pages and Route Groups, back to
+        the Resource ID.
+      - Intent display name to the routes that reference it.
+      - Entity Type display name to the parameters that reference it.
+      - Webhook display name to the fulfillments that reference it.
+
+    The agent export refers to Intents, Entity Types and Webhooks by display
+    name, so references are keyed by display name. All lookups accept
+    either the display name or the full Resource ID.
+    """
+
+    def __init__(self):
+        self.resources: Dict[str, Dict[str, Any]] = {}
+        self.names: Dict[str, Dict[str, Dict[str, str]]] = (
+            collections.defaultdict(lambda: collections.defaultdict(dict))
+        )
+        self.intent_references = collections.defaultdict(list)
+        self.entity_type_references = collections.defaultdict(list)
+        self.webhook_references = collections.defaultdict(list)
+
+    @staticmethod
+    def _reference(
+        resource, fulfillment_type: str = None, **kwargs
+    ) -> Dict[str, Any]:
+        """Describe the Page, Route Group or Intent holding a reference."""
+        flow = getattr(resource, "flow", None)
+        reference = {
+            "resource_type": resource.resource_type,
+            "display_name": resource.display_name,
+            "flow": flow.display_name if flow else None,
+        }
+        if fulfillment_type:
+            reference["fulfillment_type"] = fulfillment_type
+        reference.update(kwargs)
+
+        return reference
+
+    def add_resource(
+        self,
+        resource_type: str,
+        resource_id: str,
+        display_name: str,
+        file_path: str = None,
+        flow: str = None,
+        position: int = None,
+    ):
+        """Add a resource, with its position in the AgentData list."""
+        self.resources[resource_id] = {
+            "resource_type": resource_type,
+            "display_name": display_name,
+            "flow": flow,
+            "file_path": file_path,
+            "position": position,
+        }
+        self.names[resource_type][flow or AGENT_SCOPE][
+            display_name] = resource_id
+
+    def add_intent_reference(self, intent: str, route):
+        self.intent_references[intent].append(
+            self._reference(
+                route.page, route.fulfillment_type, trigger=route.trigger)
+        )
+
+    def add_webhook_reference(self, webhook: str, route):
+        self.webhook_references[webhook].append(
+            self._reference(
+                route.page, route.fulfillment_type, trigger=route.trigger)
+        )
+
+    def add_entity_type_reference(
+        self, entity_type: str, resource, parameter: str
+    ):
+        # Parameters refer to Entity Types as `@<display_name>`.
+        self.entity_type_references[entity_type.lstrip("@")].append(
+            self._reference(resource, parameter=parameter)
+        )
+
+    def get_resource_id(
+        self, resource_type: str, display_name: str, flow: str = None
+    ) -> str:
+        """Find the Resource ID for a display name.
+
+        Args:
+          resource_type: one of `flow`, `page`, `route_group`, `intent`,
+            `entity_type`, `webhook` or `test_case`.
+          display_name: the display name of the resource.
+          flow: the Flow display name, for `page` and `route_group`.
+
+        Returns:
+          The full Resource ID, or None if not found.
+        """
+        return self.names.get(resource_type, {}).get(
+            flow or AGENT_SCOPE, {}).get(display_name)
+
+    def get_display_name(self, resource_id: str) -> str:
+        return self.resources.get(resource_id, {}).get("display_name")
+
+    def get_file_path(self, resource_id: str) -> str:
+        return self.resources.get(resource_id, {}).get("file_path")
+
+    def _display_name(self, resource: str) -> str:
+        """Accept either a Resource ID or a display name."""
+        return self.get_display_name(resource) or resource
+
+    def get_intent_references(self, intent: str) -> List[Dict[str, Any]]:
+        """List the routes that reference the Intent."""
+        return self.intent_references.get(self._display_name(intent), [])
+
+    def get_entity_type_references(
+        self, entity_type: str
+    ) -> List[Dict[str, Any]]:
+        """List the Page form and Intent parameters using the Entity Type."""
+        return self.entity_type_references.get(
+            self._display_name(entity_type).lstrip("@"), [])
+
+    def get_webhook_references(self, webhook: str) -> List[Dict[str, Any]]:
+        """List the fulfillments that call the Webhook."""
+        return self.webhook_references.get(self._display_name(webhook), [])
+
+    def get_resource_data(self, data, resource_id: str) -> Dict[str, Any]:
+        """Get a resource from `AgentData` without scanning its lists.
+
+        Args:
+          data: the `AgentData` this index was built for.
+          resource_id: the full Resource ID.
+
+        Returns:
+          The resource data, or None if the resource is not in `data`.
+        """
+        resource = self.resources.get(resource_id)
+        if not resource or resource["position"] is None:
+            return None
+
+        collection = {
+            "flow": data.flows,
+            "page": data.pages.get(resource["flow"]),
+            "route_group": data.route_groups.get(resource["flow"]),
+            "intent": data.intents,
+            "entity_type": data.entity_types,
+            "webhook": data.webhooks,
+            "test_case": data.test_cases,
+        }[resource["resource_type"]]
+
+        return collection[resource["position"]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "resources": self.resources,
+            "names": self.names,
+            "intent_references": self.intent_references,
+            "entity_type_references": self.entity_type_references,
+            "webhook_references": self.webhook_references,
+        }
+
+    @classmethod
+    def from_dict(cls, index_dict: Dict[str, Any]) -> "AgentIndex":
+        index = cls()
+        index.resources.update(index_dict["resources"])
+        for resource_type, scopes in index_dict["names"].items():
+            for scope, names in scopes.items():
+                index.names[resource_type][scope].update(names)
+        for key in [
+            "intent_references",
+            "entity_type_references",
+            "webhook_references",
+        ]:
+            getattr(index, key).update(index_dict[key])
+
+        return index
+
+    def save(self, filename: str):
+        """Write the index to a JSON file."""
+        tmp_filename = f"{filename}.tmp"
+        with open(tmp_filename, "w", encoding="UTF-8") as index_file:
+            json.dump(self.to_dict(), index_file)
+        os.replace(tmp_filename, filename)
+
+    @classmethod
+    def load(cls, filename: str) -> "AgentIndex":
+        """Load an index written by `save`."""
+        with open(filename, "r", encoding="UTF-8") as index_file:
+            return cls.from_dict(json.load(index_file))
+
+    def __str__(self):
+        return (
+            f"AgentIndex({len(self.resources)} resources, "
+            f"{len(self.intent_references)} referenced intents)"
+        )
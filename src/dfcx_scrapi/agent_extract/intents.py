@@ -14,10 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-import os
-
-from dfcx_scrapi.agent_extract import common, types
+from dfcx_scrapi.agent_extract import common, files, types
 
 
 class Intents:
@@ -36,7 +33,8 @@ class Intents:
         return lang_code
 
     @staticmethod
-    def build_lang_code_paths(intent: types.Intent):
+    def build_lang_code_paths(
+            intent: types.Intent, agent_files: files.AgentFiles = None):
         """Builds dict of lang codes and file locations.
 
         The language_codes and paths for each file are stored in a dictionary
@@ -44,14 +42,16 @@ class Intents:
         each file and provide reporting based on each language code.
         """
         root_dir = intent.dir_path + "/trainingPhrases"
+        agent_files = agent_files or files.AgentFiles()
 
-        for lang_file in os.listdir(root_dir):
+        for lang_file in agent_files.listdir(root_dir):
             lang_code = lang_file.split(".")[0]
             lang_code_path = f"{root_dir}/{lang_file}"
             intent.training_phrases[lang_code] = {"file_path": lang_code_path}
 
     @staticmethod
-    def build_intent_path_list(agent_local_path: str):
+    def build_intent_path_list(
+            agent_local_path: str, agent_files: files.AgentFiles = None):
         """Builds a list of dirs, each representing an Intent directory.
 
         Ex: /path/to/agent/intents/<intent_dir>
@@ -62,29 +62,28 @@ class Intents:
         - /trainingPhrases, for the Training Phrases dir
         """
         root_dir = agent_local_path + "/intents"
+        agent_files = agent_files or files.AgentFiles()
 
         intent_paths = []
 
-        for intent_dir in os.listdir(root_dir):
+        for intent_dir in agent_files.listdir(root_dir):
             intent_dir_path = f"{root_dir}/{intent_dir}"
             intent_paths.append(intent_dir_path)
 
         return intent_paths
 
     def process_intent_metadata(
-            self, intent: types.Intent):
+            self, intent: types.Intent, stats: types.AgentData = None):
         """Process the metadata file for a single Intent."""
         intent.metadata_file = f"{intent.dir_path}/{intent.display_name}.json"
+        agent_files = stats.files if stats else files.AgentFiles()
 
         try:
-            with open(intent.metadata_file, "r", encoding="UTF-8") as meta_file:
-                intent.data = json.load(meta_file)
-                intent.resource_id = intent.data.get("name", None)
-                intent.labels = intent.data.get("labels", None)
-                intent.description = intent.data.get("description", None)
-                intent.parameters = intent.data.get("parameters", None)
-
-                meta_file.close()
+            intent.data = agent_files.load_json(intent.metadata_file)
+            intent.resource_id = intent.data.get("name", None)
+            intent.labels = intent.data.get("labels", None)
+            intent.description = intent.data.get("description", None)
+            intent.parameters = intent.data.get("parameters", None)
 
         except FileNotFoundError:
             pass
@@ -99,25 +98,22 @@ class Intents:
             if not self.common.check_lang_code(lang_code, stats):
                 continue
 
-            with open(tp_file, "r", encoding="UTF-8") as tps:
-                data = json.load(tps)
-                data["name"] = f"{stats.agent_id}/intents/{intent.resource_id}"
-                data["display_name"] = intent.display_name
-                data["labels"] = intent.labels
-                data["description"] = intent.description
-                data["parameters"] = intent.parameters
-                stats.intents.append(data)
-                stats.total_training_phrases += len(data["trainingPhrases"])
-
-                tps.close()
+            data = stats.files.load_json(tp_file)
+            data["name"] = f"{stats.agent_id}/intents/{intent.resource_id}"
+            data["display_name"] = intent.display_name
+            data["labels"] = intent.labels
+            data["description"] = intent.description
+            data["parameters"] = intent.parameters
+            stats.intents.append(data)
+            stats.total_training_phrases += len(data["trainingPhrases"])
 
         return stats
 
     def process_training_phrases(
             self, intent: types.Intent, stats: types.AgentData):
         """Process the Training Phrase dir for a single Intent."""
-        if "trainingPhrases" in os.listdir(intent.dir_path):
-            self.build_lang_code_paths(intent)
+        if "trainingPhrases" in stats.files.listdir(intent.dir_path):
+            self.build_lang_code_paths(intent, stats.files)
             stats = self.process_language_codes(intent, stats)
 
         return stats
@@ -129,7 +125,12 @@ class Intents:
         intent.display_name = self.common.clean_display_name(
             intent.display_name)
 
-        self.process_intent_metadata(intent)
+        self.process_intent_metadata(intent, stats)
+        for param in intent.parameters or []:
+            if param.get("entityType"):
+                stats.index.add_entity_type_reference(
+                    param["entityType"], intent, param.get("id"))
+
         stats = self.process_training_phrases(intent, stats)
         stats.total_intents += 1
 
@@ -151,15 +152,21 @@ class Intents:
         training phrase files and metadata objects for each Intent.
         """
         # Create a list of all Intent paths to iter through
-        intent_paths = self.build_intent_path_list(agent_local_path)
+        intent_paths = self.build_intent_path_list(
+            agent_local_path, stats.files)
         stats.intents = []
 
         for intent_path in intent_paths:
             intent = types.Intent()
             intent.dir_path = intent_path
+            position = len(stats.intents)
 
             stats = self.process_intent(intent, stats)
             full_intent_id = f"{stats.agent_id}/intents/{intent.resource_id}"
             stats.intents_map[intent.display_name] = full_intent_id
+            stats.index.add_resource(
+                "intent", full_intent_id, intent.display_name,
+                intent.metadata_file,
+                position=position if len(stats.intents) > position else None)
 
         return stats
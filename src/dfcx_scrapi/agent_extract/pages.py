@@ -14,11 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-import os
 from typing import Any, Dict
 
-from dfcx_scrapi.agent_extract import common, routes, types
+from dfcx_scrapi.agent_extract import common, files, routes, types
 
 
 class Pages:
@@ -29,16 +27,18 @@ class Pages:
         self.routes = routes.Fulfillments()
 
     @staticmethod
-    def build_page_path_list(flow_path: str):
+    def build_page_path_list(
+            flow_path: str, agent_files: files.AgentFiles = None):
         """Builds a list of files, each representing a Page.
 
         Ex: /path/to/agent/flows/<flow_dir>/pages/<page_name>.json
         """
         pages_path = f"{flow_path}/pages"
+        agent_files = agent_files or files.AgentFiles()
 
         page_paths = []
 
-        for page in os.listdir(pages_path):
+        for page in agent_files.listdir(pages_path):
             page_file_path = f"{pages_path}/{page}"
             page_paths.append(page_file_path)
 
@@ -73,6 +73,9 @@ class Pages:
         if parameters:
             for param in parameters:
                 fp = self.get_form_parameter_data(param, page)
+                if fp.entity_type:
+                    stats.index.add_entity_type_reference(
+                        fp.entity_type, page, fp.display_name)
                 stats = self.routes.process_reprompt_handlers(fp, stats)
 
         return stats
@@ -88,28 +91,29 @@ class Pages:
 
         page.flow.all_pages.add(page.display_name)
 
-        with open(page.page_file, "r", encoding="UTF-8") as page_file:
-            page.data = json.load(page_file)
-            page.entry = page.data.get("entryFulfillment", None)
-            page.events = page.data.get("eventHandlers", None)
-            page.form = page.data.get("form", None)
-            page.routes = page.data.get("transitionRoutes", None)
-            page.route_groups = page.data.get("transitionRouteGroups", None)
-            page.resource_id = page.data.get("name", None)
+        page.data = stats.files.load_json(page.page_file)
+        page.entry = page.data.get("entryFulfillment", None)
+        page.events = page.data.get("eventHandlers", None)
+        page.form = page.data.get("form", None)
+        page.routes = page.data.get("transitionRoutes", None)
+        page.route_groups = page.data.get("transitionRouteGroups", None)
+        page.resource_id = page.data.get("name", None)
 
-            # Order of linting is important here
-            stats = self.routes.process_entry(page, stats)
-            stats = self.routes.process_routes(page, stats)
-            stats = self.routes.process_events(page, stats)
-            stats = self.process_form(page, stats)
+        # Order of linting is important here
+        stats = self.routes.process_entry(page, stats)
+        stats = self.routes.process_routes(page, stats)
+        stats = self.routes.process_events(page, stats)
+        stats = self.process_form(page, stats)
 
-            if page.route_groups:
-                page, stats = self.routes.set_route_group_targets(page, stats)
-
-            page_file.close()
+        if page.route_groups:
+            page, stats = self.routes.set_route_group_targets(page, stats)
 
         full_flow_id = f"{stats.agent_id}/flows/{page.flow.resource_id}"
         full_page_id = f"{full_flow_id}/pages/{page.resource_id}"
+        stats.index.add_resource(
+            "page", full_page_id, page.display_name, page.page_file,
+            flow=page.flow.display_name,
+            position=len(stats.pages[page.flow.display_name]))
         stats.pages[page.flow.display_name].append(page.data)
         stats.flow_page_map[
             page.flow.display_name]["pages"][page.display_name] = full_page_id
@@ -122,8 +126,8 @@ class Pages:
         Some Flows may not contain Pages, so we check for the existence
         of the directory before traversing
         """
-        if "pages" in os.listdir(flow.dir_path):
-            page_paths = self.build_page_path_list(flow.dir_path)
+        if "pages" in stats.files.listdir(flow.dir_path):
+            page_paths = self.build_page_path_list(flow.dir_path, stats.files)
 
             for page_path in page_paths:
                 page = types.Page(flow=flow)
@@ -14,10 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-import os
-
-from dfcx_scrapi.agent_extract import common, routes, types
+from dfcx_scrapi.agent_extract import common, files, routes, types
 
 
 class RouteGroups:
@@ -36,17 +33,19 @@ class RouteGroups:
         self.routes = routes.Fulfillments()
 
     @staticmethod
-    def build_route_group_path_list(flow_local_path: str):
+    def build_route_group_path_list(
+            flow_local_path: str, agent_files: files.AgentFiles = None):
         """Builds a list of files, each representing a Route Group.
 
         Ex: /path/to/agent/flows/<flow_dir>/transitionRouteGroups/<rg.json>
         """
         root_dir = flow_local_path + "/transitionRouteGroups"
+        agent_files = agent_files or files.AgentFiles()
 
-        if "transitionRouteGroups" in os.listdir(flow_local_path):
+        if "transitionRouteGroups" in agent_files.listdir(flow_local_path):
             rg_paths = []
 
-            for rg_file in os.listdir(root_dir):
+            for rg_file in agent_files.listdir(root_dir):
                 rg_file_path = f"{root_dir}/{rg_file}"
                 rg_paths.append(rg_file_path)
 
@@ -57,20 +56,21 @@ class RouteGroups:
         rg.display_name = self.common.parse_filepath(rg.rg_file, "route_group")
         rg.display_name = self.common.clean_display_name(rg.display_name)
 
-        with open(rg.rg_file, "r", encoding="UTF-8") as route_group_file:
-            rg.data = json.load(route_group_file)
-            rg.resource_id = rg.data.get("name", None)
-            rg.display_name = rg.data.get("displayName", None)
-            rg.routes = rg.data.get("transitionRoutes", None)
-
-            stats = self.routes.process_routes(rg, stats)
+        rg.data = stats.files.load_json(rg.rg_file)
+        rg.resource_id = rg.data.get("name", None)
+        rg.display_name = rg.data.get("displayName", None)
+        rg.routes = rg.data.get("transitionRoutes", None)
 
-            route_group_file.close()
+        stats = self.routes.process_routes(rg, stats)
 
         full_flow_id = f"{stats.agent_id}/flows/{rg.flow.resource_id}"
         full_rg_id = f"{full_flow_id}/transitionRouteGroups/{rg.resource_id}"
         stats.route_groups_map[
             rg.flow.display_name]["route_groups"][rg.display_name] = full_rg_id
+        stats.index.add_resource(
+            "route_group", full_rg_id, rg.display_name, rg.rg_file,
+            flow=rg.flow.display_name,
+            position=len(stats.route_groups[rg.flow.display_name]))
         stats.route_groups[rg.flow.display_name].append(rg.data)
 
         return stats
@@ -78,9 +78,10 @@ class RouteGroups:
     def process_route_groups_directory(
             self, flow: types.Flow, stats: types.AgentData):
         """Process Route Groups dir in the JSON Package structure."""
-        if "transitionRouteGroups" in os.listdir(flow.dir_path):
+        if "transitionRouteGroups" in stats.files.listdir(flow.dir_path):
             # Create a list of all Route Group paths to iter through
-            rg_paths = self.build_route_group_path_list(flow.dir_path)
+            rg_paths = self.build_route_group_path_list(
+                flow.dir_path, stats.files)
             stats.total_route_groups += len(rg_paths)
 
             full_flow_id = f"{stats.agent_id}/flows/{flow.resource_id}"
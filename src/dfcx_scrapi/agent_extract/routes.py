@@ -70,6 +70,17 @@ class Fulfillments:
             pair = (intent, route.page.display_name)
             stats.active_intents[
                 route.page.flow.display_name].append(pair)
+            stats.index.add_intent_reference(intent, route)
+
+        return stats
+
+    @staticmethod
+    def index_webhook_reference(
+            route: types.Fulfillment, path: Dict[str, Any],
+            stats: types.AgentData):
+        """Add the Webhook called by the fulfillment to the index."""
+        if path and "webhook" in path:
+            stats.index.add_webhook_reference(path["webhook"], route)
 
         return stats
 
@@ -226,6 +237,7 @@ class Fulfillments:
 
             # Flag for Webhook Handler
             self.check_for_webhook(fp.page, path)
+            stats = self.index_webhook_reference(route, path, stats)
 
             stats = self.process_fulfillment_type(
                 stats, route, path, "messages")
@@ -254,6 +266,7 @@ class Fulfillments:
 
             # Flag for Webhook Handler
             self.check_for_webhook_event_handlers(route)
+            stats = self.index_webhook_reference(route, path, stats)
 
             stats = self.process_fulfillment_type(
                 stats, route, path, "messages")
@@ -284,6 +297,7 @@ class Fulfillments:
 
             # Flag for Webhook Handler
             self.check_for_webhook(page, path)
+            stats = self.index_webhook_reference(route, path, stats)
 
             stats = self.process_fulfillment_type(
                 stats, route, path, "messages")
@@ -314,6 +328,7 @@ class Fulfillments:
         path = route.data
 
         self.check_for_webhook(page, path)
+        stats = self.index_webhook_reference(route, path, stats)
 
         stats = self.process_fulfillment_type(stats, route, path, "messages")
 
@@ -14,11 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-import os
 from typing import Any, Dict, List
 
-from dfcx_scrapi.agent_extract import common, types
+from dfcx_scrapi.agent_extract import common, files, types
 
 
 class TestCases:
@@ -28,13 +26,15 @@ class TestCases:
         self.common = common.Common()
 
     @staticmethod
-    def build_test_case_path_list(agent_local_path: str):
+    def build_test_case_path_list(
+            agent_local_path: str, agent_files: files.AgentFiles = None):
         """Builds a list of files, each representing a test case."""
         root_dir = agent_local_path + "/testCases"
+        agent_files = agent_files or files.AgentFiles()
 
         test_case_paths = []
 
-        for test_case in os.listdir(root_dir):
+        for test_case in agent_files.listdir(root_dir):
             end = test_case.split(".")[-1]
             if end == "json":
                 test_case_path = f"{root_dir}/{test_case}"
@@ -86,13 +86,15 @@ class TestCases:
         return intent_data
 
     @staticmethod
-    def get_test_case_intent_data(agent_local_path: str):
+    def get_test_case_intent_data(
+            agent_local_path: str, agent_files: files.AgentFiles = None):
         """Collect all Intent Files and Training Phrases for Test Case."""
         intents_path = agent_local_path + "/intents"
+        agent_files = agent_files or files.AgentFiles()
 
         intent_paths = []
 
-        for intent_dir in os.listdir(intents_path):
+        for intent_dir in agent_files.listdir(intents_path):
             intent_dir_path = f"{intents_path}/{intent_dir}"
             intent_paths.append(
                 {"intent": intent_dir, "file_path": intent_dir_path}
@@ -111,28 +113,26 @@ class TestCases:
 
         return cleaned_tps
 
-    def gather_intent_tps(self, tc: types.TestCase):
+    def gather_intent_tps(
+            self, tc: types.TestCase, agent_files: files.AgentFiles = None):
         """Collect all TPs associated with Intent data in Test Case."""
         tc.associated_intent_data = {}
+        agent_files = agent_files or files.AgentFiles()
 
         for i, pair in enumerate(tc.intent_data):
             intent_dir = tc.agent_path + "/intents/" + pair["intent"]
 
             try:
-                if "trainingPhrases" in os.listdir(intent_dir):
+                if "trainingPhrases" in agent_files.listdir(intent_dir):
                     training_phrases_path = intent_dir + "/trainingPhrases"
 
-                    for lang_file in os.listdir(training_phrases_path):
+                    for lang_file in agent_files.listdir(
+                            training_phrases_path):
                         # lang_code = lang_file.split(".")[0]
                         lang_code_path = f"{training_phrases_path}/{lang_file}"
 
-                        with open(
-                            lang_code_path, "r", encoding="UTF-8"
-                        ) as tp_file:
-                            tp_data = json.load(tp_file)
-                            cleaned_tps = self.flatten_tp_data(tp_data)
-
-                            tp_file.close()
+                        tp_data = agent_files.load_json(lang_code_path)
+                        cleaned_tps = self.flatten_tp_data(tp_data)
 
                         tc.intent_data[i]["training_phrases"].extend(
                             cleaned_tps
@@ -149,28 +149,29 @@ class TestCases:
     def process_test_case(self, tc: types.TestCase, stats: types.AgentData):
         """Process a single Test Case file."""
 
-        with open(tc.dir_path, "r", encoding="UTF-8") as tc_file:
-            tc.data = json.load(tc_file)
-            tc.resource_id = tc.data.get("name", None)
-            tc.display_name = tc.data.get("displayName", None)
-            tc.tags = tc.data.get("tags", None)
-            tc.conversation_turns = tc.data.get(
-                "testCaseConversationTurns", None
-            )
-            tc.test_config = tc.data.get("testConfig", None)
-
-            full_tc_id = f"{stats.agent_id}/testCases/{tc.resource_id}"
-            tc.data["name"] = full_tc_id
-            stats.test_cases.append(tc.data)
-
-            tc_file.close()
+        tc.data = stats.files.load_json(tc.dir_path)
+        tc.resource_id = tc.data.get("name", None)
+        tc.display_name = tc.data.get("displayName", None)
+        tc.tags = tc.data.get("tags", None)
+        tc.conversation_turns = tc.data.get(
+            "testCaseConversationTurns", None
+        )
+        tc.test_config = tc.data.get("testConfig", None)
+
+        full_tc_id = f"{stats.agent_id}/testCases/{tc.resource_id}"
+        tc.data["name"] = full_tc_id
+        stats.index.add_resource(
+            "test_case", full_tc_id, tc.display_name, tc.dir_path,
+            position=len(stats.test_cases))
+        stats.test_cases.append(tc.data)
 
         return stats
 
     def process_test_cases_directory(
             self, agent_local_path: str, stats: types.AgentData):
         """Processing the test cases dir in the JSON package structure."""
-        test_case_paths = self.build_test_case_path_list(agent_local_path)
+        test_case_paths = self.build_test_case_path_list(
+            agent_local_path, stats.files)
         stats.total_test_cases = len(test_case_paths)
 
         for test_case in test_case_paths:
@@ -17,7 +17,9 @@
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Tuple
 
+from dfcx_scrapi.agent_extract import files as files_class
 from dfcx_scrapi.agent_extract import graph as graph_class
+from dfcx_scrapi.agent_extract import index as index_class
 
 
 @dataclass
@@ -187,10 +189,14 @@ class AgentData:
     agent_id: str = None
     entity_types: List[Dict[str, Any]] = field(default_factory=list)
     entity_types_map: Dict[str, Any] = field(default_factory=dict)
+    files: files_class.AgentFiles = field(
+        default_factory=files_class.AgentFiles)
     flow_page_map: Dict[str, Any] = field(default_factory=dict)
     flows: List[Dict[str, Any]] = field(default_factory=list)
     flows_map: Dict[str, Any] = field(default_factory=dict)
     graph: graph_class.Graph = None
+    index: index_class.AgentIndex = field(
+        default_factory=index_class.AgentIndex)
     intents: List[Dict[str, Any]] = field(default_factory=list)
     intents_map: Dict[str, Any] = field(default_factory=dict)
     lang_code: str = "en"
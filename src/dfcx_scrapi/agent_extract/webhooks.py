@@ -14,10 +14,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
-import os
-
-from dfcx_scrapi.agent_extract import common, types
+from dfcx_scrapi.agent_extract import common, files, types
 
 
 class Webhooks:
@@ -27,13 +24,15 @@ class Webhooks:
         self.common = common.Common()
 
     @staticmethod
-    def build_webhook_path_list(agent_local_path: str):
+    def build_webhook_path_list(
+            agent_local_path: str, agent_files: files.AgentFiles = None):
         """Builds a list of webhook file locations."""
         root_dir = agent_local_path + "/webhooks"
+        agent_files = agent_files or files.AgentFiles()
 
         webhook_paths = []
 
-        for webhook_file in os.listdir(root_dir):
+        for webhook_file in agent_files.listdir(root_dir):
             webhook_file_path = f"{root_dir}/{webhook_file}"
             webhook_paths.append(webhook_file_path)
 
@@ -54,20 +53,20 @@ class Webhooks:
             ) -> types.AgentData:
         """Process a single Webhook file."""
 
-        with open(webhook.dir_path, "r", encoding="UTF-8") as webhook_file:
-            webhook.data = json.load(webhook_file)
-            webhook.resource_id = webhook.data.get("name", None)
-            webhook.display_name = webhook.data.get("displayName", None)
-            webhook.service_type = self.get_service_type(webhook)
-
-            timeout_dict = webhook.data.get("timeout", None)
-            if timeout_dict:
-                webhook.timeout = timeout_dict.get("seconds", None)
+        webhook.data = stats.files.load_json(webhook.dir_path)
+        webhook.resource_id = webhook.data.get("name", None)
+        webhook.display_name = webhook.data.get("displayName", None)
+        webhook.service_type = self.get_service_type(webhook)
 
-            webhook_file.close()
+        timeout_dict = webhook.data.get("timeout", None)
+        if timeout_dict:
+            webhook.timeout = timeout_dict.get("seconds", None)
 
         full_webhook_id = f"{stats.agent_id}/webhooks/{webhook.resource_id}"
         webhook.data["name"] = full_webhook_id
+        stats.index.add_resource(
+            "webhook", full_webhook_id, webhook.display_name, webhook.dir_path,
+            position=len(stats.webhooks))
         stats.webhooks.append(webhook.data)
         stats.total_webhooks += 1
 
@@ -81,7 +80,8 @@ class Webhooks:
         - <webhook-name>.json
         """
         # Create a list of all Webhook paths to iter through
-        webhook_paths = self.build_webhook_path_list(agent_local_path)
+        webhook_paths = self.build_webhook_path_list(
+            agent_local_path, stats.files)
 
         for webhook_path in webhook_paths:
             webhook = types.Webhook()
@@ -131,9 +131,7 @@ class Agents(scrapi_base.ScrapiBase):
         request.parent = location_id
 
         client_options = self._set_region(location_id)
-        client = services.agents.AgentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.agents.AgentsClient, client_options)
 
         response = client.list_agents(request)
 
@@ -202,9 +200,7 @@ class Agents(scrapi_base.ScrapiBase):
         request.name = agent_id
 
         client_options = self._set_region(agent_id)
-        client = services.agents.AgentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.agents.AgentsClient, client_options)
 
         response = client.get_agent(request)
 
@@ -339,9 +335,7 @@ class Agents(scrapi_base.ScrapiBase):
         )
 
         client_options = self._set_region(parent)
-        client = services.agents.AgentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.agents.AgentsClient, client_options)
         response = client.create_agent(request)
 
         return response
@@ -375,9 +369,7 @@ class Agents(scrapi_base.ScrapiBase):
         request.language_code = language_code
 
         client_options = self._set_region(agent_id)
-        client = services.agents.AgentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.agents.AgentsClient, client_options)
 
         response = client.validate_agent(request, timeout=timeout)
 
@@ -419,9 +411,7 @@ class Agents(scrapi_base.ScrapiBase):
         request.name = agent_id + "/validationResult"
 
         client_options = self._set_region(agent_id)
-        client = services.agents.AgentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.agents.AgentsClient, client_options)
 
         response = client.get_agent_validation_result(
             request, timeout=timeout
@@ -444,9 +434,7 @@ class Agents(scrapi_base.ScrapiBase):
         request.language_code = language_code
 
         client_options = self._set_region(agent_id)
-        client = services.agents.AgentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.agents.AgentsClient, client_options)
 
         response = client.get_generative_settings(request)
 
@@ -487,9 +475,7 @@ class Agents(scrapi_base.ScrapiBase):
         mask = field_mask_pb2.FieldMask(paths=paths)
 
         client_options = self._set_region(gen_settings.name)
-        client = services.agents.AgentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.agents.AgentsClient, client_options)
 
         response = client.update_generative_settings(
             generative_settings=gen_settings, update_mask=mask
@@ -565,14 +551,13 @@ class Agents(scrapi_base.ScrapiBase):
                 )
 
         client_options = self._set_region(agent_id)
-        client = services.agents.AgentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.agents.AgentsClient, client_options)
         response = client.export_agent(request)
 
         return response.operation.name
 
 
+    @scrapi_base.invalidates_resource_map()
     @scrapi_base.api_call_counter_decorator
     def restore_agent(
         self,
@@ -611,9 +596,7 @@ class Agents(scrapi_base.ScrapiBase):
             )
 
         client_options = self._set_region(agent_id)
-        client = services.agents.AgentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.agents.AgentsClient, client_options)
         response = client.restore_agent(request)
 
         return response.operation.name
@@ -650,13 +633,12 @@ class Agents(scrapi_base.ScrapiBase):
 
         request = types.UpdateAgentRequest(agent=agent, update_mask=mask)
         client_options = self._set_region(agent_id)
-        client = services.agents.AgentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.agents.AgentsClient, client_options)
         response = client.update_agent(request)
 
         return response
 
+    @scrapi_base.invalidates_resource_map()
     @scrapi_base.api_call_counter_decorator
     def delete_agent(
         self, agent_id: str = None, obj: types.Agent = None) -> str:
@@ -678,8 +660,7 @@ class Agents(scrapi_base.ScrapiBase):
 
         request = types.DeleteAgentRequest(name=agent_id)
         client_options = self._set_region(agent_id)
-        client = services.agents.AgentsClient(
-            credentials=self.creds, client_options=client_options)
+        client = self._get_client(services.agents.AgentsClient, client_options)
         client.delete_agent(request)
 
         return f"Agent '{agent_id}' successfully deleted."
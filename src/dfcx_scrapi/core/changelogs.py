@@ -133,9 +133,8 @@ class Changelogs(scrapi_base.ScrapiBase):
                 request.filter = filter_str
 
         client_options = self._set_region(agent_id)
-        client = services.changelogs.ChangelogsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.changelogs.ChangelogsClient, client_options)
 
         response = client.list_changelogs(request)
 
@@ -162,9 +161,8 @@ class Changelogs(scrapi_base.ScrapiBase):
         request.name = changelog_id
 
         client_options = self._set_region(changelog_id)
-        client = services.changelogs.ChangelogsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.changelogs.ChangelogsClient, client_options)
 
         response = client.get_changelog(request)
 
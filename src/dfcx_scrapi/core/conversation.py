@@ -14,12 +14,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import logging
+import os
 import time
 import traceback
 import uuid
-from threading import Thread
-from typing import Any, Dict
+from concurrent import futures
+from typing import Any, Dict, List, Tuple
 
 import pandas as pd
 from google.api_core import exceptions as core_exceptions
@@ -34,6 +36,10 @@ logging.basicConfig(
 
 MAX_RETRIES = 3
 
+# Default quota for Dialogflow CX Text requests per minute. Ref:
+#   https://cloud.google.com/dialogflow/quotas#table
+DEFAULT_REQUESTS_PER_MINUTE = 1200
+
 class DialogflowConversation(scrapi_base.ScrapiBase):
     """Class that wraps the SessionsClient to hold end to end conversations
     and maintain internal session state
@@ -298,33 +304,83 @@ class DialogflowConversation(scrapi_base.ScrapiBase):
 
         self.agent_pages_map = agent_pages_map.reset_index(drop=True)
 
-    def _get_reply_results(self, utterance, page_id, results, i):
+    def _get_reply_results(
+        self, utterance: str, page_id: str) -> Tuple[str, types.Match]:
         """Get results of single text utterance to CX Agent.
 
+        Each request uses a new Session ID without touching the class session,
+        so this method can be called from many worker threads at once.
+
         Args:
           utterance: Text to send to the bot for testing.
           page_id: Specified CX Page to send the utterance request to
-          results: Pandas Dataframe to capture and store the results
-          i: Internal tracking for Python Threading
-        """
 
+        Returns:
+          A tuple of the target page display name and the CX Match.
+        """
         response = self.reply(
-            send_obj={"text": utterance}, current_page=page_id, restart=True
+            send_obj={"text": utterance},
+            current_page=page_id,
+            session_id=str(uuid.uuid4())
         )
 
-        target_page = response["page_name"]
+        return response["page_name"], response["match"]
+
+    @staticmethod
+    def _load_intent_detection_results(
+        results_file: str,
+        utterances: List[str],
+        target_pages: List[str],
+        matches: List[types.Match]) -> int:
+        """Load completed rows from a partial results file.
+
+        Rows are matched to the test set by position and validated by
+        utterance, so a results file can only be resumed against the same
+        test set that created it.
 
-        results["target_page"][i] = target_page
-        results["match"][i] = response["match"]
+        Returns:
+          The number of rows loaded.
+        """
+        if not results_file or not os.path.exists(results_file):
+            return 0
+
+        loaded = 0
+        with open(results_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                i = row["row"]
+                if i >= len(utterances) or utterances[i] != row["utterance"]:
+                    raise ValueError(
+                        f"Results file `{results_file}` does not match the "
+                        f"provided test set at row {i}."
+                    )
+                target_pages[i] = row["target_page"]
+                matches[i] = types.Match.from_json(
+                    row["match"], ignore_unknown_fields=True)
+                loaded += 1
 
-    def _get_intent_detection(self, test_set: pd.DataFrame):
-        """Gets the results of a subset of Intent Detection tests.
+        return loaded
+
+    def _get_intent_detection(
+        self,
+        test_set: pd.DataFrame,
+        max_workers: int = 20,
+        progress_interval: int = 300,
+        results_file: str = None,
+    ):
+        """Gets the results of a set of Intent Detection tests.
+
+        Requests are streamed through a fixed size worker pool, with at most
+        `max_workers * 2` requests queued at a time. Results are collected
+        into preallocated columns as they complete and, if `results_file` is
+        provided, appended to it so an interrupted run can be resumed.
 
         NOTE - This is an internal method used by run_intent_detection to
         manage parallel intent detection requests and should not be used as a
         standalone function.
         """
-
         self._page_id_mapper()
         test_set_mapped = pd.merge(
             test_set,
@@ -337,27 +393,71 @@ class DialogflowConversation(scrapi_base.ScrapiBase):
 
         self._validate_test_set_input(test_set_mapped)
 
-        threads = [None] * len(test_set_mapped)
-        results = {
-            "target_page": [None] * len(test_set_mapped),
-            "match":[None] * len(test_set_mapped),
-        }
-        for i, (utterance, page_id) in enumerate(zip(utterances, page_ids)):
-            threads[i] = Thread(
-                target=self._get_reply_results,
-                args=(utterance, page_id, results, i),
-            )
-            threads[i].start()
+        total = len(test_set_mapped)
+        target_pages = [None] * total
+        matches = [None] * total
+
+        completed = self._load_intent_detection_results(
+            results_file, utterances, target_pages, matches)
+        if completed:
+            logging.info("Resuming with %s completed rows.", completed)
 
-        for _, thread in enumerate(threads):
-            thread.join()
+        pending = (i for i in range(total) if matches[i] is None)
+        results_writer = (
+            open(results_file, "a", encoding="utf-8") # pylint: disable=R1732
+            if results_file else None
+        )
 
-        test_set_mapped["target_page"] = results["target_page"]
-        test_set_mapped["match"] = results["match"]
+        try:
+            with futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+                in_flight = {}
+
+                def submit_next() -> bool:
+                    i = next(pending, None)
+                    if i is None:
+                        return False
+                    future = pool.submit(
+                        self._get_reply_results, utterances[i], page_ids[i])
+                    in_flight[future] = i
+                    return True
+
+                while len(in_flight) < max_workers * 2 and submit_next():
+                    pass
+
+                while in_flight:
+                    done, _ = futures.wait(
+                        in_flight, return_when=futures.FIRST_COMPLETED)
+                    for future in done:
+                        i = in_flight.pop(future)
+                        target_pages[i], matches[i] = future.result()
+                        completed += 1
+
+                        if results_writer and matches[i] is not None:
+                            results_writer.write(json.dumps({
+                                "row": i,
+                                "utterance": utterances[i],
+                                "target_page": target_pages[i],
+                                "match": types.Match.to_json(matches[i]),
+                            }) + "\n")
+
+                        if completed % progress_interval == 0:
+                            if results_writer:
+                                results_writer.flush()
+                            self.progress_bar(completed, total)
+
+                        submit_next()
+
+        finally:
+            if results_writer:
+                results_writer.close()
+
+        self.progress_bar(total, total)
+
+        test_set_mapped["target_page"] = target_pages
+        test_set_mapped["match"] = matches
         test_set_mapped = test_set_mapped.drop(columns=["page_id"])
-        intent_detection = test_set_mapped.copy()
 
-        return intent_detection
+        return test_set_mapped
 
     def restart(self):
         """Starts a new session/conversation for this agent"""
@@ -389,6 +489,7 @@ class DialogflowConversation(scrapi_base.ScrapiBase):
         retries: int = 0,
         current_page: str = None,
         checkpoints: bool = False,
+        session_id: str = None,
     ):
         """Runs intent detection on one utterance and gets the agent reply.
 
@@ -406,6 +507,9 @@ class DialogflowConversation(scrapi_base.ScrapiBase):
           current_page: Specify the page id to start the conversation from
           checkpoints: Boolean flag to enable/disable Checkpoint timer
             debugging. Defaults to False.
+          session_id: (Optional) the Session UUID to use for this request
+            instead of the class session. This does not modify the class
+            session, which makes it safe to use from multiple threads.
 
         Returns:
           A dictionary for the agent reply to to the submitted text.
@@ -429,20 +533,22 @@ class DialogflowConversation(scrapi_base.ScrapiBase):
         if checkpoints:
             self.checkpoint(start=True)
 
-        if restart:
+        if restart and not session_id:
             self.restart()
 
+        if not session_id:
+            session_id = self.session_id
+
         client_options = self._set_region(self.agent_id)
-        session_client = services.sessions.SessionsClient(
-            credentials=self.creds, client_options=client_options
-        )
-        session_path = f"{self.agent_id}/sessions/{self.session_id}"
+        session_client = self._get_client(
+            services.sessions.SessionsClient, client_options)
+        session_path = f"{self.agent_id}/sessions/{session_id}"
 
         if custom_environment:
             logging.info("req using env: %s", custom_environment)
             session_path = (
                 f"{self.agent_id}/environments/"
-                f"{custom_environment}/sessions/{self.session_id}"
+                f"{custom_environment}/sessions/{session_id}"
             )
 
         # Build Query Params object
@@ -466,7 +572,9 @@ class DialogflowConversation(scrapi_base.ScrapiBase):
 
         response = None
         try:
-            response = session_client.detect_intent(request=request)
+            response = self._call_with_quota(
+                self.agent_id, "detect_intent", session_client.detect_intent,
+                request=request)
 
         except core_exceptions.InternalServerError as err:
             logging.error(
@@ -503,7 +611,9 @@ class DialogflowConversation(scrapi_base.ScrapiBase):
             retries += 1
             if retries < MAX_RETRIES:
                 logging.error("retrying")
-                return self.reply(send_obj, restart=restart, retries=retries)
+                return self.reply(
+                    send_obj, restart=restart, retries=retries,
+                    current_page=current_page, session_id=session_id)
             else:
                 logging.error("MAX_RETRIES exceeded")
                 return {
@@ -579,13 +689,19 @@ class DialogflowConversation(scrapi_base.ScrapiBase):
         self,
         test_set: pd.DataFrame,
         chunk_size: int = 300,
-        rate_limit: float = 20,
+        rate_limit: float = None,
+        max_workers: int = 20,
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        results_file: str = None,
     ):
         """Tests a set of utterances for intent detection against a CX Agent.
 
-        This function uses Python Threading to run tests in parallel to
-        expedite intent detection testing for Dialogflow CX agents. The default
-        quota for Text requests/min is 1200. Ref:
+        This function uses a fixed size pool of worker threads to run tests in
+        parallel to expedite intent detection testing for Dialogflow CX agents.
+        Requests are paced by the shared `detect_intent` quota bucket, which
+        backs off automatically when the API returns quota errors, and are
+        capped at `requests_per_minute` for this run. The default quota for
+        Text requests/min is 1200. Ref:
           https://cloud.google.com/dialogflow/quotas#table
 
         Args:
@@ -597,10 +713,17 @@ class DialogflowConversation(scrapi_base.ScrapiBase):
             utterance: str
             inject_parameters (optional): str
             end_user_metadata (optional): str
-          chunk_size: Determines the number of text requests to send in
-            parallel. This should be adjusted based on your test_set size and
-            the Quota limits set for your GCP project. Default is 300.
-          rate_limit: Number of seconds to wait between running test set chunks
+          chunk_size: Number of completed requests between progress updates
+            and results file flushes. Default is 300.
+          rate_limit: Deprecated. Requests are now paced continuously using
+            `requests_per_minute` instead of sleeping between chunks.
+          max_workers: Number of worker threads sending requests. Default
+            is 20.
+          requests_per_minute: Maximum request rate for this run. Default
+            is 1200.
+          results_file: (Optional) path to a JSONL file where completed rows
+            are appended as they finish. If the file already exists, rows
+            recorded in it are skipped so that an interrupted run can resume.
 
         Returns:
           A Pandas DataFrame consisting of the original
@@ -616,15 +739,22 @@ class DialogflowConversation(scrapi_base.ScrapiBase):
               match_type: str
               parameters_set: str
         """
+        if rate_limit is not None:
+            logging.warning(
+                "`rate_limit` is deprecated and ignored, use "
+                "`requests_per_minute` instead."
+            )
 
-        result = pd.DataFrame()
-        for start in range(0, test_set.shape[0], chunk_size):
-            test_set_chunk = test_set.iloc[start : start + chunk_size]
-            result_chunk = self._get_intent_detection(test_set=test_set_chunk)
-            result = pd.concat([result, result_chunk])
-            self.progress_bar(start, test_set.shape[0])
-            time.sleep(rate_limit)
-        self.progress_bar(test_set.shape[0], test_set.shape[0])
+        with self.call_rate_limit(
+            self.agent_id, "detect_intent",
+            rate=requests_per_minute / 60, burst=max_workers
+        ):
+            result = self._get_intent_detection(
+                test_set=test_set,
+                max_workers=max_workers,
+                progress_interval=chunk_size,
+                results_file=results_file,
+            )
 
         result = self._unpack_match(result)
         return result
@@ -17,9 +17,12 @@
 import json
 import logging
 import os
-from typing import Any, Dict, List
+from concurrent import futures
+from typing import Any, Dict, Iterator, List, Tuple
 
 from google.cloud.dialogflowcx_v3beta1 import services, types
+from google.protobuf import timestamp_pb2
+from tqdm import tqdm
 from tqdm.contrib.concurrent import thread_map
 
 from dfcx_scrapi.core import scrapi_base
@@ -31,6 +34,10 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+# How far before the sync watermark conversations are listed again, to
+# catch conversations that become listable late.
+DEFAULT_SYNC_LOOKBACK_SECONDS = 3600
+
 
 class ConversationHistory(scrapi_base.ScrapiBase):
     """Used to get Conversation History Data."""
@@ -63,22 +70,65 @@ class ConversationHistory(scrapi_base.ScrapiBase):
 
         return " ".join(messages)
 
-    def list_conversations(self, agent_id: str):
+    def list_conversations(self, agent_id: str, filter_str: str = None):
         request = types.conversation_history.ListConversationsRequest(
-            parent=agent_id)
+            parent=agent_id, filter=filter_str)
 
         client_options = self._set_region(agent_id)
-        client = services.conversation_history.ConversationHistoryClient(
-            credentials=self.creds, client_options=client_options)
+        client = self._get_client(
+            services.conversation_history.ConversationHistoryClient,
+            client_options)
 
         return list(client.list_conversations(request))
 
+    def list_conversations_pages(
+            self,
+            agent_id: str,
+            page_token: str = None,
+            page_size: int = 100,
+            filter_str: str = None
+            ) -> Iterator[Tuple[List[types.Conversation], str]]:
+        """Lazily page through the conversations of an agent.
+
+        Args:
+          agent_id: the CX Agent ID to list conversations for.
+          page_token: (Optional) the page token to start listing from, as
+            returned alongside a previous page.
+          page_size: (Optional) the number of conversations per page.
+          filter_str: (Optional) the List filter, for example
+            `create_time > "2024-04-21T11:30:00Z"`.
+
+        Yields:
+          A tuple of the conversations in each page and the token of the
+          next page, which is empty for the last page.
+        """
+        client_options = self._set_region(agent_id)
+        client = self._get_client(
+            services.conversation_history.ConversationHistoryClient,
+            client_options)
+
+        while True:
+            # Each page is requested separately so every List call is paced
+            # by the shared quota, not only the first.
+            request = types.conversation_history.ListConversationsRequest(
+                parent=agent_id, page_size=page_size, page_token=page_token,
+                filter=filter_str)
+            pager = self._call_with_quota(
+                agent_id, "read", client.list_conversations, request)
+            page = next(iter(pager.pages))
+            yield list(page.conversations), page.next_page_token
+
+            page_token = page.next_page_token
+            if not page_token:
+                break
+
     def get_conversation(self, conversation_id: str):
         request = types.conversation_history.GetConversationRequest(
             name=conversation_id)
         client_options = self._set_region(conversation_id)
-        client = services.conversation_history.ConversationHistoryClient(
-            credentials=self.creds, client_options=client_options)
+        client = self._get_client(
+            services.conversation_history.ConversationHistoryClient,
+            client_options)
 
         return client.get_conversation(request)
 
@@ -87,9 +137,9 @@ class ConversationHistory(scrapi_base.ScrapiBase):
             name=conversation_id
         )
         client_options = self._set_region(conversation_id)
-        client = services.conversation_history.ConversationHistoryClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.conversation_history.ConversationHistoryClient,
+            client_options)
 
         client.delete_conversation(request)
 
@@ -132,7 +182,12 @@ class ConversationHistory(scrapi_base.ScrapiBase):
         return data
 
     def conversation_history_to_file(self, agent_id: str, filename: str):
-        """Process existing conversation history, with progress bar."""
+        """Process existing conversation history, with progress bar.
+
+        All conversations are held in memory before writing. For agents
+        with a large conversation history, use
+        `stream_conversation_history_to_file` instead.
+        """
 
         convo_ids = [convo.name for convo in self.list_conversations(agent_id)]
 
@@ -150,5 +205,305 @@ class ConversationHistory(scrapi_base.ScrapiBase):
 
         self.write_conversations_to_file(list(results), filename)
 
+    @staticmethod
+    def _load_json_state(filename: str, agent_id: str) -> Dict[str, Any]:
+        """Load a checkpoint or watermark file if it exists for the agent."""
+        if not os.path.exists(filename):
+            return {}
+
+        with open(filename, "r", encoding="utf-8") as f:
+            state = json.load(f)
+
+        if state.get("agent_id") != agent_id:
+            raise ValueError(
+                f"{filename} belongs to agent {state.get('agent_id')}, "
+                f"not {agent_id}.")
+
+        return state
 
+    @staticmethod
+    def _write_json_atomic(filename: str, data: Dict[str, Any]):
+        """Atomically replace a checkpoint or watermark JSON file."""
+        tmp_file = f"{filename}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        os.replace(tmp_file, filename)
+
+    @staticmethod
+    def _latest_start_time(
+            convos: List[types.Conversation], latest: str = None) -> str:
+        """Return the latest start time of `convos` and `latest`."""
+        latest_ts = None
+        if latest:
+            latest_ts = timestamp_pb2.Timestamp()
+            latest_ts.FromJsonString(latest)
+
+        for convo in convos:
+            if "start_time" not in convo:
+                continue
+
+            start_time = convo.start_time.timestamp_pb()
+            if latest_ts is None or (
+                (start_time.seconds, start_time.nanos)
+                > (latest_ts.seconds, latest_ts.nanos)):
+                latest_ts = start_time
+
+        return latest_ts.ToJsonString() if latest_ts else None
+
+    @staticmethod
+    def _timestamp_seconds(rfc3339: str) -> float:
+        """Convert an RFC 3339 timestamp string to seconds since the epoch."""
+        timestamp = timestamp_pb2.Timestamp()
+        timestamp.FromJsonString(rfc3339)
+
+        return timestamp.seconds + timestamp.nanos / 1e9
+
+    @classmethod
+    def _recent_conversations(
+            cls,
+            recent: Dict[str, str],
+            convos: List[types.Conversation],
+            latest: str,
+            lookback_seconds: float) -> Dict[str, str]:
+        """Add `convos` to `recent`, keeping those within the lookback."""
+        recent = dict(recent)
+        for convo in convos:
+            if "start_time" in convo:
+                recent[convo.name] = convo.start_time.timestamp_pb(
+                    ).ToJsonString()
+
+        if not latest:
+            return recent
+
+        cutoff = cls._timestamp_seconds(latest) - lookback_seconds
+        return {
+            name: start_time for name, start_time in recent.items()
+            if cls._timestamp_seconds(start_time) >= cutoff
+        }
+
+    def _export_conversations(
+            self,
+            agent_id: str,
+            filename: str,
+            max_workers: int,
+            page_size: int,
+            checkpoint_file: str,
+            resume: bool,
+            filter_str: str = None,
+            append: bool = False,
+            recent: Dict[str, str] = None,
+            lookback_seconds: float = None
+            ) -> Dict[str, Any]:
+        """Stream conversations to file, see the public callers for details.
+
+        If `lookback_seconds` is set, conversations named in `recent` are
+        skipped, and the conversations written within `lookback_seconds` of
+        the latest start time are returned so the next sync can skip them.
+
+        Returns:
+          A dictionary with the total number of conversations written, the
+          latest conversation start time seen, as an RFC 3339 string, and
+          the recent conversation names mapped to their start times.
+        """
+        checkpoint_file = checkpoint_file or f"{filename}.checkpoint"
+        checkpoint = {}
+        if resume:
+            checkpoint = self._load_json_state(checkpoint_file, agent_id)
+
+        if checkpoint and checkpoint.get("filter") != filter_str:
+            # The page token and file offset belong to a different query.
+            logging.warning(
+                "Ignoring %s, it was saved for a different List filter.",
+                checkpoint_file)
+            checkpoint = {}
+
+        total = checkpoint.get("conversations", 0)
+        latest = checkpoint.get("latest_start_time")
+        recent = checkpoint.get("recent_conversations", recent or {})
+        if checkpoint:
+            logging.info(
+                "Resuming export after %s conversations.", total)
+            os.truncate(filename, checkpoint["file_offset"])
+        else:
+            if not append or not os.path.exists(filename):
+                with open(filename, "w", encoding="utf-8"):
+                    pass
+
+            # Record the starting size before the first page, so that a run
+            # interrupted mid-page truncates back to it on resume.
+            self._write_json_atomic(checkpoint_file, {
+                "agent_id": agent_id,
+                "filter": filter_str,
+                "page_token": None,
+                "file_offset": os.path.getsize(filename),
+                "conversations": total,
+                "latest_start_time": latest,
+                "recent_conversations": recent,
+                })
+
+        def process_conversation(conversation_id: str):
+            """Helper method to process single convo."""
+            current_convo = self._call_with_quota(
+                agent_id, "read", self.get_conversation, conversation_id)
+            return self.process_single_conversation(current_convo)
 
+        pages = self.list_conversations_pages(
+            agent_id, checkpoint.get("page_token"), page_size, filter_str)
+
+        with open(filename, "a", encoding="utf-8") as json_file, \
+            futures.ThreadPoolExecutor(max_workers=max_workers) as executor, \
+            tqdm(desc="Processing Conversations", initial=total) as pbar:
+            for convos, next_page_token in pages:
+                if lookback_seconds is not None:
+                    # Already written by a previous sync's overlap window.
+                    convos = [
+                        convo for convo in convos if convo.name not in recent
+                    ]
+
+                results = [
+                    executor.submit(process_conversation, convo.name)
+                    for convo in convos
+                ]
+                for future in futures.as_completed(results):
+                    json_file.write(json.dumps(future.result()) + "\n")
+                    pbar.update(1)
+
+                json_file.flush()
+                total += len(convos)
+                latest = self._latest_start_time(convos, latest)
+                if lookback_seconds is not None:
+                    recent = self._recent_conversations(
+                        recent, convos, latest, lookback_seconds)
+
+                if not next_page_token:
+                    break
+
+                self._write_json_atomic(checkpoint_file, {
+                    "agent_id": agent_id,
+                    "filter": filter_str,
+                    "page_token": next_page_token,
+                    "file_offset": os.fstat(json_file.fileno()).st_size,
+                    "conversations": total,
+                    "latest_start_time": latest,
+                    "recent_conversations": recent,
+                    })
+
+        if os.path.exists(checkpoint_file):
+            os.remove(checkpoint_file)
+
+        return {
+            "conversations": total,
+            "latest_start_time": latest,
+            "recent_conversations": recent,
+        }
+
+    def stream_conversation_history_to_file(
+            self,
+            agent_id: str,
+            filename: str,
+            max_workers: int = 10,
+            page_size: int = 100,
+            checkpoint_file: str = None,
+            resume: bool = True
+            ) -> int:
+        """Stream conversation history to a JSON Lines file.
+
+        Conversations are listed one page at a time and fetched with bounded
+        concurrency. Each processed conversation is written to `filename`
+        as soon as it completes, so memory use is bounded by a single page.
+
+        After every page, the next page token and the size of the output
+        file are saved to `checkpoint_file`. If an export is interrupted,
+        calling this method again with `resume=True` truncates any partial
+        page from the output file and continues from the saved page token.
+        The checkpoint file is removed once the export completes.
+
+        Args:
+          agent_id: the CX Agent ID to export conversations from.
+          filename: the JSON Lines file to write conversations to.
+          max_workers: (Optional) the maximum number of conversations to
+            fetch at once.
+          page_size: (Optional) the number of conversations per List call.
+          checkpoint_file: (Optional) the checkpoint file path. Defaults to
+            `<filename>.checkpoint`.
+          resume: (Optional) if True, resume from an existing checkpoint.
+            Otherwise the export starts from the beginning.
+
+        Returns:
+          The total number of conversations in the output file.
+        """
+        return self._export_conversations(
+            agent_id, filename, max_workers, page_size, checkpoint_file,
+            resume)["conversations"]
+
+    def sync_conversation_history_to_file(
+            self,
+            agent_id: str,
+            filename: str,
+            max_workers: int = 10,
+            page_size: int = 100,
+            watermark_file: str = None,
+            lookback_seconds: float = DEFAULT_SYNC_LOOKBACK_SECONDS
+            ) -> int:
+        """Incrementally sync new conversation history to a JSON Lines file.
+
+        The latest conversation start time written is stored in
+        `watermark_file` as a high-water mark. On the next run, only
+        conversations created after the watermark minus `lookback_seconds`
+        are listed, using the ConversationHistory List filter, and appended
+        to `filename`. The first run, with no watermark, exports the full
+        history.
+
+        The lookback window catches conversations that only become listable
+        after a later conversation has already advanced the watermark. The
+        names of the conversations written within the window are stored
+        alongside the watermark, so they are not appended twice.
+
+        An interrupted sync resumes the same way as
+        `stream_conversation_history_to_file`, from its own
+        `<filename>.sync.checkpoint` file. A checkpoint saved for a
+        different List filter is ignored. The watermark is only advanced
+        once the sync completes.
+
+        Args:
+          agent_id: the CX Agent ID to sync conversations from.
+          filename: the JSON Lines file to append conversations to.
+          max_workers: (Optional) the maximum number of conversations to
+            fetch at once.
+          page_size: (Optional) the number of conversations per List call.
+          watermark_file: (Optional) the watermark file path. Defaults to
+            `<filename>.watermark`.
+          lookback_seconds: (Optional) how far before the watermark to list
+            conversations again. Defaults to one hour.
+
+        Returns:
+          The number of new conversations appended to `filename`.
+        """
+        watermark_file = watermark_file or f"{filename}.watermark"
+        watermark = self._load_json_state(watermark_file, agent_id)
+
+        filter_str = None
+        latest = watermark.get("latest_start_time")
+        if latest:
+            since = timestamp_pb2.Timestamp()
+            since.FromNanoseconds(int(
+                (self._timestamp_seconds(latest) - lookback_seconds) * 1e9))
+            filter_str = f'create_time > "{since.ToJsonString()}"'
+            logging.info(
+                "Syncing conversations created after %s.",
+                since.ToJsonString())
+
+        result = self._export_conversations(
+            agent_id, filename, max_workers, page_size,
+            f"{filename}.sync.checkpoint", True, filter_str, append=True,
+            recent=watermark.get("recent_conversations", {}),
+            lookback_seconds=lookback_seconds)
+
+        self._write_json_atomic(watermark_file, {
+            "agent_id": agent_id,
+            "latest_start_time": result["latest_start_time"] or latest,
+            "recent_conversations": result["recent_conversations"],
+            })
+
+        return result["conversations"]
@@ -92,9 +92,7 @@ class DataStores(scrapi_base.ScrapiBase):
         client_options = self._client_options_discovery_engine(
             f"projects/{self.project_id}/locations/{location}"
         )
-        client = DataStoreServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(DataStoreServiceClient, client_options)
         request = ListDataStoresRequest(parent=parent)
         page_result = client.list_data_stores(request=request)
 
@@ -107,9 +105,7 @@ class DataStores(scrapi_base.ScrapiBase):
     def get_data_store(self, data_store_id: str) -> DataStore:
         """Get a single Data Store by specified ID."""
         client_options = self._client_options_discovery_engine(data_store_id)
-        client = DataStoreServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(DataStoreServiceClient, client_options)
         request = GetDataStoreRequest(
             name=data_store_id
             )
@@ -140,9 +136,7 @@ class DataStores(scrapi_base.ScrapiBase):
         client_options = self._client_options_discovery_engine(
             f"projects/{self.project_id}/locations/{location}"
         )
-        client = DataStoreServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(DataStoreServiceClient, client_options)
         data_store = DataStore()
         data_store.display_name = display_name
         data_store.industry_vertical = 1
@@ -163,9 +157,7 @@ class DataStores(scrapi_base.ScrapiBase):
     def delete_datastore(self, data_store_id: str):
         """Delete the specified Data Store by ID."""
         client_options = self._client_options_discovery_engine(data_store_id)
-        client = DataStoreServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(DataStoreServiceClient, client_options)
 
         request = DeleteDataStoreRequest(
             name=data_store_id
@@ -194,9 +194,7 @@ class Engines(scrapi_base.ScrapiBase):
         """
         parent = self._build_data_store_parent(location)
         client_options = self._client_options_discovery_engine(parent)
-        client = EngineServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(EngineServiceClient, client_options)
 
         request = CreateEngineRequest(
             parent=parent,
@@ -214,9 +212,7 @@ class Engines(scrapi_base.ScrapiBase):
     def delete_engine(self, engine_id: str) -> Operation:
         """Deletes the specified Engine."""
         client_options = self._client_options_discovery_engine(engine_id)
-        client = EngineServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(EngineServiceClient, client_options)
 
         request = DeleteEngineRequest(
             name=engine_id
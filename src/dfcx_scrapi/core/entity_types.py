@@ -30,6 +30,13 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+BASIC_MODE_COLUMNS = ["display_name", "entity_value", "synonyms"]
+ADVANCED_MODE_COLUMNS = [
+    "entity_type_id", "display_name", "kind", "auto_expansion_mode",
+    "fuzzy_extraction", "redact", "entity_value", "synonyms",
+]
+EXCLUDED_PHRASES_COLUMNS = ["entity_type_id", "display_name", "excluded_phrase"]
+
 
 class EntityTypes(scrapi_base.ScrapiBase):
     """Core Class for CX Entity Type Resource functions."""
@@ -56,10 +63,104 @@ class EntityTypes(scrapi_base.ScrapiBase):
         self.language_code = language_code
 
 
+    @staticmethod
+    def _append_entity_type_rows(
+        obj: types.EntityType,
+        columns: Dict[str, List],
+        index: List[int],
+        explode_synonyms: bool = True):
+        """Append the entity rows of an EntityType proto to column lists.
+
+        Values shared by every row of the Entity Type are repeated with a
+        single list extend per Entity, rather than one row at a time. The
+        index restarts at 0 for each Entity Type.
+        """
+        entity_type_dict = {
+            "entity_type_id": obj.name,
+            "display_name": obj.display_name,
+            "kind": types.EntityType.Kind(obj.kind).name,
+            "auto_expansion_mode": int(obj.auto_expansion_mode),
+            "fuzzy_extraction": obj.enable_fuzzy_extraction,
+            "redact": obj.redact,
+        }
+        entity_type_dict = {
+            key: value for key, value in entity_type_dict.items()
+            if key in columns
+        }
+
+        num_rows = 0
+        for entity in obj.entities:
+            synonyms = list(entity.synonyms)
+            if not synonyms:
+                continue
+
+            values = synonyms if explode_synonyms else [synonyms]
+            for key, value in entity_type_dict.items():
+                columns[key].extend([value] * len(values))
+            columns["entity_value"].extend([entity.value] * len(values))
+            columns["synonyms"].extend(values)
+            index.extend(range(num_rows, num_rows + len(values)))
+            num_rows += len(values)
+
+    @staticmethod
+    def _append_excluded_phrase_rows(
+        obj: types.EntityType, columns: Dict[str, List], index: List[int]):
+        """Append the excluded phrases of an EntityType proto to columns."""
+        excluded_phrases = [phrase.value for phrase in obj.excluded_phrases]
+
+        columns["entity_type_id"].extend(
+            [obj.name] * len(excluded_phrases))
+        columns["display_name"].extend(
+            [obj.display_name] * len(excluded_phrases))
+        columns["excluded_phrase"].extend(excluded_phrases)
+        index.extend(range(len(excluded_phrases)))
+
+    @staticmethod
+    def _entity_types_to_frames(
+        entity_types: List[types.EntityType],
+        mode: str = "basic",
+        explode_synonyms: bool = True):
+        """Build the DataFrames for a list of EntityType protos in one pass.
+
+        Returns:
+          In basic mode, the entity DataFrame. In advanced mode, a tuple of
+          the entity DataFrame and the excluded phrases DataFrame.
+        """
+        if mode not in ["basic", "advanced"]:
+            raise ValueError("Mode types: [basic, advanced]")
+
+        entity_columns = {
+            column: [] for column in (
+                BASIC_MODE_COLUMNS if mode == "basic"
+                else ADVANCED_MODE_COLUMNS)
+        }
+        excl_phrases_columns = {
+            column: [] for column in EXCLUDED_PHRASES_COLUMNS
+        }
+        entity_index = []
+        excl_phrases_index = []
+
+        for obj in entity_types:
+            EntityTypes._append_entity_type_rows(
+                obj, entity_columns, entity_index, explode_synonyms)
+            if mode == "advanced":
+                EntityTypes._append_excluded_phrase_rows(
+                    obj, excl_phrases_columns, excl_phrases_index)
+
+        main_df = pd.DataFrame(entity_columns, index=entity_index)
+        if mode == "basic":
+            return main_df
+
+        excl_phrases_df = pd.DataFrame(
+            excl_phrases_columns, index=excl_phrases_index)
+
+        return main_df, excl_phrases_df
+
     @staticmethod
     def entity_type_proto_to_dataframe(
-        obj: types.EntityType, mode: str = "basic"
-    ):
+        obj: types.EntityType,
+        mode: str = "basic",
+        explode_synonyms: bool = True):
         """Converts an EntityType protobuf object to a Pandas Dataframe.
 
         Args:
@@ -68,6 +169,9 @@ class EntityTypes(scrapi_base.ScrapiBase):
             and its synonyms.
             "advanced" returns entity types and excluded phrases in a
             comprehensive format.
+          explode_synonyms: (Optional) if True, the default, return one row
+            per synonym. If False, return one row per entity value, with all
+            of its synonyms in a list.
 
         Returns:
           In basic mode, a Pandas Dataframe for the entity type object with
@@ -84,51 +188,12 @@ class EntityTypes(scrapi_base.ScrapiBase):
               entity_type_id, display_name, excluded_phrase
         """
         if mode == "basic":
-            main_df = pd.DataFrame()
-
-            entity_type_dict = {}
-            entity_type_dict["display_name"] = obj.display_name
-            for entity in obj.entities:
-                entity_type_dict["entity_value"] = entity.value
-                for synonym in entity.synonyms:
-                    entity_type_dict["synonyms"] = synonym
-                    entity_type_df = pd.DataFrame(entity_type_dict, index=[0])
-                    main_df = pd.concat([main_df, entity_type_df],
-                                        ignore_index=True)
-
-            return main_df
+            return EntityTypes._entity_types_to_frames(
+                [obj], mode, explode_synonyms)
 
         elif mode == "advanced":
-
-            main_df = pd.DataFrame()
-            excl_phrases_df = pd.DataFrame()
-
-            excl_phrases_dict = {
-                "entity_type_id": obj.name,
-                "display_name": obj.display_name,
-            }
-            entity_type_dict = {
-                "entity_type_id": obj.name,
-                "display_name": obj.display_name,
-                "kind": obj.kind.name,
-                "auto_expansion_mode": obj.auto_expansion_mode,
-                "fuzzy_extraction": obj.enable_fuzzy_extraction,
-                "redact": obj.redact,
-            }
-            for entity in obj.entities:
-                entity_type_dict["entity_value"] = entity.value
-                for synonym in entity.synonyms:
-                    entity_type_dict["synonyms"] = synonym
-                    entity_type_df = pd.DataFrame(entity_type_dict, index=[0])
-                    main_df = pd.concat([main_df, entity_type_df],
-                                        ignore_index=True)
-
-            for excluded_phrase in obj.excluded_phrases:
-                excl_phrases_dict["excluded_phrase"] = excluded_phrase.value
-                excl_phrases_dict2df = pd.DataFrame(
-                                          excl_phrases_dict, index=[0])
-                excl_phrases_df = pd.concat([excl_phrases_df,
-                                     excl_phrases_dict2df], ignore_index=True)
+            main_df, excl_phrases_df = EntityTypes._entity_types_to_frames(
+                [obj], mode, explode_synonyms)
 
             return {
                 "entity_types": main_df, "excluded_phrases": excl_phrases_df
@@ -141,7 +206,8 @@ class EntityTypes(scrapi_base.ScrapiBase):
         self,
         agent_id: str = None,
         mode: str = "basic",
-        entity_type_subset: List[str] = None) -> pd.DataFrame:
+        entity_type_subset: List[str] = None,
+        explode_synonyms: bool = True) -> pd.DataFrame:
         """Extracts all Entity Types into a Pandas DataFrame.
 
         Args:
@@ -152,6 +218,10 @@ class EntityTypes(scrapi_base.ScrapiBase):
             comprehensive format.
           entity_type_subset: (Optional) A list of entities to pull
             If it's None, grab all the entity_types
+          explode_synonyms: (Optional) if True, the default, return one row
+            per synonym. If False, return one row per entity value, with all
+            of its synonyms in a list, which is much smaller for large map
+            entity types.
 
         Returns:
           In basic mode, a Pandas Dataframe for all entity types in the agent
@@ -171,36 +241,25 @@ class EntityTypes(scrapi_base.ScrapiBase):
         if not agent_id:
             agent_id = self.agent_id
 
-        entity_types = self.list_entity_types(agent_id)
+        if mode not in ["basic", "advanced"]:
+            raise ValueError("Mode types: [basic, advanced]")
+
+        entity_types = [
+            obj for obj in self.list_entity_types(agent_id, raw=True)
+            if not entity_type_subset
+            or obj.display_name in entity_type_subset
+        ]
+
         if mode == "basic":
-            main_df = pd.DataFrame()
-            for obj in entity_types:
-                if (entity_type_subset and
-                        obj.display_name not in entity_type_subset):
-                    continue
-
-                single_entity_df = self.entity_type_proto_to_dataframe(
-                    obj, mode=mode
-                )
-                main_df = pd.concat([main_df, single_entity_df])
+            main_df = self._entity_types_to_frames(
+                entity_types, mode, explode_synonyms)
             main_df = main_df.sort_values(
                 ["display_name", "entity_value"])
             return main_df
 
-        elif mode == "advanced":
-            main_df = pd.DataFrame()
-            excl_phrases_df = pd.DataFrame()
-            for obj in entity_types:
-                if (entity_type_subset and
-                        obj.display_name not in entity_type_subset):
-                    continue
-                single_entity_dict = self.entity_type_proto_to_dataframe(
-                    obj, mode=mode
-                )
-                main_df = pd.concat(
-                    [main_df, single_entity_dict["entity_types"]])
-                excl_phrases_df = pd.concat(
-                    [excl_phrases_df, single_entity_dict["excluded_phrases"]])
+        else:
+            main_df, excl_phrases_df = self._entity_types_to_frames(
+                entity_types, mode, explode_synonyms)
             type_map = {
                 "auto_expansion_mode": bool,
                 "fuzzy_extraction": bool,
@@ -212,10 +271,8 @@ class EntityTypes(scrapi_base.ScrapiBase):
                 "entity_types": main_df, "excluded_phrases": excl_phrases_df
             }
 
-        else:
-            raise ValueError("Mode types: [basic, advanced]")
-
 
+    @scrapi_base.cached_resource_map("entity_types")
     def get_entities_map(self, agent_id: str = None, reverse=False):
         """Exports Agent Entity Type Names and UUIDs into a user friendly dict.
 
@@ -233,24 +290,27 @@ class EntityTypes(scrapi_base.ScrapiBase):
         if reverse:
             entities_dict = {
                 entity.display_name: entity.name
-                for entity in self.list_entity_types(agent_id)
+                for entity in self.list_entity_types(agent_id, raw=True)
             }
 
         else:
             entities_dict = {
                 entity.name: entity.display_name
-                for entity in self.list_entity_types(agent_id)
+                for entity in self.list_entity_types(agent_id, raw=True)
             }
 
         return entities_dict
 
     @scrapi_base.api_call_counter_decorator
-    def list_entity_types(self, agent_id: str, language_code: str = "en"):
+    def list_entity_types(
+        self, agent_id: str, language_code: str = "en", raw: bool = False):
         """Returns a list of Entity Type objects.
 
         Args:
           agent_id: the formatted CX Agent ID to use
           language_code: Specifies the language of the Entity Types listed
+          raw: (Optional) if True, return the raw protobuf messages instead
+            of proto-plus objects, which are much faster to read from.
 
         Returns:
           List of Entity Type objects
@@ -263,16 +323,17 @@ class EntityTypes(scrapi_base.ScrapiBase):
         request.language_code = language_code
 
         client_options = self._set_region(agent_id)
-        client = services.entity_types.EntityTypesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.entity_types.EntityTypesClient, client_options)
 
         response = client.list_entity_types(request)
 
         entities = []
         for page in response.pages:
-            for entity in page.entity_types:
-                entities.append(entity)
+            if raw:
+                entities.extend(self.raw_proto(page).entity_types)
+            else:
+                entities.extend(page.entity_types)
 
         return entities
 
@@ -291,9 +352,8 @@ class EntityTypes(scrapi_base.ScrapiBase):
             entity_id = self.entity_id
 
         client_options = self._set_region(entity_id)
-        client = services.entity_types.EntityTypesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.entity_types.EntityTypesClient, client_options)
         request = types.entity_type.GetEntityTypeRequest()
         request.name = entity_id
         request.language_code = language_code
@@ -302,6 +362,7 @@ class EntityTypes(scrapi_base.ScrapiBase):
 
         return response
 
+    @scrapi_base.invalidates_resource_map("entity_types")
     @scrapi_base.api_call_counter_decorator
     def create_entity_type(
         self,
@@ -346,9 +407,8 @@ class EntityTypes(scrapi_base.ScrapiBase):
                 setattr(entity_type_obj, key, value)
 
         client_options = self._set_region(agent_id)
-        client = services.entity_types.EntityTypesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.entity_types.EntityTypesClient, client_options)
 
         request = types.entity_type.CreateEntityTypeRequest()
 
@@ -364,6 +424,7 @@ class EntityTypes(scrapi_base.ScrapiBase):
 
         return response
 
+    @scrapi_base.invalidates_resource_map("entity_types")
     @scrapi_base.api_call_counter_decorator
     def update_entity_type(
         self,
@@ -405,9 +466,8 @@ class EntityTypes(scrapi_base.ScrapiBase):
         mask = field_mask_pb2.FieldMask(paths=paths)
 
         client_options = self._set_region(entity_type_id)
-        client = services.entity_types.EntityTypesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.entity_types.EntityTypesClient, client_options)
 
         request = types.entity_type.UpdateEntityTypeRequest()
         request.entity_type = entity_type
@@ -419,6 +479,7 @@ class EntityTypes(scrapi_base.ScrapiBase):
 
         return response
 
+    @scrapi_base.invalidates_resource_map("entity_types")
     @scrapi_base.api_call_counter_decorator
     def delete_entity_type(
         self, entity_id: str = None,
@@ -442,7 +503,7 @@ class EntityTypes(scrapi_base.ScrapiBase):
             entity_id = obj.name
 
         client_options = self._set_region(entity_id)
-        client = services.entity_types.EntityTypesClient(
-            credentials=self.creds, client_options=client_options)
+        client = self._get_client(
+            services.entity_types.EntityTypesClient, client_options)
         req = types.DeleteEntityTypeRequest(name=entity_id, force=force)
         client.delete_entity_type(request=req)
@@ -146,9 +146,8 @@ class Environments(scrapi_base.ScrapiBase):
 
         request.parent = agent_id
         client_options = self._set_region(agent_id)
-        client = services.environments.EnvironmentsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(
+            services.environments.EnvironmentsClient, client_options)
 
         response = client.list_environments(request)
 
@@ -176,9 +175,8 @@ class Environments(scrapi_base.ScrapiBase):
         request = types.environment.GetEnvironmentRequest(
             name=environment_id)
         client_options = self._set_region(environment_id)
-        client = services.environments.EnvironmentsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(
+            services.environments.EnvironmentsClient, client_options)
 
         response = client.get_environment(request)
 
@@ -233,9 +231,8 @@ class Environments(scrapi_base.ScrapiBase):
         request.parent = agent_id
 
         client_options = self._set_region(agent_id)
-        client = services.environments.EnvironmentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.environments.EnvironmentsClient, client_options)
 
         response = client.create_environment(request)
 
@@ -286,9 +283,8 @@ class Environments(scrapi_base.ScrapiBase):
         )
 
         client_options = self._set_region(agent_id)
-        client = services.environments.EnvironmentsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(
+            services.environments.EnvironmentsClient, client_options)
 
         response = client.create_environment(request)
 
@@ -326,9 +322,8 @@ class Environments(scrapi_base.ScrapiBase):
             environment=env, update_mask=mask)
 
         client_options = self._set_region(environment_id)
-        client = services.environments.EnvironmentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.environments.EnvironmentsClient, client_options)
         response = client.update_environment(request)
         return response
 
@@ -347,9 +342,8 @@ class Environments(scrapi_base.ScrapiBase):
         request.name = environment_id
 
         client_options = self._set_region(environment_id)
-        client = services.environments.EnvironmentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.environments.EnvironmentsClient, client_options)
 
         client.delete_environment(request)
 
@@ -378,9 +372,8 @@ class Environments(scrapi_base.ScrapiBase):
         request.flow_version = flow_version
 
         client_options = self._set_region(environment_id)
-        client = services.environments.EnvironmentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.environments.EnvironmentsClient, client_options)
 
         response = client.deploy_flow(request)
 
@@ -406,9 +399,8 @@ class Environments(scrapi_base.ScrapiBase):
         )
 
         client_options = self._set_region(environment_id)
-        client = services.environments.EnvironmentsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(
+            services.environments.EnvironmentsClient, client_options)
 
         response = client.lookup_environment_history(request)
 
@@ -437,9 +429,8 @@ class Environments(scrapi_base.ScrapiBase):
         )
 
         client_options = self._set_region(environment_id)
-        client = services.environments.EnvironmentsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(
+            services.environments.EnvironmentsClient, client_options)
 
         response = client.list_continuous_test_results(request)
 
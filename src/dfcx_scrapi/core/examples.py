@@ -47,9 +47,8 @@ class Examples(scrapi_base.ScrapiBase):
         self.agent_id = agent_id
 
         client_options = self._set_region(self.agent_id)
-        self.examples_client = services.examples.ExamplesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        self.examples_client = self._get_client(
+            services.examples.ExamplesClient, client_options)
         self.playbooks_client = playbooks.Playbooks(agent_id=self.agent_id)
         self.tools_client = tools.Tools(agent_id=self.agent_id)
 
@@ -210,9 +209,8 @@ class Examples(scrapi_base.ScrapiBase):
         request.language_code = language_code
 
         client_options = self._set_region(playbook_id)
-        client = services.examples.ExamplesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.examples.ExamplesClient, client_options)
         response = client.list_examples(request)
 
         cx_examples = []
@@ -236,9 +234,8 @@ class Examples(scrapi_base.ScrapiBase):
             example_id = self.example_id
 
         client_options = self._set_region(example_id)
-        client = services.examples.ExamplesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.examples.ExamplesClient, client_options)
 
         response = client.get_example(name=example_id)
 
@@ -273,9 +270,8 @@ class Examples(scrapi_base.ScrapiBase):
             setattr(example, key, value)
 
         client_options = self._set_region(playbook_id)
-        client = services.examples.ExamplesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.examples.ExamplesClient, client_options)
 
         response = client.create_example(parent=playbook_id, example=example)
 
@@ -311,9 +307,8 @@ class Examples(scrapi_base.ScrapiBase):
         mask = field_mask_pb2.FieldMask(paths=paths)
 
         client_options = self._set_region(example_id)
-        client = services.examples.ExamplesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.examples.ExamplesClient, client_options)
 
         response = client.update_example(example=example, update_mask=mask)
 
@@ -336,6 +331,6 @@ class Examples(scrapi_base.ScrapiBase):
             example_id = obj.name
 
         client_options = self._set_region(example_id)
-        client = services.examples.ExamplesClient(
-            credentials=self.creds, client_options=client_options)
+        client = self._get_client(
+            services.examples.ExamplesClient, client_options)
         client.delete_example(name=example_id)
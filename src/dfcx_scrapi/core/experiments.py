@@ -73,9 +73,8 @@ class ScrapiExperiments(scrapi_base.ScrapiBase):
         request = types.experiment.ListExperimentsRequest()
         request.parent = environment_path
         client_options = self._set_region(environment_path)
-        client = services.experiments.ExperimentsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(
+            services.experiments.ExperimentsClient, client_options)
         response = client.list_experiments(request)
         blob = scrapi_base.ScrapiBase.cx_object_to_json(response)
 
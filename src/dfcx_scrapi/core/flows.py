@@ -15,7 +15,6 @@
 # limitations under the License.
 
 import logging
-import time
 from typing import Dict, List
 
 from google.cloud.dialogflowcx_v3beta1 import services, types
@@ -109,6 +108,7 @@ class Flows(scrapi_base.ScrapiBase):
 
         return nlu_settings
 
+    @scrapi_base.cached_resource_map("flows")
     def get_flows_map(self, agent_id: str = None, reverse=False):
         """Exports Agent Flow Names and UUIDs into a user friendly dict.
 
@@ -136,8 +136,9 @@ class Flows(scrapi_base.ScrapiBase):
 
         return flows_dict
 
+    @scrapi_base.cached_resource_map("flows", "pages")
     def get_flow_page_map(
-            self, agent_id: str, rate_limit: float = 1.0
+            self, agent_id: str, rate_limit: float = None
             ) -> Dict[str, Dict[str, str]]:
         """Exports a user friendly dict containing Flows, Pages, and IDs
         This method builds on top of `get_flows_map` and builds out a nested
@@ -152,21 +153,24 @@ class Flows(scrapi_base.ScrapiBase):
 
         Args:
           agent_id: the formatted CX Agent ID to use
+          rate_limit: (Optional) seconds to wait between List Pages calls. If
+            not provided, calls are paced by the shared `read` quota bucket
+            for the agent's project and region. List Pages calls for each
+            Flow are made concurrently within that rate.
 
         Returns:
           Dictionary containing Flow Names/UUIDs and Page Names/UUIDs
         """
-        flow_page_map = {}
-
         flows_map = self.get_flows_map(agent_id, reverse=True)
+        with self.call_rate_limit(
+            agent_id, "read", seconds_between_calls=rate_limit):
+            pages_maps = self._fan_out(
+                flows_map.values(), self.pages.get_pages_map, reverse=True)
 
-        for flow in flows_map:
-            pages_map = self.pages.get_pages_map(
-                flows_map[flow], reverse=True)
-            flow_page_map[flow] = {"id": flows_map[flow], "pages": pages_map}
-            time.sleep(rate_limit)
-
-        return flow_page_map
+        return {
+            flow: {"id": flow_id, "pages": pages_maps[flow_id]}
+            for flow, flow_id in flows_map.items()
+        }
 
     @scrapi_base.api_call_counter_decorator
     def train_flow(self, flow_id: str) -> str:
@@ -187,9 +191,7 @@ class Flows(scrapi_base.ScrapiBase):
         request.name = flow_id
 
         client_options = self._set_region(flow_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, client_options)
 
         response = client.train_flow(request)
 
@@ -222,9 +224,7 @@ class Flows(scrapi_base.ScrapiBase):
             request.language_code = self.language_code
 
         client_options = self._set_region(agent_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, client_options)
         response = client.list_flows(request)
 
         flows = []
@@ -275,13 +275,12 @@ class Flows(scrapi_base.ScrapiBase):
         request.language_code = language_code
 
         client_options = self._set_region(flow_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, client_options)
         response = client.get_flow(request)
 
         return response
 
+    @scrapi_base.invalidates_resource_map("flows", "pages")
     @scrapi_base.api_call_counter_decorator
     def create_flow(
         self,
@@ -324,13 +323,12 @@ class Flows(scrapi_base.ScrapiBase):
             request.flow = flow_obj
 
         client_options = self._set_region(agent_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, client_options)
         response = client.create_flow(request)
 
         return response
 
+    @scrapi_base.invalidates_resource_map("flows")
     @scrapi_base.api_call_counter_decorator
     def update_flow(
         self, flow_id: str, obj: types.Flow = None, **kwargs
@@ -358,9 +356,7 @@ class Flows(scrapi_base.ScrapiBase):
         mask = field_mask_pb2.FieldMask(paths=paths)
 
         client_options = self._set_region(flow_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, client_options)
         response = client.update_flow(flow=flow, update_mask=mask)
 
         return response
@@ -407,9 +403,7 @@ class Flows(scrapi_base.ScrapiBase):
         request.flow_uri = gcs_path
 
         client_options = self._set_region(flow_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, client_options)
         response = client.export_flow(request)
 
         return response.result()
@@ -430,13 +424,12 @@ class Flows(scrapi_base.ScrapiBase):
         request.include_referenced_flows = ref_flows
 
         client_options = self._set_region(flow_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, client_options)
         response = client.export_flow(request)
 
         return (response.result()).flow_content
 
+    @scrapi_base.invalidates_resource_map("flows", "pages")
     @scrapi_base.api_call_counter_decorator
     def import_flow(
         self,
@@ -478,14 +471,13 @@ class Flows(scrapi_base.ScrapiBase):
         request.import_option = import_option
 
         client_options = self._set_region(agent_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.flows.FlowsClient, client_options)
 
         response = client.import_flow(request)
 
         return response
 
+    @scrapi_base.invalidates_resource_map("flows", "pages")
     @scrapi_base.api_call_counter_decorator
     def delete_flow(
         self, flow_id: str = None, obj: types.Flow = None, force: bool = False
@@ -506,7 +498,6 @@ class Flows(scrapi_base.ScrapiBase):
             flow_id = obj.name
 
         client_options = self._set_region(flow_id)
-        client = services.flows.FlowsClient(
-            credentials=self.creds, client_options=client_options)
+        client = self._get_client(services.flows.FlowsClient, client_options)
         req = types.DeleteFlowRequest(name=flow_id, force=force)
         client.delete_flow(request=req)
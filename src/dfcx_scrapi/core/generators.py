@@ -102,6 +102,7 @@ class Generators(scrapi_base.ScrapiBase):
 
         return kwargs
 
+    @scrapi_base.cached_resource_map("generators")
     def get_generators_map(
         self, agent_id: str, reverse=False
     ) -> Dict[str, str]:
@@ -128,9 +129,8 @@ class Generators(scrapi_base.ScrapiBase):
         request.parent = agent_id
 
         client_options = self._set_region(agent_id)
-        client = services.generators.GeneratorsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.generators.GeneratorsClient, client_options)
 
         response = client.list_generators(request)
 
@@ -156,14 +156,14 @@ class Generators(scrapi_base.ScrapiBase):
         request.name = generator_id
 
         client_options = self._set_region(generator_id)
-        client = services.generators.GeneratorsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.generators.GeneratorsClient, client_options)
 
         response = client.get_generator(request)
 
         return response
 
+    @scrapi_base.invalidates_resource_map("generators")
     @scrapi_base.api_call_counter_decorator
     def create_generator(
         self,
@@ -186,15 +186,15 @@ class Generators(scrapi_base.ScrapiBase):
             generator_obj.placeholders = self.__get_placeholders(prompt)
 
         client_options = self._set_region(agent_id)
-        client = services.generators.GeneratorsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.generators.GeneratorsClient, client_options)
         response = client.create_generator(
             parent=agent_id, generator=generator_obj
         )
 
         return response
 
+    @scrapi_base.invalidates_resource_map("generators")
     @scrapi_base.api_call_counter_decorator
     def update_generator(
         self, generator_id: str, obj: types.Generator = None, **kwargs
@@ -234,15 +234,15 @@ class Generators(scrapi_base.ScrapiBase):
         mask = field_mask_pb2.FieldMask(paths=paths)
 
         client_options = self._set_region(generator_id)
-        client = services.generators.GeneratorsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.generators.GeneratorsClient, client_options)
         response = client.update_generator(
             generator=generator, update_mask=mask
         )
 
         return response
 
+    @scrapi_base.invalidates_resource_map("generators")
     @scrapi_base.api_call_counter_decorator
     def delete_generator(self, generator_id: str):
         """Deletes the specified Dialogflow CX Generator.
@@ -253,7 +253,6 @@ class Generators(scrapi_base.ScrapiBase):
               generators/<GENERATOR ID>
         """
         client_options = self._set_region(generator_id)
-        client = services.generators.GeneratorsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.generators.GeneratorsClient, client_options)
         client.delete_generator(name=generator_id)
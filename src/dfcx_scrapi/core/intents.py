@@ -18,6 +18,7 @@ import logging
 from collections import defaultdict
 from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 from google.cloud.dialogflowcx_v3beta1 import services, types
 from google.protobuf import field_mask_pb2
@@ -31,6 +32,14 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+BASIC_MODE_COLUMNS = ["display_name", "training_phrase"]
+ADVANCED_MODE_COLUMNS = [
+    "name", "display_name", "description", "priority",
+    "is_fallback", "labels", "id", "repeat_count",
+    "training_phrase_idx", "text", "text_idx",
+    "parameter_id", "entity_type", "is_list", "redact",
+]
+
 
 class Intents(scrapi_base.ScrapiBase):
     """Core Class for CX Intent Resource functions."""
@@ -98,34 +107,35 @@ class Intents(scrapi_base.ScrapiBase):
 
         return intent_dict
 
-    def process_basic_mode_proto(self, obj: types.Intent):
-        """Process Intent Proto in basic mode."""
-        intent_df = pd.DataFrame(columns=["display_name", "training_phrase"])
+    @staticmethod
+    def _append_row(columns: Dict[str, List], row: Dict[str, str]):
+        """Append a row to column lists, filling missing keys with NaN."""
+        for key, values in columns.items():
+            values.append(row.get(key, np.nan))
 
+    @staticmethod
+    def _columns_to_df(columns: Dict[str, List]) -> pd.DataFrame:
+        """Build a DataFrame from column lists in a single step."""
+        return pd.DataFrame(columns, dtype=object)
+
+    def _append_basic_mode_rows(
+        self, obj: types.Intent, columns: Dict[str, List]):
+        """Append the basic mode rows of an Intent Proto to column lists."""
         intent_dict = {"display_name": str(obj.display_name)}
 
         if not obj.training_phrases:
-            intent_df = self.concat_dict_and_df(intent_df, intent_dict)
+            self._append_row(columns, intent_dict)
 
         else:
             for phrase in obj.training_phrases:
                 parts_list = [part.text for part in phrase.parts]
                 intent_dict.update({"training_phrase": "".join(parts_list)})
 
-                intent_df = self.concat_dict_and_df(intent_df, intent_dict)
-
-        return intent_df
-
-    def process_advanced_mode_proto(self, obj: types.Intent):
-        """Process Intent Proto in advanced mode."""
-
-        intent_df = pd.DataFrame(columns=[
-            "name", "display_name", "description", "priority",
-            "is_fallback", "labels", "id", "repeat_count",
-            "training_phrase_idx", "text", "text_idx",
-            "parameter_id", "entity_type", "is_list", "redact",
-            ])
+                self._append_row(columns, intent_dict)
 
+    def _append_advanced_mode_rows(
+        self, obj: types.Intent, columns: Dict[str, List]):
+        """Append the advanced mode rows of an Intent Proto to column lists."""
         intent_dict = {
             "name": str(obj.name),
             "display_name": str(obj.display_name),
@@ -151,7 +161,7 @@ class Intents(scrapi_base.ScrapiBase):
         }
         # training phrases
         if not obj.training_phrases:
-            intent_df = self.concat_dict_and_df(intent_df, intent_dict)
+            self._append_row(columns, intent_dict)
 
         else:
             for tp_count, phrase in enumerate(obj.training_phrases):
@@ -164,9 +174,21 @@ class Intents(scrapi_base.ScrapiBase):
                     intent_dict = self.parse_phrase_for_parameter_info(
                         intent_dict, params_dict, part, part_count)
 
-                    intent_df = self.concat_dict_and_df(intent_df, intent_dict)
+                    self._append_row(columns, intent_dict)
 
-        return intent_df
+    def process_basic_mode_proto(self, obj: types.Intent):
+        """Process Intent Proto in basic mode."""
+        columns = {column: [] for column in BASIC_MODE_COLUMNS}
+        self._append_basic_mode_rows(obj, columns)
+
+        return self._columns_to_df(columns)
+
+    def process_advanced_mode_proto(self, obj: types.Intent):
+        """Process Intent Proto in advanced mode."""
+        columns = {column: [] for column in ADVANCED_MODE_COLUMNS}
+        self._append_advanced_mode_rows(obj, columns)
+
+        return self._columns_to_df(columns)
 
     @staticmethod
     def modify_training_phrase_df(
@@ -355,7 +377,8 @@ class Intents(scrapi_base.ScrapiBase):
         """Converts an intent protobuf object to a Pandas DataFrame.
 
         Args:
-          obj (types.Intent): the intent protobuf object
+          obj (types.Intent): the intent protobuf object, either proto-plus
+            or raw, as returned by `list_intents(raw=True)`
           mode (str):
             "basic" returns display name and training phrase as plain text.
             "advanced" returns training phrases broken out by parts
@@ -370,7 +393,7 @@ class Intents(scrapi_base.ScrapiBase):
             training_phrase_idx, text, text_idx,
             parameter_id, entity_type, is_list, redact
         """
-        if not isinstance(obj, types.Intent):
+        if not isinstance(obj, (types.Intent, types.Intent.pb())):
             raise ValueError("obj should be Intent.")
 
         if mode == "basic":
@@ -384,6 +407,7 @@ class Intents(scrapi_base.ScrapiBase):
 
         return intent_df
 
+    @scrapi_base.cached_resource_map("intents")
     def get_intents_map(self, agent_id: str = None, reverse: bool = False):
         """Exports Agent Intent Names and UUIDs into a user friendly dict.
 
@@ -400,13 +424,13 @@ class Intents(scrapi_base.ScrapiBase):
         if reverse:
             intents_dict = {
                 intent.display_name: intent.name
-                for intent in self.list_intents(agent_id)
+                for intent in self.list_intents(agent_id, raw=True)
             }
 
         else:
             intents_dict = {
                 intent.name: intent.display_name
-                for intent in self.list_intents(agent_id)
+                for intent in self.list_intents(agent_id, raw=True)
             }
 
         return intents_dict
@@ -415,13 +439,16 @@ class Intents(scrapi_base.ScrapiBase):
     def list_intents(
         self,
         agent_id: str = None,
-        language_code: str = None) -> List[types.Intent]:
+        language_code: str = None,
+        raw: bool = False) -> List[types.Intent]:
         """Exports List of all intents in specific CX Agent.
 
         Args:
           agent_id: the formatted CX Agent ID to use
           language_code: Language code of the intents being uploaded. Ref:
             https://cloud.google.com/dialogflow/cx/docs/reference/language
+          raw: (Optional) if True, return the raw protobuf messages instead
+            of proto-plus objects, which are much faster to read from.
 
         Returns:
           List of Intent objects
@@ -436,15 +463,16 @@ class Intents(scrapi_base.ScrapiBase):
 
         request.parent = agent_id
         client_options = self._set_region(agent_id)
-        client = services.intents.IntentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.intents.IntentsClient, client_options)
         response = client.list_intents(request)
 
         intents = []
         for page in response.pages:
-            for intent in page.intents:
-                intents.append(intent)
+            if raw:
+                intents.extend(self.raw_proto(page).intents)
+            else:
+                intents.extend(page.intents)
 
         return intents
 
@@ -452,13 +480,16 @@ class Intents(scrapi_base.ScrapiBase):
     def get_intent(
         self,
         intent_id: str = None,
-        language_code: str = None) -> types.Intent:
+        language_code: str = None,
+        raw: bool = False) -> types.Intent:
         """Get a single Intent object based on specific CX Intent ID.
 
         Args:
           intent_id: the properly formatted CX Intent ID
           language_code: Language code of the intents being uploaded. Ref:
             https://cloud.google.com/dialogflow/cx/docs/reference/language
+          raw: (Optional) if True, return the raw protobuf message instead
+            of a proto-plus object, which is much faster to read from.
 
         Returns:
           A single Intent object
@@ -473,14 +504,17 @@ class Intents(scrapi_base.ScrapiBase):
 
         request.name = intent_id
         client_options = self._set_region(intent_id)
-        client = services.intents.IntentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.intents.IntentsClient, client_options)
 
         response = client.get_intent(request)
 
+        if raw:
+            return self.raw_proto(response)
+
         return response
 
+    @scrapi_base.invalidates_resource_map("intents")
     @scrapi_base.api_call_counter_decorator
     def create_intent(
         self,
@@ -528,14 +562,14 @@ class Intents(scrapi_base.ScrapiBase):
         request.intent = intent_obj
 
         client_options = self._set_region(agent_id)
-        client = services.intents.IntentsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(
+            services.intents.IntentsClient, client_options)
 
         response = client.create_intent(request)
 
         return response
 
+    @scrapi_base.invalidates_resource_map("intents")
     @scrapi_base.api_call_counter_decorator
     def update_intent(
         self,
@@ -572,9 +606,8 @@ class Intents(scrapi_base.ScrapiBase):
         mask = field_mask_pb2.FieldMask(paths=paths)
 
         client_options = self._set_region(intent_id)
-        client = services.intents.IntentsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(
+            services.intents.IntentsClient, client_options)
 
         request = types.intent.UpdateIntentRequest()
 
@@ -588,6 +621,7 @@ class Intents(scrapi_base.ScrapiBase):
 
         return response
 
+    @scrapi_base.invalidates_resource_map("intents")
     @scrapi_base.api_call_counter_decorator
     def delete_intent(self, intent_id: str = None, obj: types.Intent = None):
         """Deletes an intent by Intent ID.
@@ -603,8 +637,8 @@ class Intents(scrapi_base.ScrapiBase):
             intent_id = obj.name
 
         client_options = self._set_region(intent_id)
-        client = services.intents.IntentsClient(
-            client_options=client_options, credentials=self.creds)
+        client = self._get_client(
+            services.intents.IntentsClient, client_options)
         client.delete_intent(name=intent_id)
 
     def bulk_intent_to_df(
@@ -658,16 +692,24 @@ class Intents(scrapi_base.ScrapiBase):
         if mode not in ["basic", "advanced"]:
             raise ValueError("Mode types: [basic, advanced]")
 
-        main_df = pd.DataFrame()
-        intents = self.list_intents(agent_id, language_code=language_code)
+        if mode == "basic":
+            columns = {column: [] for column in BASIC_MODE_COLUMNS}
+            append_rows = self._append_basic_mode_rows
+        else:
+            columns = {column: [] for column in ADVANCED_MODE_COLUMNS}
+            append_rows = self._append_advanced_mode_rows
+
+        intents = self.list_intents(
+            agent_id, language_code=language_code, raw=True)
 
+        # Rows for every Intent are collected in column lists, and the
+        # DataFrame is built once at the end.
         for obj in intents:
             if (intent_subset) and (obj.display_name not in intent_subset):
                 continue
-            intent_df = self.intent_proto_to_dataframe(obj, mode=mode)
-            main_df = pd.concat([main_df, intent_df], ignore_index=True)
+            append_rows(obj, columns)
 
-        return main_df
+        return self._columns_to_df(columns)
 
     def intents_to_df_cosine_prep(
         self,
@@ -14,10 +14,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import dataclasses
+import heapq
 import logging
-from typing import Dict
+import random
+import threading
+import time
+from concurrent import futures
+from typing import Any, Dict, Iterable, List
 
-from google.api_core import grpc_helpers, operations_v1
+from google.api_core import exceptions
+from google.cloud.dialogflowcx_v3beta1 import services
+from google.cloud.discoveryengine import DataStoreServiceClient
+from google.longrunning import operations_pb2
 
 from dfcx_scrapi.core import scrapi_base
 
@@ -28,9 +38,39 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+DEFAULT_INITIAL_DELAY = 1.0  # Seconds before the second poll of an LRO
+DEFAULT_MAX_DELAY = 30.0  # Max seconds between polls of an LRO
+DEFAULT_MULTIPLIER = 1.5  # Growth of the delay after each poll
+DEFAULT_LRO_TIMEOUT = 900.0  # Seconds to wait in await_lro and await_lros
+
+# Discovery Engine LROs are served from a different API endpoint.
+_DISCOVERY_ENGINE_RESOURCES = ["/collections/", "/dataStores/", "/engines/"]
+
+
+@dataclasses.dataclass(order=True)
+class _PendingLro:
+    """An LRO waiting for its next poll, ordered by poll time."""
+    next_poll: float
+    name: str = dataclasses.field(compare=False)
+    future: futures.Future = dataclasses.field(compare=False)
+    delay: float = dataclasses.field(compare=False)
+    deadline: float = dataclasses.field(compare=False, default=None)
+
+
 class Operations(scrapi_base.ScrapiBase):
     """Core class for Operations functions, primarily used to
     extract LRO information on long running jobs for CX.
+
+    LROs can be waited on without blocking with `submit`, which returns a
+    `concurrent.futures.Future` for the finished operation. All submitted
+    LROs are polled from one background thread, with an exponential backoff
+    and jitter between polls of each LRO, so many exports, restores or
+    imports can be tracked at once.
+
+    Args:
+      initial_delay: (Optional) seconds between the first and second poll.
+      max_delay: (Optional) the max seconds between polls of an LRO.
+      multiplier: (Optional) the growth of the delay after each poll.
     """
 
     def __init__(
@@ -38,7 +78,10 @@ class Operations(scrapi_base.ScrapiBase):
         creds_path: str = None,
         creds_dict: Dict = None,
         creds=None,
-        scope=False
+        scope=False,
+        initial_delay: float = DEFAULT_INITIAL_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        multiplier: float = DEFAULT_MULTIPLIER,
     ):
         super().__init__(
             creds_path=creds_path,
@@ -47,8 +90,34 @@ class Operations(scrapi_base.ScrapiBase):
             scope=scope
         )
 
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+
+        self._pending: List[_PendingLro] = []
+        self._pending_cond = threading.Condition()
+        self._poller = None
+
+    @staticmethod
+    def lro_name(lro: Any) -> str:
+        """Get the LRO name from a name, Operation proto or api_core Operation.
+        """
+        if isinstance(lro, str):
+            return lro
+
+        return getattr(lro, "operation", lro).name
+
+    def _get_operations_client(self, lro: str):
+        """Get the pooled API client that serves the LRO's endpoint."""
+        if any(resource in lro for resource in _DISCOVERY_ENGINE_RESOURCES):
+            client_options = self._client_options_discovery_engine(lro)
+            return self._get_client(DataStoreServiceClient, client_options)
+
+        client_options = self._set_region(lro)
+        return self._get_client(services.agents.AgentsClient, client_options)
+
     @scrapi_base.api_call_counter_decorator
-    def get_lro(self, lro: str):
+    def get_lro(self, lro: str) -> operations_pb2.Operation:
         """Used to retrieve the status of LROs for Dialogflow CX.
 
         Args:
@@ -59,17 +128,168 @@ class Operations(scrapi_base.ScrapiBase):
         Returns:
           Response status and payload from LRO
         """
-        location = lro.split("/")[3]
-        if location != "global":
-            host = f"{location}-dialogflow.googleapis.com"
-        else:
-            host = "dialogflow.googleapis.com"
-
-        channel = grpc_helpers.create_channel(
-            host,
-            credentials=self.creds
+        lro = self.lro_name(lro)
+        client = self._get_operations_client(lro)
+
+        return client.get_operation(request={"name": lro})
+
+    @staticmethod
+    def _resolve(future: futures.Future, result=None, error=None):
+        """Complete a Future, unless it was cancelled in the meantime."""
+        try:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        except futures.InvalidStateError:
+            pass
+
+    def _poll(self, pending: _PendingLro):
+        """Poll an LRO once, then resolve its Future or schedule it again."""
+        if pending.future.cancelled():
+            return
+
+        try:
+            operation = self.get_lro(pending.name)
+        except exceptions.GoogleAPICallError as err:
+            if not scrapi_base.should_retry(err):
+                self._resolve(pending.future, error=err)
+                return
+            operation = None
+        except Exception as err: # pylint: disable=W0718
+            self._resolve(pending.future, error=err)
+            return
+
+        if operation is not None and operation.done:
+            if operation.HasField("error"):
+                self._resolve(pending.future, error=exceptions.from_grpc_status(
+                    operation.error.code, operation.error.message,
+                    response=operation))
+            else:
+                self._resolve(pending.future, result=operation)
+            return
+
+        now = time.monotonic()
+        if pending.deadline is not None and now >= pending.deadline:
+            self._resolve(pending.future, error=TimeoutError(
+                f"LRO not done after timeout: {pending.name}"))
+            return
+
+        next_poll = now + pending.delay * random.uniform(0.5, 1.0)
+        if pending.deadline is not None:
+            next_poll = min(next_poll, pending.deadline)
+
+        pending.next_poll = next_poll
+        pending.delay = min(pending.delay * self.multiplier, self.max_delay)
+        with self._pending_cond:
+            heapq.heappush(self._pending, pending)
+
+    def _run_poller(self):
+        """Poll pending LROs as they come due, until none are left."""
+        while True:
+            with self._pending_cond:
+                if not self._pending:
+                    self._poller = None
+                    return
+
+                wait_time = self._pending[0].next_poll - time.monotonic()
+                if wait_time > 0:
+                    self._pending_cond.wait(wait_time)
+                    continue
+
+                pending = heapq.heappop(self._pending)
+
+            self._poll(pending)
+
+    def submit(self, lro: Any, timeout: float = None) -> futures.Future:
+        """Start waiting on an LRO without blocking.
+
+        Args:
+          lro: the LRO name, or an Operation returned by an API client.
+          timeout: (Optional) seconds after which the Future fails with a
+            TimeoutError. The LRO itself keeps running. If not provided, the
+            LRO is polled until it is done.
+
+        Returns:
+          A Future for the finished `operations_pb2.Operation`. It fails with
+          the matching GoogleAPICallError if the LRO finishes with an error.
+          Cancelling the Future stops polling. Use `asyncio.wrap_future` or
+          `await_lro_async` to await it from a coroutine.
+        """
+        now = time.monotonic()
+        future = futures.Future()
+        pending = _PendingLro(
+            next_poll=now,
+            name=self.lro_name(lro),
+            future=future,
+            delay=self.initial_delay,
+            deadline=now + timeout if timeout is not None else None,
         )
-        client = operations_v1.OperationsClient(channel)
-        response = client.get_operation(lro)
 
-        return response
+        with self._pending_cond:
+            heapq.heappush(self._pending, pending)
+            if self._poller is None:
+                self._poller = threading.Thread(
+                    target=self._run_poller, name="lro-poller", daemon=True)
+                self._poller.start()
+            self._pending_cond.notify()
+
+        return future
+
+    def submit_many(
+        self, lros: Iterable[Any], timeout: float = None
+    ) -> Dict[str, futures.Future]:
+        """Start waiting on many LROs. See `submit` for details.
+
+        Returns:
+          A dictionary of LRO name to Future, in the order of `lros`.
+        """
+        return {
+            self.lro_name(lro): self.submit(lro, timeout) for lro in lros
+        }
+
+    def await_lro(
+        self, lro: Any, timeout: float = DEFAULT_LRO_TIMEOUT
+    ) -> operations_pb2.Operation:
+        """Block until an LRO is done.
+
+        Args:
+          lro: the LRO name, or an Operation returned by an API client.
+          timeout: (Optional) the max seconds to wait. Pass None to wait
+            until the LRO is done.
+
+        Returns:
+          The finished Operation.
+
+        Raises:
+          TimeoutError: if the LRO is not done after `timeout` seconds.
+          GoogleAPICallError: if the LRO finished with an error.
+        """
+        return self.submit(lro, timeout).result()
+
+    def await_lros(
+        self, lros: Iterable[Any], timeout: float = DEFAULT_LRO_TIMEOUT
+    ) -> Dict[str, operations_pb2.Operation]:
+        """Block until all LROs are done, polling them concurrently.
+
+        If any LRO fails or times out, the others are no longer polled and
+        the error is raised.
+
+        Returns:
+          A dictionary of LRO name to finished Operation.
+        """
+        lro_futures = self.submit_many(lros, timeout)
+        try:
+            return {
+                name: future.result() for name, future in lro_futures.items()
+            }
+        except BaseException:
+            for future in lro_futures.values():
+                future.cancel()
+            raise
+
+    async def await_lro_async(
+        self, lro: Any, timeout: float = DEFAULT_LRO_TIMEOUT
+    ) -> operations_pb2.Operation:
+        """Await an LRO from a coroutine. See `await_lro` for details."""
+        return await asyncio.wrap_future(self.submit(lro, timeout))
@@ -80,6 +80,7 @@ class Pages(scrapi_base.ScrapiBase):
 
         return pages_map
 
+    @scrapi_base.cached_resource_map("pages")
     def get_pages_map(
         self, flow_id: str = None, reverse=False
     ) -> Dict[str, str]:
@@ -100,13 +101,13 @@ class Pages(scrapi_base.ScrapiBase):
         if reverse:
             pages_dict = {
                 page.display_name: page.name
-                for page in self.list_pages(flow_id)
+                for page in self.list_pages(flow_id, raw=True)
             }
 
         else:
             pages_dict = {
                 page.name: page.display_name
-                for page in self.list_pages(flow_id)
+                for page in self.list_pages(flow_id, raw=True)
             }
 
         pages_dict = self._add_generic_pages_to_map(
@@ -119,7 +120,8 @@ class Pages(scrapi_base.ScrapiBase):
     def list_pages(
         self,
         flow_id: str = None,
-        language_code: str = None) -> List[gcdc_page.Page]:
+        language_code: str = None,
+        raw: bool = False) -> List[gcdc_page.Page]:
         """Get a List of all pages for the specified Flow ID.
 
         Args:
@@ -128,6 +130,8 @@ class Pages(scrapi_base.ScrapiBase):
             majority of contents of a Page is language agnostic, the contents
             in the "Agent Says" and similar parts of a Page are affected by
             language code.
+          raw: (Optional) if True, return the raw protobuf messages instead
+            of proto-plus objects, which are much faster to read from.
 
         Returns:
           A List of CX Page objects for the specific Flow ID
@@ -142,24 +146,27 @@ class Pages(scrapi_base.ScrapiBase):
             request.language_code = self.language_code
 
         client_options = self._set_region(flow_id)
-        client = pages.PagesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(pages.PagesClient, client_options)
         response = client.list_pages(request)
 
         cx_pages = []
         for page in response.pages:
-            for cx_page in page.pages:
-                cx_pages.append(cx_page)
+            if raw:
+                cx_pages.extend(self.raw_proto(page).pages)
+            else:
+                cx_pages.extend(page.pages)
 
         return cx_pages
 
     @scrapi_base.api_call_counter_decorator
-    def get_page(self, page_id: str = None) -> gcdc_page.Page:
+    def get_page(
+        self, page_id: str = None, raw: bool = False) -> gcdc_page.Page:
         """Get a single CX Page object based on the provided Page ID.
 
         Args:
           page_id: a properly formatted CX Page ID
+          raw: (Optional) if True, return the raw protobuf message instead
+            of a proto-plus object, which is much faster to read from.
 
         Returns:
           A single CX Page Object
@@ -168,14 +175,16 @@ class Pages(scrapi_base.ScrapiBase):
             page_id = self.page_id
 
         client_options = self._set_region(page_id)
-        client = pages.PagesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(pages.PagesClient, client_options)
 
         response = client.get_page(name=page_id)
 
+        if raw:
+            return self.raw_proto(response)
+
         return response
 
+    @scrapi_base.invalidates_resource_map("pages")
     @scrapi_base.api_call_counter_decorator
     def create_page(
         self, flow_id: str = None, obj: gcdc_page.Page = None, **kwargs
@@ -202,14 +211,13 @@ class Pages(scrapi_base.ScrapiBase):
             setattr(page, key, value)
 
         client_options = self._set_region(flow_id)
-        client = pages.PagesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(pages.PagesClient, client_options)
 
         response = client.create_page(parent=flow_id, page=page)
 
         return response
 
+    @scrapi_base.invalidates_resource_map("pages")
     @scrapi_base.api_call_counter_decorator
     def update_page(
         self, page_id: str = None, obj: gcdc_page.Page = None, **kwargs
@@ -237,14 +245,13 @@ class Pages(scrapi_base.ScrapiBase):
         mask = field_mask_pb2.FieldMask(paths=paths)
 
         client_options = self._set_region(page_id)
-        client = pages.PagesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(pages.PagesClient, client_options)
 
         response = client.update_page(page=page, update_mask=mask)
 
         return response
 
+    @scrapi_base.invalidates_resource_map("pages")
     @scrapi_base.api_call_counter_decorator
     def delete_page(
         self, page_id: str = None,
@@ -266,7 +273,6 @@ class Pages(scrapi_base.ScrapiBase):
             page_id = obj.name
 
         client_options = self._set_region(page_id)
-        client = pages.PagesClient(
-            credentials=self.creds, client_options=client_options)
+        client = self._get_client(pages.PagesClient, client_options)
         req = gcdc_page.DeletePageRequest(name=page_id, force=force)
         client.delete_page(request=req)
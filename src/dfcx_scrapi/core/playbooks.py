@@ -52,12 +52,10 @@ class Playbooks(scrapi_base.ScrapiBase):
         self.agent_id = agent_id
 
         client_options = self._set_region(self.agent_id)
-        self.playbooks_client = services.playbooks.PlaybooksClient(
-            credentials=self.creds, client_options=client_options
-        )
-        self.agents_client = services.agents.AgentsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        self.playbooks_client = self._get_client(
+            services.playbooks.PlaybooksClient, client_options)
+        self.agents_client = self._get_client(
+            services.agents.AgentsClient, client_options)
 
         self.playbooks_map = playbooks_map
 
@@ -176,6 +174,7 @@ class Playbooks(scrapi_base.ScrapiBase):
 
         return response
 
+    @scrapi_base.cached_resource_map("playbooks")
     def get_playbooks_map(self, agent_id: str, reverse=False):
         """Exports Agent Playbook Names and UUIDs into a user friendly dict.
 
@@ -244,6 +243,7 @@ class Playbooks(scrapi_base.ScrapiBase):
 
         return response
 
+    @scrapi_base.invalidates_resource_map("playbooks")
     @scrapi_base.api_call_counter_decorator
     def create_playbook(
         self,
@@ -281,6 +281,7 @@ class Playbooks(scrapi_base.ScrapiBase):
 
         return response
 
+    @scrapi_base.invalidates_resource_map("playbooks")
     @scrapi_base.api_call_counter_decorator
     def update_playbook(
         self,
@@ -315,6 +316,7 @@ class Playbooks(scrapi_base.ScrapiBase):
 
         return response
 
+    @scrapi_base.invalidates_resource_map("playbooks")
     @scrapi_base.api_call_counter_decorator
     def delete_playbook(
         self, playbook_id: str = None, obj: types.Playbook = None):
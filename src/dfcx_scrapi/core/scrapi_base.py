@@ -14,15 +14,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+import copy
 import functools
+import hashlib
+import inspect
+import itertools
 import json
 import logging
+import os
 import re
 import threading
 import time
+import weakref
 from collections import defaultdict
-from typing import Any, Dict, Iterable, List, Optional
+from concurrent import futures
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import proto
 import pydantic
 import requests
 import vertexai
@@ -33,7 +42,7 @@ from google.auth.transport.requests import Request
 from google.cloud.dialogflowcx_v3beta1 import types
 from google.genai import types as genai_types
 from google.oauth2 import service_account
-from google.protobuf import field_mask_pb2, json_format, struct_pb2
+from google.protobuf import field_mask_pb2, json_format, message, struct_pb2
 from proto.marshal.collections import maps, repeated
 from vertexai.generative_models import (
     GenerativeModel,
@@ -80,9 +89,314 @@ GLOBAL_SCOPES = [
     "https://www.googleapis.com/auth/dialogflow",
     ]
 
+# Maximum concurrent calls made by `ScrapiBase._fan_out`.
+DEFAULT_FAN_OUT_WORKERS = 8
+
+# Default token bucket settings per API method family, in requests per
+# second. These are starting points only; each bucket adapts its rate with
+# AIMD based on TooManyRequests responses from the API.
+QUOTA_FAMILY_DEFAULTS = {
+    "read": {"rate": 5.0, "burst": 5, "max_rate": 20.0},
+    "write": {"rate": 1.0, "burst": 1, "max_rate": 5.0},
+    "detect_intent": {"rate": 10.0, "burst": 10, "max_rate": 100.0},
+    "default": {"rate": 2.0, "burst": 2, "max_rate": 10.0},
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket with an AIMD adaptive refill rate.
+
+    Each successful call increases the rate additively by `rate_increase`
+    up to `max_rate`. Each TooManyRequests response multiplies the rate by
+    `rate_decrease` down to `min_rate` and drains the bucket.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: float = None,
+        max_rate: float = None,
+        rate_increase: float = 0.1,
+        rate_decrease: float = 0.5,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0.")
+
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.min_rate = min_rate if min_rate else min(rate, 0.1)
+        self.max_rate = max_rate if max_rate else rate
+        self.rate_increase = rate_increase
+        self.rate_decrease = rate_decrease
+
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+    def record_success(self):
+        """Additively increase the rate after a successful call."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.rate_increase)
+
+    def record_throttle(self):
+        """Multiplicatively decrease the rate after a throttled call."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.rate_decrease)
+            self._tokens = 0.0
+            self._last = time.monotonic()
+
+
+class QuotaManager:
+    """Registry of TokenBuckets keyed by (project, method family, region).
+
+    A single QuotaManager is shared by all ScrapiBase subclasses, so that
+    concurrent callers in the same process draw from the same quota.
+    """
+
+    def __init__(self, max_retries: int = 5):
+        self.max_retries = max_retries
+        self._buckets: Dict[Tuple[str, str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def get_bucket(self, key: Tuple[str, str, str]) -> TokenBucket:
+        """Get or lazily create the TokenBucket for a quota key."""
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            return bucket
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                family = key[1]
+                settings = QUOTA_FAMILY_DEFAULTS.get(
+                    family, QUOTA_FAMILY_DEFAULTS["default"])
+                bucket = TokenBucket(**settings)
+                self._buckets[key] = bucket
+
+        return bucket
+
+    def configure(self, key: Tuple[str, str, str], **kwargs) -> TokenBucket:
+        """Replace the TokenBucket for a quota key with new settings.
+
+        Args:
+          key: The (project, method family, region) quota key.
+          **kwargs: Arguments passed to TokenBucket, for example `rate`,
+            `burst` and `max_rate`.
+        """
+        bucket = TokenBucket(**kwargs)
+        with self._lock:
+            self._buckets[key] = bucket
+
+        return bucket
+
+    def reset(self):
+        """Drop all TokenBuckets so they are rebuilt from the defaults."""
+        with self._lock:
+            self._buckets.clear()
+
+    def call(self, key: Tuple[str, str, str], func, *args, **kwargs):
+        """Call `func` once a token is available for the quota key.
+
+        TooManyRequests errors reduce the bucket rate and the call is retried
+        up to `max_retries` times before the error is raised.
+        """
+        bucket = self.get_bucket(key)
+        attempts = 0
+        while True:
+            bucket.acquire()
+            try:
+                result = func(*args, **kwargs)
+            except exceptions.TooManyRequests:
+                bucket.record_throttle()
+                attempts += 1
+                if attempts > self.max_retries:
+                    raise
+                logging.warning(
+                    "Quota exceeded for %s, retrying at %.2f requests/sec.",
+                    key, bucket.rate)
+                continue
+
+            bucket.record_success()
+            return result
+
+
+class ResourceMapCache:
+    """Per-agent cache of resource maps with TTL and optional persistence.
+
+    Entries are keyed by the map method and its arguments, and tagged with
+    the agent they belong to and the resource types they were built from, so
+    that a create, update or delete of one resource type only invalidates the
+    maps that depend on it.
+
+    Entries are not refreshed when resources are changed outside of this
+    process, so the cache is disabled by default. Enable it with
+    `ScrapiBase.set_resource_map_cache`.
+
+    Args:
+      ttl: Seconds an entry stays valid. A ttl of 0 disables the cache.
+      cache_path: (Optional) path to a JSON file used to persist entries
+        across processes. Existing entries are loaded on init.
+    """
+
+    def __init__(self, ttl: float = 0, cache_path: str = None):
+        self.ttl = ttl
+        self.cache_path = cache_path
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+        if cache_path and os.path.exists(cache_path):
+            self.load()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @staticmethod
+    def _agent_from_resource_id(resource_id: str) -> str:
+        parts = resource_id.split("/")
+        if len(parts) >= 6 and parts[4] == "agents":
+            return "/".join(parts[:6])
+
+        return resource_id
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.time() - entry["created"] < self.ttl:
+                self.hits += 1
+                return entry["value"]
+
+            if entry:
+                del self._entries[key]
+            self.misses += 1
+
+            return None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        resource_types: Iterable[str],
+        resource_id: str):
+        """Store a value for the agent that owns `resource_id`."""
+        with self._lock:
+            self._entries[key] = {
+                "created": time.time(),
+                "resource_types": list(resource_types),
+                "agent_id": self._agent_from_resource_id(resource_id),
+                "value": value,
+            }
+            if self.cache_path:
+                self.save()
+
+    def invalidate(
+        self,
+        resource_types: Iterable[str] = None,
+        resource_id: str = None):
+        """Drop cached maps for the given resource types and agent.
+
+        Args:
+          resource_types: (Optional) resource types that changed. If not
+            provided, maps for every resource type are dropped.
+          resource_id: (Optional) any resource ID within the agent that
+            changed. If not provided, maps for every agent are dropped.
+        """
+        resource_types = set(resource_types or [])
+        agent_id = (
+            self._agent_from_resource_id(resource_id) if resource_id else None
+        )
+
+        with self._lock:
+            for key in list(self._entries):
+                entry = self._entries[key]
+                if agent_id and entry["agent_id"] != agent_id:
+                    continue
+                if resource_types and not resource_types.intersection(
+                    entry["resource_types"]):
+                    continue
+                del self._entries[key]
+
+            if self.cache_path:
+                self.save()
+
+    def clear(self):
+        """Drop all entries and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            if self.cache_path:
+                self.save()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit, miss and entry counts for the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
+
+    def save(self):
+        """Write all entries to `cache_path`."""
+        with self._lock:
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+
+    def load(self):
+        """Load entries from `cache_path`, skipping any that have expired."""
+        with open(self.cache_path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+
+        now = time.time()
+        with self._lock:
+            self._entries.update({
+                key: entry for key, entry in entries.items()
+                if now - entry["created"] < self.ttl
+            })
+
+
 class ScrapiBase:
     """Core Class for managing Auth and other shared functions."""
 
+    # Process-wide registry of API clients, shared by all ScrapiBase
+    # subclasses. Keyed by (client class, api_endpoint, quota project,
+    # credential identity) so that each unique channel is only built once
+    # per process. Entries are reference counted by the instances using them
+    # and closed once the last of those instances is garbage collected.
+    _client_pool: Dict[Tuple[Any, ...], Any] = {}
+    _client_pool_refs: Dict[Tuple[Any, ...], set] = {}
+    _client_pool_tokens = itertools.count()
+    _client_pool_lock = threading.Lock()
+
+    # Process-wide quota manager, shared by all ScrapiBase subclasses.
+    quota_manager = QuotaManager()
+
+    # Process-wide cache of resource maps, shared by all ScrapiBase
+    # subclasses. Disabled until enabled with `set_resource_map_cache`.
+    resource_map_cache = ResourceMapCache()
+
     def __init__(
         self,
         creds_path: str = None,
@@ -96,6 +410,8 @@ class ScrapiBase:
         if scope:
             self.scopes += scope
 
+        self._creds_path = creds_path
+
         if creds:
             self.creds = creds
             self.creds.refresh(Request())
@@ -124,6 +440,29 @@ class ScrapiBase:
         self.agent_id = agent_id
         self.api_calls_dict = defaultdict(int)
 
+    @staticmethod
+    def set_resource_map_cache(
+        ttl: float = 300, cache_path: str = None) -> ResourceMapCache:
+        """Enable, reconfigure or disable the shared resource map cache.
+
+        When enabled, `get_*_map` results are reused for up to `ttl` seconds.
+        Changes made through this library invalidate the affected maps, but
+        changes made elsewhere, such as in the console or another process,
+        are not seen until the entry expires.
+
+        Args:
+          ttl: Seconds an entry stays valid. A ttl of 0 disables the cache.
+          cache_path: (Optional) path to a JSON file used to persist entries
+            across processes.
+
+        Returns:
+          The new ResourceMapCache shared by all ScrapiBase subclasses.
+        """
+        ScrapiBase.resource_map_cache = ResourceMapCache(
+            ttl=ttl, cache_path=cache_path)
+
+        return ScrapiBase.resource_map_cache
+
     @staticmethod
     def _set_region(resource_id: str):
         """Different regions have different API endpoints
@@ -203,21 +542,30 @@ class ScrapiBase:
     @staticmethod
     def pbuf_to_dict(pbuf):
         """Extractor of json from a protobuf"""
-        blobstr = json_format.MessageToJson(
-            pbuf
-        )
-        blob = json.loads(blobstr)
-        return blob
+        return json_format.MessageToDict(pbuf)
+
+    @staticmethod
+    def raw_proto(cx_object):
+        """Get the raw protobuf message wrapped by a proto-plus object.
+
+        Reading fields from the raw message skips the proto-plus marshal,
+        which wraps every nested message and container on each access.
+        Raw messages are returned unchanged.
+        """
+        if isinstance(cx_object, proto.Message):
+            return type(cx_object).pb(cx_object)
+
+        return cx_object
 
     @staticmethod
     def cx_object_to_json(cx_object):
         """Response objects have a magical _pb field attached"""
-        return ScrapiBase.pbuf_to_dict(cx_object._pb)  # pylint: disable=W0212
+        return ScrapiBase.pbuf_to_dict(ScrapiBase.raw_proto(cx_object))
 
     @staticmethod
     def cx_object_to_dict(cx_object):
         """Response objects have a magical _pb field attached"""
-        return ScrapiBase.pbuf_to_dict(cx_object._pb)  # pylint: disable=W0212
+        return ScrapiBase.pbuf_to_dict(ScrapiBase.raw_proto(cx_object))
 
     @staticmethod
     def extract_payload(msg):
@@ -726,6 +1074,10 @@ class ScrapiBase:
         return repeated_list
 
     def recurse_proto_marshal_to_dict(self, marshal_object):
+        if isinstance(marshal_object, message.Message):
+            return json_format.MessageToDict(
+                marshal_object, preserving_proto_field_name=True)
+
         new_dict = {}
         for k, v in marshal_object.items():
             if isinstance(v, maps.MapComposite):
@@ -736,6 +1088,280 @@ class ScrapiBase:
 
         return new_dict
 
+    def _creds_identity(self) -> Tuple[Any, ...]:
+        """Build a stable identity for this instance's credentials.
+
+        Separately built credential objects for the same account and scopes
+        resolve to the same identity, so their instances share clients. The
+        object itself is only used when no account can be determined.
+        """
+        creds = self.creds
+        refresh_token = getattr(creds, "refresh_token", None)
+        account = (
+            getattr(creds, "service_account_email", None)
+            or getattr(self, "_creds_path", None)
+            or (
+                hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+                if isinstance(refresh_token, str) else None
+            )
+        )
+        if not isinstance(account, str) or account == "default":
+            account = id(creds)
+
+        scopes = getattr(creds, "scopes", None) or getattr(self, "scopes", [])
+
+        return (type(creds).__name__, account, tuple(sorted(scopes or [])))
+
+    @staticmethod
+    def _client_pool_key(
+        client_class: Any,
+        client_options: Optional[Dict[str, str]],
+        creds_identity: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        """Build the registry key for a client class, endpoint and creds."""
+        client_options = client_options or {}
+        return (
+            client_class,
+            client_options.get("api_endpoint"),
+            client_options.get("quota_project_id"),
+            creds_identity,
+        )
+
+    @staticmethod
+    def _close_client(client: Any):
+        """Close the transport of a client, logging any failure."""
+        transport = getattr(client, "transport", None)
+        if transport is None:
+            return
+        try:
+            transport.close()
+        except Exception as err: # pylint: disable=W0718
+            logging.warning("Unable to close client transport: %s", err)
+
+    @staticmethod
+    def _release_client(key: Tuple[Any, ...], token: int):
+        """Drop one owner of a pooled client, closing it after the last."""
+        with ScrapiBase._client_pool_lock:
+            refs = ScrapiBase._client_pool_refs.get(key)
+            if not refs or token not in refs:
+                return
+
+            refs.discard(token)
+            if refs:
+                return
+
+            del ScrapiBase._client_pool_refs[key]
+            client = ScrapiBase._client_pool.pop(key, None)
+
+        if client is not None:
+            ScrapiBase._close_client(client)
+
+    def _get_client(
+        self,
+        client_class: Any,
+        client_options: Optional[Dict[str, str]] = None):
+        """Get a cached API client, building it on first use.
+
+        Clients are shared across all ScrapiBase subclasses in the process,
+        so repeated calls to the same service, endpoint and credential
+        identity reuse the same underlying gRPC channel instead of opening a
+        new one. The client is closed once every instance that used it has
+        been garbage collected.
+
+        Args:
+          client_class: The API client class to build, for example
+            `services.intents.IntentsClient`.
+          client_options: The client options dictionary as returned by
+            `_set_region` or `_client_options_discovery_engine`.
+
+        Returns:
+          An instance of `client_class`.
+        """
+        key = self._client_pool_key(
+            client_class, client_options, self._creds_identity())
+        owned = self.__dict__.setdefault("_client_pool_owned", {})
+        client = ScrapiBase._client_pool.get(key)
+        if client is not None and owned.get(key) in (
+            ScrapiBase._client_pool_refs.get(key, ())):
+            return client
+
+        with ScrapiBase._client_pool_lock:
+            client = ScrapiBase._client_pool.get(key)
+            if client is None:
+                client = client_class(
+                    credentials=self.creds, client_options=client_options
+                )
+                ScrapiBase._client_pool[key] = client
+
+            refs = ScrapiBase._client_pool_refs.setdefault(key, set())
+            if owned.get(key) not in refs:
+                token = next(ScrapiBase._client_pool_tokens)
+                owned[key] = token
+                refs.add(token)
+                weakref.finalize(self, ScrapiBase._release_client, key, token)
+
+        return client
+
+    @classmethod
+    def close_clients(cls):
+        """Close the transports of all cached clients and clear the pool."""
+        with ScrapiBase._client_pool_lock:
+            clients = list(ScrapiBase._client_pool.values())
+            ScrapiBase._client_pool.clear()
+            ScrapiBase._client_pool_refs.clear()
+
+        for client in clients:
+            ScrapiBase._close_client(client)
+
+    @staticmethod
+    def _get_quota_key(
+        resource_id: str, method_family: str = "default"
+        ) -> Tuple[str, str, str]:
+        """Build the (project, method family, region) key for a resource."""
+        parts = resource_id.split("/")
+        if len(parts) < 4:
+            raise ValueError(
+                "Resource ID must start with `projects/<Project ID>/"
+                f"locations/<Location ID>`: {resource_id}")
+
+        return (parts[1], method_family, parts[3])
+
+    @staticmethod
+    def _resolve_rate(
+        rate: float = None, seconds_between_calls: float = None) -> float:
+        """Resolve a request rate given as a rate or a delay between calls."""
+        if seconds_between_calls:
+            rate = 1.0 / seconds_between_calls
+
+        if not rate:
+            raise ValueError(
+                "One of rate or seconds_between_calls must be set.")
+
+        return rate
+
+    def set_quota_rate(
+        self,
+        resource_id: str,
+        method_family: str = "default",
+        rate: float = None,
+        seconds_between_calls: float = None,
+        **kwargs) -> TokenBucket:
+        """Set the shared request rate for a project, region and method family.
+
+        This reconfigures the process-wide bucket used by every ScrapiBase
+        instance. To limit the rate of a single operation, use
+        `call_rate_limit` instead.
+
+        Args:
+          resource_id: Any resource ID in the target project and region.
+          method_family: One of `read`, `write`, `detect_intent` or `default`.
+          rate: The request rate in requests per second. If `max_rate` is not
+            provided, the rate is fixed and will not adapt upwards.
+          seconds_between_calls: Alternative to `rate`, given as the number
+            of seconds to wait between calls.
+          **kwargs: Additional TokenBucket arguments such as `burst` and
+            `max_rate`.
+        """
+        rate = self._resolve_rate(rate, seconds_between_calls)
+        key = self._get_quota_key(resource_id, method_family)
+        return self.quota_manager.configure(key, rate=rate, **kwargs)
+
+    @contextlib.contextmanager
+    def call_rate_limit(
+        self,
+        resource_id: str,
+        method_family: str = "default",
+        rate: float = None,
+        seconds_between_calls: float = None,
+        burst: int = 1):
+        """Cap the request rate of this instance's calls within the block.
+
+        The limit is layered on top of the shared quota bucket, which is left
+        unchanged, so it can only slow calls down and has no effect on other
+        instances or on calls made after the block exits.
+
+        Args:
+          resource_id: Any resource ID in the target project and region.
+          method_family: One of `read`, `write`, `detect_intent` or `default`.
+          rate: The maximum request rate in requests per second. If neither
+            `rate` nor `seconds_between_calls` is set, no limit is applied.
+          seconds_between_calls: Alternative to `rate`, given as the number
+            of seconds to wait between calls.
+          burst: The number of calls that may be made back to back.
+        """
+        if not rate and not seconds_between_calls:
+            yield None
+            return
+
+        rate = self._resolve_rate(rate, seconds_between_calls)
+        key = self._get_quota_key(resource_id, method_family)
+        limits = self.__dict__.setdefault("_call_rate_limits", {})
+        previous = limits.get(key)
+        limits[key] = TokenBucket(rate=rate, burst=burst)
+        try:
+            yield limits[key]
+        finally:
+            if previous is None:
+                limits.pop(key, None)
+            else:
+                limits[key] = previous
+
+    def _call_with_quota(
+        self, resource_id: str, method_family: str, func, *args, **kwargs):
+        """Call `func` through the shared quota bucket for `resource_id`.
+
+        Any limit set with `call_rate_limit` is acquired first.
+        """
+        key = self._get_quota_key(resource_id, method_family)
+        limiter = self.__dict__.get("_call_rate_limits", {}).get(key)
+        if limiter is not None:
+            limiter.acquire()
+
+        return self.quota_manager.call(key, func, *args, **kwargs)
+
+    def _fan_out(
+        self,
+        parent_ids: Iterable[str],
+        func,
+        method_family: str = "read",
+        max_workers: int = DEFAULT_FAN_OUT_WORKERS,
+        **kwargs) -> Dict[str, Any]:
+        """Call `func` once per parent ID concurrently, sharing the quota.
+
+        Each call is made as `func(parent_id, **kwargs)` through the shared
+        quota bucket for the parent's project, region and `method_family`,
+        so the total request rate stays within quota regardless of the
+        number of workers.
+
+        Args:
+          parent_ids: The parent resource IDs to fan out over, for example a
+            list of Flow IDs.
+          func: The callable to run for each parent, typically a List method
+            such as `Pages.list_pages`.
+          method_family: The quota family used to pace the calls.
+          max_workers: The maximum number of calls in flight at once.
+          **kwargs: Additional keyword arguments passed to every call.
+
+        Returns:
+          A dictionary of parent ID to result, in the order of `parent_ids`.
+        """
+        parent_ids = list(dict.fromkeys(parent_ids))
+        if not parent_ids:
+            return {}
+
+        max_workers = max(1, min(max_workers, len(parent_ids)))
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = {
+                parent_id: executor.submit(
+                    self._call_with_quota, parent_id, method_family, func,
+                    parent_id, **kwargs)
+                for parent_id in parent_ids
+            }
+
+            return {
+                parent_id: future.result()
+                for parent_id, future in results.items()
+            }
+
     def get_api_calls_details(self) -> Dict[str, int]:
         """The number of API calls corresponding to each method.
 
@@ -781,6 +1407,86 @@ def api_call_counter_decorator(func):
     return wrapper
 
 
+def _find_resource_id(values: Iterable[Any]) -> Optional[str]:
+    """Find the first CX resource ID in a set of argument values."""
+    for value in values:
+        name = getattr(value, "name", value)
+        if isinstance(name, str) and name.startswith("projects/"):
+            return name
+
+    return None
+
+def cached_resource_map(*resource_types: str):
+    """Decorator that caches a `get_*_map` method in the ResourceMapCache.
+
+    Any argument left as None is resolved from the attribute of the same
+    name on the instance, for example `agent_id` or `flow_id`, before the
+    cache key is built. The key also includes the instance's credential
+    identity, so callers with different credentials never share entries.
+    """
+    def decorate(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = self.resource_map_cache
+            if not cache.enabled:
+                return func(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            call_args = {
+                name: getattr(self, name, None) if value is None else value
+                for name, value in bound.arguments.items()
+                if name != "self"
+            }
+
+            resource_id = _find_resource_id(call_args.values())
+            if not resource_id:
+                return func(self, *args, **kwargs)
+
+            key = json.dumps([
+                func.__qualname__,
+                self._creds_identity() if hasattr(self, "creds") else None,
+                getattr(self, "language_code", None),
+                sorted(call_args.items()),
+            ], default=str)
+
+            value = cache.get(key)
+            if value is None:
+                value = func(self, **call_args)
+                cache.set(key, value, resource_types, resource_id)
+
+            # Callers are free to mutate the map they get back.
+            return copy.deepcopy(value)
+
+        return wrapper
+
+    return decorate
+
+def invalidates_resource_map(*resource_types: str):
+    """Decorator that drops cached maps after a resource is changed.
+
+    The agent is resolved from the first CX resource ID, or resource object
+    with a `name`, found in the arguments, falling back to `self.agent_id`.
+    If no resource types are provided, maps of every type are dropped.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                resource_id = _find_resource_id(
+                    list(args) + list(kwargs.values())
+                ) or getattr(self, "agent_id", None)
+                self.resource_map_cache.invalidate(
+                    resource_types, resource_id)
+
+        return wrapper
+
+    return decorate
+
 def should_retry(err: exceptions.GoogleAPICallError) -> bool:
   """Helper function for deciding whether we should retry the error or not."""
   return isinstance(err, (exceptions.TooManyRequests, exceptions.ServerError))
@@ -364,10 +364,7 @@ class Search(scrapi_base.ScrapiBase):
             self, datastore_id: str, page_size: int = 1000) -> List[Document]:
         """List all documents in the provided datastore."""
         client_options = self._client_options_discovery_engine(datastore_id)
-        client = DocumentServiceClient(
-            credentials=self.creds,
-            client_options=client_options
-        )
+        client = self._get_client(DocumentServiceClient, client_options)
 
         request = ListDocumentsRequest(
             parent=f"{datastore_id}/branches/default_branch",
@@ -516,9 +513,7 @@ class Search(scrapi_base.ScrapiBase):
         )
 
         client_options = self._client_options_discovery_engine(serving_config)
-        client = SearchServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(SearchServiceClient, client_options)
         response = client.search(request)
 
         all_results = []
@@ -70,9 +70,8 @@ class SecuritySettings(scrapi_base.ScrapiBase):
 
         request.parent = location_id
         client_options = self._set_region(location_id)
-        client = self.ss_service.SecuritySettingsServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            self.ss_service.SecuritySettingsServiceClient, client_options)
 
         response = client.list_security_settings(request)
 
@@ -101,9 +100,8 @@ class SecuritySettings(scrapi_base.ScrapiBase):
 
         request.name = security_setting_id
         client_options = self._set_region(security_setting_id)
-        client = self.ss_service.SecuritySettingsServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            self.ss_service.SecuritySettingsServiceClient, client_options)
 
         response = client.get_security_settings(request)
 
@@ -153,9 +151,8 @@ class SecuritySettings(scrapi_base.ScrapiBase):
         request.security_settings = security_settings
 
         client_options = self._set_region(location_id)
-        client = self.ss_service.SecuritySettingsServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            self.ss_service.SecuritySettingsServiceClient, client_options)
 
         response = client.create_security_settings(request)
 
@@ -188,9 +185,8 @@ class SecuritySettings(scrapi_base.ScrapiBase):
         request.update_mask = mask
 
         client_options = self._set_region(security_setting_id)
-        client = self.ss_service.SecuritySettingsServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            self.ss_service.SecuritySettingsServiceClient, client_options)
 
         response = client.update_security_settings(request)
 
@@ -209,8 +205,7 @@ class SecuritySettings(scrapi_base.ScrapiBase):
         request.name = security_setting_id
 
         client_options = self._set_region(security_setting_id)
-        client = self.ss_service.SecuritySettingsServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            self.ss_service.SecuritySettingsServiceClient, client_options)
 
         client.delete_security_settings(request)
@@ -222,9 +222,9 @@ class SessionEntityTypes(scrapi_base.ScrapiBase):
         request.parent = parent_id
 
         client_options = self._set_region(session_id)
-        client = services.session_entity_types.SessionEntityTypesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.session_entity_types.SessionEntityTypesClient,
+            client_options)
 
         response = client.list_session_entity_types(request)
 
@@ -265,9 +265,9 @@ class SessionEntityTypes(scrapi_base.ScrapiBase):
         request.name = parent_id
 
         client_options = self._set_region(session_entity_type_id)
-        client = services.session_entity_types.SessionEntityTypesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.session_entity_types.SessionEntityTypesClient,
+            client_options)
 
         response = client.get_session_entity_type(request)
 
@@ -293,9 +293,9 @@ class SessionEntityTypes(scrapi_base.ScrapiBase):
         request.session_entity_type = session_entity_type
 
         client_options = self._set_region(session_id)
-        client = services.session_entity_types.SessionEntityTypesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.session_entity_types.SessionEntityTypesClient,
+            client_options)
 
         response = client.create_session_entity_type(request)
 
@@ -353,9 +353,9 @@ class SessionEntityTypes(scrapi_base.ScrapiBase):
         mask = field_mask_pb2.FieldMask(paths=paths)
 
         client_options = self._set_region(parent_id)
-        client = services.session_entity_types.SessionEntityTypesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.session_entity_types.SessionEntityTypesClient,
+            client_options)
         request = types.UpdateSessionEntityTypeRequest()
         request.session_entity_type = parent_id
         request.update_mask = mask
@@ -391,9 +391,9 @@ class SessionEntityTypes(scrapi_base.ScrapiBase):
             parent_id = session_entity_type_id
 
         client_options = self._set_region(session_entity_type_id)
-        client = services.session_entity_types.SessionEntityTypesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.session_entity_types.SessionEntityTypesClient,
+            client_options)
 
         request = types.DeleteSessionEntityTypeRequest()
         request.name = parent_id
@@ -291,7 +291,8 @@ class Sessions(ScrapiBase):
         end_user_metadata: Dict[str, Any] = None,
         populate_data_store_connection_signals: bool = False,
         intent_id: str = None,
-        timezone: str = None
+        timezone: str = None,
+        raw: bool = False
     ):
         """Returns the result of detect intent with texts as inputs.
 
@@ -322,14 +323,15 @@ class Sessions(ScrapiBase):
             capturing datetime via system functions, they can be modified to
             user the provied timezone vs. the default agent timezone.
             Refs: https://www.iana.org/time-zones
+          raw: (Optional) if True, return the raw protobuf QueryResult instead
+            of a proto-plus object, which is much faster to read from.
 
         Returns:
           The CX query result from intent detection
         """
         client_options = self._set_region(agent_id)
-        session_client = services.sessions.SessionsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        session_client = self._get_client(
+            services.sessions.SessionsClient, client_options)
 
         res = self._parse_resource_path("session", str(session_id), False)
         if not res:
@@ -373,6 +375,9 @@ class Sessions(ScrapiBase):
         response = session_client.detect_intent(request=request)
         query_result = response.query_result
 
+        if raw:
+            return self.raw_proto(query_result)
+
         return query_result
 
     def get_agent_answer(self, user_query: str) -> str:
@@ -380,9 +385,9 @@ class Sessions(ScrapiBase):
 
         session_id = self.build_session_id(self.agent_id)
         res = MessageToDict(
-            self.detect_intent(  # pylint: disable=W0212
-                self.agent_id, session_id, user_query
-            )._pb
+            self.detect_intent(
+                self.agent_id, session_id, user_query, raw=True
+            )
         )
 
         answer_text = res["responseMessages"][0]["text"]["text"][0]
@@ -95,9 +95,7 @@ class Sites(scrapi_base.ScrapiBase):
     def list_sites(self, data_store_id: str) -> List[TargetSite]:
         """List all URL patterns for a given Data Store ID."""
         client_options = self._client_options_discovery_engine(data_store_id)
-        client = SiteSearchEngineServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(SiteSearchEngineServiceClient, client_options)
 
         parent = self.__build_site_search_parent(data_store_id)
         request = ListTargetSitesRequest(
@@ -116,9 +114,7 @@ class Sites(scrapi_base.ScrapiBase):
     def get_site(self, site_id: str) -> TargetSite:
         """Get a single Site by specified ID."""
         client_options = self._client_options_discovery_engine(site_id)
-        client = SiteSearchEngineServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(SiteSearchEngineServiceClient, client_options)
         request = GetTargetSiteRequest(name=site_id)
         response = client.get_target_site(request=request)
 
@@ -144,9 +140,7 @@ class Sites(scrapi_base.ScrapiBase):
             search engine.
         """
         client_options = self._client_options_discovery_engine(data_store_id)
-        client = SiteSearchEngineServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(SiteSearchEngineServiceClient, client_options)
 
         target_site = TargetSite()
         target_site.provided_uri_pattern = uri_pattern
@@ -166,9 +160,7 @@ class Sites(scrapi_base.ScrapiBase):
     def delete_site(self, site_id: str) -> Operation:
         """Deletes a TargetSite in a Data Store by the specified ID."""
         client_options = self._client_options_discovery_engine(site_id)
-        client = SiteSearchEngineServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(SiteSearchEngineServiceClient, client_options)
 
         request = DeleteTargetSiteRequest(name=site_id)
         operation = client.delete_target_site(request=request)
@@ -178,9 +170,7 @@ class Sites(scrapi_base.ScrapiBase):
     def enable_advanced_site_search(self, data_store_id: str) -> Operation:
         """Enables Advanced Site Search for the provided Data Store ID."""
         client_options = self._client_options_discovery_engine(data_store_id)
-        client = SiteSearchEngineServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(SiteSearchEngineServiceClient, client_options)
 
         parent = self.__build_site_search_parent(data_store_id)
         request = EnableAdvancedSiteSearchRequest(
@@ -194,9 +184,7 @@ class Sites(scrapi_base.ScrapiBase):
     def disable_advanced_site_search(self, data_store_id: str) -> Operation:
         """Disable Advanced Site Search for the provided Data Store ID."""
         client_options = self._client_options_discovery_engine(data_store_id)
-        client = SiteSearchEngineServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(SiteSearchEngineServiceClient, client_options)
 
         parent = self.__build_site_search_parent(data_store_id)
         request = DisableAdvancedSiteSearchRequest(
@@ -210,9 +198,7 @@ class Sites(scrapi_base.ScrapiBase):
     def recrawl_uris(self, data_store_id: str, uris: List[str]) -> Operation:
         """Recrawl the specified set of URIs for the Data Store."""
         client_options = self._client_options_discovery_engine(data_store_id)
-        client = SiteSearchEngineServiceClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(SiteSearchEngineServiceClient, client_options)
 
         parent = self.__build_site_search_parent(data_store_id)
         request = RecrawlUrisRequest(
@@ -198,9 +198,8 @@ class TestCases(scrapi_base.ScrapiBase):
 
         client_options = self._set_region(agent_id)
 
-        client = services.test_cases.TestCasesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.test_cases.TestCasesClient, client_options)
 
         response = client.list_test_cases(request)
 
@@ -251,13 +250,13 @@ class TestCases(scrapi_base.ScrapiBase):
         request.filter = data_filter
 
         client_options = self._set_region(agent_id)
-        client = services.test_cases.TestCasesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.test_cases.TestCasesClient, client_options)
         response = client.export_test_cases(request)
 
         return response
 
+    @scrapi_base.invalidates_resource_map("test_cases")
     @scrapi_base.api_call_counter_decorator
     def create_test_case(self, test_case: types.TestCase, agent_id: str = None):
         """Create a new Test Case in the specified CX Agent.
@@ -278,9 +277,8 @@ class TestCases(scrapi_base.ScrapiBase):
         request.test_case = test_case
 
         client_options = self._set_region(agent_id)
-        client = services.test_cases.TestCasesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.test_cases.TestCasesClient, client_options)
         response = client.create_test_case(request)
         return response
 
@@ -301,12 +299,12 @@ class TestCases(scrapi_base.ScrapiBase):
         request.name = test_case_id
 
         client_options = self._set_region(test_case_id)
-        client = services.test_cases.TestCasesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.test_cases.TestCasesClient, client_options)
         response = client.get_test_case(request)
         return response
 
+    @scrapi_base.invalidates_resource_map("test_cases")
     @scrapi_base.api_call_counter_decorator
     def import_test_cases(self, gcs_uri: str, agent_id: str = None):
         """Import test cases from cloud storage.
@@ -329,13 +327,13 @@ class TestCases(scrapi_base.ScrapiBase):
         request.gcs_uri = gcs_uri
 
         client_options = self._set_region(agent_id)
-        client = services.test_cases.TestCasesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.test_cases.TestCasesClient, client_options)
         response = client.import_test_cases(request)
         result = response.result()
         return result
 
+    @scrapi_base.invalidates_resource_map("test_cases")
     @scrapi_base.api_call_counter_decorator
     def batch_delete_test_cases(
         self,
@@ -362,9 +360,8 @@ class TestCases(scrapi_base.ScrapiBase):
         request.names = test_case_ids
 
         client_options = self._set_region(agent_id)
-        client = services.test_cases.TestCasesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.test_cases.TestCasesClient, client_options)
         client.batch_delete_test_cases(request)
 
     @scrapi_base.api_call_counter_decorator
@@ -386,9 +383,8 @@ class TestCases(scrapi_base.ScrapiBase):
         request.parent = test_case_id
 
         client_options = self._set_region(test_case_id)
-        client = services.test_cases.TestCasesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.test_cases.TestCasesClient, client_options)
         response = client.list_test_case_results(request)
 
         test_case_results = []
@@ -429,13 +425,13 @@ class TestCases(scrapi_base.ScrapiBase):
         request.test_cases = test_cases
 
         client_options = self._set_region(agent_id)
-        client = services.test_cases.TestCasesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.test_cases.TestCasesClient, client_options)
         response = client.batch_run_test_cases(request)
         results = response.result()
         return results
 
+    @scrapi_base.invalidates_resource_map("test_cases")
     @scrapi_base.api_call_counter_decorator
     def update_test_case(
         self,
@@ -482,9 +478,8 @@ class TestCases(scrapi_base.ScrapiBase):
             test_case=test_case, update_mask=mask)
 
         client_options = self._set_region(test_case_id or obj.name)
-        client = services.test_cases.TestCasesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.test_cases.TestCasesClient, client_options)
         response = client.update_test_case(request)
         return response
 
@@ -509,9 +504,8 @@ class TestCases(scrapi_base.ScrapiBase):
         request.environment = environment
 
         client_options = self._set_region(test_case_id)
-        client = services.test_cases.TestCasesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.test_cases.TestCasesClient, client_options)
         response = client.run_test_case(request)
         results = response.result()
         return results
@@ -532,9 +526,8 @@ class TestCases(scrapi_base.ScrapiBase):
         request.name = test_case_result_id
 
         client_options = self._set_region(test_case_result_id)
-        client = services.test_cases.TestCasesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.test_cases.TestCasesClient, client_options)
         response = client.get_test_case_result(request)
         return response
 
@@ -568,12 +561,12 @@ class TestCases(scrapi_base.ScrapiBase):
         request.type_ = coverage_type
 
         client_options = self._set_region(agent_id)
-        client = services.test_cases.TestCasesClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.test_cases.TestCasesClient, client_options)
         response = client.calculate_coverage(request)
         return response
 
+    @scrapi_base.cached_resource_map("test_cases")
     def get_test_cases_map(self, agent_id: str = None, reverse=False):
         """Exports Agent Test Cases and UUIDs into a user friendly dict.
 
@@ -624,9 +617,7 @@ class TestCases(scrapi_base.ScrapiBase):
         dfcx_flows = flows.Flows(creds=self.creds, agent_id=self.agent_id)
         dfcx_pages = pages.Pages(creds=self.creds)
         flows_map = dfcx_flows.get_flows_map(agent_id=self.agent_id)
-        pages_map = {}
-        for flow_id in flows_map.keys():
-            pages_map[flow_id] = dfcx_pages.get_pages_map(flow_id=flow_id)
+        pages_map = self._fan_out(flows_map.keys(), dfcx_pages.get_pages_map)
 
         test_case_results = self.list_test_cases(self.agent_id)
         retest_ids = []
@@ -53,6 +53,7 @@ class Tools(scrapi_base.ScrapiBase):
             open_api_spec=types.Tool.OpenApiTool(text_schema=spec)
             )
 
+    @scrapi_base.cached_resource_map("tools")
     @scrapi_base.api_call_counter_decorator
     def get_tools_map(self, agent_id: str, reverse: bool = False):
         """Returns a map of tool names to tool IDs"""
@@ -75,9 +76,7 @@ class Tools(scrapi_base.ScrapiBase):
         """Returns a list of tools for a given agent"""
         request = types.tool.ListToolsRequest(parent=agent_id)
         client_options = self._set_region(agent_id)
-        client = services.tools.ToolsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(services.tools.ToolsClient, client_options)
         response = client.list_tools(request=request)
 
         return list(response)
@@ -87,12 +86,11 @@ class Tools(scrapi_base.ScrapiBase):
         """Get the specified Tool ID."""
         request = types.tool.GetToolRequest(name=tool_id)
         client_options = self._set_region(tool_id)
-        client = services.tools.ToolsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(services.tools.ToolsClient, client_options)
 
         return client.get_tool(request=request)
 
+    @scrapi_base.invalidates_resource_map("tools")
     @scrapi_base.api_call_counter_decorator
     def create_tool(self, agent_id: str, obj: types.Tool = None, **kwargs):
         """Create an Agent Tool."""
@@ -113,14 +111,13 @@ class Tools(scrapi_base.ScrapiBase):
         request.tool = tool_obj
 
         client_options = self._set_region(agent_id)
-        client = services.tools.ToolsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(services.tools.ToolsClient, client_options)
 
         response = client.create_tool(request)
 
         return response
 
+    @scrapi_base.invalidates_resource_map("tools")
     @scrapi_base.api_call_counter_decorator
     def update_tool(self, tool_id: str, obj: types.Tool = None, **kwargs):
         """Update a single Tool with the specific object or kwargs."""
@@ -137,14 +134,13 @@ class Tools(scrapi_base.ScrapiBase):
         mask = field_mask_pb2.FieldMask(paths=paths)
 
         client_options = self._set_region(tool_id)
-        client = services.tools.ToolsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(services.tools.ToolsClient, client_options)
 
         response = client.update_tool(tool=tool, update_mask=mask)
 
         return response
 
+    @scrapi_base.invalidates_resource_map("tools")
     @scrapi_base.api_call_counter_decorator
     def delete_tool(self, tool_id: str = None, obj: types.Tool = None):
         """Deletes a single Agent Tool resource."""
@@ -155,8 +151,6 @@ class Tools(scrapi_base.ScrapiBase):
             tool_id = obj.name
 
         client_options = self._set_region(tool_id)
-        client = services.tools.ToolsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(services.tools.ToolsClient, client_options)
 
         client.delete_tool(name=tool_id)
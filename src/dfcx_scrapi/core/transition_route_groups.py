@@ -15,7 +15,6 @@
 # limitations under the License.
 
 import logging
-import time
 from typing import Dict, List
 
 import pandas as pd
@@ -107,6 +106,7 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
 
         return temp_dict
 
+    @scrapi_base.cached_resource_map("transition_route_groups")
     def get_route_groups_map(self, flow_id: str = None, reverse=False):
         """Exports Agent Route Group UUIDs and Names into a user friendly dict.
 
@@ -163,9 +163,9 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
             request.language_code = self.language_code
 
         client_options = self._set_region(flow_id)
-        client = services.transition_route_groups.TransitionRouteGroupsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.transition_route_groups.TransitionRouteGroupsClient,
+            client_options)
         response = client.list_transition_route_groups(request)
 
         cx_route_groups = []
@@ -188,13 +188,14 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
         request = types.transition_route_group.GetTransitionRouteGroupRequest()
         request.name = route_group_id
         client_options = self._set_region(route_group_id)
-        client = services.transition_route_groups.TransitionRouteGroupsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.transition_route_groups.TransitionRouteGroupsClient,
+            client_options)
         response = client.get_transition_route_group(request)
 
         return response
 
+    @scrapi_base.invalidates_resource_map("transition_route_groups")
     @scrapi_base.api_call_counter_decorator
     def create_transition_route_group(
         self,
@@ -226,15 +227,16 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
             setattr(trg, key, value)
 
         client_options = self._set_region(flow_id)
-        client = services.transition_route_groups.TransitionRouteGroupsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.transition_route_groups.TransitionRouteGroupsClient,
+            client_options)
         response = client.create_transition_route_group(
             parent=flow_id, transition_route_group=trg
         )
 
         return response
 
+    @scrapi_base.invalidates_resource_map("transition_route_groups")
     @scrapi_base.api_call_counter_decorator
     def update_transition_route_group(
         self,
@@ -267,9 +269,9 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
         mask = field_mask_pb2.FieldMask(paths=paths)
 
         client_options = self._set_region(route_group_id)
-        client = services.transition_route_groups.TransitionRouteGroupsClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.transition_route_groups.TransitionRouteGroupsClient,
+            client_options)
 
         request = (
             types.transition_route_group.UpdateTransitionRouteGroupRequest()
@@ -287,6 +289,7 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
 
         return response
 
+    @scrapi_base.invalidates_resource_map("transition_route_groups")
     @scrapi_base.api_call_counter_decorator
     def delete_transition_route_group(
         self, route_group_id: str = None,
@@ -307,15 +310,16 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
             route_group_id = obj.name
 
         client_options = self._set_region(route_group_id)
-        client = services.transition_route_groups.TransitionRouteGroupsClient(
-            credentials=self.creds, client_options=client_options)
+        client = self._get_client(
+            services.transition_route_groups.TransitionRouteGroupsClient,
+            client_options)
         req = types.DeleteTransitionRouteGroupRequest(
             name=route_group_id, force=force)
         client.delete_transition_route_group(request=req)
 
 
     def route_groups_to_dataframe(
-        self, agent_id: str = None, rate_limit: float = 0.5
+        self, agent_id: str = None, rate_limit: float = None
     ):
         """Extracts the Flow Transition Route Groups from a given Agent and
          returns key information about the Route Groups in a Pandas Dataframe
@@ -330,8 +334,9 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
         Args:
           agent_id: the Agent ID string in the following format:
             projects/<project_id>/locations/<location_id>/agents/<agent_id>
-          rate_limit: Time in seconds to wait between each API call. Use this
-            to control hitting Quota limits on your project.
+          rate_limit: (Optional) Time in seconds to wait between each API
+            call. If not provided, the per-Flow List calls are made
+            concurrently and paced by the shared `read` quota bucket.
 
         Returns:
           a Pandas Dataframe with columns: flow, route_group_name, target_page,
@@ -351,10 +356,14 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
         if self._get_agent_level_data_only:
             all_rgs.extend(self.list_transition_route_groups(agent_id))
         else:
-            for flow in flows_map:
-                all_pages_map.update(self.pages.get_pages_map(flow))
-                all_rgs.extend(self.list_transition_route_groups(flow))
-                time.sleep(rate_limit)
+            with self.call_rate_limit(
+                agent_id, "read", seconds_between_calls=rate_limit):
+                for pages_map in self._fan_out(
+                    flows_map, self.pages.get_pages_map).values():
+                    all_pages_map.update(pages_map)
+                for flow_rgs in self._fan_out(
+                    flows_map, self.list_transition_route_groups).values():
+                    all_rgs.extend(flow_rgs)
 
         rows_list = []
         for route_group in all_rgs:
@@ -412,7 +421,7 @@ class TransitionRouteGroups(scrapi_base.ScrapiBase):
         return final_dataframe
 
     def agent_route_groups_to_dataframe(
-            self, agent_id: str = None, rate_limit: float = 0.5
+            self, agent_id: str = None, rate_limit: float = None
     ):
         """Extracts the Transition Route Groups from a given Agent and
         returns key information about the Route Groups in a Pandas Dataframe
@@ -68,9 +68,8 @@ class Versions(scrapi_base.ScrapiBase):
         request.parent = flow_id
 
         client_options = self._set_region(flow_id)
-        client = services.versions.VersionsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(
+            services.versions.VersionsClient, client_options)
 
         response = client.list_versions(request)
 
@@ -115,10 +114,8 @@ class Versions(scrapi_base.ScrapiBase):
 
         else:
             request = types.version.GetVersionRequest(name=version_id)
-            client = services.versions.VersionsClient(
-                client_options=self._set_region(version_id),
-                credentials=self.creds
-            )
+            client = self._get_client(
+                services.versions.VersionsClient, self._set_region(version_id))
 
             response = client.get_version(request)
 
@@ -173,9 +170,8 @@ class Versions(scrapi_base.ScrapiBase):
         )
 
         client_options = self._set_region(flow_id)
-        client = services.versions.VersionsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(
+            services.versions.VersionsClient, client_options)
 
         response = client.load_version(request)
         return response
@@ -202,9 +198,8 @@ class Versions(scrapi_base.ScrapiBase):
         request = types.version.CreateVersionRequest()
 
         client_options = self._set_region(flow_id)
-        client = services.versions.VersionsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(
+            services.versions.VersionsClient, client_options)
 
         version = types.Version()
         version.display_name = display_name
@@ -228,10 +223,8 @@ class Versions(scrapi_base.ScrapiBase):
         """
         request = types.version.DeleteVersionRequest(name=version_id)
 
-        client = services.versions.VersionsClient(
-            client_options=self._set_region(version_id),
-            credentials=self.creds
-        )
+        client = self._get_client(
+            services.versions.VersionsClient, self._set_region(version_id))
 
         return client.delete_version(request)
 
@@ -268,9 +261,8 @@ class Versions(scrapi_base.ScrapiBase):
         )
 
         client_options = self._set_region(flow_id)
-        client = services.versions.VersionsClient(
-            client_options=client_options, credentials=self.creds
-        )
+        client = self._get_client(
+            services.versions.VersionsClient, client_options)
 
         response = client.compare_versions(request)
 
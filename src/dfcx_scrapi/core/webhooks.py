@@ -56,6 +56,7 @@ class Webhooks(scrapi_base.ScrapiBase):
         if agent_id:
             self.agent_id = agent_id
 
+    @scrapi_base.cached_resource_map("webhooks")
     def get_webhooks_map(
         self,
         agent_id: str = None,
@@ -105,9 +106,8 @@ class Webhooks(scrapi_base.ScrapiBase):
         request.parent = agent_id
 
         client_options = self._set_region(agent_id)
-        client = services.webhooks.WebhooksClient(
-            credentials=self.creds, client_options=client_options
-        )
+        client = self._get_client(
+            services.webhooks.WebhooksClient, client_options)
         response = client.list_webhooks(request)
 
         cx_webhooks = []
@@ -117,6 +117,7 @@ class Webhooks(scrapi_base.ScrapiBase):
 
         return cx_webhooks
 
+    @scrapi_base.invalidates_resource_map("webhooks")
     @scrapi_base.api_call_counter_decorator
     def create_webhook(
         self,
@@ -144,8 +145,8 @@ class Webhooks(scrapi_base.ScrapiBase):
             setattr(webhook, key, value)
 
         client_options = self._set_region(agent_id)
-        client = services.webhooks.WebhooksClient(
-            client_options=client_options, credentials=self.creds)
+        client = self._get_client(
+            services.webhooks.WebhooksClient, client_options)
         response = client.create_webhook(parent=agent_id, webhook=webhook)
 
         return response
@@ -167,8 +168,8 @@ class Webhooks(scrapi_base.ScrapiBase):
         request.name = webhook_id
 
         client_options = self._set_region(webhook_id)
-        client = services.webhooks.WebhooksClient(
-            client_options=client_options, credentials=self.creds)
+        client = self._get_client(
+            services.webhooks.WebhooksClient, client_options)
 
         response = client.get_webhook(request)
 
@@ -205,6 +206,7 @@ class Webhooks(scrapi_base.ScrapiBase):
         return webhook_obj
 
 
+    @scrapi_base.invalidates_resource_map("webhooks")
     @scrapi_base.api_call_counter_decorator
     def update_webhook(
         self,
@@ -236,8 +238,8 @@ class Webhooks(scrapi_base.ScrapiBase):
         mask = field_mask_pb2.FieldMask(paths=paths)
 
         client_options = self._set_region(webhook_id)
-        client = services.webhooks.WebhooksClient(
-            client_options=client_options, credentials=self.creds)
+        client = self._get_client(
+            services.webhooks.WebhooksClient, client_options)
 
         request = types.webhook.UpdateWebhookRequest()
         request.webhook = webhook_obj
@@ -248,6 +250,7 @@ class Webhooks(scrapi_base.ScrapiBase):
         return response
 
 
+    @scrapi_base.invalidates_resource_map("webhooks")
     @scrapi_base.api_call_counter_decorator
     def delete_webhook(
         self, webhook_id: str = None,
@@ -274,7 +277,7 @@ class Webhooks(scrapi_base.ScrapiBase):
             webhook_id = obj.name
 
         client_options = self._set_region(webhook_id)
-        client = services.webhooks.WebhooksClient(
-            client_options=client_options, credentials=self.creds)
+        client = self._get_client(
+            services.webhooks.WebhooksClient, client_options)
         req = types.DeleteWebhookRequest(name=webhook_id, force=force)
         client.delete_webhook(request=req)
@@ -0,0 +1,150 @@
+"""Conversation History Resource Async functions."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, List
+
+from google.cloud.dialogflowcx_v3beta1 import services, types
+
+from dfcx_scrapi.core.conversation_history import ConversationHistory
+from dfcx_scrapi.core_async.scrapi_base import (
+    DEFAULT_MAX_CONCURRENCY,
+    ScrapiBaseAsync,
+)
+
+# logging config
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)-8s %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+class ConversationHistoryAsync(ScrapiBaseAsync):
+    """Used to get Conversation History Data with Async clients."""
+
+    def __init__(
+        self,
+        creds_path: str = None,
+        creds_dict: Dict = None,
+        creds=None,
+        scope=False,
+        agent_id: str = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        super().__init__(
+            creds_path=creds_path,
+            creds_dict=creds_dict,
+            creds=creds,
+            scope=scope,
+            max_concurrency=max_concurrency,
+        )
+
+        self.agent_id = agent_id
+
+    @staticmethod
+    def process_single_conversation(
+        current_convo: types.Conversation) -> Dict[str, Any]:
+        """Extract details from single conversation for embed and cluster."""
+        conversation = {}
+        conversation["session_id"] = current_convo.name
+        conversation["create_time"] = current_convo.start_time.rfc3339()
+        conversation["turns"] = []
+        for action in reversed(current_convo.interactions):
+            conversation["turns"].append({
+                "user": ConversationHistory.get_user_input(
+                    action.request.query_input),
+                "agent": ConversationHistory.get_query_result(
+                    action.response.query_result),
+            })
+
+        return conversation
+
+    def _get_conversation_client(self, resource_id: str):
+        client_options = self._set_region(resource_id)
+        return self._get_async_client(
+            services.conversation_history.ConversationHistoryAsyncClient,
+            client_options)
+
+    async def iter_conversations(
+        self, agent_id: str = None) -> AsyncIterator[types.Conversation]:
+        """Iterate over all Conversations, fetching pages as needed."""
+        if not agent_id:
+            agent_id = self.agent_id
+
+        request = types.conversation_history.ListConversationsRequest(
+            parent=agent_id)
+        client = self._get_conversation_client(agent_id)
+
+        pager = await self._call_api(client.list_conversations, request)
+        async for convo in pager:
+            yield convo
+
+    async def list_conversations(
+        self, agent_id: str = None) -> List[types.Conversation]:
+        """List all Conversations for the Agent."""
+        return [convo async for convo in self.iter_conversations(agent_id)]
+
+    async def get_conversation(
+        self, conversation_id: str) -> types.Conversation:
+        """Get a single Conversation by its ID."""
+        request = types.conversation_history.GetConversationRequest(
+            name=conversation_id)
+        client = self._get_conversation_client(conversation_id)
+
+        return await self._call_api(client.get_conversation, request)
+
+    async def get_conversations(
+        self, conversation_ids: List[str]) -> List[types.Conversation]:
+        """Get many Conversations concurrently, in the order provided."""
+        return await self.gather(
+            self.get_conversation(convo_id) for convo_id in conversation_ids
+        )
+
+    async def conversation_history_to_file(
+        self, filename: str, agent_id: str = None) -> int:
+        """Fetch, process and write all Conversations to a JSONL file.
+
+        Conversations are fetched concurrently in batches of
+        `max_concurrency` while the list pages are still being iterated.
+
+        Returns:
+          The number of Conversations written.
+        """
+        count = 0
+        batch = []
+
+        with open(filename, "w", encoding="utf-8") as json_file:
+
+            async def flush():
+                convos = await self.get_conversations(batch)
+                for convo in convos:
+                    json.dump(self.process_single_conversation(convo),
+                              json_file)
+                    json_file.write("\n")
+                batch.clear()
+                return len(convos)
+
+            async for convo in self.iter_conversations(agent_id):
+                batch.append(convo.name)
+                if len(batch) >= self.max_concurrency:
+                    count += await flush()
+
+            if batch:
+                count += await flush()
+
+        return count
@@ -0,0 +1,132 @@
+"""Flow Resource Async functions."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from typing import Dict, List
+
+from google.cloud.dialogflowcx_v3beta1 import services, types
+
+from dfcx_scrapi.core_async.scrapi_base import (
+    DEFAULT_MAX_CONCURRENCY,
+    ScrapiBaseAsync,
+)
+
+# logging config
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)-8s %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+class FlowsAsync(ScrapiBaseAsync):
+    """Core Class for CX Flow Resource Async functions."""
+
+    def __init__(
+        self,
+        creds_path: str = None,
+        creds_dict: Dict = None,
+        creds=None,
+        scope=False,
+        agent_id: str = None,
+        language_code: str = "en",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        super().__init__(
+            creds_path=creds_path,
+            creds_dict=creds_dict,
+            creds=creds,
+            scope=scope,
+            max_concurrency=max_concurrency,
+        )
+
+        self.agent_id = agent_id
+        self.language_code = language_code
+
+    async def get_flows_map(
+        self, agent_id: str = None, reverse: bool = False) -> Dict[str, str]:
+        """Exports Agent Flow Names and UUIDs into a user friendly dict.
+
+        Args:
+          agent_id: the formatted CX Agent ID to use
+          reverse: (Optional) Boolean flag to swap key:value -> value:key
+
+        Returns:
+          Dictionary containing flow UUIDs as keys and display names as values
+        """
+        flows = await self.list_flows(agent_id)
+
+        if reverse:
+            return {flow.display_name: flow.name for flow in flows}
+
+        return {flow.name: flow.display_name for flow in flows}
+
+    async def list_flows(
+        self,
+        agent_id: str = None,
+        language_code: str = None) -> List[types.Flow]:
+        """Get a List of all Flows in the current Agent.
+
+        Args:
+          agent_id: CX Agent ID string in the proper format
+            projects/<PROJECT ID>/locations/<LOCATION ID>/agents/<AGENT ID>
+          language_code: (Optional) the language of the Flows to list.
+
+        Returns:
+          List of Flow objects
+        """
+        if not agent_id:
+            agent_id = self.agent_id
+
+        request = types.flow.ListFlowsRequest()
+        request.parent = agent_id
+        request.language_code = language_code or self.language_code
+
+        client_options = self._set_region(agent_id)
+        client = self._get_async_client(
+            services.flows.FlowsAsyncClient, client_options)
+
+        return await self._list_all(client.list_flows, request)
+
+    async def get_flow(
+        self, flow_id: str, language_code: str = None) -> types.Flow:
+        """Get a single CX Flow object.
+
+        Args:
+          flow_id: CX Flow ID in the proper format
+          language_code: (Optional) the language of the Flow to get.
+
+        Returns:
+          A single CX Flow object
+        """
+        request = types.flow.GetFlowRequest()
+        request.name = flow_id
+        request.language_code = language_code or self.language_code
+
+        client_options = self._set_region(flow_id)
+        client = self._get_async_client(
+            services.flows.FlowsAsyncClient, client_options)
+
+        return await self._call_api(client.get_flow, request)
+
+    async def get_flows(
+        self,
+        flow_ids: List[str],
+        language_code: str = None) -> List[types.Flow]:
+        """Get many Flow objects concurrently, in the order provided."""
+        return await self.gather(
+            self.get_flow(flow_id, language_code) for flow_id in flow_ids
+        )
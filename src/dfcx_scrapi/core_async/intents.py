@@ -0,0 +1,216 @@
+"""Intent Resource Async functions."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from typing import Dict, List
+
+from google.cloud.dialogflowcx_v3beta1 import services, types
+from google.protobuf import field_mask_pb2
+
+from dfcx_scrapi.core_async.scrapi_base import (
+    DEFAULT_MAX_CONCURRENCY,
+    ScrapiBaseAsync,
+)
+
+# logging config
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)-8s %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+class IntentsAsync(ScrapiBaseAsync):
+    """Core Class for CX Intent Resource Async functions."""
+
+    def __init__(
+        self,
+        creds_path: str = None,
+        creds_dict: Dict = None,
+        creds=None,
+        scope=False,
+        agent_id: str = None,
+        language_code: str = "en",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        super().__init__(
+            creds_path=creds_path,
+            creds_dict=creds_dict,
+            creds=creds,
+            scope=scope,
+            max_concurrency=max_concurrency,
+        )
+
+        self.agent_id = agent_id
+        self.language_code = language_code
+
+    async def get_intents_map(
+        self, agent_id: str = None, reverse: bool = False) -> Dict[str, str]:
+        """Exports Agent Intent Names and UUIDs into a user friendly dict.
+
+        Args:
+          agent_id: the formatted CX Agent ID to use
+          reverse: (Optional) Boolean flag to swap key:value -> value:key
+
+        Returns:
+          Dictionary containing Intent UUIDs as keys and display names as values
+        """
+        intents = await self.list_intents(agent_id)
+
+        if reverse:
+            return {intent.display_name: intent.name for intent in intents}
+
+        return {intent.name: intent.display_name for intent in intents}
+
+    async def list_intents(
+        self,
+        agent_id: str = None,
+        language_code: str = None) -> List[types.Intent]:
+        """Exports List of all intents in specific CX Agent.
+
+        Args:
+          agent_id: the formatted CX Agent ID to use
+          language_code: Language code of the intents being listed.
+
+        Returns:
+          List of Intent objects
+        """
+        if not agent_id:
+            agent_id = self.agent_id
+
+        request = types.intent.ListIntentsRequest()
+        request.parent = agent_id
+
+        if language_code:
+            request.language_code = language_code
+
+        client_options = self._set_region(agent_id)
+        client = self._get_async_client(
+            services.intents.IntentsAsyncClient, client_options)
+
+        return await self._list_all(client.list_intents, request)
+
+    async def get_intent(
+        self, intent_id: str, language_code: str = None) -> types.Intent:
+        """Get a single Intent object by its ID.
+
+        Args:
+          intent_id: the formatted CX Intent ID to get
+          language_code: (Optional) the language of the Intent to get.
+
+        Returns:
+          The Intent object
+        """
+        request = types.intent.GetIntentRequest()
+        request.name = intent_id
+
+        if language_code:
+            request.language_code = language_code
+
+        client_options = self._set_region(intent_id)
+        client = self._get_async_client(
+            services.intents.IntentsAsyncClient, client_options)
+
+        return await self._call_api(client.get_intent, request)
+
+    async def get_intents(
+        self,
+        intent_ids: List[str],
+        language_code: str = None) -> List[types.Intent]:
+        """Get many Intent objects concurrently, in the order provided."""
+        return await self.gather(
+            self.get_intent(intent_id, language_code)
+            for intent_id in intent_ids
+        )
+
+    async def create_intent(
+        self,
+        obj: types.Intent,
+        agent_id: str = None,
+        language_code: str = None) -> types.Intent:
+        """Creates an Intent from a protobuf or proto-plus Intent object.
+
+        Args:
+          obj: the Intent object to create
+          agent_id: (Optional) the formatted CX Agent ID to use
+          language_code: (Optional) the language of the Intent to create.
+
+        Returns:
+          The created Intent object
+        """
+        if not agent_id:
+            agent_id = self.agent_id
+
+        request = types.intent.CreateIntentRequest()
+        request.parent = agent_id
+        request.intent = obj
+
+        if language_code:
+            request.language_code = language_code
+
+        client_options = self._set_region(agent_id)
+        client = self._get_async_client(
+            services.intents.IntentsAsyncClient, client_options)
+
+        return await self._call_api(client.create_intent, request)
+
+    async def update_intent(
+        self,
+        intent_id: str,
+        obj: types.Intent,
+        language_code: str = None,
+        **kwargs) -> types.Intent:
+        """Updates a single Intent object based on provided args.
+
+        Args:
+          intent_id: the formatted CX Intent ID to update
+          obj: the Intent object to use for the update
+          language_code: (Optional) the language of the Intent to update.
+          **kwargs: Intent attributes to set. If provided, only these fields
+            are updated, otherwise the full Intent is replaced.
+
+        Returns:
+          The updated Intent object
+        """
+        intent = obj
+        intent.name = intent_id
+
+        for key, value in kwargs.items():
+            setattr(intent, key, value)
+        paths = kwargs.keys() if kwargs else None
+
+        request = types.intent.UpdateIntentRequest()
+        request.intent = intent
+
+        if paths:
+            request.update_mask = field_mask_pb2.FieldMask(paths=paths)
+
+        if language_code:
+            request.language_code = language_code
+
+        client_options = self._set_region(intent_id)
+        client = self._get_async_client(
+            services.intents.IntentsAsyncClient, client_options)
+
+        return await self._call_api(client.update_intent, request)
+
+    async def delete_intent(self, intent_id: str) -> None:
+        """Deletes the specified Intent."""
+        client_options = self._set_region(intent_id)
+        client = self._get_async_client(
+            services.intents.IntentsAsyncClient, client_options)
+
+        await self._call_api(client.delete_intent, name=intent_id)
@@ -0,0 +1,149 @@
+"""Page Resource Async functions."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from typing import Dict, List
+
+from google.cloud.dialogflowcx_v3beta1 import services, types
+
+from dfcx_scrapi.core.pages import Pages
+from dfcx_scrapi.core_async.scrapi_base import (
+    DEFAULT_MAX_CONCURRENCY,
+    ScrapiBaseAsync,
+)
+
+# logging config
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)-8s %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+class PagesAsync(ScrapiBaseAsync):
+    """Core Class for CX Page Resource Async functions."""
+
+    def __init__(
+        self,
+        creds_path: str = None,
+        creds_dict: Dict = None,
+        creds=None,
+        scope=False,
+        flow_id: str = None,
+        language_code: str = "en",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        super().__init__(
+            creds_path=creds_path,
+            creds_dict=creds_dict,
+            creds=creds,
+            scope=scope,
+            max_concurrency=max_concurrency,
+        )
+
+        self.flow_id = flow_id
+        self.language_code = language_code
+
+    async def get_pages_map(
+        self, flow_id: str = None, reverse: bool = False) -> Dict[str, str]:
+        """Exports Flow Page UUIDs and Names into a user friendly dict.
+
+        Args:
+          flow_id: the formatted CX Agent Flow ID to use
+          reverse: (Optional) Boolean flag to swap key:value -> value:key
+
+        Returns:
+          Dictionary containing Page UUIDs as keys and display names as values,
+          including the special START_PAGE, END_FLOW and END_SESSION pages.
+        """
+        if not flow_id:
+            flow_id = self.flow_id
+
+        pages = await self.list_pages(flow_id)
+
+        if reverse:
+            pages_dict = {page.display_name: page.name for page in pages}
+        else:
+            pages_dict = {page.name: page.display_name for page in pages}
+
+        return Pages._add_generic_pages_to_map( # pylint: disable=W0212
+            flow_id, pages_dict, reverse)
+
+    async def list_pages(
+        self,
+        flow_id: str = None,
+        language_code: str = None) -> List[types.Page]:
+        """Get a List of all pages for the specified Flow ID.
+
+        Args:
+          flow_id: the properly formatted Flow ID string
+          language_code: (Optional) the language of the Pages to list.
+
+        Returns:
+          A List of CX Page objects for the specific Flow ID
+        """
+        if not flow_id:
+            flow_id = self.flow_id
+
+        request = types.page.ListPagesRequest()
+        request.parent = flow_id
+        request.language_code = language_code or self.language_code
+
+        client_options = self._set_region(flow_id)
+        client = self._get_async_client(
+            services.pages.PagesAsyncClient, client_options)
+
+        return await self._list_all(client.list_pages, request)
+
+    async def list_pages_for_flows(
+        self,
+        flow_ids: List[str],
+        language_code: str = None) -> Dict[str, List[types.Page]]:
+        """List the Pages of many Flows concurrently.
+
+        Args:
+          flow_ids: the properly formatted Flow ID strings
+          language_code: (Optional) the language of the Pages to list.
+
+        Returns:
+          A Dictionary of Flow ID to the List of Pages in that Flow.
+        """
+        results = await self.gather(
+            self.list_pages(flow_id, language_code) for flow_id in flow_ids
+        )
+
+        return dict(zip(flow_ids, results))
+
+    async def get_page(
+        self, page_id: str, language_code: str = None) -> types.Page:
+        """Get a single CX Page object based on the provided Page ID.
+
+        Args:
+          page_id: a properly formatted CX Page ID
+          language_code: (Optional) the language of the Page to get.
+
+        Returns:
+          A single CX Page Object
+        """
+        request = types.page.GetPageRequest()
+        request.name = page_id
+        request.language_code = language_code or self.language_code
+
+        client_options = self._set_region(page_id)
+        client = self._get_async_client(
+            services.pages.PagesAsyncClient, client_options)
+
+        return await self._call_api(client.get_page, request)
@@ -0,0 +1,136 @@
+"""Base for other SCRAPI Async classes."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import weakref
+from typing import Any, Awaitable, Dict, Iterable, List
+
+from dfcx_scrapi.core.scrapi_base import ScrapiBase
+
+# logging config
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)-8s %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+class ScrapiBaseAsync(ScrapiBase):
+    """Core Class for managing Async clients and bounded concurrency.
+
+    Async gRPC clients are bound to the event loop they are created on, so
+    clients and semaphores are cached per running loop rather than in the
+    process-wide pool used by the synchronous classes.
+    """
+
+    def __init__(
+        self,
+        creds_path: str = None,
+        creds_dict: Dict[str, str] = None,
+        creds=None,
+        scope: List[str] = None,
+        agent_id: str = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        super().__init__(
+            creds_path=creds_path,
+            creds_dict=creds_dict,
+            creds=creds,
+            scope=scope,
+            agent_id=agent_id,
+        )
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than 0.")
+
+        self.max_concurrency = max_concurrency
+        self._loop_semaphores = weakref.WeakKeyDictionary()
+        self._loop_clients = weakref.WeakKeyDictionary()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._loop_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop_semaphores[loop] = semaphore
+
+        return semaphore
+
+    def _get_async_client(
+        self,
+        client_class: Any,
+        client_options: Dict[str, str] = None):
+        """Get a cached Async client for the running event loop.
+
+        Args:
+          client_class: The Async API client class to build, for example
+            `services.sessions.SessionsAsyncClient`.
+          client_options: The client options dictionary as returned by
+            `_set_region`.
+
+        Returns:
+          An instance of `client_class`.
+        """
+        loop = asyncio.get_running_loop()
+        clients = self._loop_clients.setdefault(loop, {})
+        key = self._client_pool_key(
+            client_class, client_options, self._creds_identity())
+        client = clients.get(key)
+        if client is None:
+            client = client_class(
+                credentials=self.creds, client_options=client_options
+            )
+            clients[key] = client
+
+        return client
+
+    async def _call_api(self, method, *args, **kwargs):
+        """Await a single API call while holding the concurrency semaphore."""
+        async with self._get_semaphore():
+            return await method(*args, **kwargs)
+
+    async def _list_all(self, method, *args, **kwargs) -> List[Any]:
+        """Await a List API call and iterate over every page of results.
+
+        The semaphore is held while following page tokens, so a single large
+        list counts as one unit of concurrency.
+        """
+        async with self._get_semaphore():
+            pager = await method(*args, **kwargs)
+            return [item async for item in pager]
+
+    @staticmethod
+    async def gather(awaitables: Iterable[Awaitable[Any]]) -> List[Any]:
+        """Run awaitables concurrently, returning results in input order.
+
+        Concurrency is bounded by the semaphore held within each API call,
+        not by this method.
+        """
+        return list(await asyncio.gather(*awaitables))
+
+    async def close(self):
+        """Close all Async clients created on the running event loop."""
+        loop = asyncio.get_running_loop()
+        clients = self._loop_clients.pop(loop, {})
+        for client in clients.values():
+            try:
+                await client.transport.close()
+            except Exception as err: # pylint: disable=W0718
+                logging.warning("Unable to close client transport: %s", err)
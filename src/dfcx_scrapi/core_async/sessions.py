@@ -0,0 +1,244 @@
+"""CX Session Resource Async functions."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import uuid
+from typing import Any, Dict, List
+
+from google.cloud.dialogflowcx_v3beta1 import services, types
+
+from dfcx_scrapi.core.sessions import Sessions
+from dfcx_scrapi.core_async.scrapi_base import (
+    DEFAULT_MAX_CONCURRENCY,
+    ScrapiBaseAsync,
+)
+
+# logging config
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)-8s %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+class SessionsAsync(ScrapiBaseAsync):
+    """Core Class for CX Session Resource Async functions."""
+
+    def __init__(
+        self,
+        creds_path: str = None,
+        creds_dict: Dict = None,
+        creds=None,
+        scope=False,
+        agent_id: str = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        super().__init__(
+            creds_path=creds_path,
+            creds_dict=creds_dict,
+            creds=creds,
+            scope=scope,
+            max_concurrency=max_concurrency,
+        )
+
+        self.agent_id = agent_id
+
+    def build_session_id(
+        self, agent_id: str = None, environment_id: str = None) -> str:
+        """Creates a valid UUID-4 Session ID to use with other methods.
+
+        Args:
+          agent_id: the Agent ID of the CX Agent.
+          environment_id: (Optional) the fully qualified Environment ID to
+            use when building the session ID. If this is not provided, DRAFT
+            is assumed.
+        """
+        if not agent_id:
+            agent_id = self.agent_id
+
+        _ = self._parse_resource_path("agent", agent_id)
+
+        if environment_id:
+            _ = self._parse_resource_path("environment", environment_id)
+            return f"{environment_id}/sessions/{uuid.uuid4()}"
+
+        return f"{agent_id}/sessions/{uuid.uuid4()}"
+
+    @staticmethod
+    def build_detect_intent_request(
+        session_id: str,
+        text: str = None,
+        language_code: str = "en",
+        parameters: Dict[str, Any] = None,
+        end_user_metadata: Dict[str, Any] = None,
+        populate_data_store_connection_signals: bool = False,
+        intent_id: str = None,
+        timezone: str = None
+    ) -> types.session.DetectIntentRequest:
+        """Build the DetectIntentRequest for a single user turn."""
+        if intent_id:
+            query_input = Sessions.build_intent_query_input(
+                intent_id, language_code)
+        else:
+            query_input = Sessions._build_query_input( # pylint: disable=W0212
+                text, language_code)
+
+        request = types.session.DetectIntentRequest()
+        request.session = session_id
+        request.query_input = query_input
+
+        query_param_mapping = {}
+
+        if parameters:
+            query_param_mapping["parameters"] = parameters
+
+        if end_user_metadata:
+            query_param_mapping["end_user_metadata"] = end_user_metadata
+
+        if populate_data_store_connection_signals:
+            query_param_mapping[
+                "populate_data_store_connection_signals"
+            ] = populate_data_store_connection_signals
+
+        if timezone:
+            query_param_mapping["time_zone"] = timezone
+
+        if query_param_mapping:
+            query_params = types.session.QueryParameters(query_param_mapping)
+            request.query_params = query_params
+
+        return request
+
+    async def detect_intent(
+        self,
+        agent_id: str,
+        session_id: str,
+        text: str = None,
+        language_code: str = "en",
+        parameters: Dict[str, Any] = None,
+        end_user_metadata: Dict[str, Any] = None,
+        populate_data_store_connection_signals: bool = False,
+        intent_id: str = None,
+        timezone: str = None
+    ) -> types.session.QueryResult:
+        """Returns the result of detect intent with texts as inputs.
+
+        Using the same `session_id` between requests allows continuation
+        of the conversation. See `Sessions.detect_intent` for details on
+        each of the arguments.
+
+        Returns:
+          The CX query result from intent detection
+        """
+        res = self._parse_resource_path("session", str(session_id), False)
+        if not res:
+            raise ValueError(
+                "Session ID must be provided in the following format: "
+                "`projects/<Project ID>/locations/<Location ID>/agents/"
+                "<Agent ID>/sessions/<Session ID>`.\n\n"
+                "Utilize `build_session_id` to create a new Session ID."
+            )
+
+        request = self.build_detect_intent_request(
+            session_id,
+            text=text,
+            language_code=language_code,
+            parameters=parameters,
+            end_user_metadata=end_user_metadata,
+            populate_data_store_connection_signals=(
+                populate_data_store_connection_signals),
+            intent_id=intent_id,
+            timezone=timezone
+        )
+
+        client_options = self._set_region(agent_id)
+        client = self._get_async_client(
+            services.sessions.SessionsAsyncClient, client_options)
+
+        response = await self._call_api(client.detect_intent, request=request)
+
+        return response.query_result
+
+    async def run_conversation(
+        self,
+        utterances: List[str],
+        agent_id: str = None,
+        session_id: str = None,
+        language_code: str = "en",
+        **kwargs
+    ) -> List[types.session.QueryResult]:
+        """Send a list of utterances, in order, within a single session.
+
+        Args:
+          utterances: The user utterances to send, one per turn.
+          agent_id: (Optional) the Agent ID to converse with.
+          session_id: (Optional) the Session ID to use. If not provided, a
+            new session is created.
+          language_code: (Optional) the language code for each turn.
+          **kwargs: Additional arguments passed to `detect_intent`.
+
+        Returns:
+          A list of CX query results, one per utterance.
+        """
+        if not agent_id:
+            agent_id = self.agent_id
+
+        if not session_id:
+            session_id = self.build_session_id(agent_id)
+
+        results = []
+        for text in utterances:
+            results.append(
+                await self.detect_intent(
+                    agent_id, session_id, text, language_code, **kwargs
+                )
+            )
+
+        return results
+
+    async def bulk_detect_intent(
+        self,
+        utterances: List[str],
+        agent_id: str = None,
+        language_code: str = "en",
+        **kwargs
+    ) -> List[types.session.QueryResult]:
+        """Run detect intent concurrently, one new session per utterance.
+
+        Concurrency is bounded by `max_concurrency`.
+
+        Args:
+          utterances: The user utterances to send.
+          agent_id: (Optional) the Agent ID to converse with.
+          language_code: (Optional) the language code for each request.
+          **kwargs: Additional arguments passed to `detect_intent`.
+
+        Returns:
+          A list of CX query results in the same order as `utterances`.
+        """
+        if not agent_id:
+            agent_id = self.agent_id
+
+        return await self.gather(
+            self.detect_intent(
+                agent_id,
+                self.build_session_id(agent_id),
+                text,
+                language_code,
+                **kwargs
+            )
+            for text in utterances
+        )
@@ -20,7 +20,10 @@ from typing import Dict, List
 from google.cloud.dialogflowcx_v3beta1 import services, types
 from google.protobuf import field_mask_pb2
 
-from dfcx_scrapi.core.scrapi_base import ScrapiBase
+from dfcx_scrapi.core_async.scrapi_base import (
+    DEFAULT_MAX_CONCURRENCY,
+    ScrapiBaseAsync,
+)
 
 # logging config
 logging.basicConfig(
@@ -30,7 +33,7 @@ logging.basicConfig(
 )
 
 
-class TestCasesAsync(ScrapiBase):
+class TestCasesAsync(ScrapiBaseAsync):
     """Core Class for CX Test Cases Async."""
 
     def __init__(
@@ -40,12 +43,14 @@ class TestCasesAsync(ScrapiBase):
         creds=None,
         scope=False,
         agent_id: str = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         super().__init__(
             creds_path=creds_path,
             creds_dict=creds_dict,
             creds=creds,
             scope=scope,
+            max_concurrency=max_concurrency,
         )
 
         if agent_id:
@@ -60,7 +65,7 @@ class TestCasesAsync(ScrapiBase):
             iterated.append(instance)
         return iterated
 
-    def list_test_cases(self, agent_id: str = None):
+    async def list_test_cases(self, agent_id: str = None):
         """Lists all Test Cases for a given Agent.
 
         Args:
@@ -68,7 +73,7 @@ class TestCasesAsync(ScrapiBase):
              `projects/<Project ID>/locations/<Location ID>/agents/<Agent ID>`.
 
         Returns:
-          List of test cases from an agent as a coroutine
+          List of test cases from an agent
         """
 
         if not agent_id:
@@ -79,14 +84,13 @@ class TestCasesAsync(ScrapiBase):
 
         client_options = self._set_region(agent_id)
 
-        client = services.test_cases.TestCasesAsyncClient(
-            credentials=self.creds, client_options=client_options
-        )
-        response = client.list_test_cases(request)
+        client = self._get_async_client(
+            services.test_cases.TestCasesAsyncClient, client_options)
+        response = await self._list_all(client.list_test_cases, request)
 
         return response
 
-    def export_test_cases(
+    async def export_test_cases(
         self,
         gcs_uri: str,
         agent_id: str = None,
@@ -113,7 +117,7 @@ class TestCasesAsync(ScrapiBase):
               exact resource name "t1" or "t2".
 
         Returns:
-          Long running operation for export as a coroutine
+          Long running operation for export
         """
 
         if not agent_id:
@@ -126,13 +130,12 @@ class TestCasesAsync(ScrapiBase):
         request.filter = data_filter
 
         client_options = self._set_region(agent_id)
-        client = services.test_cases.TestCasesAsyncClient(
-            credentials=self.creds, client_options=client_options
-        )
-        response = client.export_test_cases(request)
+        client = self._get_async_client(
+            services.test_cases.TestCasesAsyncClient, client_options)
+        response = await self._call_api(client.export_test_cases, request)
         return response
 
-    def create_test_case(
+    async def create_test_case(
         self,
         test_case: types.TestCase,
         agent_id: str = None):
@@ -144,7 +147,7 @@ class TestCasesAsync(ScrapiBase):
             `projects/<Project ID>/locations/<Location ID>/agents/<Agent ID>`.
 
         Returns:
-          Test case which was created as a coroutine
+          Test case which was created
         """
 
         if not agent_id:
@@ -155,13 +158,12 @@ class TestCasesAsync(ScrapiBase):
         request.test_case = test_case
 
         client_options = self._set_region(agent_id)
-        client = services.test_cases.TestCasesAsyncClient(
-            credentials=self.creds, client_options=client_options
-        )
-        response = client.create_test_case(request)
+        client = self._get_async_client(
+            services.test_cases.TestCasesAsyncClient, client_options)
+        response = await self._call_api(client.create_test_case, request)
         return response
 
-    def get_test_case(self, test_case_id: str):
+    async def get_test_case(self, test_case_id: str):
         """Get the specified Test Case object.
 
         Args:
@@ -170,20 +172,19 @@ class TestCasesAsync(ScrapiBase):
               testCases/<TestCase ID>`.
 
         Returns:
-          Test Case object as coroutine
+          Test Case object
         """
 
         request = types.test_case.GetTestCaseRequest()
         request.name = test_case_id
 
         client_options = self._set_region(test_case_id)
-        client = services.test_cases.TestCasesAsyncClient(
-            credentials=self.creds, client_options=client_options
-        )
-        response = client.get_test_case(request)
+        client = self._get_async_client(
+            services.test_cases.TestCasesAsyncClient, client_options)
+        response = await self._call_api(client.get_test_case, request)
         return response
 
-    def import_test_cases(self, gcs_uri: str, agent_id: str = None):
+    async def import_test_cases(self, gcs_uri: str, agent_id: str = None):
         """Import Test Cases from Google Cloud Storage.
 
         Args:
@@ -193,7 +194,7 @@ class TestCasesAsync(ScrapiBase):
             `projects/<Project ID>/locations/<Location ID>/agents/<Agent ID>`.
 
         Returns:
-          Long running operation for importing test cases as a couroutine.
+          Long running operation for importing test cases.
         """
 
         if not agent_id:
@@ -204,13 +205,12 @@ class TestCasesAsync(ScrapiBase):
         request.gcs_uri = gcs_uri
 
         client_options = self._set_region(agent_id)
-        client = services.test_cases.TestCasesAsyncClient(
-            credentials=self.creds, client_options=client_options
-        )
-        response = client.import_test_cases(request)
+        client = self._get_async_client(
+            services.test_cases.TestCasesAsyncClient, client_options)
+        response = await self._call_api(client.import_test_cases, request)
         return response
 
-    def batch_delete_test_cases(
+    async def batch_delete_test_cases(
         self,
         test_case_ids: List[str],
         agent_id: str = None):
@@ -235,12 +235,11 @@ class TestCasesAsync(ScrapiBase):
         request.names = test_case_ids
 
         client_options = self._set_region(agent_id)
-        client = services.test_cases.TestCasesAsyncClient(
-            credentials=self.creds, client_options=client_options
-        )
-        client.batch_delete_test_cases(request)
+        client = self._get_async_client(
+            services.test_cases.TestCasesAsyncClient, client_options)
+        await self._call_api(client.batch_delete_test_cases, request)
 
-    def list_test_case_results(self, test_case_id: str):
+    async def list_test_case_results(self, test_case_id: str):
         """List a set of Test Case results for a given Test Case ID.
 
         Args:
@@ -257,13 +256,13 @@ class TestCasesAsync(ScrapiBase):
         request.parent = test_case_id
 
         client_options = self._set_region(test_case_id)
-        client = services.test_cases.TestCasesAsyncClient(
-            credentials=self.creds, client_options=client_options
-        )
-        response = client.list_test_case_results(request)
+        client = self._get_async_client(
+            services.test_cases.TestCasesAsyncClient, client_options)
+        response = await self._list_all(
+            client.list_test_case_results, request)
         return response
 
-    def batch_run_test_cases(
+    async def batch_run_test_cases(
         self,
         test_cases: List[str],
         agent_id: str = None,
@@ -279,7 +278,7 @@ class TestCasesAsync(ScrapiBase):
             environments/<Environment ID>`.
 
         Returns:
-          Results for the set of Test Cases as a coroutine.
+          Long running operation for the batch run of Test Cases.
         """
 
         if not agent_id:
@@ -290,13 +289,12 @@ class TestCasesAsync(ScrapiBase):
         request.environment = environment
         request.test_cases = test_cases
         client_options = self._set_region(agent_id)
-        client = services.test_cases.TestCasesAsyncClient(
-            credentials=self.creds, client_options=client_options
-        )
-        response = client.batch_run_test_cases(request)
+        client = self._get_async_client(
+            services.test_cases.TestCasesAsyncClient, client_options)
+        response = await self._call_api(client.batch_run_test_cases, request)
         return response
 
-    def update_test_case(
+    async def update_test_case(
         self,
         obj: types.TestCase,
         test_case_id: str = None,
@@ -308,7 +306,7 @@ class TestCasesAsync(ScrapiBase):
           test_case_id: (Optional) The Test Case ID to update.
 
         Returns:
-          Updated test case as coroutine.
+          Updated test case.
         """
         test_case = obj
         if test_case_id:
@@ -324,13 +322,12 @@ class TestCasesAsync(ScrapiBase):
         request.update_mask = mask
 
         client_options = self._set_region(test_case_id)
-        client = services.test_cases.TestCasesAsyncClient(
-            credentials=self.creds, client_options=client_options
-        )
-        response = client.update_test_case(request)
+        client = self._get_async_client(
+            services.test_cases.TestCasesAsyncClient, client_options)
+        response = await self._call_api(client.update_test_case, request)
         return response
 
-    def run_test_case(self, test_case_id: str, environment: str = None):
+    async def run_test_case(self, test_case_id: str, environment: str = None):
         """Run test case and get result for a specified test case.
 
         Args:
@@ -342,7 +339,7 @@ class TestCasesAsync(ScrapiBase):
               <Location ID>/agents/<Agent ID>/environments/<Environment ID>`.
 
         Returns:
-          Test Case result as coroutine
+          Long running operation for the Test Case run
         """
 
         request = types.test_case.RunTestCaseRequest()
@@ -350,13 +347,36 @@ class TestCasesAsync(ScrapiBase):
         request.environment = environment
 
         client_options = self._set_region(test_case_id)
-        client = services.test_cases.TestCasesAsyncClient(
-            credentials=self.creds, client_options=client_options
-        )
-        response = client.run_test_case(request)
+        client = self._get_async_client(
+            services.test_cases.TestCasesAsyncClient, client_options)
+        response = await self._call_api(client.run_test_case, request)
         return response
 
-    def get_test_case_result(self, test_case_result_id: str):
+    async def run_test_cases(
+        self,
+        test_case_ids: List[str],
+        environment: str = None) -> List[types.RunTestCaseResponse]:
+        """Run many Test Cases concurrently and wait for all results.
+
+        Args:
+          test_case_ids: List of Test Case IDs to run. Format:
+            `projects/<Project ID>/locations/ <Location ID>/agents/<AgentID>/
+              testCases/<TestCase ID>`.
+          environment: (Optional) Environment name. If not set, DRAFT
+            environment is assumed.
+
+        Returns:
+          List of RunTestCaseResponse objects in the same order as the input.
+        """
+        async def run_and_wait(test_case_id: str):
+            operation = await self.run_test_case(test_case_id, environment)
+            return await operation.result()
+
+        return await self.gather(
+            run_and_wait(test_case_id) for test_case_id in test_case_ids
+        )
+
+    async def get_test_case_result(self, test_case_result_id: str):
         """Get Test Case result for a specified run on a specified Test Case.
 
         Args:
@@ -365,20 +385,20 @@ class TestCasesAsync(ScrapiBase):
               testCases/<TestCase ID>/results/<TestCaseResult ID>
 
         Returns:
-          Test Case result as coroutine.
+          Test Case result.
         """
 
         request = types.test_case.GetTestCaseResultRequest()
         request.name = test_case_result_id
 
         client_options = self._set_region(test_case_result_id)
-        client = services.test_cases.TestCasesAsyncClient(
-            credentials=self.creds, client_options=client_options
-        )
-        response = client.get_test_case_result(request)
+        client = self._get_async_client(
+            services.test_cases.TestCasesAsyncClient, client_options)
+        response = await self._call_api(client.get_test_case_result, request)
         return response
 
-    def calculate_coverage(self, coverage_type: int, agent_id: str = None):
+    async def calculate_coverage(
+        self, coverage_type: int, agent_id: str = None):
         """Calculate coverage of different resources in the test case set.
 
         Args:
@@ -390,8 +410,7 @@ class TestCasesAsync(ScrapiBase):
             `projects/<Project ID>/locations/<Location ID>/agents/<Agent ID>`.
 
         Returns:
-          Coroutine for returning the coverage of the test cases for
-            the type_ specified.
+          The coverage of the test cases for the type_ specified.
         """
 
         if not agent_id:
@@ -408,8 +427,7 @@ class TestCasesAsync(ScrapiBase):
         request.type_ = coverage_type
 
         client_options = self._set_region(agent_id)
-        client = services.test_cases.TestCasesAsyncClient(
-            credentials=self.creds, client_options=client_options
-        )
-        response = client.calculate_coverage(request)
+        client = self._get_async_client(
+            services.test_cases.TestCasesAsyncClient, client_options)
+        response = await self._call_api(client.calculate_coverage, request)
         return response
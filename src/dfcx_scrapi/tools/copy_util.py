@@ -16,7 +16,6 @@
 
 import copy
 import logging
-import time
 from collections import defaultdict
 from typing import Dict, List
 
@@ -467,14 +466,15 @@ class CopyUtil(ScrapiBase):
 
         for intent in resources_objects["intents"]:
             logging.info("Creating Intent %s...", intent.display_name)
-            time.sleep(1)  # sleep to not overrun API rate limiter
 
             if "parameters" in intent:
                 intent = self._remap_parameters_in_intent(
                     source_agent, destination_agent, intent
                 )
             try:
-                self.intents.create_intent(destination_agent, intent)
+                self._call_with_quota(
+                    destination_agent, "write", self.intents.create_intent,
+                    destination_agent, intent)
                 resources_skip_list["intents"].append(intent.display_name)
                 logging.info(
                     "Intent %s created successfully", intent.display_name
@@ -16,12 +16,13 @@
 
 import json
 import logging
-import time
-from typing import Any, Dict, List
+from concurrent import futures
+from typing import Any, Callable, Dict, List, Tuple
 
 import gspread
 import numpy as np
 import pandas as pd
+from google.api_core import exceptions
 from google.cloud.dialogflowcx_v3beta1 import types
 from gspread_dataframe import set_with_dataframe
 from tabulate import tabulate
@@ -30,7 +31,7 @@ from dfcx_scrapi.core.entity_types import EntityTypes
 from dfcx_scrapi.core.flows import Flows
 from dfcx_scrapi.core.intents import Intents
 from dfcx_scrapi.core.pages import Pages
-from dfcx_scrapi.core.scrapi_base import ScrapiBase
+from dfcx_scrapi.core.scrapi_base import DEFAULT_FAN_OUT_WORKERS, ScrapiBase
 from dfcx_scrapi.core.transition_route_groups import TransitionRouteGroups
 
 SHEETS_SCOPE = [
@@ -45,6 +46,12 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+INTENT_REPORT_COLUMNS = [
+    "display_name", "intent_id", "status", "error",
+    "training_phrases_added", "training_phrases_removed",
+    "parameters_added", "parameters_removed",
+]
+
 class DataframeFunctions(ScrapiBase):
     """Class that supports dataframe functions in DFCX."""
 
@@ -143,6 +150,148 @@ class DataframeFunctions(ScrapiBase):
 
         return new_intent
 
+    @staticmethod
+    def _group_by_intent(dataframe: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """Split a DataFrame into one DataFrame per intent, in a single pass.
+        """
+        if dataframe is None or dataframe.empty:
+            return {}
+
+        return {
+            display_name: group.drop(columns="display_name")
+            for display_name, group in dataframe.groupby(
+                "display_name", sort=False)
+        }
+
+    @staticmethod
+    def _build_training_phrases(
+        train_phrases: pd.DataFrame, mode: str) -> List[Dict[str, Any]]:
+        """Build training phrase dicts from a training phrase DataFrame."""
+        if mode == "basic":
+            return [
+                {
+                    "parts": [{"text": text, "parameter_id": None}],
+                    "repeat_count": 1,
+                    "id": "",
+                }
+                for text in train_phrases["text"]
+            ]
+
+        training_phrases = []
+        for _, tp_parts in train_phrases.groupby("training_phrase"):
+            parts = [
+                {
+                    "text": text,
+                    "parameter_id": None if pd.isna(param_id) else param_id,
+                }
+                for text, param_id in zip(
+                    tp_parts["text"], tp_parts["parameter_id"])
+            ]
+            training_phrases.append(
+                {"parts": parts, "repeat_count": 1, "id": ""})
+
+        return training_phrases
+
+    @staticmethod
+    def _build_parameters(params: pd.DataFrame) -> List[Dict[str, Any]]:
+        """Build parameter dicts from a parameter DataFrame."""
+        if params is None or params.empty:
+            return []
+
+        return [
+            {
+                "id": param_id,
+                "entity_type": entity_type,
+                "is_list": False,
+                "redact": False,
+            }
+            for param_id, entity_type in zip(
+                params["id"], params["entity_type"])
+        ]
+
+    @staticmethod
+    def _diff_intents(
+        original: types.Intent, new_intent: types.Intent
+    ) -> Dict[str, List[str]]:
+        """List the training phrases and parameters a write would change."""
+        def phrases(intent):
+            return {
+                "".join(part.text for part in phrase.parts)
+                for phrase in intent.training_phrases
+            } if intent else set()
+
+        def params(intent):
+            return {
+                param.id for param in intent.parameters
+            } if intent else set()
+
+        return {
+            "training_phrases_added": sorted(
+                phrases(new_intent) - phrases(original)),
+            "training_phrases_removed": sorted(
+                phrases(original) - phrases(new_intent)),
+            "parameters_added": sorted(params(new_intent) - params(original)),
+            "parameters_removed": sorted(
+                params(original) - params(new_intent)),
+        }
+
+    def _run_intent_tasks(
+        self,
+        tasks: Dict[str, Callable[[], Tuple[types.Intent, Dict[str, Any]]]],
+        max_workers: int = DEFAULT_FAN_OUT_WORKERS,
+    ) -> Dict[str, Tuple[types.Intent, Dict[str, Any]]]:
+        """Run one task per intent concurrently, in the order of `tasks`.
+
+        The tasks pace their own API calls through the shared quota buckets,
+        so `max_workers` only bounds the number of calls in flight. If a
+        task raises, the tasks that haven't started yet are cancelled.
+        """
+        if not tasks:
+            return {}
+
+        results = {}
+        max_workers = max(1, min(max_workers, len(tasks)))
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_map = {
+                executor.submit(task): display_name
+                for display_name, task in tasks.items()
+            }
+            try:
+                for i, future in enumerate(
+                    futures.as_completed(future_map), start=1):
+                    results[future_map[future]] = future.result()
+                    self.progress_bar(i, len(tasks))
+            except BaseException:
+                for future in future_map:
+                    future.cancel()
+                raise
+
+        return {display_name: results[display_name] for display_name in tasks}
+
+    @staticmethod
+    def _intents_report(
+        results: Dict[str, Tuple[types.Intent, Dict[str, Any]]]
+    ) -> pd.DataFrame:
+        return pd.DataFrame(
+            [row for _, row in results.values()],
+            columns=INTENT_REPORT_COLUMNS,
+        )
+
+    @staticmethod
+    def _raise_for_failed_intents(
+        results: Dict[str, Tuple[types.Intent, Dict[str, Any]]], action: str
+    ):
+        """Raise a RuntimeError listing every intent whose write failed."""
+        failed = [
+            f"{row['display_name']}: {row.get('error')}"
+            for _, row in results.values()
+            if row.get("status") == "failed"
+        ]
+        if failed:
+            raise RuntimeError(
+                f"Failed to {action} {len(failed)} intent(s): "
+                + "; ".join(failed))
+
     def _check_and_update_sheets_scopes(self):
         """Update Credentials scopes if possible based on creds type."""
         if self.creds.scopes:
@@ -154,6 +303,7 @@ class DataframeFunctions(ScrapiBase):
         train_phrases: pd.DataFrame,
         params=None,
         mode: str = "basic",
+        original: types.Intent = None,
     ):
         """Make an Updated Intent Object based on already existing Intent.
 
@@ -171,6 +321,7 @@ class DataframeFunctions(ScrapiBase):
           mode: "basic" - build assuming one row is one training phrase no
             entities, "advanced" - build keeping track of training phrases and
             parts with the training_phrase and parts column.
+          original: (Optional) the existing Intent, if already fetched.
 
         Returns:
           The new intents protobuf object
@@ -241,55 +392,19 @@ class DataframeFunctions(ScrapiBase):
         else:
             raise ValueError("Mode must be 'basic' or 'advanced'")
 
-        original = self.intents.get_intent(intent_id=intent_id)
+        if original is None:
+            original = self.intents.get_intent(intent_id=intent_id)
         intent = self._remap_intent_values(original)
 
         # training phrases
-        if mode == "advanced":
-            training_phrases = []
-            for phrase in list(set(train_phrases["training_phrase"])):
-                tp_parts = train_phrases[
-                    train_phrases["training_phrase"].astype(int) == int(phrase)
-                ]
-                parts = []
-                for _, row in tp_parts.iterrows():
-                    param_id = row["parameter_id"]
-                    part = {
-                        "text": row["text"],
-                        "parameter_id": None if pd.isna(param_id) else param_id,
-                }
-                    parts.append(part)
-
-                training_phrase = {"parts": parts, "repeat_count": 1, "id": ""}
-                training_phrases.append(training_phrase)
-
-            intent.training_phrases = training_phrases
-            parameters = []
-            for _, row in params.iterrows():
-                parameter = {
-                    "id": row["id"],
-                    "entity_type": row["entity_type"],
-                    "is_list": False,
-                    "redact": False,
-                }
-                parameters.append(parameter)
+        intent.training_phrases = self._build_training_phrases(
+            train_phrases, mode)
 
+        if mode == "advanced":
+            parameters = self._build_parameters(params)
             if parameters:
                 intent.parameters = parameters
 
-        elif mode == "basic":
-            training_phrases = []
-            for _, row in train_phrases.iterrows():
-                part = {"text": row["text"], "parameter_id": None}
-                parts = [part]
-                training_phrase = {"parts": parts, "repeat_count": 1, "id": ""}
-                training_phrases.append(training_phrase)
-            intent.training_phrases = training_phrases
-        else:
-            raise ValueError("mode must be basic or advanced")
-
-        # json_intent = json.dumps(intent)
-        # intent_pb = types.Intent.from_json(json_intent)
         return intent
 
     def bulk_update_intents_from_dataframe(
@@ -299,11 +414,20 @@ class DataframeFunctions(ScrapiBase):
         params_df: pd.DataFrame = None,
         mode: str = "basic",
         update_flag: bool = False,
-        rate_limiter: int = 5,
-        language_code: str = None
+        rate_limiter: int = None,
+        language_code: str = None,
+        max_workers: int = DEFAULT_FAN_OUT_WORKERS,
+        dry_run: bool = False,
+        return_report: bool = False,
     ):
         """Update existing Intent, TPs and Parameters from a Dataframe.
 
+        Intents are fetched, built and written concurrently. Failed API calls
+        are logged and reported per intent, and don't stop the other intents.
+        Failed intents are left out of the returned dictionary and, unless
+        `return_report` is True, a RuntimeError listing them is raised once
+        every intent has been processed.
+
         Args:
           agent_id: name parameter of the agent to update_flag - full path to
             agent
@@ -316,13 +440,21 @@ class DataframeFunctions(ScrapiBase):
             advanced, build keeping track of training phrases and parts with the
               training_phrase and parts column.
           update_flag: True to update_flag the intents in the agent
-          rate_limiter: seconds to sleep between operations.
+          rate_limiter: (Optional) seconds to wait between operations. If not
+            provided, writes are paced by the shared `write` quota bucket.
           language_code: Language code of the intents being uploaded. Reference:
             https://cloud.google.com/dialogflow/cx/docs/reference/language
+          max_workers: (Optional) the max number of intents processed at once.
+          dry_run: (Optional) if True, nothing is written, and the report
+            lists the training phrases and parameters each update would add
+            or remove.
+          return_report: (Optional) if True, also return a DataFrame with one
+            row per intent and the columns in `INTENT_REPORT_COLUMNS`.
 
         Returns:
           Dictionary with intent display names as keys and the new intent
-          protobufs as values
+          protobufs as values. If `return_report` is True, a tuple of this
+          dictionary and the report DataFrame.
         """
 
         if mode == "basic":
@@ -428,46 +560,87 @@ class DataframeFunctions(ScrapiBase):
             agent_id=agent_id, reverse=True
         )
 
-        intent_names = list(set(tp_df["display_name"]))
+        tps_by_intent = self._group_by_intent(tp_df)
+        params_by_intent = {}
+        if mode == "advanced":
+            params_by_intent = self._group_by_intent(params_df)
+
+        def update_intent(intent_name: str, tps: pd.DataFrame):
+            row = {
+                "display_name": intent_name,
+                "intent_id": intents_map[intent_name],
+            }
+            try:
+                original = self._call_with_quota(
+                    agent_id, "read", self.intents.get_intent,
+                    intent_id=row["intent_id"], language_code=language_code)
+                new_intent = self._update_intent_from_dataframe(
+                    intent_id=row["intent_id"],
+                    train_phrases=tps,
+                    params=params_by_intent.get(intent_name, pd.DataFrame()),
+                    mode=mode,
+                    original=original,
+                )
+            except exceptions.GoogleAPICallError as err:
+                logging.error(
+                    "FAIL to update - [%s]: %s", intent_name, err)
+                row.update({"status": "failed", "error": str(err)})
+                return None, row
+
+            if dry_run:
+                row.update(self._diff_intents(original, new_intent))
+                row["status"] = "dry_run"
+            elif update_flag:
+                try:
+                    self._call_with_quota(
+                        agent_id, "write", self.intents.update_intent,
+                        intent_id=new_intent.name,
+                        obj=new_intent,
+                        language_code=language_code
+                    )
+                    row["status"] = "updated"
+                except exceptions.GoogleAPICallError as err:
+                    logging.error(
+                        "FAIL to update - [%s]: %s", intent_name, err)
+                    row.update({"status": "failed", "error": str(err)})
+            else:
+                row["status"] = "built"
+
+            return new_intent, row
 
-        new_intents = {}
-        i = 0
-        for intent_name in intent_names:
+        tasks = {}
+        not_found = {}
+        for intent_name, tps in tps_by_intent.items():
             if intent_name in (["", np.nan, None]):
                 logging.warning("empty intent_name")
                 continue
 
-            tps = tp_df.copy()[tp_df["display_name"] == intent_name].drop(
-                columns="display_name"
-            )
-            params = pd.DataFrame()
-            if mode == "advanced":
-                params = params_df.copy()[
-                    params_df["display_name"] == intent_name
-                ].drop(columns="display_name")
-
             if intent_name not in intents_map.keys():
                 logging.error(
                     "FAIL to update - intent not found: [%s]", intent_name
                 )
+                not_found[intent_name] = (
+                    None, {"display_name": intent_name, "status": "not_found"})
                 continue
 
-            new_intent = self._update_intent_from_dataframe(
-                intent_id=intents_map[intent_name],
-                train_phrases=tps,
-                params=params,
-                mode=mode,
-            )
-            new_intents[intent_name] = new_intent
-            i += 1
-            self.progress_bar(i, len(intent_names))
-            if update_flag:
-                self.intents.update_intent(
-                    intent_id=new_intent.name,
-                    obj=new_intent,
-                    language_code=language_code
-                )
-                time.sleep(rate_limiter)
+            tasks[intent_name] = (
+                lambda name=intent_name, tps=tps: update_intent(name, tps))
+
+        with self.call_rate_limit(
+            agent_id, "write",
+            seconds_between_calls=rate_limiter if update_flag else None):
+            results = self._run_intent_tasks(tasks, max_workers)
+        new_intents = {
+            intent_name: new_intent
+            for intent_name, (new_intent, row) in results.items()
+            if new_intent is not None and row["status"] != "failed"
+        }
+
+        if return_report:
+            results.update(not_found)
+            return new_intents, self._intents_report(results)
+
+        self._raise_for_failed_intents(results, "update")
 
         return new_intents
 
@@ -566,49 +739,13 @@ class DataframeFunctions(ScrapiBase):
             intent["description"] = meta.get("description", "")
 
         # training phrases
-        if mode == "advanced":
-            training_phrases = []
-            for phrase in list(set(tp_df["training_phrase"])):
-                tp_parts = tp_df[
-                    tp_df["training_phrase"].astype(int) == int(phrase)
-                ]
-                parts = []
-                for _, row in tp_parts.iterrows():
-                    param_id = row["parameter_id"]
-                    part = {
-                        "text": row["text"],
-                        "parameter_id": None if pd.isna(param_id) else param_id,
-                    }
-                    parts.append(part)
-
-                training_phrase = {"parts": parts, "repeat_count": 1, "id": ""}
-                training_phrases.append(training_phrase)
-
-            intent["training_phrases"] = training_phrases
-            parameters = []
-            for _, row in params_df.iterrows():
-                parameter = {
-                    "id": row["id"],
-                    "entity_type": row["entity_type"],
-                    "is_list": False,
-                    "redact": False,
-                }
-                parameters.append(parameter)
+        intent["training_phrases"] = self._build_training_phrases(tp_df, mode)
 
+        if mode == "advanced":
+            parameters = self._build_parameters(params_df)
             if parameters:
                 intent["parameters"] = parameters
 
-        elif mode == "basic":
-            training_phrases = []
-            for _, row in tp_df.iterrows():
-                part = {"text": row["text"], "parameter_id": None}
-                parts = [part]
-                training_phrase = {"parts": parts, "repeat_count": 1, "id": ""}
-                training_phrases.append(training_phrase)
-            intent["training_phrases"] = training_phrases
-        else:
-            raise ValueError("mode must be basic or advanced")
-
         json_intent = json.dumps(intent)
         intent_pb = types.Intent.from_json(json_intent)
 
@@ -621,12 +758,21 @@ class DataframeFunctions(ScrapiBase):
         params_df: pd.DataFrame = None,
         mode: str = "basic",
         update_flag: bool = False,
-        rate_limiter: int = 5,
+        rate_limiter: int = None,
         meta: Dict[str, str] = None,
         language_code: str = None,
+        max_workers: int = DEFAULT_FAN_OUT_WORKERS,
+        dry_run: bool = False,
+        return_report: bool = False,
     ):
         """Create Intents in DFCX from a DataFrame.
 
+        Intents are built and written concurrently. Failed API calls are
+        logged and reported per intent, and don't stop the other intents.
+        Failed intents are left out of the returned dictionary and, unless
+        `return_report` is True, a RuntimeError listing them is raised once
+        every intent has been processed.
+
         Args:
           agent_id: name parameter of the agent to update_flag - full path to
            agent
@@ -639,15 +785,21 @@ class DataframeFunctions(ScrapiBase):
             advanced - build keeping track of training phrases and parts with
               the training_phrase and parts column.
           update_flag: True to update_flag the intents in the agent
-          rate_limiter: number of seconds to wait between calls
+          rate_limiter: (Optional) number of seconds to wait between calls. If
+            not provided, writes are paced by the shared `write` quota bucket.
           meta: dictionary of intent metadata
           language_code: Language code of the intents being uploaded. Reference:
             https://cloud.google.com/dialogflow/cx/docs/reference/language
+          max_workers: (Optional) the max number of intents processed at once.
+          dry_run: (Optional) if True, nothing is written, and the report
+            lists the training phrases and parameters each intent would have.
+          return_report: (Optional) if True, also return a DataFrame with one
+            row per intent and the columns in `INTENT_REPORT_COLUMNS`.
 
         Returns:
           new_intents: dictionary with intent display names as keys and the new
-            intent protobufs as values
-
+            intent protobufs as values. If `return_report` is True, a tuple of
+            this dictionary and the report DataFrame.
         """
         if mode == "basic":
             if all(k in tp_df for k in ["display_name", "text"]):
@@ -738,33 +890,62 @@ class DataframeFunctions(ScrapiBase):
         else:
             raise ValueError("mode must be basic or advanced")
 
-        temp_intents = list(set(tp_df["display_name"]))
-        new_intents = {}
-        i = 0
-        for intent in temp_intents:
-            tps = tp_df.copy()[tp_df["display_name"] == intent].drop(
-                columns="display_name"
-            )
-            params = pd.DataFrame()
-            if mode == "advanced":
-                params = params_df.copy()[
-                    params_df["display_name"] == intent
-                ].drop(columns="display_name")
+        tps_by_intent = self._group_by_intent(tp_df)
+        params_by_intent = {}
+        if mode == "advanced":
+            params_by_intent = self._group_by_intent(params_df)
 
+        def create_intent(intent_name: str, tps: pd.DataFrame):
+            row = {"display_name": intent_name}
             new_intent = self._create_intent_from_dataframe(
-                display_name=intent,
+                display_name=intent_name,
                 tp_df=tps,
-                params_df=params,
+                params_df=params_by_intent.get(intent_name, pd.DataFrame()),
                 meta=meta,
                 mode=mode,
             )
-            new_intents[intent] = new_intent
-            i += 1
-            self.progress_bar(i, len(temp_intents))
-            if update_flag:
-                time.sleep(rate_limiter)
-                self.intents.create_intent(agent_id=agent_id, obj=new_intent,
-                    language_code=language_code)
+
+            if dry_run:
+                row.update(self._diff_intents(None, new_intent))
+                row["status"] = "dry_run"
+            elif update_flag:
+                try:
+                    created = self._call_with_quota(
+                        agent_id, "write", self.intents.create_intent,
+                        agent_id=agent_id, obj=new_intent,
+                        language_code=language_code)
+                    row.update({"intent_id": created.name, "status": "created"})
+                except exceptions.GoogleAPICallError as err:
+                    logging.error(
+                        "FAIL to create - [%s]: %s", intent_name, err)
+                    row.update({"status": "failed", "error": str(err)})
+            else:
+                row["status"] = "built"
+
+            return new_intent, row
+
+        with self.call_rate_limit(
+            agent_id, "write",
+            seconds_between_calls=rate_limiter if update_flag else None):
+            results = self._run_intent_tasks(
+                {
+                    intent_name: (
+                        lambda name=intent_name, tps=tps: create_intent(
+                            name, tps))
+                    for intent_name, tps in tps_by_intent.items()
+                },
+                max_workers,
+            )
+        new_intents = {
+            intent_name: new_intent
+            for intent_name, (new_intent, row) in results.items()
+            if row["status"] != "failed"
+        }
+
+        if return_report:
+            return new_intents, self._intents_report(results)
+
+        self._raise_for_failed_intents(results, "create")
 
         return new_intents
 
@@ -810,7 +991,7 @@ class DataframeFunctions(ScrapiBase):
 
     def bulk_create_entity_from_dataframe(
         self, agent_id, entities_df, update_flag=False,
-        language_code: str = None, rate_limiter=5,
+        language_code: str = None, rate_limiter=None,
 
     ):
         """Bulk create entities from a dataframe.
@@ -823,7 +1004,8 @@ class DataframeFunctions(ScrapiBase):
           update_flag: True to update_flag the entities in the agent
           language_code: Language code of the intents being uploaded. Ref:
             https://cloud.google.com/dialogflow/cx/docs/reference/language
-          rate_limiter: seconds to sleep between operations.
+          rate_limiter: (Optional) seconds to wait between operations. If not
+            provided, writes are paced by the shared `write` quota bucket.
 
         Returns:
           Dictionary with entity display names as keys and the
@@ -839,40 +1021,43 @@ class DataframeFunctions(ScrapiBase):
             )
 
         i, custom_entities = 0, {}
-        for entity in list(set(entities_df["display_name"])):
-            one_entity = entities_df[entities_df["display_name"] == entity]
-            if "meta" in locals():
-                meta_ = meta[meta["display_name"] == entity]["meta"].iloc[0]
-                meta_ = json.loads(meta_)
-                new_entity = self.create_entity_from_dataframe(
-                    display_name=entity, entity_df=one_entity, meta=meta
-                )
+        with self.call_rate_limit(
+            agent_id, "write",
+            seconds_between_calls=rate_limiter if update_flag else None):
+            for entity in list(set(entities_df["display_name"])):
+                one_entity = entities_df[entities_df["display_name"] == entity]
+                if "meta" in locals():
+                    meta_ = meta[meta["display_name"] == entity]["meta"].iloc[0]
+                    meta_ = json.loads(meta_)
+                    new_entity = self.create_entity_from_dataframe(
+                        display_name=entity, entity_df=one_entity, meta=meta
+                    )
 
-            else:
-                new_entity = self.create_entity_from_dataframe(
-                    display_name=entity, entity_df=one_entity
-                )
+                else:
+                    new_entity = self.create_entity_from_dataframe(
+                        display_name=entity, entity_df=one_entity
+                    )
 
-            custom_entities[entity] = new_entity
-            i += 1
+                custom_entities[entity] = new_entity
+                i += 1
 
-            if update_flag:
-                self.entities.create_entity_type(
-                    agent_id=agent_id,
-                    obj=new_entity,
-                    language_code=language_code,
-                )
-                time.sleep(rate_limiter)
+                if update_flag:
+                    self._call_with_quota(
+                        agent_id, "write", self.entities.create_entity_type,
+                        agent_id=agent_id,
+                        obj=new_entity,
+                        language_code=language_code,
+                    )
 
-            self.progress_bar(
-                i, len(list(set(
-                    entities_df["display_name"]))), type_="entities"
-            )
+                self.progress_bar(
+                    i, len(list(set(
+                        entities_df["display_name"]))), type_="entities"
+                )
         return custom_entities
 
     def bulk_update_entity_from_dataframe(
         self, entities_df, update_flag=False, language_code=None,
-        rate_limiter=5
+        rate_limiter=None
     ):
         """Bulk updates entities from a dataframe.
 
@@ -884,7 +1069,8 @@ class DataframeFunctions(ScrapiBase):
           update_flag: True to update_flag the entities in the agent
           language_code: Language code of the intents being uploaded. Ref:
           https://cloud.google.com/dialogflow/cx/docs/reference/language
-          rate_limiter: seconds to sleep between operations.
+          rate_limiter: (Optional) seconds to wait between operations. If not
+            provided, writes are paced by the shared `write` quota bucket.
 
         Returns:
           Dictionary with entity display names as keys and the
@@ -900,34 +1086,38 @@ class DataframeFunctions(ScrapiBase):
             )
 
         i, custom_entities = 0, {}
-        for entity in list(set(entities_df["display_name"])):
-            one_entity = entities_df[entities_df["display_name"] == entity]
-            if "meta" in locals():
-                meta_ = meta[meta["display_name"] == entity]["meta"].iloc[0]
-                meta_ = json.loads(meta_)
-                new_entity = self.create_entity_from_dataframe(
-                    display_name=entity, entity_df=one_entity, meta=meta
-                )
+        with self.call_rate_limit(
+            entities_df["name"].max(), "write",
+            seconds_between_calls=rate_limiter if update_flag else None):
+            for entity in list(set(entities_df["display_name"])):
+                one_entity = entities_df[entities_df["display_name"] == entity]
+                if "meta" in locals():
+                    meta_ = meta[meta["display_name"] == entity]["meta"].iloc[0]
+                    meta_ = json.loads(meta_)
+                    new_entity = self.create_entity_from_dataframe(
+                        display_name=entity, entity_df=one_entity, meta=meta
+                    )
 
-            else:
-                new_entity = self.create_entity_from_dataframe(
-                    display_name=entity, entity_df=one_entity
-                )
+                else:
+                    new_entity = self.create_entity_from_dataframe(
+                        display_name=entity, entity_df=one_entity
+                    )
 
-            custom_entities[entity] = new_entity
-            i += 1
-            entity_type_id = one_entity["name"].max()
+                custom_entities[entity] = new_entity
+                i += 1
+                entity_type_id = one_entity["name"].max()
 
-            if update_flag:
-                self.entities.update_entity_type(
-                    entity_type_id, new_entity, language_code
-                )
-                time.sleep(rate_limiter)
+                if update_flag:
+                    self._call_with_quota(
+                        entity_type_id, "write",
+                        self.entities.update_entity_type,
+                        entity_type_id, new_entity, language_code
+                    )
 
-            self.progress_bar(
-                i, len(list(set(
-                    entities_df["display_name"]))), type_="entities"
-            )
+                self.progress_bar(
+                    i, len(list(set(
+                        entities_df["display_name"]))), type_="entities"
+                )
 
         return custom_entities
 
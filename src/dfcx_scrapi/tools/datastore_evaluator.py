@@ -34,7 +34,8 @@ from tqdm import tqdm
 
 from dfcx_scrapi.core.scrapi_base import ScrapiBase
 from dfcx_scrapi.tools.agent_response import AgentResponse
-from dfcx_scrapi.tools.metrics import build_metrics
+from dfcx_scrapi.tools.metrics import MAX_WORKERS, MetricsEngine, build_metrics
+from dfcx_scrapi.tools.results_store import ResultsWriter
 
 _FOLDER_ID = re.compile(r"folders\/(.*?)(?=\/|\?|$)")
 EVAL_RESULTS_COLS = [
@@ -61,13 +62,13 @@ class DataStoreEvaluator(ScrapiBase):
                 )
         )
 
-    def run(self, scraper_output: pd.DataFrame) -> "EvaluationResult":
+    def run(
+        self, scraper_output: pd.DataFrame, max_workers: int = MAX_WORKERS
+        ) -> "EvaluationResult":
         timestamp = datetime.now(tz=timezone.utc)
         scraper_output = scraper_output.copy(deep=True)
-        result = pd.DataFrame(index=scraper_output.index)
-
-        for metric in self.metrics:
-           result = pd.concat([result, metric.run(scraper_output)], axis=1)
+        result = MetricsEngine(
+            self.metrics, max_workers=max_workers).run(scraper_output)
 
         # adding timestamp and agent display name so they can be used as a multi
         # index
@@ -313,6 +314,22 @@ class EvaluationResult:
 
         return filepath
 
+    def export_to_parquet(self, root_path: str, run_id: str = None) -> str:
+        """Append the results to a Parquet dataset, by run.
+
+        AgentResponse fields are stored as native columns, with search
+        results as nested lists rather than JSON strings, and without the
+        Google Sheets truncation applied by the other exports.
+
+        Returns:
+          The run ID the results were written to.
+        """
+        results = pd.concat(
+            [self.scrape_outputs, self.metric_outputs], axis=1
+        )
+
+        return ResultsWriter(root_path).write(results, run_id)
+
     def display_on_screen(self):
         queryset = self.scrape_outputs.drop("query_result", axis=1)
         responses = self.scrape_outputs["query_result"].apply(
@@ -14,9 +14,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
 import datetime
 import json
+import logging
+import os
 import re
+from concurrent import futures
 from typing import Any, Union
 
 import gspread
@@ -30,6 +34,7 @@ from dfcx_scrapi.core.sessions import Sessions
 from dfcx_scrapi.tools.agent_response import AgentResponse
 
 MAX_RETRIES = 5
+DEFAULT_MAX_WORKERS = 10
 INPUT_SCHEMA_REQUIRED_COLUMNS = [
     "conversation_id",
     "turn_index",
@@ -212,7 +217,10 @@ class DataStoreScraper(ScrapiBase):
             except ValueError as err:
                 raise UserWarning("Invalid parameters") from err
 
-        response = self.sessions.detect_intent(
+        response = self._call_with_quota(
+            self.agent_id,
+            "detect_intent",
+            self.sessions.detect_intent,
             agent_id=self.agent_id,
             session_id=session_id,
             text=query,
@@ -227,24 +235,138 @@ class DataStoreScraper(ScrapiBase):
 
         return ar
 
-    def run(
-        self, queryset: pd.DataFrame, flatten_response: bool = True
-    ) -> pd.DataFrame:
-        "Runs through each query and concatenates responses to the queryset."
-        queryset = self.setup_queryset(queryset)
-        progress_bar = tqdm(desc="Scraping queries", total=len(queryset))
-
-        def scrape(row):
-            result = self.scrape_detect_intent(
+    @staticmethod
+    def _load_checkpoint(
+        checkpoint_file: str) -> dict[tuple[str, int], AgentResponse]:
+        """Load completed responses keyed by (conversation_id, turn_index).
+
+        A partially written final line, left by an interrupted run, is
+        ignored.
+        """
+        completed = {}
+        if not checkpoint_file or not os.path.exists(checkpoint_file):
+            return completed
+
+        with open(checkpoint_file, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+                key = (str(row["conversation_id"]), int(row["turn_index"]))
+                completed[key] = AgentResponse.from_row(row["response"])
+
+        return completed
+
+    def _scrape_conversation(
+        self, conversation: pd.DataFrame) -> list[AgentResponse]:
+        """Scrape the turns of a single conversation in order."""
+        return [
+            self.scrape_detect_intent(
                 query=row["query"],
                 session_id=row["session_id"],
                 user_metadata=row["user_metadata"],
                 parameters=row["parameters"]
             )
-            progress_bar.update()
-
-            return result
+            for _, row in conversation.iterrows()
+        ]
 
-        queryset["query_result"] = queryset.apply(scrape, axis=1)
+    def run(
+        self,
+        queryset: pd.DataFrame,
+        flatten_response: bool = True,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        requests_per_minute: int = None,
+        checkpoint_file: str = None
+    ) -> pd.DataFrame:
+        """Runs through each query and concatenates responses to the queryset.
+
+        Conversations are scraped concurrently on up to `max_workers`
+        threads. The turns of each conversation are always sent in
+        `turn_index` order within the conversation's session.
+
+        Args:
+          queryset: the queryset dataframe, see `INPUT_SCHEMA_REQUIRED_COLUMNS`.
+          flatten_response: unused, kept for backwards compatibility.
+          max_workers: the maximum number of conversations to scrape at once.
+          requests_per_minute: (Optional) the maximum detect intent rate for
+            this run. Calls are always paced by the adaptive `detect_intent`
+            quota bucket for the agent's project and region.
+          checkpoint_file: (Optional) a JSON Lines file that completed
+            conversations are appended to as `AgentResponse.to_row` rows.
+            When re-running with the same file, conversations that were
+            already completed are loaded from it rather than scraped again.
+
+        Returns:
+          The queryset with a `query_result` column of AgentResponse objects.
+        """
+        queryset = self.setup_queryset(queryset)
+        completed = self._load_checkpoint(checkpoint_file)
+
+        results = {}
+        pending = []
+        for conversation_id, conversation in queryset.groupby(
+            "conversation_id", sort=False):
+            keys = [
+                (str(conversation_id), int(turn_index))
+                for turn_index in conversation["turn_index"]
+            ]
+            if all(key in completed for key in keys):
+                for index, key in zip(conversation.index, keys):
+                    results[index] = completed[key]
+            else:
+                pending.append(conversation)
+
+        progress_bar = tqdm(
+            desc="Scraping queries", total=len(queryset), initial=len(results))
+
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor, \
+            contextlib.ExitStack() as stack:
+            stack.enter_context(self.call_rate_limit(
+                self.agent_id, "detect_intent",
+                rate=requests_per_minute / 60 if requests_per_minute else None,
+                burst=max_workers))
+            checkpoint = None
+            if checkpoint_file:
+                checkpoint = stack.enter_context(
+                    open(checkpoint_file, "a", encoding="utf-8"))
+
+            future_map = {
+                executor.submit(self._scrape_conversation, conversation):
+                conversation for conversation in pending
+            }
+            errors = []
+            for future in futures.as_completed(future_map):
+                conversation = future_map[future]
+                try:
+                    responses = future.result()
+                except Exception as err: # pylint: disable=W0718
+                    # Keep saving other conversations so a rerun can resume.
+                    logging.error(
+                        "Conversation %s failed: %s",
+                        conversation["conversation_id"].iloc[0], err)
+                    errors.append(err)
+                    continue
+
+                for (index, row), response in zip(
+                    conversation.iterrows(), responses):
+                    results[index] = response
+                    if checkpoint:
+                        checkpoint.write(json.dumps({
+                            "conversation_id": str(row["conversation_id"]),
+                            "turn_index": int(row["turn_index"]),
+                            "response": response.to_row(),
+                        }) + "\n")
+
+                if checkpoint:
+                    checkpoint.flush()
+                progress_bar.update(len(responses))
+
+        progress_bar.close()
+        if errors:
+            raise errors[0]
+
+        queryset["query_result"] = pd.Series(results)
 
         return queryset
@@ -16,9 +16,10 @@
 
 import logging
 from ast import literal_eval
+from concurrent import futures
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -34,7 +35,8 @@ from dfcx_scrapi.core.sessions import Sessions
 from dfcx_scrapi.core.tools import Tools
 from dfcx_scrapi.tools.agent_response import AgentResponse
 from dfcx_scrapi.tools.dataframe_functions import DataframeFunctions
-from dfcx_scrapi.tools.metrics import build_metrics
+from dfcx_scrapi.tools.metrics import MAX_WORKERS, MetricsEngine, build_metrics
+from dfcx_scrapi.tools.results_store import ResultsWriter
 
 # logging config
 logging.basicConfig(
@@ -43,6 +45,9 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+# Maximum number of eval conversations replayed concurrently.
+DEFAULT_MAX_WORKERS = 10
+
 @dataclass
 class Interaction:
     actions: List[types.Action] = field(default_factory=list)
@@ -397,20 +402,39 @@ class Evaluations(ScrapiBase):
 
         return df
 
-    def run_detect_intent_queries(
-        self, df: pd.DataFrame, language_code: str = "en"
-    ) -> pd.DataFrame:
-        for index, row in tqdm(df.iterrows(), total=df.shape[0]):
-            data = {}
-            if row["action_id"] == 1:
-                self.session_id = self.sessions_client.build_session_id(
-                    self.agent_id)
-                data["session_id"] = self.session_id
-                data["agent_id"] = self.agent_id
+    def _group_conversations(self, df: pd.DataFrame) -> List[List[int]]:
+        """Group the row indices of `df` into independent conversations.
 
-            else:
-                data["session_id"] = self.session_id
-                data["agent_id"] = self.agent_id
+        A new conversation starts on every row where `action_id == 1`.
+        """
+        conversations = []
+        for index, action_id in zip(df.index, df["action_id"]):
+            if action_id == 1 or not conversations:
+                conversations.append([])
+            conversations[-1].append(index)
+
+        return conversations
+
+    def _replay_conversation(
+        self,
+        df: pd.DataFrame,
+        indices: List[int],
+        language_code: str = "en"
+    ) -> List[Tuple[int, str, types.QueryResult]]:
+        """Replay the user utterances of a single conversation in order.
+
+        Returns:
+          A list of (row index, session ID, detect intent result) for each
+          User Utterance row of the conversation.
+        """
+        if df.loc[indices[0], "action_id"] == 1 or not self.session_id:
+            session_id = self.sessions_client.build_session_id(self.agent_id)
+        else:
+            session_id = self.session_id
+
+        results = []
+        for index in indices:
+            row = df.loc[index]
 
             # If the incoming dataset has an empty value in the row, skip it
             # this is because we build the incoming dataset with multi-row
@@ -423,66 +447,128 @@ class Evaluations(ScrapiBase):
             if "session_parameters" in row:
                 session_parameters = self.str_to_dict(row["session_parameters"])
 
-            res = self.sessions_client.detect_intent(
+            res = self._call_with_quota(
+                self.agent_id,
+                "detect_intent",
+                self.sessions_client.detect_intent,
                 agent_id=self.agent_id,
-                session_id=self.session_id,
+                session_id=session_id,
                 text=row["action_input"],
                 parameters=session_parameters,
                 language_code=language_code
             )
-            # Add data to the existing row
-            df.loc[index, ["session_id", "agent_id"]] = [
-                data["session_id"],
-                data["agent_id"],
-            ]
-            text_res = self.ar._extract_text(res)
-
-            # Handle Agent Responses
-            if row["utterance_pair"] != "":
-                utterance_idx = int(row["utterance_pair"])
-                df.loc[utterance_idx, ["agent_response"]] = [text_res]
+            results.append((index, session_id, res))
 
-            else:
-                # collect the data for inserting later
-                self.unexpected_rows.append(
-                    {
-                        "session_id": data["session_id"],
-                        "agent_id": data["agent_id"],
-                        "action_type": "UNEXPECTED Agent Response",
-                        "index": index,
-                        "column": "agent_response",
-                        "data": text_res
-                    }
-                    )
-
-            # Handle Playbook Invocations
-            playbook_responses = (
-                self.sessions_client.collect_playbook_responses(res)
-            )
-            if len(playbook_responses) > 0:
-                df = self.process_playbook_invocations(
-                    playbook_responses, index, row, df
-                )
+        return results
+
+    def _apply_detect_intent_result(
+        self,
+        df: pd.DataFrame,
+        index: int,
+        session_id: str,
+        res: types.QueryResult
+    ) -> pd.DataFrame:
+        """Map a single detect intent result back onto the eval dataframe."""
+        row = df.loc[index]
+
+        # Add data to the existing row
+        df.loc[index, ["session_id", "agent_id"]] = [
+            session_id,
+            self.agent_id,
+        ]
+        text_res = self.ar._extract_text(res)
+
+        # Handle Agent Responses
+        if row["utterance_pair"] != "":
+            utterance_idx = int(row["utterance_pair"])
+            df.loc[utterance_idx, ["agent_response"]] = [text_res]
 
-            # Handle Flow Invocations
-            flow_responses = self.sessions_client.collect_flow_responses(res)
-            if len(flow_responses) > 0:
-                df = self.process_flow_invocations(
-                    flow_responses, index, row, df
+        else:
+            # collect the data for inserting later
+            self.unexpected_rows.append(
+                {
+                    "session_id": session_id,
+                    "agent_id": self.agent_id,
+                    "action_type": "UNEXPECTED Agent Response",
+                    "index": index,
+                    "column": "agent_response",
+                    "data": text_res
+                }
                 )
 
-            # Handle Tool Invocations
-            if "tool_call_quality" in self.user_input_metrics:
-                tool_responses = (
-                    self.sessions_client.collect_tool_responses(res)
+        # Handle Playbook Invocations
+        playbook_responses = (
+            self.sessions_client.collect_playbook_responses(res)
+        )
+        if len(playbook_responses) > 0:
+            df = self.process_playbook_invocations(
+                playbook_responses, index, row, df
+            )
+
+        # Handle Flow Invocations
+        flow_responses = self.sessions_client.collect_flow_responses(res)
+        if len(flow_responses) > 0:
+            df = self.process_flow_invocations(
+                flow_responses, index, row, df
+            )
+
+        # Handle Tool Invocations
+        if "tool_call_quality" in self.user_input_metrics:
+            tool_responses = (
+                self.sessions_client.collect_tool_responses(res)
+            )
+            if tool_responses:  # Only call if not empty
+                df = self.process_tool_invocations(
+                    tool_responses,
+                    index,
+                    row,
+                    df
                 )
-                if tool_responses:  # Only call if not empty
-                    df = self.process_tool_invocations(
-                        tool_responses,
-                        index,
-                        row,
-                        df
-                    )
+
+        return df
+
+    def run_detect_intent_queries(
+        self,
+        df: pd.DataFrame,
+        language_code: str = "en",
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> pd.DataFrame:
+        """Replay the eval dataset against the agent with detect intent.
+
+        Conversations are independent, so each one is replayed sequentially
+        in its own session while up to `max_workers` conversations run
+        concurrently within the shared detect intent quota. Results are
+        merged back into `df` in row order once all conversations have
+        completed, so the output does not depend on `max_workers`.
+
+        Args:
+          df: the eval dataframe, as prepared by `add_response_columns`.
+          language_code: the language code used for every query.
+          max_workers: the maximum number of conversations to replay at
+            once. Set to 1 to replay conversations serially.
+
+        Returns:
+          The eval dataframe with the agent responses added.
+        """
+        conversations = self._group_conversations(df)
+        results = [None] * len(conversations)
+
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_map = {
+                executor.submit(
+                    self._replay_conversation, df, indices, language_code
+                ): idx
+                for idx, indices in enumerate(conversations)
+            }
+            for future in tqdm(
+                futures.as_completed(future_map), total=len(future_map)):
+                results[future_map[future]] = future.result()
+
+        for conversation in results:
+            for index, session_id, res in conversation:
+                df = self._apply_detect_intent_result(
+                    df, index, session_id, res)
+                self.session_id = session_id
 
         return df
 
@@ -507,27 +593,36 @@ class Evaluations(ScrapiBase):
 
         return df
 
-    def run_evals(self, df: pd.DataFrame) -> pd.DataFrame:
+    def run_evals(
+        self, df: pd.DataFrame, max_workers: int = MAX_WORKERS
+    ) -> pd.DataFrame:
         print("Starting Evals...")
 
-        for metric in self.metrics:
-           df = pd.concat([df, metric.run(df)], axis=1)
+        results = MetricsEngine(self.metrics, max_workers=max_workers).run(df)
 
-        return df
+        return pd.concat([df, results], axis=1)
 
     def scrape_results(
-        self, df: pd.DataFrame, language_code: str = "en"
+        self,
+        df: pd.DataFrame,
+        language_code: str = "en",
+        max_workers: int = DEFAULT_MAX_WORKERS
     ) -> pd.DataFrame:
         df = self.add_response_columns(df)
-        df = self.run_detect_intent_queries(df, language_code=language_code)
+        df = self.run_detect_intent_queries(
+            df, language_code=language_code, max_workers=max_workers)
         df = self.insert_unexpected_rows(df)
 
         return df
 
     def run_query_and_eval(
-        self, df: pd.DataFrame, language_code: str = "en"
+        self,
+        df: pd.DataFrame,
+        language_code: str = "en",
+        max_workers: int = DEFAULT_MAX_WORKERS
     ) -> pd.DataFrame:
-        df = self.scrape_results(df, language_code=language_code)
+        df = self.scrape_results(
+            df, language_code=language_code, max_workers=max_workers)
         df = self.run_evals(df)
         df = self.clean_outputs(df)
 
@@ -809,6 +904,19 @@ class DataLoader:
 
             self.dffx.dataframe_to_sheets(sheet_name, results_tab, df)
 
+    @staticmethod
+    def write_eval_results_to_parquet(
+        df: pd.DataFrame, root_path: str, run_id: str = None
+    ) -> str:
+        """Append eval results to a Parquet dataset, by run.
+
+        Nested values, such as tool call parameters, are stored as JSON
+        strings. See `results_store.load_results` to read the results back.
+
+        Returns:
+          The run ID the results were written to.
+        """
+        return ResultsWriter(root_path).write(df, run_id)
 
     def build_report_summary(self, df: pd.DataFrame) -> pd.DataFrame:
         # Check for agent_id or get from dataframe
@@ -15,12 +15,15 @@
 # limitations under the License.
 
 import logging
-from typing import Union
+import os
+from concurrent import futures
+from typing import Dict, Iterable, List, Tuple, Union
 
 import numpy as np
 import pandas
 from google.cloud.dialogflowcx_v3beta1 import types
 
+from dfcx_scrapi.agent_extract.types import AgentData
 from dfcx_scrapi.core.intents import Intents
 
 # logging config
@@ -29,38 +32,78 @@ logging.basicConfig(
     format="%(asctime)s %(levelname)-8s %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S")
 
+OVERLAP_COLUMNS = ["intent_a", "intent_b", "phrase_a", "phrase_b", "ratio"]
+
 class Levenshtein():
     """Utils class for performing analysis on DFCX data."""
 
     @staticmethod
-    def __levenshtein_ratio(s: str, t: str) -> float:
-        """Calculates levenshtein distance between two strings."""
-        rows = len(s)+1
-        cols = len(t)+1
-        distance = np.zeros((rows,cols),dtype = int)
-
-        for i in range(1, rows):
-            for k in range(1,cols):
-                distance[i][0] = i
-                distance[0][k] = k
-
-        for col in range(1, cols):
-            for row in range(1, rows):
-                if s[row-1] == t[col-1]:
-                    cost = 0
-                else:
-                    cost = 2
-
-                distance[row][col] =  min(
-                    distance[row-1][col] + 1,
-                    distance[row][col-1] + 1,
-                    distance[row-1][col-1] + cost
-                )
-
-        # Computation of the Levenshtein Distance Ratio
-        ratio = ((len(s)+len(t)) - distance[row][col]) / (len(s)+len(t))
-        return ratio
+    def _pattern_masks(s: str) -> Dict[str, int]:
+        """Build the per-character bit masks of `s` used by `_lcs_length`."""
+        masks = {}
+        for i, char in enumerate(s):
+            masks[char] = masks.get(char, 0) | (1 << i)
+
+        return masks
+
+    @staticmethod
+    def _lcs_length(masks: Dict[str, int], s_len: int, t: str) -> int:
+        """Calculates the longest common subsequence length of `s` and `t`.
+
+        Uses the bit-parallel algorithm of Allison-Dix / Hyyro, where each
+        bit of `v` represents one character of `s`, so every character of
+        `t` is processed with a handful of integer operations.
+
+        Args:
+          masks: the output of `_pattern_masks(s)`.
+          s_len: the length of `s`.
+          t: the string to compare against `s`.
+        """
+        full = (1 << s_len) - 1
+        v = full
+        for char in t:
+            u = v & masks.get(char, 0)
+            v = ((v + u) | (v - u)) & full
+
+        return s_len - bin(v).count("1")
+
+    @staticmethod
+    def _ratio_from_masks(masks: Dict[str, int], s_len: int, t: str) -> float:
+        """Calculates the levenshtein ratio with precomputed masks of `s`."""
+        total = s_len + len(t)
+        if total == 0:
+            return 1.0
+
+        return 2 * Levenshtein._lcs_length(masks, s_len, t) / total
+
+    @staticmethod
+    def levenshtein_ratio(s: str, t: str) -> float:
+        """Calculates the levenshtein distance ratio between two strings.
 
+        Substitutions cost 2 and insertions/deletions cost 1, so the distance
+        is `len(s) + len(t) - 2 * LCS(s, t)` and the ratio reduces to
+        `2 * LCS(s, t) / (len(s) + len(t))`.
+        """
+        return Levenshtein._ratio_from_masks(
+            Levenshtein._pattern_masks(s), len(s), t)
+
+    @staticmethod
+    def _length_bounds(length: int, threshold: float) -> Tuple[float, float]:
+        """Range of string lengths that could exceed `threshold` vs `length`.
+
+        The ratio can be at most `2 * min(n, m) / (n + m)`, so any string
+        whose length falls outside of these bounds can be skipped.
+        """
+        if threshold <= 0:
+            return 0, np.inf
+
+        if threshold >= 2:
+            return np.inf, 0
+
+        return (
+            length * threshold / (2 - threshold),
+            length * (2 - threshold) / threshold
+        )
 
     @staticmethod
     def calc_tp_distances(
@@ -134,10 +177,17 @@ class Levenshtein():
         num_keys_overlapped = 0
         num_comparators_overlapped = 0
 
+        list_comparators = list(list_comparators)
+        comparator_lens = np.array([len(line) for line in list_comparators])
+
         for line1 in list_keys:
 
             phrase_similarity_list = {}
             found_key_similarity = False
+            masks = Levenshtein._pattern_masks(line1)
+            low, high = Levenshtein._length_bounds(len(line1), threshold)
+            candidates = np.flatnonzero(
+                (comparator_lens >= low) & (comparator_lens <= high))
 
             if not silent:
                 completed = float(count/len(list_keys))*100.0
@@ -147,12 +197,10 @@ class Levenshtein():
                     f"{round(completed,1)}% complete. \r",end="",flush=True
                      )
 
-            for line2 in list_comparators:
-
-                distance = Levenshtein.__levenshtein_ratio(
-                    line1,
-                    line2
-                )
+            for idx in candidates:
+                line2 = list_comparators[idx]
+                distance = Levenshtein._ratio_from_masks(
+                    masks, len(line1), line2)
 
                 if distance>threshold:
                     phrase_similarity_list[line2] = round(distance,3)
@@ -202,3 +250,218 @@ class Levenshtein():
 
         results = {"stats":stats,"distances":tp_distances}
         return results
+
+    @staticmethod
+    def _agent_data_to_df(agent_data: AgentData) -> pandas.DataFrame:
+        """Build a display_name/training_phrase frame from extracted data."""
+        rows = []
+        for intent in agent_data.intents:
+            for tp in intent.get("trainingPhrases", []):
+                text = "".join(part.get("text", "") for part in tp["parts"])
+                rows.append((intent["display_name"], text))
+
+        return pandas.DataFrame(
+            rows, columns=["display_name", "training_phrase"])
+
+    @staticmethod
+    def _prepare_phrases(
+        intents_data: Union[pandas.DataFrame, AgentData]
+    ) -> Tuple[List[str], List[str], np.ndarray]:
+        """Deduplicate phrases and sort them by length for pair comparison.
+
+        Returns:
+          The intent names, phrases and phrase lengths in ascending length
+          order.
+        """
+        if isinstance(intents_data, AgentData):
+            intents_data = Levenshtein._agent_data_to_df(intents_data)
+
+        phrases = (
+            intents_data[["display_name", "training_phrase"]]
+            .dropna()
+            .drop_duplicates()
+        )
+        phrases = phrases.assign(
+            length=phrases.training_phrase.str.len()
+        ).sort_values("length", kind="stable")
+
+        return (
+            phrases.display_name.tolist(),
+            phrases.training_phrase.tolist(),
+            phrases.length.to_numpy()
+        )
+
+    @staticmethod
+    def _compare_rows(
+        names: List[str],
+        texts: List[str],
+        lengths: np.ndarray,
+        threshold: float,
+        include_same_intent: bool,
+        rows: Iterable[int]
+    ) -> List[Tuple[str, str, str, str, float]]:
+        """Compare each phrase in `rows` against every longer phrase.
+
+        Phrases must be sorted by length, so each row only needs to be
+        compared with the rows after it, up to the length bound.
+        """
+        pairs = []
+        for i in rows:
+            line1 = texts[i]
+            _, high = Levenshtein._length_bounds(len(line1), threshold)
+            stop = np.searchsorted(lengths, high, side="right")
+            masks = Levenshtein._pattern_masks(line1)
+
+            for j in range(i + 1, stop):
+                if not include_same_intent and names[i] == names[j]:
+                    continue
+
+                distance = Levenshtein._ratio_from_masks(
+                    masks, len(line1), texts[j])
+                if distance > threshold:
+                    pairs.append(
+                        (names[i], names[j], line1, texts[j],
+                         round(distance, 3)))
+
+        return pairs
+
+    @staticmethod
+    def _pairs_to_df(
+        pairs: List[Tuple[str, str, str, str, float]]) -> pandas.DataFrame:
+        """Build the overlap dataframe, sorted by descending ratio."""
+        return (
+            pandas.DataFrame(pairs, columns=OVERLAP_COLUMNS)
+            .sort_values("ratio", ascending=False, kind="stable")
+            .reset_index(drop=True)
+        )
+
+    @staticmethod
+    def calc_all_pairs_distances(
+        intents_df: pandas.DataFrame,
+        threshold: float = 0.75,
+        include_same_intent: bool = False
+    ) -> pandas.DataFrame:
+        """Finds similar training phrases across every pair of intents.
+
+        Each unique pair of phrases is compared once. Phrases are sorted by
+        length so that only pairs whose lengths could exceed `threshold` are
+        compared. See `calc_agent_overlap` to spread the work across
+        multiple processes.
+
+        Args:
+          intents_df: dataframe with columns display_name and
+            training_phrase, as returned by `Intents.bulk_intent_to_df`.
+          threshold: float describing the levenshtein ratio above which
+            a pair of phrases is returned. Default: .75
+          include_same_intent: when set to True, pairs of phrases from the
+            same intent are also returned. Default=False
+
+        Returns:
+          A dataframe with columns intent_a, intent_b, phrase_a, phrase_b,
+          ratio, sorted by descending ratio.
+        """
+        names, texts, lengths = Levenshtein._prepare_phrases(intents_df)
+        pairs = Levenshtein._compare_rows(
+            names, texts, lengths, threshold, include_same_intent,
+            range(len(texts)))
+
+        return Levenshtein._pairs_to_df(pairs)
+
+    @staticmethod
+    def calc_agent_overlap(
+        intents_data: Union[pandas.DataFrame, AgentData],
+        threshold: float = 0.75,
+        include_same_intent: bool = False,
+        processes: int = None,
+        shards_per_process: int = 4
+    ) -> pandas.DataFrame:
+        """Finds overlapping training phrases across an entire agent.
+
+        Phrases are deduplicated and the pair space is split into
+        interleaved shards of rows, which are compared on a process pool.
+        Interleaving keeps the shards balanced, as shorter phrases are
+        compared against more candidates than longer ones.
+
+        Args:
+          intents_data: dataframe with columns display_name and
+            training_phrase, as returned by `Intents.bulk_intent_to_df`, or
+            an `agent_extract.types.AgentData` object.
+          threshold: float describing the levenshtein ratio above which
+            a pair of phrases is returned. Default: .75
+          include_same_intent: when set to True, pairs of phrases from the
+            same intent are also returned. Default=False
+          processes: the number of worker processes. Defaults to the number
+            of CPUs. If set to 1, the comparison runs in the current process.
+          shards_per_process: the number of shards to create per process.
+
+        Returns:
+          A sparse overlap dataframe with one row per similar pair of
+          phrases and columns intent_a, intent_b, phrase_a, phrase_b, ratio,
+          sorted by descending ratio.
+        """
+        names, texts, lengths = Levenshtein._prepare_phrases(intents_data)
+        processes = processes or os.cpu_count() or 1
+        processes = max(1, min(processes, len(texts)))
+
+        if processes == 1:
+            pairs = Levenshtein._compare_rows(
+                names, texts, lengths, threshold, include_same_intent,
+                range(len(texts)))
+            return Levenshtein._pairs_to_df(pairs)
+
+        num_shards = processes * shards_per_process
+        pairs = []
+        with futures.ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_overlap_worker,
+            initargs=(names, texts, lengths, threshold, include_same_intent)
+        ) as executor:
+            for shard_pairs in executor.map(
+                _overlap_shard,
+                [(offset, num_shards) for offset in range(num_shards)]):
+                pairs.extend(shard_pairs)
+
+        return Levenshtein._pairs_to_df(pairs)
+
+    @staticmethod
+    def overlap_matrix(overlap_df: pandas.DataFrame) -> pandas.DataFrame:
+        """Summarize an overlap dataframe as an intent by intent matrix.
+
+        Args:
+          overlap_df: the output of `calc_agent_overlap` or
+            `calc_all_pairs_distances`.
+
+        Returns:
+          A symmetric dataframe indexed by intent display name on both axes,
+          containing the number of overlapping phrase pairs.
+        """
+        pairs = overlap_df[["intent_a", "intent_b"]]
+        swapped = pairs[pairs.intent_a != pairs.intent_b].set_axis(
+            ["intent_b", "intent_a"], axis=1)
+        pairs = pandas.concat([pairs, swapped], ignore_index=True)
+
+        return pandas.crosstab(
+            pairs.intent_a, pairs.intent_b
+        ).rename_axis(index=None, columns=None)
+
+_WORKER_PHRASES = None
+
+def _init_overlap_worker(
+    names: List[str],
+    texts: List[str],
+    lengths: np.ndarray,
+    threshold: float,
+    include_same_intent: bool):
+    """Store the shared phrase data once per worker process."""
+    global _WORKER_PHRASES # pylint: disable=W0603
+    _WORKER_PHRASES = (names, texts, lengths, threshold, include_same_intent)
+
+def _overlap_shard(
+    shard: Tuple[int, int]) -> List[Tuple[str, str, str, str, float]]:
+    """Compare the interleaved rows `offset::step` in a worker process."""
+    offset, step = shard
+    names, texts, lengths, threshold, include_same_intent = _WORKER_PHRASES
+
+    return Levenshtein._compare_rows( # pylint: disable=W0212
+        names, texts, lengths, threshold, include_same_intent,
+        range(offset, len(texts), step))
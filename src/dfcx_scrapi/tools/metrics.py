@@ -16,11 +16,18 @@
 
 import abc
 import collections
+import contextlib
 import dataclasses
+import functools
+import hashlib
 import json
 import logging
 import math
+import re
+import sqlite3
 import statistics
+import threading
+from concurrent import futures
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -29,6 +36,7 @@ from google import genai
 from google.genai import types as genai_types
 from pydantic import BaseModel
 from rouge_score import rouge_scorer
+from tqdm import tqdm
 from tqdm.contrib import concurrent
 from vertexai.language_models import (
     TextEmbeddingInput,
@@ -37,8 +45,8 @@ from vertexai.language_models import (
 
 from dfcx_scrapi.core.scrapi_base import (
     EMBEDDING_MODELS_NO_DIMENSIONALITY,
+    TokenBucket,
     handle_api_error,
-    ratelimit,
     retry_api_call,
 )
 
@@ -54,7 +62,11 @@ class Statement(BaseModel):
 
 
 MAX_RETRIES = 5  # Max # of attempts for exponential backoff if API errors
-RATE = 2  # Limit max LLM API calls per second
+RATE = 2  # Limit max LLM API calls per second, shared by all metrics
+MAX_WORKERS = 8  # Max # of concurrent metric tasks in a MetricsEngine
+EMBEDDING_BATCH_SIZE = 100  # Max # of texts per embedding API call
+CACHE_SIZE = 10000  # Max # of embeddings or LLM responses held in memory
+TOP_LOGPROBS = 5  # Min # of alternative tokens scored per batched verdict
 DATASTORE_METRICS = [
     "url_match", "rougeL", "answer_correctness", "faithfulness",
     "context_recall",]
@@ -63,6 +75,57 @@ CONVERSATIONAL_AGENTS_METRICS = [
     "tool_call_quality"]
 SUPPORTED_METRICS = DATASTORE_METRICS + CONVERSATIONAL_AGENTS_METRICS
 
+_llm_rate_limiter = TokenBucket(rate=RATE)
+
+def set_llm_rate_limit(rate: float, burst: int = 1):
+    """Set the LLM calls per second budget shared by all metrics."""
+    global _llm_rate_limiter # pylint: disable=W0603
+    _llm_rate_limiter = TokenBucket(rate=rate, burst=burst)
+
+@contextlib.contextmanager
+def llm_rate_limit(rate: float, burst: int = 1):
+    """Set the shared LLM calls per second budget within the block only.
+
+    The previous limiter is restored when the block exits, even on error.
+    """
+    global _llm_rate_limiter # pylint: disable=W0603
+    previous = _llm_rate_limiter
+    _llm_rate_limiter = TokenBucket(rate=rate, burst=burst)
+    try:
+        yield _llm_rate_limiter
+    finally:
+        _llm_rate_limiter = previous
+
+def llm_ratelimit(func):
+    """Decorator that paces calls with the shared LLM rate limiter."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _llm_rate_limiter.acquire()
+        return func(*args, **kwargs)
+
+    return wrapper
+
+def map_tasks(
+        func,
+        *iterables,
+        executor: futures.Executor = None,
+        desc: str = None,
+        max_workers: int = None) -> list[Any]:
+    """Map `func` over `iterables` on `executor`, in input order.
+
+    If no executor is provided, a new thread pool of `max_workers` is used.
+    """
+    if executor is None:
+        kwargs = {"max_workers": max_workers} if max_workers else {}
+        return concurrent.thread_map(func, *iterables, desc=desc, **kwargs)
+
+    tasks = [executor.submit(func, *args) for args in zip(*iterables)]
+    for _ in tqdm(futures.as_completed(tasks), total=len(tasks), desc=desc):
+        pass
+
+    return [task.result() for task in tasks]
+
 def safe_geometric_mean(values: list[float]) -> float:
     return statistics.geometric_mean(
         [min(value + 1e-6, 1.0) for value in values]
@@ -72,7 +135,8 @@ def build_metrics(
         metrics: list[str],
         genai_client: genai.client.Client,
         model_id: str,
-        embedding_model: TextEmbeddingModel = None
+        embedding_model: TextEmbeddingModel = None,
+        statement_batch_size: int = None
         ) -> list["Metric"]:
     metric_list: list[Metric] = []
     for metric in metrics:
@@ -84,21 +148,24 @@ def build_metrics(
             metric_list.append(
                 AnswerCorrectness(
                     genai_client =genai_client,
-                    model_id = model_id
+                    model_id = model_id,
+                    statement_batch_size = statement_batch_size
                     )
             )
         elif metric == "faithfulness":
             metric_list.append(
                 Faithfulness(
                     genai_client =genai_client,
-                    model_id = model_id
+                    model_id = model_id,
+                    statement_batch_size = statement_batch_size
                     )
                 )
         elif metric == "context_recall":
             metric_list.append(
                 ContextRecall(
                     genai_client =genai_client,
-                    model_id = model_id
+                    model_id = model_id,
+                    statement_batch_size = statement_batch_size
                     )
                 )
         elif metric in [
@@ -136,10 +203,14 @@ class Metric(abc.ABC):
     @abc.abstractmethod
     def __call__(self, inputs: dict[str, Any]) -> dict[str, Any]: ...
 
-    def run(self, inputs: pd.DataFrame) -> pd.DataFrame:
-        result = concurrent.thread_map(
+    def run(
+        self,
+        inputs: pd.DataFrame,
+        executor: futures.Executor = None) -> pd.DataFrame:
+        result = map_tasks(
             self,
             inputs.to_dict(orient="records"),
+            executor=executor,
             desc=f"Computing {self.__class__.__name__}",
         )
         return pd.DataFrame(result, index=inputs.index)
@@ -194,14 +265,210 @@ class ToolActionMatch(Metric):
         return {"tool_action_match": tool_action_match}
 
 
+class LLMCacheMissError(LookupError):
+    """Raised when an offline LLMResponseCache has no entry for a prompt."""
+
+
+class PersistentCache:
+    """Content-addressed cache with an in-memory LRU and optional SQLite file.
+
+    Recently used values are held in memory, and all values are optionally
+    persisted to the `TABLE` table of a SQLite file at `cache_path`, so they
+    can be reused across runs. Subclasses define how values are encoded.
+    """
+    TABLE: str = "cache"
+
+    def __init__(self, max_size: int = CACHE_SIZE, cache_path: str = None):
+        self.max_size = max_size
+        self.cache_path = cache_path
+        self._lru = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self.hits = 0
+        self.misses = 0
+
+        if cache_path:
+            self._db = sqlite3.connect(cache_path, check_same_thread=False)
+            self._db.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE} "
+                "(key TEXT PRIMARY KEY, value BLOB)")
+            self._db.commit()
+
+    @staticmethod
+    def hash_key(*parts: Any) -> str:
+        """Build a cache key from the SHA-256 of JSON serializable parts."""
+        content = json.dumps(parts, sort_keys=True)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        return json.dumps(value).encode("utf-8")
+
+    @staticmethod
+    def _decode(value: bytes) -> Any:
+        return json.loads(value)
+
+    def _remember(self, key: str, value: Any):
+        """Add a value to the in-memory LRU, evicting the oldest entry."""
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_size:
+            self._lru.popitem(last=False)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Return the cached values for any of `keys` that are cached."""
+        found = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                if key in self._lru:
+                    self._lru.move_to_end(key)
+                    found[key] = self._lru[key]
+                else:
+                    missing.append(key)
+
+            if self._db and missing:
+                for i in range(0, len(missing), 500):
+                    chunk = missing[i:i + 500]
+                    rows = self._db.execute(
+                        f"SELECT key, value FROM {self.TABLE} WHERE key IN "
+                        f"({','.join('?' * len(chunk))})", chunk)
+                    for key, value in rows:
+                        found[key] = self._decode(value)
+                        self._remember(key, found[key])
+
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+
+        return found
+
+    def set_many(self, values: Dict[str, Any]):
+        """Store values in the cache, and on disk if configured."""
+        with self._lock:
+            for key, value in values.items():
+                self._remember(key, value)
+
+            if self._db:
+                self._db.executemany(
+                    f"INSERT OR REPLACE INTO {self.TABLE} VALUES (?, ?)",
+                    [(key, self._encode(value))
+                     for key, value in values.items()])
+                self._db.commit()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value for `key`, or `default`."""
+        return self.get_many([key]).get(key, default)
+
+    def set(self, key: str, value: Any):
+        """Store a single value in the cache."""
+        self.set_many({key: value})
+
+    def stats(self) -> Dict[str, float]:
+        """Return the hit and miss counts and hit rate of the cache."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+class EmbeddingCache(PersistentCache):
+    """Cache of text embeddings keyed by model, task and dimensionality."""
+    TABLE: str = "embeddings"
+
+    @staticmethod
+    def build_key(
+        model_id: str,
+        text: str,
+        task: str = "SEMANTIC_SIMILARITY",
+        dimensionality: Optional[int] = None) -> str:
+        """Build the cache key for a single text."""
+        return PersistentCache.hash_key(model_id, task, dimensionality, text)
+
+    @staticmethod
+    def _encode(value: np.ndarray) -> bytes:
+        return np.asarray(value, dtype=np.float64).tobytes()
+
+    @staticmethod
+    def _decode(value: bytes) -> np.ndarray:
+        return np.frombuffer(value, dtype=np.float64)
+
+
+class LLMResponseCache(PersistentCache):
+    """Cache of LLM responses keyed by model, generation config and prompt.
+
+    Used by all LLM-judged metrics. With `offline=True`, a cache miss raises
+    LLMCacheMissError rather than calling the model, so an eval can be
+    re-scored entirely from a previous run.
+    """
+    TABLE: str = "llm_responses"
+
+    def __init__(
+            self,
+            max_size: int = CACHE_SIZE,
+            cache_path: str = None,
+            offline: bool = False):
+        super().__init__(max_size=max_size, cache_path=cache_path)
+        self.offline = offline
+
+    @staticmethod
+    def build_key(model_id: str, config: Dict[str, Any], prompt: str) -> str:
+        """Build the cache key for a single prompt."""
+        return PersistentCache.hash_key(model_id, config, prompt)
+
+    def get_or_generate(self, key: str, generate, *args, **kwargs) -> Any:
+        """Return the cached response for `key` or generate and cache it.
+
+        Responses of None, as returned for handled API errors, are not
+        cached.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is not sentinel:
+            return value
+
+        if self.offline:
+            raise LLMCacheMissError(f"No cached LLM response for key {key}.")
+
+        value = generate(*args, **kwargs)
+        if value is not None:
+            self.set(key, value)
+
+        return value
+
+
+_llm_response_cache = LLMResponseCache()
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Return the LLM response cache shared by the LLM-judged metrics."""
+    return _llm_response_cache
+
+def set_llm_response_cache(cache: LLMResponseCache):
+    """Replace the shared LLM response cache, e.g. with a persistent one."""
+    global _llm_response_cache # pylint: disable=W0603
+    _llm_response_cache = cache
+
+
 class SemanticSimilarity(Metric):
-    """Compute semantic similarity using text embedding LLM models."""
+    """Compute semantic similarity using text embedding LLM models.
+
+    All unique texts are embedded up front in batches of `batch_size`,
+    reusing any embeddings already in `cache`, and the cosine similarities
+    for every row are then computed at once.
+    """
     COLUMNS: list[str] = ["similarity"]
 
     def __init__(
             self,
-            model: TextEmbeddingModel):
+            model: TextEmbeddingModel,
+            cache: EmbeddingCache = None,
+            batch_size: int = EMBEDDING_BATCH_SIZE,
+            dimensionality: Optional[int] = 256):
         self.model = model
+        self.cache = cache if cache is not None else EmbeddingCache()
+        self.batch_size = batch_size
+        self.dimensionality = dimensionality
 
     @staticmethod
     def safe_check(
@@ -256,16 +523,55 @@ class SemanticSimilarity(Metric):
         # else, safe check returned tuple, so unpack it
         reference, prediction = checked_inputs
 
-        embeds = self.vertex_embed(self.model, [reference, prediction])
-        embed_reference = embeds[0]
-        embed_prediction = embeds[1]
+        embeds = self.embed([reference, prediction])
+
+        return self.cosine_similarity(embeds[:1], embeds[1:])[0]
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts, using the cache and batching any uncached texts.
+
+        Returns:
+          An array with one embedding row per input text.
+        """
+        model_id = getattr(self.model, "_model_id", None)
+        keys = [
+            self.cache.build_key(
+                model_id, text, dimensionality=self.dimensionality)
+            for text in texts
+        ]
+        vectors = self.cache.get_many(list(dict.fromkeys(keys)))
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                missing[key] = text
+
+        missing_keys = list(missing)
+        for i in range(0, len(missing_keys), self.batch_size):
+            batch_keys = missing_keys[i:i + self.batch_size]
+            embeds = self.vertex_embed(
+                self.model,
+                [missing[key] for key in batch_keys],
+                dimensionality=self.dimensionality)
+            new_vectors = {
+                key: np.asarray(embed, dtype=np.float64)
+                for key, embed in zip(batch_keys, embeds)
+            }
+            self.cache.set_many(new_vectors)
+            vectors.update(new_vectors)
+
+        return np.array([vectors[key] for key in keys])
 
-        # Compute the cosine similarity between the two encodings.
-        similarity = np.inner(embed_reference, embed_prediction) / (
-            np.linalg.norm(embed_reference) * np.linalg.norm(embed_prediction)
+    @staticmethod
+    def cosine_similarity(
+        references: np.ndarray, predictions: np.ndarray) -> np.ndarray:
+        """Row-wise cosine similarity of two embedding arrays."""
+        similarity = np.sum(references * predictions, axis=1) / (
+            np.linalg.norm(references, axis=1)
+            * np.linalg.norm(predictions, axis=1)
             )
 
-        return round(similarity, 5)
+        return np.round(similarity, 5)
 
     def __call__(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
         if inputs["action_type"] != "Agent Response":
@@ -278,6 +584,34 @@ class SemanticSimilarity(Metric):
 
         return {"similarity": similarity}
 
+    def run(
+        self,
+        inputs: pd.DataFrame,
+        executor: futures.Executor = None) -> pd.DataFrame:
+        """Compute similarity for every row with batched embedding calls.
+
+        The embedding calls are already batched, so `executor` is unused.
+        """
+        positions = []
+        pairs = []
+        for pos, row in enumerate(inputs.to_dict(orient="records")):
+            if row["action_type"] != "Agent Response":
+                continue
+
+            checked_inputs = self.safe_check(
+                row["action_input"], row["agent_response"])
+            if isinstance(checked_inputs, tuple):
+                positions.append(pos)
+                pairs.append(checked_inputs)
+
+        similarity = np.full(len(inputs), np.nan)
+        if pairs:
+            embeds = self.embed([text for pair in pairs for text in pair])
+            similarity[positions] = self.cosine_similarity(
+                embeds[0::2], embeds[1::2])
+
+        return pd.DataFrame({"similarity": similarity}, index=inputs.index)
+
 
 class RougeL(Metric):
     COLUMNS: list[str] = ["rougeL_generative", "rougeL_extractive"]
@@ -353,11 +687,13 @@ class Scorer:
         genai_client: genai.client.Client,
         model_id: str,
         max_output_tokens: int = 1,
+        cache: LLMResponseCache = None,
     ):
         self._completions = completions
         self._max_output_tokens = max_output_tokens
         self.genai_client = genai_client
         self.model_id = model_id
+        self.cache = cache
 
     @staticmethod
     def _normalize(scores: dict[str, float]) -> dict[str, float]:
@@ -379,10 +715,25 @@ class Scorer:
             result[key] = value / norm
         return result
 
-    @ratelimit(RATE)
+    def score(self, prompt: str) -> Union[dict[str, float], None]:
+        """Score the prompt, using the LLM response cache when possible."""
+        cache = self.cache or get_llm_response_cache()
+        key = cache.build_key(
+            self.model_id,
+            {
+                "response_mime_type": "text/x.enum",
+                "enum": self._completions,
+                "max_output_tokens": self._max_output_tokens,
+            },
+            prompt
+        )
+
+        return cache.get_or_generate(key, self._score, prompt)
+
+    @llm_ratelimit
     @handle_api_error
     @retry_api_call([2**i for i in range(MAX_RETRIES)])
-    def score(self, prompt: str) -> Union[dict[str, float], None]:
+    def _score(self, prompt: str) -> Union[dict[str, float], None]:
         result = {completion: None for completion in self._completions}
         merged_top_log_probs = collections.defaultdict(lambda: float("-inf"))
         response = self.genai_client.models.generate_content(
@@ -419,15 +770,169 @@ class Scorer:
                     break
         return self._normalize(result)
 
+    def _batch_schema(self) -> dict[str, Any]:
+        return {
+            "type": "ARRAY",
+            "items": {
+                "type": "OBJECT",
+                "properties": {
+                    "index": {"type": "INTEGER"},
+                    "verdict": {"type": "STRING", "enum": self._completions},
+                },
+                "required": ["index", "verdict"],
+            },
+        }
+
+    def _top_logprobs(self) -> int:
+        return min(max(TOP_LOGPROBS, len(self._completions)), 20)
+
+    def _verdict_log_probs(
+        self, logprobs_result: Any, offset: int
+    ) -> Union[dict[str, float], None]:
+        """Merge the alternative tokens at a character offset per completion.
+
+        The offset is matched against the chosen tokens of the candidate, and
+        each alternative token there counts towards the completions it starts.
+        """
+        chosen = getattr(logprobs_result, "chosen_candidates", None) or []
+        top = getattr(logprobs_result, "top_candidates", None) or []
+        position, index = 0, None
+        for i, token in enumerate(chosen):
+            position += len(token.token or "")
+            if position > offset:
+                index = i
+                break
+
+        if index is None or index >= len(top):
+            return None
+
+        result = {completion: None for completion in self._completions}
+        for alternative in top[index].candidates or []:
+            # Tokens may carry the opening quote or a leading space.
+            text = (alternative.token or "").strip(' "')
+            if not text:
+                continue
+            for completion in self._completions:
+                if completion.startswith(text) and (
+                    result[completion] is None
+                    or alternative.log_probability > result[completion]
+                ):
+                    result[completion] = alternative.log_probability
+
+        if all(value is None for value in result.values()):
+            return None
+
+        return self._normalize(result)
+
+    def _parse_batch(
+        self, candidate: Any, num_statements: int
+    ) -> Union[list[dict[str, float]], None]:
+        """Unpack one score per statement index, or None if malformed.
+
+        Scores are the class probabilities of the verdict token, so they can
+        be compared with the ones returned by `score`.
+        """
+        text = candidate.content.parts[0].text
+        try:
+            items = json.loads(text)
+            verdicts = {int(item["index"]): item["verdict"] for item in items}
+        except (TypeError, ValueError, KeyError):
+            return None
+
+        if sorted(verdicts) != list(range(num_statements)):
+            return None
+        if len(items) != num_statements:
+            return None
+
+        offsets = [
+            match.end()
+            for match in re.finditer(r'"verdict"\s*:\s*"', text)
+        ]
+        if len(offsets) != num_statements:
+            return None
+
+        results = [None] * num_statements
+        for item, offset in zip(items, offsets):
+            if item["verdict"] not in self._completions:
+                return None
+            scores = self._verdict_log_probs(candidate.logprobs_result, offset)
+            if scores is None:
+                return None
+            results[int(item["index"])] = scores
+
+        return results
+
+    def score_batch(
+        self, prompt: str, num_statements: int
+    ) -> Union[list[dict[str, float]], None]:
+        """Score several statements packed into a single prompt.
+
+        The model returns one verdict per statement index as structured
+        output. Each statement is scored with the probabilities of the
+        alternative tokens at its verdict, normalized like `score`.
+
+        Args:
+          prompt: the prompt listing the numbered statements, from 0.
+          num_statements: the number of statements listed in the prompt.
+
+        Returns:
+          A list of scores in statement order, or None if the response could
+          not be unpacked or carried no log probabilities. Malformed responses
+          are not cached.
+        """
+        cache = self.cache or get_llm_response_cache()
+        key = cache.build_key(
+            self.model_id,
+            {
+                "response_mime_type": "application/json",
+                "response_schema": self._batch_schema(),
+                "response_logprobs": True,
+                "logprobs": self._top_logprobs(),
+                "num_statements": num_statements,
+            },
+            prompt
+        )
+
+        return cache.get_or_generate(
+            key, self._score_batch, prompt, num_statements)
+
+    @llm_ratelimit
+    @handle_api_error
+    @retry_api_call([2**i for i in range(MAX_RETRIES)])
+    def _score_batch(
+        self, prompt: str, num_statements: int
+    ) -> Union[list[dict[str, float]], None]:
+        response = self.genai_client.models.generate_content(
+            model=self.model_id,
+            contents=prompt,
+            config=genai_types.GenerateContentConfig(
+                response_mime_type="application/json",
+                response_schema=self._batch_schema(),
+                response_logprobs=True,
+                logprobs=self._top_logprobs(),
+            ),
+        )
+        if not response:
+            return None
+
+        for candidate in response.candidates:
+            results = self._parse_batch(candidate, num_statements)
+            if results is not None:
+                return results
+
+        return None
+
 
 class StatementExtractor:
     def __init__(
         self,
         genai_client: genai.client.Client,
-        model_id: str
+        model_id: str,
+        cache: LLMResponseCache = None,
     ):
         self.genai_client = genai_client
         self.model_id = model_id
+        self.cache = cache
 
     def generate_text_vertex(
         self,
@@ -450,14 +955,27 @@ class StatementExtractor:
                 )
         return generative_statement_list
 
-    @ratelimit(RATE)
-    @handle_api_error
-    @retry_api_call([2**i for i in range(MAX_RETRIES)])
     def extract_statements(self, question: str, answer: str) -> list[str]:
+        """Extract statements, using the LLM response cache when possible."""
         prompt = MetricPrompts.STATEMENT_EXTRACTOR_PROMPT_TEMPLATE.format(
             question=question, answer=answer
         )
+        cache = self.cache or get_llm_response_cache()
+        key = cache.build_key(
+            self.model_id,
+            {
+                "response_mime_type": "application/json",
+                "response_schema": Statement.model_json_schema(),
+            },
+            prompt
+        )
 
+        return cache.get_or_generate(key, self._extract_statements, prompt)
+
+    @llm_ratelimit
+    @handle_api_error
+    @retry_api_call([2**i for i in range(MAX_RETRIES)])
+    def _extract_statements(self, prompt: str) -> list[str]:
         llm_outputs = self.generate_text_vertex(
             prompt=prompt,
         )
@@ -475,12 +993,65 @@ class StatementExtractor:
 
 
 class StatementScorer:
-    def __init__(self, scorer: Scorer, prompt_template: str):
+    def __init__(
+        self,
+        scorer: Scorer,
+        prompt_template: str,
+        batch_prompt_template: str = None,
+        batch_size: int = None,
+    ):
         self._scorer = scorer
         self._prompt_template = prompt_template
+        self._batch_prompt_template = batch_prompt_template
+        self._batch_size = batch_size
 
     def score(
         self, shared_template_parameters: dict[str, str], statements: list[str]
+    ) -> Union[list[ScoredStatement], None]:
+        """Score each statement, packing up to `batch_size` per request.
+
+        Without a `batch_size` every statement is scored with its own
+        request. In batched mode, any batch whose response can't be unpacked
+        is scored again one statement at a time.
+        """
+        if not (self._batch_size and self._batch_prompt_template):
+            return self._score_each(shared_template_parameters, statements)
+
+        scored_statements: list[ScoredStatement] = []
+        for start in range(0, len(statements), self._batch_size):
+            batch = statements[start:start + self._batch_size]
+            results = self._scorer.score_batch(
+                self._batch_prompt_template.format(
+                    **shared_template_parameters,
+                    statements="\n".join(
+                        f"{index}. {statement}"
+                        for index, statement in enumerate(batch)
+                    ),
+                ),
+                len(batch),
+            )
+
+            if results is None:
+                logging.warning(
+                    f"Could not unpack the batched scores for {len(batch)} "
+                    "statements, falling back to scoring them one by one."
+                )
+                batch_statements = self._score_each(
+                    shared_template_parameters, batch)
+                if batch_statements is None:
+                    return None
+                scored_statements.extend(batch_statements)
+                continue
+
+            scored_statements.extend(
+                ScoredStatement(statement=statement, scores=result)
+                for statement, result in zip(batch, results)
+            )
+
+        return scored_statements
+
+    def _score_each(
+        self, shared_template_parameters: dict[str, str], statements: list[str]
     ) -> Union[list[ScoredStatement], None]:
         scored_statements: list[ScoredStatement] = []
 
@@ -504,7 +1075,8 @@ class AnswerCorrectnessScorer:
     def __init__(
         self,
         genai_client: genai.client.Client,
-        model_id: str
+        model_id: str,
+        statement_batch_size: int = None,
     ):
         self._statement_scorer = StatementScorer(
             scorer=Scorer(
@@ -513,6 +1085,9 @@ class AnswerCorrectnessScorer:
                 model_id=model_id
             ),
             prompt_template=MetricPrompts.ANSWER_CORRECTNESS_PROMPT_TEMPLATE,
+            batch_prompt_template=(
+                MetricPrompts.ANSWER_CORRECTNESS_BATCH_PROMPT_TEMPLATE),
+            batch_size=statement_batch_size,
         )
         self.genai_client = genai_client
         self.model_id = model_id
@@ -557,7 +1132,8 @@ class AnswerCorrectness(Metric):
             self,
             genai_client: genai.client.Client = None,
             model_id: str = None,
-            compute_precision: bool = True
+            compute_precision: bool = True,
+            statement_batch_size: int = None,
     ):
         self._statement_extractor = StatementExtractor(
             genai_client=genai_client,
@@ -566,7 +1142,8 @@ class AnswerCorrectness(Metric):
 
         answer_scorer = AnswerCorrectnessScorer(
             genai_client=genai_client,
-            model_id=model_id
+            model_id=model_id,
+            statement_batch_size=statement_batch_size,
         )
         self._recall_answer_scorer = answer_scorer
         self._precision_answer_scorer = (
@@ -633,7 +1210,8 @@ class AnswerGroundednessScorer:
     def __init__(
         self,
         genai_client: genai.client.Client,
-        model_id: str
+        model_id: str,
+        statement_batch_size: int = None,
     ):
         self._statement_scorer = StatementScorer(
             scorer=Scorer(
@@ -642,6 +1220,8 @@ class AnswerGroundednessScorer:
                 model_id=model_id
             ),
             prompt_template=MetricPrompts.GROUNDING_PROMPT_TEMPLATE,
+            batch_prompt_template=MetricPrompts.GROUNDING_BATCH_PROMPT_TEMPLATE,
+            batch_size=statement_batch_size,
         )
 
     def score(
@@ -654,6 +1234,8 @@ class AnswerGroundednessScorer:
             shared_template_parameters={"sources": "\n".join(sources)},
             statements=answer_statements,
         )
+        if not scored_statements:
+            return None
 
         scores = [
             scored_statement.scores["TRUE"]
@@ -671,7 +1253,8 @@ class AnswerGroundedness(Metric):
     def __init__(
         self,
         genai_client: genai.client.Client = None,
-        model_id: str = None
+        model_id: str = None,
+        statement_batch_size: int = None,
     ):
         self._statement_extractor = StatementExtractor(
             genai_client=genai_client,
@@ -679,7 +1262,8 @@ class AnswerGroundedness(Metric):
             )
         self._answer_scorer = AnswerGroundednessScorer(
             genai_client=genai_client,
-            model_id=model_id
+            model_id=model_id,
+            statement_batch_size=statement_batch_size,
             )
 
     def call(
@@ -743,6 +1327,7 @@ class StatementBasedBundledMetric(Metric):
         answer_correctness: bool = True,
         faithfulness: bool = True,
         context_recall: bool = True,
+        statement_batch_size: int = None,
     ):
         self._statement_extractor = StatementExtractor(
             genai_client=genai_client,
@@ -758,16 +1343,19 @@ class StatementBasedBundledMetric(Metric):
         self._answer_correctness = (
             AnswerCorrectness(
                 genai_client=genai_client,
-                model_id=model_id
+                model_id=model_id,
+                statement_batch_size=statement_batch_size,
             ) if answer_correctness else None
         )
         self._faithfulness = Faithfulness(
             genai_client=genai_client,
-            model_id=model_id
+            model_id=model_id,
+            statement_batch_size=statement_batch_size,
         ) if faithfulness else None
         self._context_recall = ContextRecall(
             genai_client=genai_client,
-            model_id=model_id
+            model_id=model_id,
+            statement_batch_size=statement_batch_size,
         ) if context_recall else None
 
     def __call__(self, inputs: dict[str, Any]) -> dict[str, Any]:
@@ -816,64 +1404,157 @@ class StatementBasedBundledMetric(Metric):
 
         return output
 
-    def run(self, inputs: pd.DataFrame) -> pd.DataFrame:
-        reference_statements = pd.DataFrame(
-            columns=["reference_statements"], index=inputs.index
-        )
+    def run(
+        self,
+        inputs: pd.DataFrame,
+        executor: futures.Executor = None) -> pd.DataFrame:
+        """Extract statements once, then run the enabled metrics together.
+
+        All statement extraction and scoring calls are made on `executor`,
+        or on a new pool of 4 threads if not provided, and the enabled
+        metrics run at the same time rather than one after another.
+        """
+        with contextlib.ExitStack() as stack:
+            if executor is None:
+                executor = stack.enter_context(
+                    futures.ThreadPoolExecutor(max_workers=4))
+
+            return self._run(inputs, executor)
+
+    def _run(
+        self, inputs: pd.DataFrame, executor: futures.Executor
+    ) -> pd.DataFrame:
+        reference_tasks = []
         if self._context_recall or self._answer_correctness:
-            reference_statements[
-                "reference_statements"] = concurrent.thread_map(
+            reference_tasks = [
+                executor.submit(
                     self._statement_extractor.extract_statements,
-                    inputs["query"].tolist(),
-                    inputs["expected_answer"].tolist(),
-                    max_workers=4,
-                    desc="Extracting statements: `expected_answer`",
-                    )
+                    query,
+                    expected_answer)
+                for query, expected_answer in zip(
+                    inputs["query"], inputs["expected_answer"])
+            ]
 
-        prediction_statements = pd.DataFrame(
-            columns=["prediction_statements"], index=inputs.index
-        )
+        prediction_tasks = []
         if self._faithfulness or (
             self._answer_correctness
             and self._answer_correctness.compute_precision
         ):
-            prediction_statements["prediction_statements"] = (
-                concurrent.thread_map(
+            prediction_tasks = [
+                executor.submit(
                     self._statement_extractor.extract_statements,
-                    inputs["query"].tolist(),
-                    [
-                        response.answer_text
-                        for response in inputs["query_result"].tolist()
-                    ],
-                    max_workers=4,
-                    desc="Extracting statements: `answer_text`",
-                )
-            )
+                    query,
+                    response.answer_text)
+                for query, response in zip(
+                    inputs["query"], inputs["query_result"])
+            ]
+
+        for _ in tqdm(
+            futures.as_completed(reference_tasks + prediction_tasks),
+            total=len(reference_tasks) + len(prediction_tasks),
+            desc="Extracting statements"):
+            pass
 
-        output = pd.DataFrame(index=inputs.index)
+        reference_statements = pd.DataFrame(
+            columns=["reference_statements"], index=inputs.index
+        )
+        if reference_tasks:
+            reference_statements["reference_statements"] = [
+                task.result() for task in reference_tasks
+            ]
 
+        prediction_statements = pd.DataFrame(
+            columns=["prediction_statements"], index=inputs.index
+        )
+        if prediction_tasks:
+            prediction_statements["prediction_statements"] = [
+                task.result() for task in prediction_tasks
+            ]
+
+        metric_inputs = []
         if self._answer_correctness:
-            answer_correctness_results = self._answer_correctness.run(
-                inputs=pd.concat(
+            metric_inputs.append((
+                self._answer_correctness,
+                pd.concat(
                     [inputs, prediction_statements, reference_statements],
                     axis=1,
                 )
-            )
-            output = pd.concat([output, answer_correctness_results], axis=1)
+            ))
 
         if self._context_recall:
-            context_recall_results = self._context_recall.run(
-                inputs=pd.concat([inputs, reference_statements], axis=1)
-            )
-            output = pd.concat([output, context_recall_results], axis=1)
+            metric_inputs.append((
+                self._context_recall,
+                pd.concat([inputs, reference_statements], axis=1)
+            ))
 
         if self._faithfulness:
-            faithfulness_results = self._faithfulness.run(
-                inputs=pd.concat([inputs, prediction_statements], axis=1)
+            metric_inputs.append((
+                self._faithfulness,
+                pd.concat([inputs, prediction_statements], axis=1)
+            ))
+
+        # Each metric only waits on its own rows, so they run side by side
+        # on `executor` from lightweight coordinator threads.
+        with futures.ThreadPoolExecutor(
+            max_workers=len(metric_inputs)) as coordinator:
+            results = [
+                coordinator.submit(metric.run, metric_input, executor)
+                for metric, metric_input in metric_inputs
+            ]
+
+            return pd.concat(
+                [pd.DataFrame(index=inputs.index)]
+                + [result.result() for result in results],
+                axis=1,
             )
-            output = pd.concat([output, faithfulness_results], axis=1)
 
-        return output
+
+class MetricsEngine:
+    """Run several metrics over a DataFrame on one shared executor.
+
+    Every metric submits its row-level work to a single thread pool of
+    `max_workers`, and all LLM calls share one calls per second budget, so
+    independent metrics overlap instead of running back-to-back. If `rate`
+    is set, the budget is only changed for the duration of `run`.
+    """
+
+    def __init__(
+        self,
+        metrics: list[Metric],
+        max_workers: int = MAX_WORKERS,
+        rate: float = None,
+        burst: int = 1,
+    ):
+        self.metrics = metrics
+        self.max_workers = max_workers
+        self.rate = rate
+        self.burst = burst
+
+    def run(self, inputs: pd.DataFrame) -> pd.DataFrame:
+        """Run all metrics, returning their columns in metric order."""
+        output = pd.DataFrame(index=inputs.index)
+        if not self.metrics:
+            return output
+
+        with contextlib.ExitStack() as stack:
+            if self.rate:
+                stack.enter_context(llm_rate_limit(self.rate, self.burst))
+
+            return self._run_metrics(inputs, output)
+
+    def _run_metrics(
+        self, inputs: pd.DataFrame, output: pd.DataFrame) -> pd.DataFrame:
+        with futures.ThreadPoolExecutor(
+            max_workers=self.max_workers) as executor, \
+            futures.ThreadPoolExecutor(
+                max_workers=len(self.metrics)) as coordinator:
+            results = [
+                coordinator.submit(metric.run, inputs, executor)
+                for metric in self.metrics
+            ]
+
+            return pd.concat(
+                [output] + [result.result() for result in results], axis=1)
 
 
 class MetricPrompts:
@@ -1145,6 +1826,33 @@ premise: {sources}
 hypothesis: {statement}
 answer: """ # noqa: E501
 
+    ANSWER_CORRECTNESS_BATCH_PROMPT_TEMPLATE = """You are provided with a question, an answer and a numbered list of statements.
+Your task is to evaluate each statement independently and decide, whether its information content is provided by the answer.
+Return one item per statement with its `index` and your decision as the `verdict`: `true` if the statement is provided by the answer, otherwise `false`.
+
+START_QUESTION
+{question}
+END_QUESTION
+START_ANSWER
+{answer}
+END_ANSWER
+START_STATEMENTS
+{statements}
+END_STATEMENTS
+""" # noqa: E501
+
+    GROUNDING_BATCH_PROMPT_TEMPLATE = """I need your help with "Natural language inference". Your task is to check, for each numbered hypothesis, if the hypothesis is true, given the premise.
+
+Instructions:
+* Evaluate each hypothesis independently of the others.
+* If it is possible to fully derive the hypothesis from the premise (entailment), then its verdict is TRUE, otherwise FALSE.
+* Return one item per hypothesis with its `index` and `verdict`.
+
+premise: {sources}
+hypotheses:
+{statements}
+""" # noqa: E501
+
 
 class Metrics:
     """Metrics tooling for Generative features in Agent Builder and DFCX."""
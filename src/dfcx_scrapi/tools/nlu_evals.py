@@ -21,9 +21,10 @@ from typing import Dict
 
 import gspread
 import pandas as pd
+import pyarrow as pa
 
 from dfcx_scrapi.core import agents, conversation, scrapi_base
-from dfcx_scrapi.tools import dataframe_functions
+from dfcx_scrapi.tools import dataframe_functions, results_store
 
 pd.options.display.max_colwidth = 200
 
@@ -56,6 +57,10 @@ OUTPUT_SCHEMA_COLUMNS = [
     "input_source"
     ]
 
+OUTPUT_ARROW_SCHEMA = results_store.schema_from_columns(
+    OUTPUT_SCHEMA_COLUMNS, {"confidence": pa.float64()}
+)
+
 SUMMARY_SCHEMA_COLUMNS = [
     "test_run_timestamp",
     "total_tests",
@@ -233,9 +238,18 @@ class NluEvals(scrapi_base.ScrapiBase):
         return df
 
     def run_evals(self, df: pd.DataFrame, chunk_size: int = 300,
-                  rate_limit: float = 10.0,
-                  eval_run_display_name: str = "Evals"):
-        """Run the full Eval dataset."""
+                  rate_limit: float = None,
+                  eval_run_display_name: str = "Evals",
+                  max_workers: int = 20,
+                  requests_per_minute: int = (
+                      conversation.DEFAULT_REQUESTS_PER_MINUTE),
+                  results_file: str = None):
+        """Run the full Eval dataset.
+
+        See `DialogflowConversation.run_intent_detection` for details on the
+        `chunk_size`, `max_workers`, `requests_per_minute` and `results_file`
+        arguments. `rate_limit` is deprecated.
+        """
         logsx = "-" * 10
 
         agent_type = self.get_agent_type(self.agent_id)
@@ -250,7 +264,12 @@ class NluEvals(scrapi_base.ScrapiBase):
 
         logging.info(f"{logsx} STARTING {eval_run_display_name} {logsx}")
         results = self._dc.run_intent_detection(
-            test_set=df, chunk_size=chunk_size, rate_limit=rate_limit
+            test_set=df,
+            chunk_size=chunk_size,
+            rate_limit=rate_limit,
+            max_workers=max_workers,
+            requests_per_minute=requests_per_minute,
+            results_file=results_file,
         )
 
         # Reorder Columns
@@ -301,6 +320,21 @@ class NluEvals(scrapi_base.ScrapiBase):
     def write_results_to_file(self, df: pd.DataFrame, output_file: str):
         df.to_csv(output_file, index=False)
 
+    def write_results_to_parquet(
+        self, df: pd.DataFrame, root_path: str, run_id: str = None
+    ) -> str:
+        """Append the output results to a Parquet dataset, by run.
+
+        See `results_store.ResultsWriter` for details, and
+        `results_store.load_results` to read the results back.
+
+        Returns:
+          The run ID the results were written to.
+        """
+        writer = results_store.ResultsWriter(root_path, OUTPUT_ARROW_SCHEMA)
+
+        return writer.write(df, run_id)
+
     def write_results_to_sheets(self, df: pd.DataFrame, google_sheet_name: str,
                                 full_output_tab: str,
                                 summary_tab: str,
@@ -0,0 +1,376 @@
+"""Columnar storage for evaluation results, using Parquet datasets."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import json
+import logging
+import os
+import typing
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from dfcx_scrapi.tools.agent_response import AgentResponse, Snippet
+
+# logging config
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)-8s %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+RUN_ID_COLUMN = "run_id"
+AGENT_RESPONSE_COLUMN = "query_result"
+BATCH_SIZE = 65536  # Max # of rows per DataFrame yielded by scan_results
+
+_RUN_PARTITIONING = ds.partitioning(
+    pa.schema([(RUN_ID_COLUMN, pa.string())]), flavor="hive"
+)
+
+_ARROW_TYPES = {
+    str: pa.string(),
+    int: pa.int64(),
+    float: pa.float64(),
+    bool: pa.bool_(),
+    list[int]: pa.list_(pa.int64()),
+    list[Snippet]: pa.list_(
+        pa.struct(
+            [(field.name, pa.string()) for field in dataclasses.fields(Snippet)]
+        )
+    ),
+}
+
+
+def schema_from_dataclass(cls: type) -> pa.Schema:
+    """Derive an Arrow schema from the type hints of a dataclass."""
+    hints = typing.get_type_hints(cls)
+
+    return pa.schema(
+        [
+            pa.field(field.name, _ARROW_TYPES[hints[field.name]])
+            for field in dataclasses.fields(cls)
+        ]
+    )
+
+
+def schema_from_columns(
+    columns: List[str], types: Dict[str, pa.DataType] = None
+) -> pa.Schema:
+    """Build an Arrow schema for `columns`, defaulting to string columns."""
+    types = types or {}
+
+    return pa.schema(
+        [pa.field(column, types.get(column, pa.string())) for column in columns]
+    )
+
+
+AGENT_RESPONSE_SCHEMA = schema_from_dataclass(AgentResponse)
+
+
+def _is_nested(value: Any) -> bool:
+    return isinstance(value, (dict, list, tuple))
+
+
+def _to_json(value: Any) -> Any:
+    if _is_nested(value):
+        return json.dumps(value, default=str)
+
+    return value
+
+
+def _is_numeric(data_type: pa.DataType) -> bool:
+    return pa.types.is_integer(data_type) or pa.types.is_floating(data_type)
+
+
+def _column_to_array(values: pd.Series, field: pa.Field = None) -> pa.Array:
+    """Convert a column to Arrow, encoding untyped nested values as JSON.
+
+    Values in numeric typed columns that are not numbers, such as the empty
+    confidence of a failed detect intent call, are stored as nulls. If a
+    column still does not fit its type, the type is inferred instead.
+    """
+    if field is not None:
+        typed_values = values
+        if _is_numeric(field.type):
+            try:
+                typed_values = pd.to_numeric(values, errors="coerce")
+            except (TypeError, ValueError):
+                pass
+        elif pa.types.is_string(field.type) and values.map(_is_nested).any():
+            typed_values = values.map(_to_json)
+
+        try:
+            return pa.array(typed_values, type=field.type, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            logging.warning(
+                "Column %s does not match type %s, inferring its type.",
+                field.name, field.type)
+
+    if values.dtype == object and values.map(_is_nested).any():
+        values = values.map(_to_json)
+
+    try:
+        return pa.array(values, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array(values.map(
+            lambda x: None if pd.isna(x) else str(x)), type=pa.string())
+
+
+def expand_agent_responses(
+    df: pd.DataFrame, column: str = AGENT_RESPONSE_COLUMN
+) -> pd.DataFrame:
+    """Replace a column of AgentResponse objects with one column per field.
+
+    Unlike `AgentResponse.to_row`, the search results and cited snippet
+    indices are kept as native lists so they can be stored as nested
+    Arrow types instead of JSON strings.
+    """
+    responses = pd.DataFrame(
+        [dataclasses.asdict(response) for response in df[column]],
+        columns=AGENT_RESPONSE_SCHEMA.names,
+        index=df.index,
+    )
+
+    return pd.concat([df.drop(column, axis=1), responses], axis=1)
+
+
+def agent_responses_from_results(df: pd.DataFrame) -> pd.Series:
+    """Rebuild AgentResponse objects from loaded AgentResponse columns."""
+    def _to_response(row: Dict[str, Any]) -> AgentResponse:
+        row["search_results"] = [
+            Snippet(**snippet) for snippet in row["search_results"]
+        ]
+        row["cited_snippet_indices"] = [
+            int(index) for index in row["cited_snippet_indices"]
+        ]
+
+        return AgentResponse(**row)
+
+    responses = df[AGENT_RESPONSE_SCHEMA.names].astype(object)
+    responses = responses.where(responses.notna(), None)
+
+    return pd.Series(
+        [_to_response(row) for row in responses.to_dict("records")],
+        index=df.index,
+    )
+
+
+class ResultsWriter:
+    """Write evaluation results to a Parquet dataset partitioned by run.
+
+    Each call to `write` adds a new file under `<root_path>/run_id=<run_id>`,
+    so results can be appended to an existing run, or a new run, without
+    rewriting any earlier files.
+
+    Args:
+      root_path: the local directory holding the dataset.
+      schema: (Optional) Arrow types for known columns. Columns holding
+        AgentResponse objects always use `AGENT_RESPONSE_SCHEMA`. Other
+        columns have their types inferred, and nested values in columns
+        without a schema are stored as JSON strings.
+    """
+
+    def __init__(self, root_path: str, schema: pa.Schema = None):
+        self.root_path = root_path
+        self.schema = schema
+
+    @staticmethod
+    def new_run_id() -> str:
+        return datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+
+    def _field(self, column: str) -> pa.Field:
+        for schema in [self.schema, AGENT_RESPONSE_SCHEMA]:
+            if schema is not None and column in schema.names:
+                return schema.field(column)
+
+        return None
+
+    def to_table(self, df: pd.DataFrame) -> pa.Table:
+        """Convert a results DataFrame to an Arrow Table."""
+        if AGENT_RESPONSE_COLUMN in df.columns and df[
+            AGENT_RESPONSE_COLUMN].map(
+                lambda x: isinstance(x, AgentResponse)).all():
+            df = expand_agent_responses(df)
+
+        if RUN_ID_COLUMN in df.columns:
+            df = df.drop(RUN_ID_COLUMN, axis=1)
+
+        return pa.Table.from_arrays(
+            [
+                _column_to_array(df[column], self._field(str(column)))
+                for column in df.columns
+            ],
+            names=[str(column) for column in df.columns],
+        )
+
+    def write(self, df: pd.DataFrame, run_id: str = None) -> str:
+        """Append the results in `df` to the dataset.
+
+        Args:
+          df: the results to write. The index is not stored.
+          run_id: (Optional) the run to append to. If not provided, a new
+            run ID is generated from the current UTC time.
+
+        Returns:
+          The run ID the results were written to.
+        """
+        run_id = run_id or self.new_run_id()
+        run_dir = os.path.join(self.root_path, f"{RUN_ID_COLUMN}={run_id}")
+        os.makedirs(run_dir, exist_ok=True)
+
+        filepath = os.path.join(run_dir, f"part-{uuid.uuid4().hex}.parquet")
+        pq.write_table(self.to_table(df), filepath)
+        logging.info(f"Wrote {len(df)} results to {filepath}")
+
+        return run_id
+
+    def write_csv(
+        self, csv_path: str, run_id: str = None, chunksize: int = BATCH_SIZE
+    ) -> str:
+        """Convert a CSV results file to one run, `chunksize` rows at a time.
+
+        Returns:
+          The run ID the results were written to.
+        """
+        run_id = run_id or self.new_run_id()
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+            self.write(chunk, run_id)
+
+        return run_id
+
+    def write_jsonl(
+        self, jsonl_path: str, run_id: str = None, chunksize: int = BATCH_SIZE
+    ) -> str:
+        """Convert a JSON Lines file, such as a conversation history export
+        from `ConversationHistory`, to one run, `chunksize` rows at a time.
+
+        Returns:
+          The run ID the results were written to.
+        """
+        run_id = run_id or self.new_run_id()
+        with pd.read_json(
+            jsonl_path, lines=True, chunksize=chunksize, dtype=False
+        ) as reader:
+            for chunk in reader:
+                self.write(chunk, run_id)
+
+        return run_id
+
+
+def _unify_schemas(schemas: List[pa.Schema]) -> pa.Schema:
+    """Merge file schemas whose column types were inferred separately.
+
+    Compatible types are promoted, for example an int64 column that holds
+    nulls in another file is read as double. Columns whose types can't be
+    promoted, such as int64 and string, are read as strings.
+    """
+    try:
+        return pa.unify_schemas(schemas, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+
+    fields = {}
+    for schema in schemas:
+        for field in schema:
+            fields.setdefault(field.name, []).append(field)
+
+    unified = []
+    for name, same_name in fields.items():
+        try:
+            unified.append(pa.unify_schemas(
+                [pa.schema([field]) for field in same_name],
+                promote_options="permissive").field(name))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            unified.append(pa.field(name, pa.string()))
+
+    return pa.schema(unified)
+
+
+def _results_dataset(root_path: str) -> ds.Dataset:
+    """Open the dataset, merging the schemas of every run."""
+    dataset = ds.dataset(
+        root_path, format="parquet", partitioning=_RUN_PARTITIONING
+    )
+    schema = _unify_schemas(
+        [fragment.physical_schema for fragment in dataset.get_fragments()]
+        + [pa.schema([(RUN_ID_COLUMN, pa.string())])]
+    )
+
+    return ds.dataset(
+        root_path,
+        schema=schema,
+        format="parquet",
+        partitioning=_RUN_PARTITIONING,
+    )
+
+
+def list_runs(root_path: str) -> List[str]:
+    """List the run IDs stored under `root_path`, oldest name first."""
+    prefix = f"{RUN_ID_COLUMN}="
+
+    return sorted(
+        name[len(prefix):]
+        for name in os.listdir(root_path)
+        if name.startswith(prefix)
+    )
+
+
+def scan_results(
+    root_path: str,
+    columns: List[str] = None,
+    run_ids: List[str] = None,
+    batch_size: int = BATCH_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """Lazily read results, one DataFrame of up to `batch_size` rows at a time.
+
+    Only the requested `columns` are read from disk, and only the files of
+    the requested `run_ids` are opened.
+
+    Args:
+      root_path: the directory written to by a ResultsWriter.
+      columns: (Optional) the columns to read. Defaults to all columns.
+      run_ids: (Optional) the runs to read. Defaults to all runs.
+      batch_size: (Optional) the max number of rows per DataFrame.
+
+    Yields:
+      DataFrames of results.
+    """
+    dataset = _results_dataset(root_path)
+    row_filter = None
+    if run_ids is not None:
+        row_filter = ds.field(RUN_ID_COLUMN).isin(run_ids)
+
+    for batch in dataset.to_batches(
+        columns=columns, filter=row_filter, batch_size=batch_size
+    ):
+        yield batch.to_pandas()
+
+
+def load_results(
+    root_path: str, columns: List[str] = None, run_ids: List[str] = None
+) -> pd.DataFrame:
+    """Read results into one DataFrame. See `scan_results` for details."""
+    dataset = _results_dataset(root_path)
+    row_filter = None
+    if run_ids is not None:
+        row_filter = ds.field(RUN_ID_COLUMN).isin(run_ids)
+
+    return dataset.to_table(columns=columns, filter=row_filter).to_pandas()
@@ -15,7 +15,6 @@
 # limitations under the License.
 
 import logging
-import time
 from operator import attrgetter
 from typing import Dict, List
 
@@ -636,10 +635,10 @@ class SearchUtil(scrapi_base.ScrapiBase):
                     flow_id=flows_map[flow_name], reverse=True
                 )
                 for page in pages_map:
-                    page_search = self.search_conditionals_page(
+                    page_search = self._call_with_quota(
+                        agent_id, "read", self.search_conditionals_page,
                         page_id=pages_map[page], search=search
                     )
-                    time.sleep(0.5)
                     page_search.insert(0, "resource_name", page)
                     page_search.insert(0, "resource_type", "page")
                     locator = pd.concat([locator, page_search])
@@ -663,10 +662,10 @@ class SearchUtil(scrapi_base.ScrapiBase):
                     flow_id=flows_map[flow], reverse=True
                 )
                 for page in pages_map:
-                    page_search = self.search_conditionals_page(
+                    page_search = self._call_with_quota(
+                        agent_id, "read", self.search_conditionals_page,
                         page_id=pages_map[page], search=search
                     )
-                    time.sleep(0.5)
                     page_search.insert(0, "resource_name", page)
                     page_search.insert(0, "resource_type", "page")
                     locator = pd.concat([locator, page_search])
@@ -922,9 +921,10 @@ class SearchUtil(scrapi_base.ScrapiBase):
             parameters,
             entry_fulfillment
         """
+        flow_pages = self._fan_out(flow_df.flow_id, self.pages.list_pages)
         page_df = (
             flow_df[["flow_name", "flow_id"]]
-            .assign(page_obj=flow_df.flow_id.apply(self.pages.list_pages))
+            .assign(page_obj=flow_df.flow_id.map(flow_pages))
             .explode("page_obj", ignore_index=True)
         )
 
@@ -64,15 +64,18 @@ class StatsUtil(ScrapiBase):
     def _list_all_pages(self, flows):
         """Get a List of all pages from every flow."""
         pages = []
-        for flow in flows:
-            pages += self._pages_tracker.list_pages(flow)
+        for flow_pages in self._fan_out(
+            flows, self._pages_tracker.list_pages).values():
+            pages += flow_pages
+
         return pages
 
     def _list_all_rgs(self, flows):
         """Get a list of all route groups from every flow."""
         rgs = []
-        for flow in flows:
-            rgs += self._rg_tracker.list_transition_route_groups(flow)
+        for flow_rgs in self._fan_out(
+            flows, self._rg_tracker.list_transition_route_groups).values():
+            rgs += flow_rgs
 
         return rgs
 
@@ -175,9 +175,8 @@ class TestCasesUtil(scrapi_base.ScrapiBase):
             creds=self.creds, agent_id=agent_id)
         dfcx_intents_map = dfcx_intents.get_intents_map(agent_id=agent_id)
         dfcx_flows_map = dfcx_flows.get_flows_map(agent_id=agent_id)
-        dfcx_pages_map = {}
-        for flow_id in dfcx_flows_map.keys():
-            dfcx_pages_map[flow_id] = dfcx_pages.get_pages_map(flow_id=flow_id)
+        dfcx_pages_map = self._fan_out(
+            dfcx_flows_map.keys(), dfcx_pages.get_pages_map)
         commons_config["test_cases"] = dfcx_testcases
         commons_config["flows"] = dfcx_flows
         commons_config["pages"] = dfcx_pages
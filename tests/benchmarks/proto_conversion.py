@@ -0,0 +1,163 @@
+"""Benchmark reading CX resources as proto-plus objects vs raw protobufs.
+
+Run with `make benchmark` or `python tests/benchmarks/proto_conversion.py`.
+Each case converts the same synthetic resources twice: once from the
+proto-plus objects the API clients return by default, and once from the raw
+protobuf messages returned with `raw=True`.
+"""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import argparse
+import timeit
+
+from google.cloud.dialogflowcx_v3beta1 import types
+
+from dfcx_scrapi.core.entity_types import EntityTypes
+from dfcx_scrapi.core.intents import Intents
+from dfcx_scrapi.core.scrapi_base import ScrapiBase
+
+AGENT_ID = "projects/p/locations/global/agents/a"
+
+
+def build_intents(num_intents: int, num_phrases: int):
+    part = types.Intent.TrainingPhrase.Part
+
+    return [
+        types.Intent(
+            name=f"{AGENT_ID}/intents/{i}",
+            display_name=f"intent_{i}",
+            labels={"head": "head"},
+            parameters=[
+                types.Intent.Parameter(id="city", entity_type="@sys.geo-city")
+            ],
+            training_phrases=[
+                types.Intent.TrainingPhrase(
+                    id=f"tp{j}",
+                    repeat_count=1,
+                    parts=[
+                        part(text="fly to "),
+                        part(text="paris", parameter_id="city"),
+                        part(text=f" on day {j}"),
+                    ],
+                )
+                for j in range(num_phrases)
+            ],
+        )
+        for i in range(num_intents)
+    ]
+
+
+def build_entity_types(num_entity_types: int, num_entities: int):
+    return [
+        types.EntityType(
+            name=f"{AGENT_ID}/entityTypes/{i}",
+            display_name=f"entity_type_{i}",
+            kind=types.EntityType.Kind.KIND_MAP,
+            entities=[
+                types.EntityType.Entity(
+                    value=f"value_{j}", synonyms=[f"value_{j}", f"v{j}"])
+                for j in range(num_entities)
+            ],
+        )
+        for i in range(num_entity_types)
+    ]
+
+
+def build_pages(num_pages: int, num_routes: int):
+    return [
+        types.Page(
+            name=f"{AGENT_ID}/flows/f/pages/{i}",
+            display_name=f"page_{i}",
+            entry_fulfillment=types.Fulfillment(
+                messages=[
+                    types.ResponseMessage(
+                        text=types.ResponseMessage.Text(text=[f"page {i}"]))
+                ]
+            ),
+            transition_routes=[
+                types.TransitionRoute(
+                    intent=f"{AGENT_ID}/intents/{j}",
+                    target_page=f"{AGENT_ID}/flows/f/pages/{j}",
+                )
+                for j in range(num_routes)
+            ],
+        )
+        for i in range(num_pages)
+    ]
+
+
+def route_targets(pages):
+    """Read a few fields from every route, as the search tools do."""
+    return [
+        (route.intent, route.target_page)
+        for page in pages
+        for route in page.transition_routes
+    ]
+
+
+def intents_to_df(intents, mode):
+    intents_client = Intents.__new__(Intents)
+    intents_client.list_intents = lambda *args, **kwargs: intents
+
+    return intents_client.bulk_intent_to_df(AGENT_ID, mode=mode)
+
+
+def entity_types_to_df(entity_types):
+    entity_types_client = EntityTypes.__new__(EntityTypes)
+    entity_types_client.list_entity_types = (
+        lambda *args, **kwargs: entity_types)
+
+    return entity_types_client.entity_types_to_df(AGENT_ID)
+
+
+def run(scale: int, repeat: int):
+    intents = build_intents(10 * scale, 20)
+    entity_types = build_entity_types(scale, 100)
+    pages = build_pages(10 * scale, 20)
+
+    cases = {
+        "intents_to_df (basic)": (
+            intents, lambda objs: intents_to_df(objs, "basic")),
+        "intents_to_df (advanced)": (
+            intents, lambda objs: intents_to_df(objs, "advanced")),
+        "entity_types_to_df": (entity_types, entity_types_to_df),
+        "page route fields": (pages, route_targets),
+        "cx_object_to_dict (pages)": (
+            pages, lambda objs: [
+                ScrapiBase.cx_object_to_dict(obj) for obj in objs]),
+    }
+
+    print(f"{'case':<28}{'proto-plus':>12}{'raw':>12}{'speedup':>10}")
+    for name, (objs, func) in cases.items():
+        raw_objs = [ScrapiBase.raw_proto(obj) for obj in objs]
+        wrapped = min(timeit.repeat(
+            lambda objs=objs, func=func: func(objs), number=1, repeat=repeat))
+        raw = min(timeit.repeat(
+            lambda objs=raw_objs, func=func: func(objs),
+            number=1, repeat=repeat))
+        print(
+            f"{name:<28}{wrapped:>11.3f}s{raw:>11.3f}s{wrapped / raw:>9.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scale", type=int, default=10,
+        help="10x this many Intents and Pages, and this many Entity Types.")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run(args.scale, args.repeat)
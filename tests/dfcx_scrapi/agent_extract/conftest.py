@@ -0,0 +1,113 @@
+"""Shared fixtures for the agent_extract tests."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+
+import pytest
+
+from dfcx_scrapi.agent_extract import (
+    agents,
+    entity_types,
+    flows,
+    intents,
+    test_cases,
+    webhooks,
+)
+
+AGENT_ID = "projects/p/locations/global/agents/a"
+
+AGENT_FILES = {
+    "flows/Default Start Flow/Default Start Flow.json": {
+        "name": "start-flow",
+        "transitionRoutes": [
+            {"intent": "order_pizza", "targetPage": "Order"},
+        ],
+        "eventHandlers": [{
+            "event": "sys.no-match-default",
+            "triggerFulfillment": {
+                "messages": [{"text": {"text": ["Sorry?"]}}],
+            },
+        }],
+    },
+    "flows/Default Start Flow/pages/Order.json": {
+        "name": "order-page",
+        "entryFulfillment": {"webhook": "orders", "tag": "entry"},
+        "form": {"parameters": [
+            {"displayName": "size", "entityType": "@size"},
+        ]},
+        "transitionRoutes": [
+            {
+                "condition": "$page.params.status = FINAL",
+                "targetPage": "End Session",
+                "triggerFulfillment": {"webhook": "orders"},
+            },
+        ],
+        "transitionRouteGroups": ["Help"],
+    },
+    "flows/Default Start Flow/transitionRouteGroups/Help.json": {
+        "name": "help-rg",
+        "displayName": "Help",
+        "transitionRoutes": [{"intent": "help", "targetPage": "Order"}],
+    },
+    "intents/order_pizza/order_pizza.json": {
+        "name": "order-intent",
+        "parameters": [{"id": "pizza_size", "entityType": "@size"}],
+    },
+    "intents/order_pizza/trainingPhrases/en.json": {
+        "trainingPhrases": [{"parts": [{"text": "I want a pizza"}]}],
+    },
+    "intents/help/help.json": {"name": "help-intent"},
+    "intents/help/trainingPhrases/en.json": {
+        "trainingPhrases": [{"parts": [{"text": "help"}]}],
+    },
+    "entityTypes/size/size.json": {"name": "size-et", "kind": "KIND_MAP"},
+    "entityTypes/size/entities/en.json": {
+        "entities": [{"value": "large", "synonyms": ["large", "big"]}],
+    },
+    "webhooks/orders.json": {"name": "orders-wh", "displayName": "orders"},
+    "testCases/tc1.json": {"name": "tc1", "displayName": "Order test"},
+}
+
+
+def write_agent_export(root: str) -> str:
+    """Write a small agent export, as unzipped JSON files, under `root`."""
+    for path, content in AGENT_FILES.items():
+        file_path = os.path.join(root, path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "w", encoding="UTF-8") as agent_file:
+            json.dump(content, agent_file)
+
+    return root
+
+
+@pytest.fixture
+def agent_export(tmpdir):
+    return write_agent_export(os.path.join(tmpdir, "agent"))
+
+
+@pytest.fixture
+def extract_agents():
+    """An agent_extract Agents instance without any API clients."""
+    agent = agents.Agents.__new__(agents.Agents)
+    agent.lang_code = "en"
+    agent.flows = flows.Flows()
+    agent.intents = intents.Intents()
+    agent.etypes = entity_types.EntityTypes()
+    agent.webhooks = webhooks.Webhooks()
+    agent.tcs = test_cases.TestCases()
+
+    return agent
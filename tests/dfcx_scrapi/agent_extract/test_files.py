@@ -0,0 +1,118 @@
+"""Test Class for Agent File loading in SCRAPI."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import dataclasses
+import io
+import json
+import os
+import zipfile
+
+import pytest
+
+from dfcx_scrapi.agent_extract import test_cases, types
+from dfcx_scrapi.agent_extract.files import AgentFiles, ZipAgentFiles
+from tests.dfcx_scrapi.agent_extract.conftest import AGENT_FILES, AGENT_ID
+
+
+def comparable(data):
+    """AgentData fields that don't depend on the file loading strategy."""
+    result = dataclasses.asdict(
+        dataclasses.replace(data, files=None, graph=None, index=None))
+    result["index"] = data.index.to_dict()
+    result["graph"] = (data.graph.nodes, dict(data.graph.edges))
+
+    return result
+
+def test_prefetch_serves_each_file_once(agent_export):
+    agent_files = AgentFiles(agent_export + "/")
+    agent_files.prefetch(max_workers=2)
+    webhook_file = f"{agent_export}/webhooks/orders.json"
+
+    first = agent_files.load_json(webhook_file)
+    first["name"] = "changed"
+
+    assert len(agent_files.json_paths()) == len(AGENT_FILES)
+    assert agent_files.load_json(webhook_file) == AGENT_FILES[
+        "webhooks/orders.json"]
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_parallel_extraction_matches_serial(
+    agent_export, extract_agents, use_processes):
+    serial = extract_agents.process_agent_directory(agent_export, AGENT_ID)
+    parallel = extract_agents.process_agent_directory(
+        agent_export, AGENT_ID, parallel=True, max_workers=2,
+        use_processes=use_processes)
+
+    assert comparable(parallel) == comparable(serial)
+    assert parallel.total_pages == 1
+    assert len(parallel.intents) == 2
+
+def write_agent_zip(zip_path):
+    with zipfile.ZipFile(zip_path, "w") as agent_zip:
+        for path, content in AGENT_FILES.items():
+            agent_zip.writestr(path, json.dumps(content))
+
+    return zip_path
+
+def test_zip_files_list_and_load_members(tmpdir):
+    zip_path = write_agent_zip(os.path.join(tmpdir, "agent.zip"))
+
+    with ZipAgentFiles(zip_path) as agent_files:
+        root = agent_files.root_path
+        assert agent_files.listdir(f"{root}/flows/Default Start Flow") == [
+            "Default Start Flow.json", "pages", "transitionRouteGroups"]
+        assert agent_files.load_json(f"{root}/webhooks/orders.json") == (
+            AGENT_FILES["webhooks/orders.json"])
+        with pytest.raises(FileNotFoundError):
+            agent_files.load_json(f"{root}/webhooks/missing.json")
+        with pytest.raises(FileNotFoundError):
+            agent_files.listdir(f"{root}/missing")
+
+@pytest.mark.parametrize("source", ["path", "bytes", "stream"])
+def test_zip_extraction_matches_directory(
+    agent_export, extract_agents, tmpdir, source):
+    zip_path = write_agent_zip(os.path.join(tmpdir, "agent.zip"))
+    with open(zip_path, "rb") as zip_file:
+        raw = zip_file.read()
+    agent_zip = {
+        "path": zip_path, "bytes": raw, "stream": io.BytesIO(raw)}[source]
+
+    expected = extract_agents.process_agent_directory(agent_export, AGENT_ID)
+    res = extract_agents.process_agent_zip(
+        agent_zip, AGENT_ID, parallel=source == "bytes", max_workers=2)
+
+    res, expected = comparable(res), comparable(expected)
+    assert res.pop("index")["resources"].keys() == expected.pop(
+        "index")["resources"].keys()
+    assert res == expected
+
+def test_test_case_intent_helpers_read_from_zip(tmpdir):
+    zip_path = write_agent_zip(os.path.join(tmpdir, "agent.zip"))
+    tc = types.TestCase(intent_data=[
+        {"intent": "help", "status": "valid", "training_phrases": []},
+        {"intent": "missing", "status": "valid", "training_phrases": []},
+    ])
+
+    with ZipAgentFiles(zip_path) as agent_files:
+        tc.agent_path = agent_files.root_path
+        intent_data = test_cases.TestCases.get_test_case_intent_data(
+            tc.agent_path, agent_files)
+        tc = test_cases.TestCases().gather_intent_tps(tc, agent_files)
+
+    assert [i["intent"] for i in intent_data] == ["help", "order_pizza"]
+    assert tc.associated_intent_data == {"help": ["help"]}
+    assert tc.intent_data[1]["status"] == "invalid_intent"
+    assert tc.has_invalid_intent
@@ -0,0 +1,66 @@
+"""Test Class for the Agent Index in SCRAPI."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+from dfcx_scrapi.agent_extract.index import AgentIndex
+from tests.dfcx_scrapi.agent_extract.conftest import AGENT_ID
+
+FLOW = "Default Start Flow"
+
+
+def test_index_maps_resources_and_references(agent_export, extract_agents):
+    data = extract_agents.process_agent_directory(agent_export, AGENT_ID)
+    index = data.index
+
+    intent_id = f"{AGENT_ID}/intents/order-intent"
+    page_id = f"{AGENT_ID}/flows/start-flow/pages/order-page"
+    assert index.get_resource_id("intent", "order_pizza") == intent_id
+    assert index.get_resource_id("page", "Order", flow=FLOW) == page_id
+    assert index.get_display_name(page_id) == "Order"
+    assert index.get_file_path(page_id).endswith("pages/Order.json")
+    assert index.get_resource_data(data, intent_id)["display_name"] == (
+        "order_pizza")
+    assert index.get_resource_data(data, page_id)["name"] == "order-page"
+
+    assert index.get_intent_references(intent_id) == [{
+        "resource_type": "page",
+        "display_name": f"{FLOW}: Start Page",
+        "flow": FLOW,
+        "fulfillment_type": "transition_route",
+        "trigger": "route : intent",
+    }]
+    assert [ref["resource_type"] for ref in index.get_intent_references(
+        "help")] == ["route_group"]
+    assert sorted(
+        (ref["resource_type"], ref["parameter"])
+        for ref in index.get_entity_type_references("@size")
+    ) == [("intent", "pizza_size"), ("page", "size")]
+    assert [ref["fulfillment_type"] for ref in index.get_webhook_references(
+        f"{AGENT_ID}/webhooks/orders-wh")] == ["entry", "transition_route"]
+
+def test_index_save_and_load(agent_export, extract_agents, tmpdir):
+    data = extract_agents.process_agent_directory(agent_export, AGENT_ID)
+    index_file = os.path.join(tmpdir, "index.json")
+
+    data.index.save(index_file)
+    loaded = AgentIndex.load(index_file)
+
+    assert loaded.to_dict() == data.index.to_dict()
+    assert loaded.get_resource_id("route_group", "Help", flow=FLOW) == (
+        f"{AGENT_ID}/flows/start-flow/transitionRouteGroups/help-rg")
+    assert loaded.get_webhook_references("orders")
+    assert loaded.get_intent_references("missing") == []
@@ -348,3 +348,45 @@ def test_page_id_mapper_class_invalid_lang_code(
 
     assert "Agent does not support language: 'en'." in str(excinfo.value)
     mock_list_flows.assert_called_once_with(expected_request)
+
+@patch("dfcx_scrapi.core.flows.services.flows.FlowsClient.list_flows")
+@patch("dfcx_scrapi.core.pages.pages.PagesClient.list_pages")
+def test_run_intent_detection_with_resume(
+    mock_list_pages,
+    mock_list_flows,
+    test_config,
+    test_set_en,
+    mock_list_flows_pager,
+    mock_list_pages_pager,
+    tmp_path
+    ):
+    mock_list_pages.return_value = mock_list_pages_pager
+    mock_list_flows.return_value = mock_list_flows_pager
+    results_file = str(tmp_path / "results.jsonl")
+
+    def mock_reply(send_obj, current_page, session_id):
+        match = types.Match(
+            intent=types.Intent(display_name=f"intent {send_obj['text']}"),
+            match_type=types.Match.MatchType.INTENT,
+            confidence=0.9
+        )
+        return {"page_name": "Test Page 1", "match": match}
+
+    dc = DialogflowConversation(agent_id=test_config["agent_id"])
+    with patch.object(dc, "reply", side_effect=mock_reply) as reply:
+        res = dc.run_intent_detection(
+            test_set_en, max_workers=2, results_file=results_file)
+
+    assert reply.call_count == 2
+    assert list(res.detected_intent) == ["intent Hi!", "intent How are you?"]
+    assert list(res.target_page) == ["Test Page 1", "Test Page 1"]
+    assert len(set(call.kwargs["session_id"]
+                   for call in reply.call_args_list)) == 2
+
+    # A second run against the same results file skips completed rows.
+    with patch.object(dc, "reply", side_effect=mock_reply) as reply:
+        res = dc.run_intent_detection(
+            test_set_en, max_workers=2, results_file=results_file)
+
+    reply.assert_not_called()
+    assert list(res.detected_intent) == ["intent Hi!", "intent How are you?"]
@@ -192,3 +192,202 @@ def test_conversation_history_to_file(
     filename = os.path.join(tmpdir, "test.json")
     ch.conversation_history_to_file(agent_id, filename)
     assert os.path.exists(filename)
+
+# Test stream_conversation_history_to_file
+def test_stream_conversation_history_to_file_resumes(
+    mock_client, test_conversation, tmpdir, test_config
+    ):
+    agent_id = test_config["agent_id"]
+    convos = [
+        types.Conversation(name=f"{agent_id}/conversations/{i}")
+        for i in range(4)
+    ]
+    responses = [
+        types.conversation_history.ListConversationsResponse(
+            conversations=convos[:2], next_page_token="page-2"),
+        types.conversation_history.ListConversationsResponse(
+            conversations=convos[2:]),
+    ]
+
+    def list_pages(request):
+        start = 1 if request.page_token == "page-2" else 0
+        return MagicMock(pages=responses[start:])
+
+    def get_conversation(request):
+        if request.name.endswith("/3") and not calls:
+            calls.append(request.name)
+            raise RuntimeError("interrupted")
+        convo = types.Conversation(test_conversation)
+        convo.name = request.name
+        return convo
+
+    calls = []
+    mock_client.return_value.list_conversations.side_effect = list_pages
+    mock_client.return_value.get_conversation.side_effect = get_conversation
+    ch = ConversationHistory()
+    filename = os.path.join(tmpdir, "test.jsonl")
+
+    with pytest.raises(RuntimeError):
+        ch.stream_conversation_history_to_file(
+            agent_id, filename, max_workers=2, page_size=2)
+
+    with open(f"{filename}.checkpoint", "r", encoding="utf-8") as f:
+        assert json.load(f)["page_token"] == "page-2"
+
+    total = ch.stream_conversation_history_to_file(
+        agent_id, filename, max_workers=2, page_size=2)
+    data = ch.read_conversations_from_file(filename)
+
+    assert total == 4
+    assert sorted(d["session_id"] for d in data) == [c.name for c in convos]
+    assert data[0]["turns"][0]["user"] == "How are you?"
+    assert not os.path.exists(f"{filename}.checkpoint")
+
+# Test sync_conversation_history_to_file
+def test_sync_conversation_history_to_file(
+    mock_client, test_conversation, tmpdir, test_config
+    ):
+    agent_id = test_config["agent_id"]
+    convos = [
+        types.Conversation(
+            name=f"{agent_id}/conversations/{i}",
+            start_time=timestamp_pb2.Timestamp(seconds=1678886400 + i))
+        for i in range(3)
+    ]
+    pages = [convos[:2], convos[2:], []]
+
+    def list_pages(request):
+        return MagicMock(pages=[
+            types.conversation_history.ListConversationsResponse(
+                conversations=pages.pop(0))])
+
+    mock_client.return_value.list_conversations.side_effect = list_pages
+    mock_client.return_value.get_conversation.return_value = test_conversation
+    list_mock = mock_client.return_value.list_conversations
+    ch = ConversationHistory()
+    filename = os.path.join(tmpdir, "test.jsonl")
+
+    assert ch.sync_conversation_history_to_file(agent_id, filename) == 2
+    assert not list_mock.call_args.args[0].filter
+
+    assert ch.sync_conversation_history_to_file(agent_id, filename) == 1
+    assert list_mock.call_args.args[0].filter == (
+        'create_time > "2023-03-15T12:20:01Z"')
+
+    assert ch.sync_conversation_history_to_file(agent_id, filename) == 0
+    assert list_mock.call_args.args[0].filter == (
+        'create_time > "2023-03-15T12:20:02Z"')
+    assert len(ch.read_conversations_from_file(filename)) == 3
+
+def test_sync_conversation_history_resumes_first_page(
+    mock_client, test_conversation, tmpdir, test_config
+    ):
+    agent_id = test_config["agent_id"]
+    convos = [
+        types.Conversation(
+            name=f"{agent_id}/conversations/{i}",
+            start_time=timestamp_pb2.Timestamp(seconds=1678886400 + i))
+        for i in range(3)
+    ]
+    pages = [convos[:1], convos[1:], convos[1:]]
+
+    def list_pages(request):
+        return MagicMock(pages=[
+            types.conversation_history.ListConversationsResponse(
+                conversations=pages.pop(0))])
+
+    def get_conversation(request):
+        if request.name.endswith("/2") and not calls:
+            calls.append(request.name)
+            raise RuntimeError("interrupted")
+        convo = types.Conversation(test_conversation)
+        convo.name = request.name
+        return convo
+
+    calls = []
+    mock_client.return_value.list_conversations.side_effect = list_pages
+    mock_client.return_value.get_conversation.side_effect = get_conversation
+    ch = ConversationHistory()
+    filename = os.path.join(tmpdir, "test.jsonl")
+
+    assert ch.sync_conversation_history_to_file(
+        agent_id, filename, max_workers=1) == 1
+
+    with pytest.raises(RuntimeError):
+        ch.sync_conversation_history_to_file(agent_id, filename, max_workers=1)
+
+    with open(f"{filename}.sync.checkpoint", "r", encoding="utf-8") as f:
+        assert json.load(f)["page_token"] is None
+
+    assert ch.sync_conversation_history_to_file(
+        agent_id, filename, max_workers=1) == 2
+    data = ch.read_conversations_from_file(filename)
+    assert [d["session_id"] for d in data] == [c.name for c in convos]
+
+def test_sync_conversation_history_ignores_other_checkpoints(
+    mock_client, test_conversation, tmpdir, test_config
+    ):
+    agent_id = test_config["agent_id"]
+    convo = types.Conversation(
+        name=f"{agent_id}/conversations/0",
+        start_time=timestamp_pb2.Timestamp(seconds=1678886400))
+    mock_client.return_value.list_conversations.return_value = MagicMock(
+        pages=[types.conversation_history.ListConversationsResponse(
+            conversations=[convo])])
+    mock_client.return_value.get_conversation.return_value = test_conversation
+    list_mock = mock_client.return_value.list_conversations
+    ch = ConversationHistory()
+    filename = os.path.join(tmpdir, "test.jsonl")
+
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"session_id": "existing"}) + "\n")
+    stale = {
+        "agent_id": agent_id, "page_token": "stale", "file_offset": 0,
+        "conversations": 5, "latest_start_time": None}
+    for suffix, stale_filter in [
+        (".checkpoint", None), (".sync.checkpoint", "create_time > 0")]:
+        with open(f"{filename}{suffix}", "w", encoding="utf-8") as f:
+            json.dump({**stale, "filter": stale_filter}, f)
+
+    assert ch.sync_conversation_history_to_file(agent_id, filename) == 1
+    assert not list_mock.call_args.args[0].page_token
+    assert len(ch.read_conversations_from_file(filename)) == 2
+
+def test_sync_conversation_history_catches_late_arrivals(
+    mock_client, test_conversation, tmpdir, test_config
+    ):
+    agent_id = test_config["agent_id"]
+    convos = [
+        types.Conversation(
+            name=f"{agent_id}/conversations/{i}",
+            start_time=timestamp_pb2.Timestamp(seconds=1678886400 + i))
+        for i in range(3)
+    ]
+    # Conversation 1 only becomes listable after conversation 2 is synced.
+    pages = [[convos[0], convos[2]], [convos[2], convos[1]]]
+
+    def list_pages(request):
+        return MagicMock(pages=[
+            types.conversation_history.ListConversationsResponse(
+                conversations=pages.pop(0))])
+
+    def get_conversation(request):
+        convo = types.Conversation(test_conversation)
+        convo.name = request.name
+        return convo
+
+    mock_client.return_value.list_conversations.side_effect = list_pages
+    mock_client.return_value.get_conversation.side_effect = get_conversation
+    ch = ConversationHistory()
+    filename = os.path.join(tmpdir, "test.jsonl")
+
+    assert ch.sync_conversation_history_to_file(
+        agent_id, filename, lookback_seconds=60) == 2
+    assert ch.sync_conversation_history_to_file(
+        agent_id, filename, lookback_seconds=60) == 1
+
+    data = ch.read_conversations_from_file(filename)
+    assert sorted(d["session_id"] for d in data) == [c.name for c in convos]
+    with open(f"{filename}.watermark", "r", encoding="utf-8") as f:
+        assert sorted(json.load(f)["recent_conversations"]) == [
+            c.name for c in convos]
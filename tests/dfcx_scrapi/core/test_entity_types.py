@@ -0,0 +1,123 @@
+"""Test Class for core Entity Type Methods in SCRAPI."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.cloud.dialogflowcx_v3beta1 import types
+
+from dfcx_scrapi.core.entity_types import (
+    ADVANCED_MODE_COLUMNS,
+    EXCLUDED_PHRASES_COLUMNS,
+    EntityTypes,
+)
+
+
+@pytest.fixture
+def test_config():
+    project_id = "my-project-id-1234"
+    agent_id = f"projects/{project_id}/locations/global/agents/my-agent-1234"
+
+    return {
+        "project_id": project_id,
+        "agent_id": agent_id,
+    }
+
+@pytest.fixture
+def mock_entity_types_list(test_config):
+    entity_type1 = types.EntityType(
+        name=f"{test_config['agent_id']}/entityTypes/1",
+        display_name="size",
+        kind=types.EntityType.Kind.KIND_MAP,
+        redact=True,
+        entities=[
+            types.EntityType.Entity(value="small", synonyms=["small", "s"]),
+            types.EntityType.Entity(value="large", synonyms=["large"]),
+        ],
+        excluded_phrases=[types.EntityType.ExcludedPhrase(value="medium")],
+    )
+    entity_type2 = types.EntityType(
+        name=f"{test_config['agent_id']}/entityTypes/2",
+        display_name="color",
+        kind=types.EntityType.Kind.KIND_LIST,
+        entities=[types.EntityType.Entity(value="red", synonyms=["red"])],
+    )
+
+    return [entity_type1, entity_type2]
+
+@pytest.fixture(autouse=True)
+def mock_creds(test_config: Dict[str, str]):
+    """Setup fixture for EntityTypes Class to be used with all tests."""
+    with patch("dfcx_scrapi.core.scrapi_base.default") as mock_default, \
+        patch("dfcx_scrapi.core.scrapi_base.Request") as mock_request:
+        mock_creds = MagicMock()
+        mock_default.return_value = (mock_creds, test_config["project_id"])
+        mock_request.return_value = MagicMock()
+
+        yield mock_creds
+
+@patch("dfcx_scrapi.core.entity_types.EntityTypes.list_entity_types")
+def test_entity_types_to_df_basic(
+    mock_list_entity_types, mock_entity_types_list, test_config):
+    mock_list_entity_types.return_value = mock_entity_types_list
+
+    df = EntityTypes().entity_types_to_df(test_config["agent_id"])
+
+    assert list(df.columns) == ["display_name", "entity_value", "synonyms"]
+    assert list(df.display_name) == ["color", "size", "size", "size"]
+    assert list(df.entity_value) == ["red", "large", "small", "small"]
+    assert list(df.synonyms) == ["red", "large", "small", "s"]
+
+@patch("dfcx_scrapi.core.entity_types.EntityTypes.list_entity_types")
+def test_entity_types_to_df_compact_synonyms(
+    mock_list_entity_types, mock_entity_types_list, test_config):
+    mock_list_entity_types.return_value = mock_entity_types_list
+
+    df = EntityTypes().entity_types_to_df(
+        test_config["agent_id"], explode_synonyms=False)
+
+    assert list(df.entity_value) == ["red", "large", "small"]
+    assert list(df.synonyms) == [["red"], ["large"], ["small", "s"]]
+
+@patch("dfcx_scrapi.core.entity_types.EntityTypes.list_entity_types")
+def test_entity_types_to_df_advanced(
+    mock_list_entity_types, mock_entity_types_list, test_config):
+    mock_list_entity_types.return_value = mock_entity_types_list
+
+    res = EntityTypes().entity_types_to_df(
+        test_config["agent_id"], mode="advanced")
+    entity_df = res["entity_types"]
+    excl_df = res["excluded_phrases"]
+
+    assert list(entity_df.columns) == ADVANCED_MODE_COLUMNS
+    assert len(entity_df) == 4
+    assert list(entity_df.kind) == ["KIND_MAP"] * 3 + ["KIND_LIST"]
+    assert list(entity_df.redact) == [True, True, True, False]
+    assert entity_df.redact.dtype == bool
+
+    assert list(excl_df.columns) == EXCLUDED_PHRASES_COLUMNS
+    assert list(excl_df.excluded_phrase) == ["medium"]
+    assert list(excl_df.display_name) == ["size"]
+
+def test_entity_type_proto_to_dataframe_without_synonyms(
+    mock_entity_types_list):
+    obj = mock_entity_types_list[1]
+    obj.entities.append(types.EntityType.Entity(value="blue"))
+
+    df = EntityTypes.entity_type_proto_to_dataframe(obj)
+
+    assert list(df.entity_value) == ["red"]
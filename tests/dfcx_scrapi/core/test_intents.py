@@ -0,0 +1,136 @@
+"""Test Class for core Intent Methods in SCRAPI."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from google.cloud.dialogflowcx_v3beta1 import types
+
+from dfcx_scrapi.core.intents import ADVANCED_MODE_COLUMNS, Intents
+
+
+@pytest.fixture
+def test_config():
+    project_id = "my-project-id-1234"
+    agent_id = f"projects/{project_id}/locations/global/agents/my-agent-1234"
+
+    return {
+        "project_id": project_id,
+        "agent_id": agent_id,
+    }
+
+@pytest.fixture
+def mock_intents_list(test_config):
+    part = types.Intent.TrainingPhrase.Part
+
+    intent1 = types.Intent(
+        name=f"{test_config['agent_id']}/intents/1",
+        display_name="travel",
+        labels={"head": "head", "topic": "trips"},
+        parameters=[
+            types.Intent.Parameter(
+                id="city", entity_type="@sys.geo-city", is_list=True)
+        ],
+        training_phrases=[
+            types.Intent.TrainingPhrase(
+                id="tp1",
+                repeat_count=1,
+                parts=[
+                    part(text="fly to "),
+                    part(text="paris", parameter_id="city"),
+                    part(text=" today"),
+                ],
+            ),
+            types.Intent.TrainingPhrase(
+                id="tp2", repeat_count=2, parts=[part(text="book a trip")]),
+        ],
+    )
+    intent2 = types.Intent(
+        name=f"{test_config['agent_id']}/intents/2",
+        display_name="no_phrases",
+    )
+
+    return [intent1, intent2]
+
+@pytest.fixture(autouse=True)
+def mock_creds(test_config: Dict[str, str]):
+    """Setup fixture for Intents Class to be used with all tests."""
+    with patch("dfcx_scrapi.core.scrapi_base.default") as mock_default, \
+        patch("dfcx_scrapi.core.scrapi_base.Request") as mock_request:
+        mock_creds = MagicMock()
+        mock_default.return_value = (mock_creds, test_config["project_id"])
+        mock_request.return_value = MagicMock()
+
+        yield mock_creds
+
+@patch("dfcx_scrapi.core.intents.Intents.list_intents")
+def test_bulk_intent_to_df_basic(
+    mock_list_intents, mock_intents_list, test_config):
+    mock_list_intents.return_value = mock_intents_list
+
+    df = Intents().bulk_intent_to_df(test_config["agent_id"])
+
+    assert list(df.columns) == ["display_name", "training_phrase"]
+    assert list(df.display_name) == ["travel", "travel", "no_phrases"]
+    assert list(df.training_phrase[:2]) == ["fly to paris today", "book a trip"]
+    assert pd.isna(df.training_phrase[2])
+
+@patch("dfcx_scrapi.core.intents.Intents.list_intents")
+def test_bulk_intent_to_df_advanced_matches_per_intent(
+    mock_list_intents, mock_intents_list, test_config):
+    mock_list_intents.return_value = mock_intents_list
+    intents = Intents()
+
+    df = intents.bulk_intent_to_df(test_config["agent_id"], mode="advanced")
+    per_intent = pd.concat(
+        [
+            intents.intent_proto_to_dataframe(obj, mode="advanced")
+            for obj in mock_intents_list
+        ],
+        ignore_index=True,
+    )
+
+    pd.testing.assert_frame_equal(df, per_intent)
+    assert list(df.columns) == ADVANCED_MODE_COLUMNS
+    assert list(df.text[:4]) == ["fly to ", "paris", " today", "book a trip"]
+    assert list(df.parameter_id[:3].fillna("")) == ["", "city", ""]
+    # Protobuf map iteration order is not guaranteed.
+    assert sorted(df.labels[0].split(",")) == ["head", "topic:trips"]
+    assert list(df.training_phrase_idx[:4]) == [0, 0, 0, 1]
+
+@patch("dfcx_scrapi.core.intents.Intents.list_intents")
+def test_bulk_intent_to_df_subset(
+    mock_list_intents, mock_intents_list, test_config):
+    mock_list_intents.return_value = mock_intents_list
+
+    df = Intents().bulk_intent_to_df(
+        test_config["agent_id"], mode="advanced", intent_subset=["missing"])
+
+    assert df.empty
+    assert list(df.columns) == ADVANCED_MODE_COLUMNS
+
+def test_intent_proto_to_dataframe_raw(mock_intents_list):
+    intents = Intents()
+
+    for obj in mock_intents_list:
+        for mode in ["basic", "advanced"]:
+            pd.testing.assert_frame_equal(
+                intents.intent_proto_to_dataframe(
+                    intents.raw_proto(obj), mode=mode),
+                intents.intent_proto_to_dataframe(obj, mode=mode),
+            )
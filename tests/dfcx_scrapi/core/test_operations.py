@@ -0,0 +1,123 @@
+"""Test Class for core Operations Methods in SCRAPI."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Dict
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.api_core import exceptions
+from google.longrunning import operations_pb2
+from google.rpc import status_pb2
+
+from dfcx_scrapi.core.operations import Operations
+
+
+@pytest.fixture
+def test_config():
+    project_id = "my-project-id-1234"
+    parent = f"projects/{project_id}/locations/us-central1"
+
+    return {
+        "project_id": project_id,
+        "lro_1": f"{parent}/operations/1111",
+        "lro_2": f"{parent}/operations/2222",
+    }
+
+@pytest.fixture(autouse=True)
+def mock_creds(test_config: Dict[str, str]):
+    """Setup fixture for Operations Class to be used with all tests."""
+    with patch("dfcx_scrapi.core.scrapi_base.default") as mock_default, \
+        patch("dfcx_scrapi.core.scrapi_base.Request") as mock_request:
+        mock_creds = MagicMock()
+        mock_default.return_value = (mock_creds, test_config["project_id"])
+        mock_request.return_value = MagicMock()
+
+        yield mock_creds
+
+def build_operations(responses: Dict[str, list]):
+    """Build Operations with a client that returns `responses` in turn."""
+    def get_operation(request):
+        res = responses[request["name"]].pop(0)
+        if isinstance(res, Exception):
+            raise res
+        return res
+
+    ops = Operations(initial_delay=0.001, max_delay=0.01)
+    client = MagicMock()
+    client.get_operation.side_effect = get_operation
+    ops._get_operations_client = MagicMock(return_value=client)
+
+    return ops, client
+
+def test_get_lro_uses_regional_endpoint(test_config):
+    ops = Operations()
+    with patch.object(ops, "_get_client") as mock_get_client:
+        ops.get_lro(test_config["lro_1"])
+
+    assert mock_get_client.call_args.args[1]["api_endpoint"] == (
+        "us-central1-dialogflow.googleapis.com:443")
+    mock_get_client.return_value.get_operation.assert_called_once_with(
+        request={"name": test_config["lro_1"]})
+
+def test_await_lros_polls_until_done(test_config):
+    lro_1, lro_2 = test_config["lro_1"], test_config["lro_2"]
+    ops, client = build_operations({
+        lro_1: [
+            operations_pb2.Operation(name=lro_1),
+            operations_pb2.Operation(name=lro_1, done=True),
+        ],
+        lro_2: [
+            operations_pb2.Operation(name=lro_2),
+            exceptions.ServiceUnavailable("try again"),
+            operations_pb2.Operation(name=lro_2, done=True),
+        ],
+    })
+
+    res = ops.await_lros([lro_1, operations_pb2.Operation(name=lro_2)])
+
+    assert list(res) == [lro_1, lro_2]
+    assert all(operation.done for operation in res.values())
+    assert client.get_operation.call_count == 5
+
+def test_await_lro_raises_operation_error(test_config):
+    lro = test_config["lro_1"]
+    ops, _ = build_operations({lro: [
+        operations_pb2.Operation(
+            name=lro,
+            done=True,
+            error=status_pb2.Status(code=7, message="denied")),
+    ]})
+
+    with pytest.raises(exceptions.PermissionDenied):
+        ops.await_lro(lro)
+
+def test_await_lro_times_out(test_config):
+    lro = test_config["lro_1"]
+    ops, _ = build_operations({
+        lro: [operations_pb2.Operation(name=lro)] * 1000})
+
+    with pytest.raises(TimeoutError):
+        ops.await_lro(lro, timeout=0.05)
+
+def test_await_lro_async(test_config):
+    lro = test_config["lro_1"]
+    ops, _ = build_operations({
+        lro: [operations_pb2.Operation(name=lro, done=True)]})
+
+    res = asyncio.run(ops.await_lro_async(lro))
+
+    assert res.done
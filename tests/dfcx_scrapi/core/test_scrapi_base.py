@@ -14,6 +14,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -27,9 +30,15 @@ from google.oauth2.service_account import (
 from google.protobuf import field_mask_pb2, struct_pb2
 
 from dfcx_scrapi.core.scrapi_base import (
+    QUOTA_FAMILY_DEFAULTS,
+    QuotaManager,
+    ResourceMapCache,
     ScrapiBase,
+    TokenBucket,
     api_call_counter_decorator,
+    cached_resource_map,
     handle_api_error,
+    invalidates_resource_map,
     retry_api_call,
     should_retry,
 )
@@ -233,6 +242,16 @@ def test_pbuf_to_dict():
     assert result["field1"] == "value1"
     assert result["field2"] == 123
 
+def test_raw_proto_and_cx_object_to_dict():
+    """Test raw_proto unwraps proto-plus objects and converters accept it."""
+    page = types.Page(display_name="Start", description="first page")
+    raw_page = ScrapiBase.raw_proto(page)
+
+    assert isinstance(raw_page, types.Page.pb())
+    assert ScrapiBase.raw_proto(raw_page) is raw_page
+    assert ScrapiBase.cx_object_to_dict(page) == ScrapiBase.cx_object_to_dict(
+        raw_page) == {"displayName": "Start", "description": "first page"}
+
 def test_dict_to_struct():
     """Test dict_to_struct."""
     input_dict = {"field1": "value1", "field2": 123}
@@ -511,3 +530,272 @@ def test_get_generation_config_invalid_parameters():
     assert not hasattr(gen_config, "invalid_parameter")
 
 
+
+def test_get_client_reuses_cached_client(mocked_scrapi_base, test_config):
+    """Test that _get_client builds a client once per endpoint and creds."""
+    ScrapiBase.close_clients()
+    mock_client_class = MagicMock()
+    global_options = ScrapiBase._set_region(test_config["global_agent_id"])
+    regional_options = ScrapiBase._set_region(
+        test_config["non_global_agent_id"])
+
+    client_a = mocked_scrapi_base._get_client(mock_client_class, global_options)
+    client_b = mocked_scrapi_base._get_client(mock_client_class, global_options)
+    mocked_scrapi_base._get_client(mock_client_class, regional_options)
+
+    assert client_a is client_b
+    assert mock_client_class.call_count == 2
+    mock_client_class.assert_any_call(
+        credentials=mocked_scrapi_base.creds, client_options=global_options)
+
+    ScrapiBase.close_clients()
+
+def test_close_clients(mocked_scrapi_base, test_config):
+    """Test that close_clients closes transports and empties the pool."""
+    ScrapiBase.close_clients()
+    mock_client_class = MagicMock()
+    client_options = ScrapiBase._set_region(test_config["global_agent_id"])
+
+    client = mocked_scrapi_base._get_client(mock_client_class, client_options)
+    ScrapiBase.close_clients()
+
+    client.transport.close.assert_called_once()
+    assert not ScrapiBase._client_pool
+
+    mocked_scrapi_base._get_client(mock_client_class, client_options)
+    assert mock_client_class.call_count == 2
+
+    ScrapiBase.close_clients()
+
+def test_get_client_shared_across_equivalent_creds(test_config):
+    """Test that separately built creds for one account share a client."""
+    ScrapiBase.close_clients()
+    mock_client_class = MagicMock()
+    client_options = ScrapiBase._set_region(test_config["global_agent_id"])
+
+    creds_a = test_config["creds_object"]
+    creds_b = ServiceAccountCredentials(
+        signer=MagicMock(),
+        token_uri="https://oauth2.googleapis.com/token",
+        service_account_email=creds_a.service_account_email,
+        scopes=[],
+    )
+    creds_b.refresh = MagicMock()
+
+    base_a = ScrapiBase(creds=creds_a)
+    base_b = ScrapiBase(creds=creds_b)
+
+    assert base_a._get_client(mock_client_class, client_options) is (
+        base_b._get_client(mock_client_class, client_options))
+    assert mock_client_class.call_count == 1
+
+    ScrapiBase.close_clients()
+
+def test_get_client_evicted_after_last_owner(test_config):
+    """Test that pooled clients are closed once their owners are collected."""
+    ScrapiBase.close_clients()
+    mock_client_class = MagicMock()
+    client_options = ScrapiBase._set_region(test_config["global_agent_id"])
+
+    base_a = ScrapiBase(creds=test_config["creds_object"])
+    base_b = ScrapiBase(creds=test_config["creds_object"])
+    client = base_a._get_client(mock_client_class, client_options)
+    base_a._get_client(mock_client_class, client_options)
+    base_b._get_client(mock_client_class, client_options)
+
+    del base_a
+    gc.collect()
+    client.transport.close.assert_not_called()
+    assert len(ScrapiBase._client_pool) == 1
+
+    del base_b
+    gc.collect()
+    client.transport.close.assert_called_once()
+    assert not ScrapiBase._client_pool
+    assert not ScrapiBase._client_pool_refs
+
+def test_token_bucket_aimd():
+    """Test that the TokenBucket rate adapts additively and multiplicatively."""
+    bucket = TokenBucket(rate=2.0, max_rate=2.5, rate_increase=0.2)
+
+    bucket.record_success()
+    assert bucket.rate == pytest.approx(2.2)
+    bucket.record_success()
+    bucket.record_success()
+    assert bucket.rate == pytest.approx(2.5)
+
+    bucket.record_throttle()
+    assert bucket.rate == pytest.approx(1.25)
+
+@patch("time.sleep")
+def test_quota_manager_retries_too_many_requests(mock_sleep):
+    """Test that QuotaManager.call backs off and retries on TooManyRequests."""
+    manager = QuotaManager(max_retries=2)
+    key = ("my-project", "write", "global")
+    bucket = manager.configure(key, rate=1000.0, burst=10, max_rate=1000.0)
+    func = MagicMock(side_effect=[exceptions.TooManyRequests("quota"), "ok"])
+
+    assert manager.call(key, func, "arg") == "ok"
+    assert func.call_count == 2
+    assert bucket.rate == pytest.approx(500.1)
+
+    func = MagicMock(side_effect=exceptions.TooManyRequests("quota"))
+    with pytest.raises(exceptions.TooManyRequests):
+        manager.call(key, func)
+    assert func.call_count == 3
+
+def test_call_rate_limit_is_scoped_to_the_call(
+    mocked_scrapi_base, test_config, monkeypatch):
+    """Test that a per-call rate limit leaves the shared bucket unchanged."""
+    monkeypatch.setattr(ScrapiBase, "quota_manager", QuotaManager())
+    agent_id = test_config["global_agent_id"]
+    key = ScrapiBase._get_quota_key(agent_id, "write")
+    shared = ScrapiBase.quota_manager.get_bucket(key)
+    func = MagicMock(return_value="ok")
+
+    with mocked_scrapi_base.call_rate_limit(
+        agent_id, "write", seconds_between_calls=2) as limiter:
+        with patch.object(limiter, "acquire") as mock_acquire:
+            assert mocked_scrapi_base._call_with_quota(
+                agent_id, "write", func) == "ok"
+            mock_acquire.assert_called_once()
+        assert limiter.rate == pytest.approx(0.5)
+
+    assert ScrapiBase.quota_manager.get_bucket(key) is shared
+    assert shared.max_rate == QUOTA_FAMILY_DEFAULTS["write"]["max_rate"]
+    assert not mocked_scrapi_base._call_rate_limits
+
+    with mocked_scrapi_base.call_rate_limit(agent_id, "write") as limiter:
+        assert limiter is None
+
+def test_get_quota_key(test_config):
+    """Test that quota keys are built from project, family and region."""
+    key = ScrapiBase._get_quota_key(test_config["non_global_agent_id"], "read")
+
+    assert key == (test_config["project_id"], "read", "us-central1")
+
+    with pytest.raises(ValueError):
+        ScrapiBase._get_quota_key("projects/only", "read")
+
+def test_fan_out_returns_results_keyed_by_parent(
+    mocked_scrapi_base, test_config, monkeypatch):
+    """Test that fan out runs concurrently and preserves parent order."""
+    flow_ids = [f"{test_config['global_agent_id']}/flows/{i}" for i in range(6)]
+    in_flight = []
+    max_in_flight = []
+    lock = threading.Lock()
+
+    def list_children(parent_id, suffix):
+        with lock:
+            in_flight.append(parent_id)
+            max_in_flight.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(parent_id)
+        return parent_id + suffix
+
+    monkeypatch.setattr(ScrapiBase, "quota_manager", QuotaManager())
+    mocked_scrapi_base.set_quota_rate(flow_ids[0], "read", rate=1000, burst=10)
+    res = mocked_scrapi_base._fan_out(
+        flow_ids + flow_ids[:1], list_children, max_workers=3, suffix="/x")
+
+    assert list(res) == flow_ids
+    assert res[flow_ids[2]] == flow_ids[2] + "/x"
+    assert 1 < max(max_in_flight) <= 3
+    assert mocked_scrapi_base._fan_out([], list_children) == {}
+
+class MockMapResource(ScrapiBase):
+    """Minimal ScrapiBase subclass used to exercise the resource map cache."""
+    def __init__(self, agent_id):  # pylint: disable=W0231
+        self.agent_id = agent_id
+        self.list_calls = 0
+
+    @cached_resource_map("intents")
+    def get_intents_map(self, agent_id: str = None, reverse: bool = False):
+        self.list_calls += 1
+        return {"display_name": agent_id} if reverse else {agent_id: "name"}
+
+    @invalidates_resource_map("intents")
+    def create_intent(self, agent_id: str = None):
+        pass
+
+    @invalidates_resource_map("flows")
+    def create_flow(self, agent_id: str = None):
+        pass
+
+@pytest.fixture
+def map_cache(monkeypatch):
+    cache = ResourceMapCache(ttl=300)
+    monkeypatch.setattr(ScrapiBase, "resource_map_cache", cache)
+    return cache
+
+def test_cached_resource_map_hits_and_invalidation(map_cache, test_config):
+    """Test that maps are cached per agent and dropped on invalidation."""
+    resource = MockMapResource(test_config["global_agent_id"])
+
+    assert resource.get_intents_map() == resource.get_intents_map(
+        test_config["global_agent_id"])
+    resource.get_intents_map(reverse=True)
+    assert resource.list_calls == 2
+    assert map_cache.stats() == {"hits": 1, "misses": 2, "entries": 2}
+
+    resource.create_flow()
+    resource.get_intents_map()
+    assert resource.list_calls == 2
+
+    resource.create_intent(test_config["non_global_agent_id"])
+    resource.get_intents_map()
+    assert resource.list_calls == 2
+
+    resource.create_intent()
+    resource.get_intents_map()
+    assert resource.list_calls == 3
+
+def test_resource_map_cache_is_opt_in(test_config, monkeypatch):
+    """Test that maps are only cached after the cache is enabled."""
+    monkeypatch.setattr(ScrapiBase, "resource_map_cache", ResourceMapCache())
+    resource = MockMapResource(test_config["global_agent_id"])
+
+    resource.get_intents_map()
+    resource.get_intents_map()
+    assert resource.list_calls == 2
+
+    cache = ScrapiBase.set_resource_map_cache(ttl=300)
+    assert ScrapiBase.resource_map_cache is cache
+    resource.get_intents_map()
+    resource.get_intents_map()
+    assert resource.list_calls == 3
+
+def test_cached_resource_map_keyed_by_creds(map_cache, test_config):
+    """Test that callers with different credentials do not share maps."""
+    resource_a = MockMapResource(test_config["global_agent_id"])
+    resource_a.creds = test_config["creds_object"]
+    resource_b = MockMapResource(test_config["global_agent_id"])
+    resource_b.creds = test_config["adc_creds_object"]
+
+    resource_a.get_intents_map()
+    resource_b.get_intents_map()
+    resource_b.get_intents_map()
+
+    assert resource_a.list_calls == 1
+    assert resource_b.list_calls == 1
+    assert map_cache.stats() == {"hits": 1, "misses": 2, "entries": 2}
+
+def test_cached_resource_map_ttl_and_persistence(test_config, tmp_path):
+    """Test that expired entries are refetched and entries persist to disk."""
+    cache_path = str(tmp_path / "maps.json")
+    cache = ResourceMapCache(ttl=300, cache_path=cache_path)
+    cache.set("key", {"a": "b"}, ["intents"], test_config["global_flow_id"])
+
+    reloaded = ResourceMapCache(ttl=300, cache_path=cache_path)
+    assert reloaded.get("key") == {"a": "b"}
+
+    reloaded.invalidate(["intents"], test_config["global_agent_id"])
+    assert reloaded.get("key") is None
+
+    with patch("dfcx_scrapi.core.scrapi_base.time.time") as mock_time:
+        mock_time.return_value = 0
+        cache.set(
+            "key", {"a": "b"}, ["intents"], test_config["global_agent_id"])
+        mock_time.return_value = 301
+        assert cache.get("key") is None
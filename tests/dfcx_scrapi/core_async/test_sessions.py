@@ -0,0 +1,110 @@
+"""Unit Tests for Async Sessions."""
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.cloud.dialogflowcx_v3beta1 import types
+
+from dfcx_scrapi.core_async.sessions import SessionsAsync
+
+
+@pytest.fixture
+def test_config():
+    project_id = "my-project-id-1234"
+    agent_id = f"projects/{project_id}/locations/global/agents/fcdecc6a-3f2e-4f8d-abca-63426024d8bb"
+    session_id = f"{agent_id}/sessions/a1b2c3d4-e5f6-7890-1234-567890abcdef"
+
+    return {
+        "project_id": project_id,
+        "agent_id": agent_id,
+        "session_id": session_id,
+    }
+
+@pytest.fixture
+def mock_sessions_client(test_config):
+    """Fixture to create a mocked SessionsAsyncClient."""
+    with patch("dfcx_scrapi.core.scrapi_base.default") as mock_default, \
+        patch("dfcx_scrapi.core.scrapi_base.Request") as mock_request, \
+        patch("dfcx_scrapi.core_async.sessions.services.sessions.SessionsAsyncClient") as mock_client:
+
+        mock_creds = MagicMock()
+        mock_default.return_value = (mock_creds, test_config["project_id"])
+        mock_request.return_value = MagicMock()
+
+        yield mock_client
+
+def build_detect_intent(max_seen: list):
+    """Build an async detect_intent mock that tracks concurrent calls."""
+    in_flight = 0
+
+    async def detect_intent(request):
+        nonlocal in_flight
+        in_flight += 1
+        max_seen.append(in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return types.DetectIntentResponse(
+            query_result=types.QueryResult(text=request.query_input.text.text)
+        )
+
+    return detect_intent
+
+def test_detect_intent(mock_sessions_client, test_config):
+    mock_sessions_client.return_value.detect_intent = build_detect_intent([])
+    sessions = SessionsAsync(agent_id=test_config["agent_id"])
+
+    res = asyncio.run(sessions.detect_intent(
+        test_config["agent_id"], test_config["session_id"], "Hello!"))
+
+    assert isinstance(res, types.QueryResult)
+    assert res.text == "Hello!"
+
+def test_detect_intent_invalid_session(mock_sessions_client, test_config):
+    sessions = SessionsAsync(agent_id=test_config["agent_id"])
+
+    with pytest.raises(ValueError):
+        asyncio.run(sessions.detect_intent(
+            test_config["agent_id"], "invalid_session", "Hello!"))
+
+def test_bulk_detect_intent_bounded(mock_sessions_client, test_config):
+    max_seen = []
+    mock_sessions_client.return_value.detect_intent = build_detect_intent(
+        max_seen)
+    sessions = SessionsAsync(
+        agent_id=test_config["agent_id"], max_concurrency=3)
+    utterances = [f"utterance {i}" for i in range(10)]
+
+    res = asyncio.run(sessions.bulk_detect_intent(utterances))
+
+    assert [r.text for r in res] == utterances
+    assert max(max_seen) == 3
+    mock_sessions_client.assert_called_once()
+
+def test_run_conversation_single_session(mock_sessions_client, test_config):
+    sessions_seen = []
+
+    async def detect_intent(request):
+        sessions_seen.append(request.session)
+        return types.DetectIntentResponse()
+
+    mock_sessions_client.return_value.detect_intent = detect_intent
+    sessions = SessionsAsync(agent_id=test_config["agent_id"])
+
+    res = asyncio.run(sessions.run_conversation(["hi", "bye"]))
+
+    assert len(res) == 2
+    assert len(set(sessions_seen)) == 1
@@ -18,9 +18,13 @@
 
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
+from google.api_core import exceptions
+from google.cloud.dialogflowcx_v3beta1 import types
 from google.oauth2.service_account import Credentials
 
+from dfcx_scrapi.core.scrapi_base import QuotaManager, ScrapiBase
 from dfcx_scrapi.tools.dataframe_functions import DataframeFunctions
 
 
@@ -54,6 +58,7 @@ def test_config():
 
     return {
         "project_id": project_id,
+        "agent_id": f"projects/{project_id}/locations/global/agents/1234",
         "creds_path": creds_path,
         "creds_dict": creds_dict,
         "creds_object": creds_object,
@@ -155,3 +160,97 @@ def test_dffx_init_creds_object(mock_dffx_setup, test_config):
     dffx = DataframeFunctions(creds=test_config["creds_object"])
 
     assert dffx.creds == test_config["creds_object"]
+
+
+def test_bulk_update_intents_dry_run_report(mock_dffx_setup, test_config):
+    agent_id = test_config["agent_id"]
+    dffx = DataframeFunctions(creds=test_config["creds_object"])
+    dffx.progress_bar = MagicMock()
+    dffx.intents.get_intents_map = MagicMock(
+        return_value={"greeting": f"{agent_id}/intents/1"})
+    dffx.intents.get_intent = MagicMock(return_value=types.Intent(
+        name=f"{agent_id}/intents/1",
+        display_name="greeting",
+        training_phrases=[
+            {"parts": [{"text": "hi"}]}, {"parts": [{"text": "hey"}]}
+        ],
+    ))
+    dffx.intents.update_intent = MagicMock()
+    tp_df = pd.DataFrame({
+        "display_name": ["greeting", "greeting", "missing"],
+        "text": ["hi", "hello", "bye"],
+    })
+
+    new_intents, report = dffx.bulk_update_intents_from_dataframe(
+        agent_id, tp_df, update_flag=True, dry_run=True, return_report=True)
+
+    dffx.intents.update_intent.assert_not_called()
+    assert list(new_intents) == ["greeting"]
+    assert list(report.status) == ["dry_run", "not_found"]
+    assert report.training_phrases_added[0] == ["hello"]
+    assert report.training_phrases_removed[0] == ["hey"]
+
+def test_bulk_create_intents_reports_failures(mock_dffx_setup, test_config):
+    agent_id = test_config["agent_id"]
+    dffx = DataframeFunctions(creds=test_config["creds_object"])
+    dffx.progress_bar = MagicMock()
+
+    def create_intent(agent_id, obj, language_code):
+        if obj.display_name == "bad":
+            raise exceptions.BadRequest("invalid intent")
+        return types.Intent(name=f"{agent_id}/intents/1")
+
+    dffx.intents.create_intent = MagicMock(side_effect=create_intent)
+    tp_df = pd.DataFrame({
+        "display_name": ["good", "bad", "good"],
+        "text": ["one", "two", "three"],
+    })
+
+    new_intents, report = dffx.bulk_create_intent_from_dataframe(
+        agent_id, tp_df, update_flag=True, return_report=True)
+
+    assert dffx.intents.create_intent.call_count == 2
+    assert [
+        part.text
+        for phrase in new_intents["good"].training_phrases
+        for part in phrase.parts
+    ] == ["one", "three"]
+    assert "bad" not in new_intents
+    assert list(report.status) == ["created", "failed"]
+    assert report.intent_id[0] == f"{agent_id}/intents/1"
+    assert "invalid intent" in report.error[1]
+
+    with pytest.raises(RuntimeError, match="bad: .*invalid intent"):
+        dffx.bulk_create_intent_from_dataframe(
+            agent_id, tp_df, update_flag=True)
+
+def test_bulk_update_intents_raises_on_failed_writes(
+    mock_dffx_setup, test_config, monkeypatch):
+    agent_id = test_config["agent_id"]
+    monkeypatch.setattr(ScrapiBase, "quota_manager", QuotaManager())
+    dffx = DataframeFunctions(creds=test_config["creds_object"])
+    dffx.set_quota_rate(agent_id, "write", rate=1000, burst=10)
+    dffx.progress_bar = MagicMock()
+    dffx.intents.get_intents_map = MagicMock(return_value={
+        "good": f"{agent_id}/intents/1", "bad": f"{agent_id}/intents/2"})
+    dffx.intents.get_intent = MagicMock(
+        side_effect=lambda intent_id, language_code: types.Intent(
+            name=intent_id))
+
+    def update_intent(intent_id, obj, language_code):
+        if intent_id.endswith("/2"):
+            raise exceptions.BadRequest("invalid intent")
+        return obj
+
+    dffx.intents.update_intent = MagicMock(side_effect=update_intent)
+    tp_df = pd.DataFrame({"display_name": ["good", "bad"], "text": ["a", "b"]})
+
+    new_intents, report = dffx.bulk_update_intents_from_dataframe(
+        agent_id, tp_df, update_flag=True, return_report=True)
+
+    assert list(new_intents) == ["good"]
+    assert list(report.status) == ["updated", "failed"]
+
+    with pytest.raises(RuntimeError, match="Failed to update 1 intent"):
+        dffx.bulk_update_intents_from_dataframe(
+            agent_id, tp_df, update_flag=True)
@@ -0,0 +1,94 @@
+"""Test Class for Data Store Scraper Methods in SCRAPI."""
+
+# pylint: disable=redefined-outer-name
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import os
+import threading
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from google.cloud.dialogflowcx_v3beta1 import types
+
+from dfcx_scrapi.core.scrapi_base import QuotaManager, ScrapiBase
+from dfcx_scrapi.tools.datastore_scraper import DataStoreScraper
+
+AGENT_ID = "projects/my-project-id-1234/locations/global/agents/my-agent-1234"
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    """DataStoreScraper with mocked Sessions and Agents clients."""
+    monkeypatch.setattr(ScrapiBase, "quota_manager", QuotaManager())
+    scraper = DataStoreScraper.__new__(DataStoreScraper)
+    scraper.agent_id = AGENT_ID
+    scraper.language_code = "en"
+    scraper.agents = MagicMock()
+    scraper.agents.get_agent.return_value.display_name = "my-agent"
+    session_counter = itertools.count()
+    scraper.sessions = MagicMock()
+    scraper.sessions.build_session_id.side_effect = (
+        lambda agent_id: f"{agent_id}/sessions/{next(session_counter)}")
+
+    return scraper
+
+@pytest.fixture
+def queryset():
+    return pd.DataFrame({
+        "conversation_id": [2, 1, 1, 3, 2],
+        "turn_index": [1, 2, 1, 1, 2],
+        "query": ["2-1", "1-2", "1-1", "3-1", "2-2"],
+        "expected_answer": [""] * 5,
+        "expected_uri": [""] * 5,
+        "user_metadata": [""] * 5,
+        "parameters": [""] * 5,
+    })
+
+def test_run_preserves_turn_order_and_resumes(scraper, queryset, tmpdir):
+    lock = threading.Lock()
+    session_turns = {}
+
+    def detect_intent(agent_id, session_id, text, **kwargs):
+        if text == "3-1" and "fail" not in session_turns:
+            session_turns["fail"] = True
+            raise ValueError("interrupted")
+        with lock:
+            session_turns.setdefault(session_id, []).append(text)
+
+        return types.QueryResult(response_messages=[
+            types.ResponseMessage(
+                text=types.ResponseMessage.Text(text=[f"answer {text}"]))])
+
+    scraper.sessions.detect_intent.side_effect = detect_intent
+    checkpoint_file = os.path.join(tmpdir, "checkpoint.jsonl")
+
+    with pytest.raises(ValueError):
+        scraper.run(
+            queryset, max_workers=3, checkpoint_file=checkpoint_file)
+
+    assert sorted(
+        turns for key, turns in session_turns.items() if key != "fail") == [
+            ["1-1", "1-2"], ["2-1", "2-2"]]
+
+    session_turns.clear()
+    session_turns["fail"] = True
+    res = scraper.run(queryset, max_workers=3, checkpoint_file=checkpoint_file)
+
+    assert list(session_turns.values())[1:] == [["3-1"]]
+    assert [r.answer_text for r in res.query_result] == [
+        "answer 1-1", "answer 1-2", "answer 2-1", "answer 2-2", "answer 3-1"]
@@ -0,0 +1,107 @@
+"""Test Class for Evaluations Methods in SCRAPI."""
+
+# pylint: disable=redefined-outer-name
+# pylint: disable=protected-access
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+from google.cloud.dialogflowcx_v3beta1 import types
+
+from dfcx_scrapi.core.scrapi_base import QuotaManager, ScrapiBase
+from dfcx_scrapi.tools.agent_response import AgentResponse
+from dfcx_scrapi.tools.evaluations import Evaluations
+
+AGENT_ID = "projects/my-project-id-1234/locations/global/agents/my-agent-1234"
+
+
+@pytest.fixture
+def evals(monkeypatch):
+    """Evaluations instance with a mocked Sessions client."""
+    monkeypatch.setattr(ScrapiBase, "quota_manager", QuotaManager())
+    evals = Evaluations.__new__(Evaluations)
+    evals.agent_id = AGENT_ID
+    evals.session_id = None
+    evals.ar = AgentResponse()
+    evals.user_input_metrics = []
+    evals.unexpected_rows = []
+    evals.sessions_client = MagicMock()
+    evals.sessions_client.build_session_id.side_effect = (
+        f"{AGENT_ID}/sessions/{i}" for i in range(100))
+    evals.sessions_client.collect_playbook_responses.return_value = []
+    evals.sessions_client.collect_flow_responses.return_value = []
+
+    return evals
+
+@pytest.fixture
+def eval_df():
+    rows = []
+    for convo in range(4):
+        for turn in range(2):
+            idx = len(rows)
+            rows.extend([
+                {"action_id": turn * 2 + 1, "action_type": "User Utterance",
+                 "action_input": f"convo {convo} turn {turn}",
+                 "utterance_pair": str(idx + 1)},
+                {"action_id": turn * 2 + 2, "action_type": "Agent Response",
+                 "action_input": "", "utterance_pair": ""},
+            ])
+
+    df = pd.DataFrame(rows)
+    df["agent_response"] = pd.Series(dtype="str")
+    df["agent_id"] = pd.Series(dtype="str")
+    df["session_id"] = pd.Series(dtype="str")
+
+    return df
+
+def test_group_conversations(evals, eval_df):
+    assert evals._group_conversations(eval_df) == [
+        [0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 10, 11], [12, 13, 14, 15]]
+
+def test_run_detect_intent_queries_concurrent(evals, eval_df):
+    in_flight = []
+    max_in_flight = []
+    lock = threading.Lock()
+    session_turns = {}
+
+    def detect_intent(agent_id, session_id, text, **kwargs):
+        with lock:
+            in_flight.append(session_id)
+            max_in_flight.append(len(in_flight))
+            session_turns.setdefault(session_id, []).append(text)
+        time.sleep(0.02)
+        with lock:
+            in_flight.remove(session_id)
+
+        return types.QueryResult(response_messages=[
+            types.ResponseMessage(
+                text=types.ResponseMessage.Text(text=[f"reply to {text}"]))])
+
+    evals.sessions_client.detect_intent.side_effect = detect_intent
+    res = evals.run_detect_intent_queries(eval_df, max_workers=4)
+
+    assert max(max_in_flight) > 1
+    assert sorted(session_turns.values()) == [
+        [f"convo {c} turn 0", f"convo {c} turn 1"] for c in range(4)]
+    assert res.loc[1, "agent_response"] == "reply to convo 0 turn 0"
+    assert res.loc[15, "agent_response"] == "reply to convo 3 turn 1"
+    assert res.loc[0, "session_id"] == res.loc[2, "session_id"]
+    assert res.loc[0, "session_id"] != res.loc[4, "session_id"]
+    assert res.loc[4, "agent_id"] == AGENT_ID
@@ -0,0 +1,119 @@
+"""Test Class for Levenshtein Methods in SCRAPI."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+from unittest.mock import patch
+
+import pandas as pd
+
+from dfcx_scrapi.agent_extract.types import AgentData
+from dfcx_scrapi.tools.levenshtein import Levenshtein
+
+
+def reference_ratio(s: str, t: str) -> float:
+    """Cell-by-cell levenshtein ratio with a substitution cost of 2."""
+    previous = list(range(len(t) + 1))
+    for i, s_char in enumerate(s, start=1):
+        current = [i]
+        for k, t_char in enumerate(t, start=1):
+            cost = 0 if s_char == t_char else 2
+            current.append(min(
+                previous[k] + 1, current[k - 1] + 1, previous[k - 1] + cost))
+        previous = current
+
+    return (len(s) + len(t) - previous[-1]) / (len(s) + len(t))
+
+def test_levenshtein_ratio_matches_reference():
+    rng = random.Random(42)
+    for _ in range(200):
+        s = "".join(rng.choices("abcd ", k=rng.randint(1, 80)))
+        t = "".join(rng.choices("abcd ", k=rng.randint(1, 80)))
+        assert Levenshtein.levenshtein_ratio(s, t) == reference_ratio(s, t)
+
+    assert Levenshtein.levenshtein_ratio("", "") == 1.0
+    assert Levenshtein.levenshtein_ratio("abc", "") == 0.0
+
+@patch("dfcx_scrapi.tools.levenshtein.Intents")
+def test_calc_tp_distances_prefilters_by_length(mock_intents):
+    del mock_intents
+    key_df = pd.DataFrame({"tp": ["book a flight", "cancel my order"]})
+    comparator_df = pd.DataFrame(
+        {"tp": ["book flight", "cancel order", "hi", "book a flight please"]})
+
+    res = Levenshtein.calc_tp_distances(
+        key_df, comparator_df, threshold=0.75, silent=True)
+
+    assert res["distances"] == {
+        "book a flight": {"book flight": 0.917, "book a flight please": 0.788},
+        "cancel my order": {"cancel order": 0.889},
+    }
+    assert res["stats"]["keys"]["num_overlap"] == 2
+    assert res["stats"]["comparators"]["num_overlap"] == 3
+
+def test_calc_all_pairs_distances():
+    intents_df = pd.DataFrame({
+        "display_name": ["book", "book", "flight", "cancel"],
+        "training_phrase": [
+            "book a flight", "book flight", "book a flights", "cancel order"],
+    })
+
+    res = Levenshtein.calc_all_pairs_distances(intents_df, threshold=0.75)
+
+    assert res.to_dict("records") == [
+        {"intent_a": "book", "intent_b": "flight",
+         "phrase_a": "book a flight", "phrase_b": "book a flights",
+         "ratio": 0.963},
+        {"intent_a": "book", "intent_b": "flight",
+         "phrase_a": "book flight", "phrase_b": "book a flights",
+         "ratio": 0.88},
+    ]
+
+    res = Levenshtein.calc_all_pairs_distances(
+        intents_df, threshold=0.75, include_same_intent=True)
+    assert len(res) == 3
+
+def test_calc_agent_overlap_matches_single_process():
+    rng = random.Random(7)
+    words = ["book", "a", "flight", "cancel", "my", "order", "hotel", "room"]
+    intents_df = pd.DataFrame({
+        "display_name": [f"intent_{rng.randint(0, 5)}" for _ in range(120)],
+        "training_phrase": [
+            " ".join(rng.choices(words, k=rng.randint(2, 6)))
+            for _ in range(120)],
+    })
+
+    expected = Levenshtein.calc_all_pairs_distances(intents_df)
+    res = Levenshtein.calc_agent_overlap(intents_df, processes=2)
+
+    pd.testing.assert_frame_equal(
+        res.sort_values(list(res.columns)).reset_index(drop=True),
+        expected.sort_values(list(expected.columns)).reset_index(drop=True))
+
+def test_calc_agent_overlap_from_agent_data():
+    agent_data = AgentData(intents=[
+        {"display_name": "book", "trainingPhrases": [
+            {"parts": [{"text": "book a "}, {"text": "flight"}]}]},
+        {"display_name": "flight", "trainingPhrases": [
+            {"parts": [{"text": "book a flights"}]},
+            {"parts": [{"text": "book a flights"}]}]},
+    ])
+
+    res = Levenshtein.calc_agent_overlap(agent_data, processes=1)
+    matrix = Levenshtein.overlap_matrix(res)
+
+    assert res[["phrase_a", "phrase_b"]].values.tolist() == [
+        ["book a flight", "book a flights"]]
+    assert matrix.loc["book", "flight"] == matrix.loc["flight", "book"] == 1
@@ -0,0 +1,223 @@
+"""Test Class for Metrics Methods in SCRAPI."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dfcx_scrapi.tools import metrics
+from dfcx_scrapi.tools.metrics import (
+    AnswerGroundednessScorer,
+    EmbeddingCache,
+    LLMCacheMissError,
+    LLMResponseCache,
+    Metric,
+    MetricsEngine,
+    Scorer,
+    SemanticSimilarity,
+    StatementExtractor,
+)
+
+
+def mock_embedding_model():
+    """Embedding model returning a deterministic vector per text."""
+    model = MagicMock()
+    model._model_id = "text-embedding-004"
+
+    def get_embeddings(inputs, **kwargs):
+        return [
+            MagicMock(values=[len(i.text), i.text.count("a") + 1.0, 1.0])
+            for i in inputs
+        ]
+
+    model.get_embeddings.side_effect = get_embeddings
+
+    return model
+
+def test_semantic_similarity_run_batches_unique_texts(tmpdir):
+    model = mock_embedding_model()
+    cache_path = os.path.join(tmpdir, "embeddings.db")
+    metric = SemanticSimilarity(
+        model, cache=EmbeddingCache(cache_path=cache_path), batch_size=2)
+    inputs = pd.DataFrame({
+        "action_type": ["Agent Response", "User Utterance", "Agent Response",
+                        "Agent Response", "Agent Response"],
+        "action_input": ["banana", "hi", "banana", "apple", ""],
+        "agent_response": ["bread", None, "banana", "bread", "bread"],
+    }, index=[10, 11, 12, 13, 14])
+
+    res = metric.run(inputs)
+
+    assert model.get_embeddings.call_count == 2
+    assert res.loc[12, "similarity"] == 1.0
+    assert np.isnan(res.loc[11, "similarity"])
+    assert np.isnan(res.loc[14, "similarity"])
+    assert res.loc[10, "similarity"] == metric.compute("banana", "bread")
+
+    reloaded = SemanticSimilarity(
+        model, cache=EmbeddingCache(max_size=1, cache_path=cache_path))
+    pd.testing.assert_frame_equal(reloaded.run(inputs), res)
+    assert model.get_embeddings.call_count == 2
+    assert reloaded.cache.stats() == {"hits": 3, "misses": 0, "hit_rate": 1.0}
+
+def test_llm_response_cache_persists_and_runs_offline(tmpdir):
+    cache_path = os.path.join(tmpdir, "llm.db")
+    genai_client = MagicMock()
+    genai_client.models.generate_content.return_value.candidates = [
+        MagicMock(content=MagicMock(
+            parts=[MagicMock(text='{"statements": ["a", "b"]}')]))]
+    extractor = StatementExtractor(
+        genai_client, "gemini", cache=LLMResponseCache(cache_path=cache_path))
+
+    assert extractor.extract_statements("q", "answer") == ["a", "b"]
+    assert extractor.extract_statements("q", "answer") == ["a", "b"]
+    assert genai_client.models.generate_content.call_count == 1
+    assert extractor.cache.stats()["hit_rate"] == 0.5
+
+    offline = LLMResponseCache(cache_path=cache_path, offline=True)
+    extractor = StatementExtractor(genai_client, "gemini", cache=offline)
+    scorer = Scorer(["TRUE", "FALSE"], genai_client, "gemini", cache=offline)
+
+    assert extractor.extract_statements("q", "answer") == ["a", "b"]
+    with pytest.raises(LLMCacheMissError):
+        extractor.extract_statements("q", "other answer")
+    with pytest.raises(LLMCacheMissError):
+        scorer.score("prompt")
+    assert genai_client.models.generate_content.call_count == 1
+
+def mock_candidate(text, avg_logprobs=None, logprobs_result=None):
+    return MagicMock(
+        content=MagicMock(parts=[MagicMock(text=text)]),
+        avg_logprobs=avg_logprobs,
+        logprobs_result=logprobs_result)
+
+def mock_batch_candidate(tokens):
+    """Candidate whose text is the chosen tokens, each with alternatives."""
+    chosen, top = [], []
+    for token, alternatives in tokens:
+        chosen.append(MagicMock(token=token, log_probability=0.0))
+        top.append(MagicMock(candidates=[
+            MagicMock(token=alt, log_probability=log_prob)
+            for alt, log_prob in alternatives or [(token, 0.0)]
+        ]))
+
+    return mock_candidate(
+        "".join(token for token, _ in tokens),
+        logprobs_result=MagicMock(chosen_candidates=chosen, top_candidates=top))
+
+def test_groundedness_scores_statements_in_batches(tmpdir):
+    genai_client = MagicMock()
+    genai_client.models.generate_content.side_effect = [
+        MagicMock(candidates=[mock_batch_candidate([
+            ('[{"index": 1, "verdict": "', None),
+            ("FALSE", [("FALSE", math.log(0.75)), ("TRUE", math.log(0.25))]),
+            ('"}, {"index": 0, "verdict": ', None),
+            ('"TRUE', [('"TRUE', math.log(0.6)), ('"FALSE', math.log(0.2))]),
+            ('"}]', None),
+        ])]),
+        # Malformed batch: the missing index falls back to single scoring.
+        MagicMock(candidates=[mock_batch_candidate([
+            ('[{"index": 0, "verdict": "', None),
+            ("TRUE", None),
+            ('"}]', None),
+        ])]),
+        MagicMock(candidates=[mock_candidate("TRUE", -0.1)]),
+        MagicMock(candidates=[mock_candidate("FALSE", -0.1)]),
+    ]
+    scorer = AnswerGroundednessScorer(
+        genai_client, "gemini", statement_batch_size=2)
+    scorer._statement_scorer._scorer.cache = LLMResponseCache(
+        cache_path=os.path.join(tmpdir, "llm.db"))
+
+    res = scorer._statement_scorer.score(
+        {"sources": "premise"}, ["a", "b", "c", "d"])
+
+    assert [r.statement for r in res] == ["a", "b", "c", "d"]
+    assert [r.scores["TRUE"] for r in res] == pytest.approx(
+        [0.75, 0.25, 1.0, 0.0])
+    assert genai_client.models.generate_content.call_count == 4
+    batch_call = genai_client.models.generate_content.call_args_list[0]
+    assert "0. a\n1. b" in batch_call.kwargs["contents"]
+    assert batch_call.kwargs["config"].response_logprobs
+
+def test_batch_without_logprobs_falls_back_to_single_scoring(tmpdir):
+    genai_client = MagicMock()
+    genai_client.models.generate_content.side_effect = [
+        MagicMock(candidates=[mock_candidate(
+            '[{"index": 0, "verdict": "TRUE"}]')]),
+        MagicMock(candidates=[mock_candidate("TRUE", -0.1)]),
+    ]
+    scorer = AnswerGroundednessScorer(
+        genai_client, "gemini", statement_batch_size=2)
+    scorer._statement_scorer._scorer.cache = LLMResponseCache(
+        cache_path=os.path.join(tmpdir, "llm.db"))
+
+    res = scorer._statement_scorer.score({"sources": "premise"}, ["a"])
+
+    assert [r.scores["TRUE"] for r in res] == [1.0]
+    assert genai_client.models.generate_content.call_count == 2
+
+class SlowMetric(Metric):
+    """Metric that records how many rows are scored at the same time."""
+    def __init__(self, column, tracker):
+        self.COLUMNS = [column]
+        self.tracker = tracker
+
+    def __call__(self, inputs):
+        with self.tracker["lock"]:
+            self.tracker["in_flight"] += 1
+            self.tracker["max"] = max(
+                self.tracker["max"], self.tracker["in_flight"])
+        time.sleep(0.02)
+        with self.tracker["lock"]:
+            self.tracker["in_flight"] -= 1
+
+        return {self.COLUMNS[0]: inputs["value"] * 2}
+
+def test_metrics_engine_overlaps_metrics_within_budget():
+    tracker = {"lock": threading.Lock(), "in_flight": 0, "max": 0}
+    inputs = pd.DataFrame({"value": range(6)}, index=list("abcdef"))
+    engine = MetricsEngine(
+        [SlowMetric("first", tracker), SlowMetric("second", tracker)],
+        max_workers=4)
+
+    res = engine.run(inputs)
+
+    assert list(res.columns) == ["first", "second"]
+    assert res.loc["f", "second"] == 10
+    assert 1 < tracker["max"] <= 4
+
+def test_metrics_engine_rate_is_scoped_to_run():
+    limiter = metrics._llm_rate_limiter
+    rates = []
+
+    class RateMetric(SlowMetric):
+        def __call__(self, inputs):
+            rates.append(metrics._llm_rate_limiter.rate)
+            return super().__call__(inputs)
+
+    tracker = {"lock": threading.Lock(), "in_flight": 0, "max": 0}
+    engine = MetricsEngine([RateMetric("first", tracker)], rate=50, burst=5)
+    engine.run(pd.DataFrame({"value": range(2)}))
+
+    assert rates == [50, 50]
+    assert metrics._llm_rate_limiter is limiter
@@ -0,0 +1,134 @@
+"""Test Class for Results Store Methods in SCRAPI."""
+
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+
+from dfcx_scrapi.tools.agent_response import AgentResponse, Snippet
+from dfcx_scrapi.tools.results_store import (
+    AGENT_RESPONSE_SCHEMA,
+    ResultsWriter,
+    agent_responses_from_results,
+    list_runs,
+    load_results,
+    scan_results,
+    schema_from_columns,
+)
+
+
+def test_agent_response_schema_uses_native_types():
+    assert AGENT_RESPONSE_SCHEMA.field("latency").type == pa.float64()
+    assert AGENT_RESPONSE_SCHEMA.field("faq_citation").type == pa.bool_()
+    assert AGENT_RESPONSE_SCHEMA.field(
+        "cited_snippet_indices").type == pa.list_(pa.int64())
+    assert AGENT_RESPONSE_SCHEMA.field(
+        "search_results").type.value_type.names == ["uri", "title", "text"]
+
+def test_write_and_load_runs_with_projection(tmpdir):
+    root = os.path.join(tmpdir, "results")
+    responses = [
+        AgentResponse(
+            answer_text="hi",
+            latency=1.5,
+            search_results=[Snippet(uri="u", title="t", text=None)],
+            cited_snippet_indices=[0],
+        ),
+        AgentResponse(answer_text="bye"),
+    ]
+    scrape = pd.DataFrame({
+        "query": ["q1", "q2"],
+        "query_result": responses,
+        "metadata": [{"a": 1}, None],
+    })
+    writer = ResultsWriter(root)
+
+    first = writer.write(scrape, "run1")
+    writer.write(scrape.iloc[:1], first)
+    writer.write(scrape.assign(rougeL=[0.5, 1.0]), "run2")
+
+    assert list_runs(root) == ["run1", "run2"]
+
+    res = load_results(root, columns=["query", "answer_text", "run_id"])
+    assert list(res.columns) == ["query", "answer_text", "run_id"]
+    assert sorted(res.run_id) == ["run1", "run1", "run1", "run2", "run2"]
+
+    run2 = load_results(root, run_ids=["run2"])
+    assert len(run2) == 2
+    assert json.loads(run2.metadata.iloc[0]) == {"a": 1}
+    assert list(run2.rougeL) == [0.5, 1.0]
+    assert list(agent_responses_from_results(run2)) == responses
+
+    batches = list(scan_results(root, columns=["query"], batch_size=1))
+    assert all(len(batch) == 1 for batch in batches)
+    assert len(batches) == 5
+
+def test_write_applies_schema_to_known_columns(tmpdir):
+    root = os.path.join(tmpdir, "nlu")
+    schema = schema_from_columns(
+        ["utterance", "confidence"], {"confidence": pa.float64()})
+    df = pd.DataFrame({"utterance": ["hi"], "confidence": [None]})
+
+    ResultsWriter(root, schema).write(df, "run1")
+    res = load_results(root)
+
+    assert res.confidence.dtype == "float64"
+    assert res.utterance.iloc[0] == "hi"
+
+def test_write_coerces_empty_values_in_numeric_columns(tmpdir):
+    root = os.path.join(tmpdir, "nlu")
+    schema = schema_from_columns(
+        ["utterance", "confidence", "turns"],
+        {"confidence": pa.float64(), "turns": pa.int64()})
+    df = pd.DataFrame({
+        "utterance": ["hi", "bye"],
+        "confidence": [0.9, ""],
+        "turns": [1, "many"],
+    })
+
+    ResultsWriter(root, schema).write(df, "run1")
+    res = load_results(root)
+
+    assert res.confidence.dtype == "float64"
+    assert res.confidence.iloc[0] == 0.9
+    assert pd.isna(res.confidence.iloc[1])
+    assert res.turns.iloc[0] == 1
+    assert pd.isna(res.turns.iloc[1])
+
+def test_write_falls_back_to_inferred_type(tmpdir):
+    root = os.path.join(tmpdir, "nlu")
+    schema = schema_from_columns(["ids"], {"ids": pa.list_(pa.int64())})
+    df = pd.DataFrame({"ids": [["a"], ["b"]]})
+
+    ResultsWriter(root, schema).write(df, "run1")
+
+    assert list(load_results(root).ids) == ['["a"]', '["b"]']
+
+def test_load_merges_chunks_with_different_types(tmpdir):
+    root = os.path.join(tmpdir, "csv")
+    csv_path = os.path.join(tmpdir, "results.csv")
+    with open(csv_path, "w", encoding="utf-8") as f:
+        f.write("a,b,c\n1,x,1\n2,y,2\n,z,three\n4,w,four\n")
+
+    run_id = ResultsWriter(root).write_csv(csv_path, chunksize=2)
+    res = load_results(root, run_ids=[run_id]).set_index("b").loc[
+        ["x", "y", "z", "w"]]
+
+    assert res.a.dtype == "float64"
+    assert list(res.a.fillna(-1)) == [1.0, 2.0, -1.0, 4.0]
+    assert list(res.c) == ["1", "2", "three", "four"]